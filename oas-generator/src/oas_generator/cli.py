@@ -77,6 +77,18 @@ Examples:
         help="Custom description for the generated package (overrides spec description)",
         dest="custom_description",
     )
+    parser.add_argument(
+        "--benchmarks",
+        action="store_true",
+        help="Also generate a vitest benchmark of model decode/encode throughput (tests/codec.bench.ts)",
+        dest="emit_benchmarks",
+    )
+    parser.add_argument(
+        "--mock-server",
+        action="store_true",
+        help="Also generate a route table for a local mock server of the API (tests/mock-server.ts)",
+        dest="emit_mock_server",
+    )
 
     parsed_args = parser.parse_args(args)
 
@@ -137,6 +149,8 @@ def main(args: list[str] | None = None) -> int:
                 parsed_args.output_dir,
                 parsed_args.package_name,
                 custom_description=parsed_args.custom_description,
+                emit_benchmarks=parsed_args.emit_benchmarks,
+                emit_mock_server=parsed_args.emit_mock_server,
             )
 
             # Write files to disk (overwrite safely)
@@ -83,6 +83,7 @@ class DirectoryName(StrEnum):
     MODELS = "models"
     APIS = "apis"
     CORE = "core"
+    TESTS = "tests"
 
 
 class HttpMethod(StrEnum):
@@ -195,6 +196,10 @@ MODELS_META_TEMPLATE: Final[str] = "models/model-meta.ts.j2"
 MODELS_META_FILE: Final[str] = "model-meta.ts"
 API_SERVICE_TEMPLATE: Final[str] = "apis/service.ts.j2"
 APIS_INDEX_TEMPLATE: Final[str] = "apis/index.ts.j2"
+CODEC_BENCH_TEMPLATE: Final[str] = "tests/codec.bench.ts.j2"
+CODEC_BENCH_FILE: Final[str] = "codec.bench.ts"
+MOCK_SERVER_TEMPLATE: Final[str] = "tests/mock-server.ts.j2"
+MOCK_SERVER_FILE: Final[str] = "mock-server.ts"
 
 # Status code prefixes
 SUCCESS_STATUS_PREFIX: Final[str] = "2"
@@ -222,6 +227,10 @@ X_ALGOKIT_BOX_REFERENCE: Final[str] = "x-algokit-box-reference"
 X_ALGOKIT_HOLDING_REFERENCE: Final[str] = "x-algokit-holding-reference"
 X_ALGOKIT_LOCALS_REFERENCE: Final[str] = "x-algokit-locals-reference"
 X_ALGOKIT_BYTE_LENGTH: Final[str] = "x-algokit-byte-length"
+X_ALGOKIT_CACHE: Final[str] = "x-algokit-cache"
+
+# Response cache policies understood by the generated runtime
+CACHE_POLICIES: Final[frozenset[str]] = frozenset(["immutable", "slow-changing"])
 
 # Template configuration
 TEMPLATE_TRIM_BLOCKS: Final[bool] = True
@@ -347,7 +347,8 @@ def _map_non_composite(schema: Schema, schemas: Schemas | None) -> str:
             if items_schema.get(constants.X_ALGOKIT_LOCALS_REFERENCE) is True:
                 return "LocalsReference[]"
         items_type = ts_type(items_schema, schemas)
-        return f"{items_type}[]"
+        # Parenthesise unions (e.g. enums) so the array applies to the whole union
+        return f"({items_type})[]" if " | " in items_type else f"{items_type}[]"
 
     if schema_type == TypeScriptType.OBJECT or (
         not schema_type and (SchemaKey.PROPERTIES in schema or SchemaKey.ADDITIONAL_PROPERTIES in schema)
@@ -53,6 +53,10 @@ class OperationContext:
     error_types: list[ErrorDescriptor] | None = None
     is_private: bool = False
     skip_generation: bool = False
+    # Response cache policy ("immutable" or "slow-changing") for operations whose responses may be cached
+    cache_policy: str | None = None
+    # Whether the operation waits on the server for something to happen (e.g. the next round)
+    is_long_poll: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for template rendering."""
@@ -71,6 +75,8 @@ class OperationContext:
             "errorTypes": [self._error_to_dict(e) for e in (self.error_types or [])],
             "isPrivate": self.is_private,
             "skipGeneration": self.skip_generation,
+            "cachePolicy": self.cache_policy,
+            "isLongPoll": self.is_long_poll,
         }
 
     @staticmethod
@@ -4,7 +4,7 @@ import re
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -97,6 +97,12 @@ class TemplateRenderer:
 class SchemaProcessor:
     """Processes OpenAPI schemas and generates TypeScript models."""
 
+    # Models whose generated files are replaced by custom templates, per service class
+    CUSTOM_MODELS: ClassVar[dict[str, set[str]]] = {
+        "AlgodApi": {"SuggestedParams", "Block", "BlockResponse", "LedgerStateDelta"},
+        "KmdApi": {"SignMultisigRequest", "SignTransactionRequest"},
+    }
+
     def __init__(self, renderer: TemplateRenderer, service_class_name: str = "") -> None:
         self.renderer = renderer
         self.service_class_name = service_class_name
@@ -141,8 +147,9 @@ class SchemaProcessor:
             else:
                 register_model_kind(model_name, "primitive")
 
-        # Second pass: Generate individual model files and collect custom method exports
+        # Second pass: Generate individual model files and collect custom method and projection exports
         custom_method_exports: list[dict[str, Any]] = []
+        projection_exports: list[dict[str, Any]] = []
         for name, schema in filtered_schemas.items():
             descriptor = self._build_model_descriptor(name, schema, schemas)
             context = self._create_model_context(name, schema, schemas, descriptor)
@@ -156,10 +163,19 @@ class SchemaProcessor:
                     "file_name": ts_kebab_case(name),
                     "method_name": method.name,
                 })
+            if context["emit_projection"]:
+                projection_exports.append({
+                    "file_name": ts_kebab_case(name),
+                    "method_name": f"decode{ts_pascal_case(name)}",
+                })
 
         files[models_dir / constants.INDEX_FILE] = self.renderer.render(
             constants.MODELS_INDEX_TEMPLATE,
-            {"schemas": filtered_schemas, "custom_method_exports": custom_method_exports},
+            {
+                "schemas": filtered_schemas,
+                "custom_method_exports": custom_method_exports,
+                "projection_exports": projection_exports,
+            },
         )
 
         files[models_dir / constants.MODELS_META_FILE] = self.renderer.render(
@@ -190,6 +206,9 @@ class SchemaProcessor:
             "descriptor": descriptor,
             "custom_imports": custom_extensions.imports if custom_extensions else [],
             "custom_methods": custom_extensions.methods if custom_extensions else [],
+            # Typed partial decoding helper, e.g. `decodeAccount(payload, ['amount', 'round'])`
+            "emit_projection": descriptor.is_object
+            and model_name not in self.CUSTOM_MODELS.get(self.service_class_name, set()),
         }
 
     @staticmethod
@@ -600,10 +619,19 @@ class OperationProcessor:
         # Get private method configurations for this service
         private_methods = self._get_private_methods(service_class_name)
 
-        # Mark operations as private or skipped, where required
+        # Get cacheable and long poll operation configurations for this service
+        cacheable_methods = self._get_cacheable_methods(service_class_name)
+        long_poll_methods = self._get_long_poll_methods(service_class_name)
+
+        # Mark operations as private, cacheable, long polls or skipped, where required
         for operation in all_operations:
             if operation.operation_id in private_methods:
                 operation.is_private = True
+            cache_policy = cacheable_methods.get(ts_camel_case(operation.operation_id))
+            if cache_policy and operation.cache_policy is None and operation.method == "GET":
+                operation.cache_policy = cache_policy
+            if ts_camel_case(operation.operation_id) in long_poll_methods:
+                operation.is_long_poll = True
 
         # Filter out operations marked for skipping
         all_operations = [op for op in all_operations if not op.skip_generation]
@@ -632,6 +660,12 @@ class OperationProcessor:
             },
         )
 
+        if service_class_name == "AlgodApi":
+            files[apis_dir / "suggested-params-provider.ts"] = self.renderer.render(
+                "apis/custom/algod/suggested-params-provider.ts.j2", {}
+            )
+            files[apis_dir / "block-follower.ts"] = self.renderer.render("apis/custom/algod/block-follower.ts.j2", {})
+
         # Generate barrel export
         files[apis_dir / constants.INDEX_FILE] = self.renderer.render(
             constants.APIS_INDEX_TEMPLATE, {"service_class_name": service_class_name}
@@ -639,6 +673,44 @@ class OperationProcessor:
 
         return files, import_types
 
+    def collect_response_models(
+        self,
+        operations_by_tag: dict[str, list[OperationContext]],
+        tags: set[str],
+        import_types: set[str],
+    ) -> list[dict[str, str]]:
+        """Collect the models (and wire format) that generated operations decode their responses into."""
+        response_models: dict[tuple[str, str], dict[str, str]] = {}
+        for route in self.collect_mock_routes(operations_by_tag, tags, import_types):
+            if route["model"]:
+                key = (route["model"], route["format"])
+                response_models[key] = {"model": route["model"], "format": route["format"]}
+        return [response_models[key] for key in sorted(response_models)]
+
+    def collect_mock_routes(
+        self,
+        operations_by_tag: dict[str, list[OperationContext]],
+        tags: set[str],
+        import_types: set[str],
+    ) -> list[dict[str, str | None]]:
+        """Collect the route of each generated operation, with the model (if any) its response decodes into."""
+        routes: list[dict[str, str | None]] = []
+        for op in self._collect_unique_operations(operations_by_tag, tags):
+            if op.skip_generation:
+                continue
+            # SuggestedParams is built by a custom method rather than decoded
+            decoded = op.response_type in import_types and op.response_type != "SuggestedParams"
+            routes.append(
+                {
+                    "operationId": ts_camel_case(op.operation_id),
+                    "method": op.method.upper(),
+                    "path": op.path,
+                    "model": op.response_type if decoded else None,
+                    "format": "msgpack" if op.force_msgpack_query else "json",
+                }
+            )
+        return routes
+
     def _get_custom_service_extensions(self, service_class_name: str) -> tuple[list[str], list[str]]:
         """Get custom imports and methods for specific service classes."""
         custom_imports: list[str] = []
@@ -652,7 +724,7 @@ class OperationProcessor:
             send_raw_transaction_method = '''/**
    * Send a signed transaction or array of signed transactions to the network.
    */
-  async sendRawTransaction(stxOrStxs: Uint8Array | Uint8Array[]): Promise<PostTransactionsResponse> {
+  async sendRawTransaction(stxOrStxs: Uint8Array | Uint8Array[], requestOptions?: RequestOptions): Promise<PostTransactionsResponse> {
     let rawTransactions = stxOrStxs;
     if (Array.isArray(stxOrStxs)) {
       if (!stxOrStxs.every((a) => a instanceof Uint8Array)) {
@@ -662,21 +734,21 @@ class OperationProcessor:
     } else if (!(rawTransactions instanceof Uint8Array)) {
       throw new Error('Argument must be byte array');
     }
-    return this._rawTransaction(rawTransactions);
+    return this._rawTransaction(rawTransactions, requestOptions);
   }'''
             get_application_box_by_name = '''/**
    * Given an application ID and box name, it returns the round, box name, and value.
    */
-  async applicationBoxByName(applicationId: number | bigint, boxName: Uint8Array): Promise<Box> {
+  async applicationBoxByName(applicationId: number | bigint, boxName: Uint8Array, requestOptions?: RequestOptions): Promise<Box> {
     const name = `b64:${Buffer.from(boxName).toString('base64')}`;
-    return this._applicationBoxByName(applicationId, { name });
+    return this._applicationBoxByName(applicationId, { name }, requestOptions);
   }
 '''
             suggested_params_method = '''/**
    * Returns the common needed parameters for a new transaction.
    */
-  async suggestedParams(): Promise<SuggestedParams> {
-    const txnParams = await this._transactionParams();
+  async suggestedParams(requestOptions?: RequestOptions): Promise<SuggestedParams> {
+    const txnParams = await this._transactionParams(requestOptions);
 
     return {
       flatFee: false,
@@ -692,36 +764,123 @@ class OperationProcessor:
             get_transaction_params_method = '''/**
    * Returns the common needed parameters for a new transaction.
    */
-  async transactionParams(): Promise<SuggestedParams> {
-    return await this.suggestedParams();
+  async transactionParams(requestOptions?: RequestOptions): Promise<SuggestedParams> {
+    return await this.suggestedParams(requestOptions);
   }'''
             simulate_raw_transactions_method = '''/**
    * Simulate an encoded signed transaction or array of encoded signed transactions.
    */
-  async simulateRawTransactions(stxOrStxs: Uint8Array | Uint8Array[]): Promise<SimulateResponse> {
+  async simulateRawTransactions(stxOrStxs: Uint8Array | Uint8Array[], requestOptions?: RequestOptions): Promise<SimulateResponse> {
     const txns = Array.isArray(stxOrStxs) ? stxOrStxs.map((stxn) => decodeSignedTransaction(stxn)) : [decodeSignedTransaction(stxOrStxs)];
-    return this.simulateTransactions({
-      txnGroups: [
-        {
-          txns,
-        },
-      ],
-    });
+    return this.simulateTransactions(
+      {
+        txnGroups: [
+          {
+            txns,
+          },
+        ],
+      },
+      requestOptions,
+    );
   }'''
 
             custom_methods = [send_raw_transaction_method, get_application_box_by_name, suggested_params_method, get_transaction_params_method, simulate_raw_transactions_method]
 
         if service_class_name == "IndexerApi":
+            custom_imports = [
+                "import { decodeFields, unselectedWireKeys } from '../core/model-runtime';",
+                "import type { Account } from '../models/index';",
+                "import { AccountMeta } from '../models/model-meta';",
+            ]
             lookup_application_box_by_id_and_name = '''/**
    * Given an application ID and box name, it returns the round, box name, and value.
    */
-  async lookupApplicationBoxByIdAndName(applicationId: number | bigint, boxName: Uint8Array): Promise<Box> {
+  async lookupApplicationBoxByIdAndName(applicationId: number | bigint, boxName: Uint8Array, requestOptions?: RequestOptions): Promise<Box> {
     const name = `b64:${Buffer.from(boxName).toString('base64')}`;
-    return this._lookupApplicationBoxByIdAndName(applicationId, { name });
+    return this._lookupApplicationBoxByIdAndName(applicationId, { name }, requestOptions);
+  }
+'''
+
+            lookup_account_fields_by_id = '''/**
+   * Looks up account information with only the given account fields.
+   * Asset holdings, application local states and created assets and applications that aren't selected are excluded by the server,
+   * and only the selected fields are decoded.
+   */
+  async lookupAccountFieldsById<K extends keyof Account & string>(
+    account: ReadableAddress,
+    fields: readonly K[],
+    params?: { round?: number | bigint; includeAll?: boolean },
+    requestOptions?: RequestOptions,
+  ): Promise<{ account: Pick<Account, K>; currentRound: bigint }> {
+    const headers: Record<string, string> = {};
+    headers['Accept'] = this.mimeTypeFor('json');
+
+    return this.httpRequest.request<{ account: Pick<Account, K>; currentRound: bigint }>({
+      method: 'GET',
+      url: '/v2/accounts/{account-id}',
+      buildUrl: urlBuilders.lookupAccountById,
+      path: { 'account-id': account },
+      query: { round: params?.round, 'include-all': params?.includeAll, exclude: this.accountExclusions(fields) },
+      headers,
+      body: undefined,
+      decode: (payload: Record<string, unknown>) => ({
+        ...decodeFields(payload, AccountResponseMeta, ['currentRound']),
+        account: decodeFields(payload['account'] as Record<string, unknown>, AccountMeta, fields),
+      }),
+      operationId: 'lookupAccountById',
+      ...requestOptions,
+    });
+  }
+'''
+            search_for_accounts_fields = '''/**
+   * Searches for accounts, returning only the given account fields.
+   * Asset holdings, application local states and created assets and applications that aren't selected are excluded by the server,
+   * and only the selected fields are decoded.
+   */
+  async searchForAccountsFields<K extends keyof Account & string>(
+    fields: readonly K[],
+    params?: Omit<NonNullable<Parameters<IndexerApi['searchForAccounts']>[0]>, 'exclude'>,
+    requestOptions?: RequestOptions,
+  ): Promise<Omit<AccountsResponse, 'accounts'> & { accounts: Pick<Account, K>[] }> {
+    const headers: Record<string, string> = {};
+    headers['Accept'] = this.mimeTypeFor('json');
+
+    return this.httpRequest.request<Omit<AccountsResponse, 'accounts'> & { accounts: Pick<Account, K>[] }>({
+      method: 'GET',
+      url: '/v2/accounts',
+      buildUrl: urlBuilders.searchForAccounts,
+      path: {},
+      query: {
+        'asset-id': params?.assetId,
+        limit: params?.limit,
+        next: params?.next,
+        'currency-greater-than': params?.currencyGreaterThan,
+        'include-all': params?.includeAll,
+        exclude: this.accountExclusions(fields),
+        'currency-less-than': params?.currencyLessThan,
+        'auth-addr': params?.authAddr,
+        round: params?.round,
+        'application-id': params?.applicationId,
+        'online-only': params?.onlineOnly,
+      },
+      headers,
+      body: undefined,
+      decode: (payload: Record<string, unknown>) => ({
+        ...decodeFields(payload, AccountsResponseMeta, ['currentRound', 'nextToken']),
+        accounts: ((payload['accounts'] ?? []) as Record<string, unknown>[]).map((account) => decodeFields(account, AccountMeta, fields)),
+      }),
+      operationId: 'searchForAccounts',
+      ...requestOptions,
+    });
+  }
+'''
+            account_exclusions = '''private accountExclusions(fields: readonly (keyof Account & string)[]) {
+    const exclude = unselectedWireKeys(AccountMeta, fields, ['assets', 'created-assets', 'apps-local-state', 'created-apps'] as const);
+    return exclude.length > 0 ? exclude : undefined;
   }
 '''
 
-            custom_methods = [lookup_application_box_by_id_and_name]
+            custom_methods = [lookup_application_box_by_id_and_name, lookup_account_fields_by_id, search_for_accounts_fields, account_exclusions]
 
         if service_class_name == "KmdApi":
             custom_imports = [
@@ -731,12 +890,12 @@ class OperationProcessor:
             create_wallet = '''/**
    * Create a new wallet (collection of keys) with the given parameters.
    */
-  async createWallet(body: CreateWalletRequest): Promise<CreateWalletResponse> {
+  async createWallet(body: CreateWalletRequest, requestOptions?: RequestOptions): Promise<CreateWalletResponse> {
     const requestBody = {
       ...body,
       walletDriverName: body.walletDriverName ?? 'sqlite',
     }
-    return await this._createWallet(requestBody)
+    return await this._createWallet(requestBody, requestOptions)
   }
 '''
             sign_multisig_transaction = '''/**
@@ -745,12 +904,12 @@ class OperationProcessor:
    * When a signer is provided it is used to resolve the private key and sign the transaction, enabling rekeyed account signing.
    * @returns A multisig signature or partial signature, which can be used to form a signed transaction.
    */
-  async signMultisigTransaction(body: SignMultisigRequest): Promise<SignMultisigResponse> {
+  async signMultisigTransaction(body: SignMultisigRequest, requestOptions?: RequestOptions): Promise<SignMultisigResponse> {
     const requestBody = {
       ...body,
       transaction: encodeTransactionRaw(body.transaction),
     } satisfies SignMultisigTxnRequest
-    return this._signMultisigTransaction(requestBody)
+    return this._signMultisigTransaction(requestBody, requestOptions)
   }
 '''
             sign_transaction = '''/**
@@ -758,12 +917,12 @@ class OperationProcessor:
    * When a public key is provided it is used to resolve the private key and sign the transaction, enabling rekeyed account signing.
    * @returns An encoded, signed transaction.
    */
-  async signTransaction(body: SignTransactionRequest): Promise<SignTransactionResponse> {
+  async signTransaction(body: SignTransactionRequest, requestOptions?: RequestOptions): Promise<SignTransactionResponse> {
     const requestBody = {
       ...body,
       transaction: encodeTransactionRaw(body.transaction),
     } satisfies SignTxnRequest
-    return this._signTransaction(requestBody)
+    return this._signTransaction(requestBody, requestOptions)
   }
 '''
 
@@ -792,6 +951,56 @@ class OperationProcessor:
 
         return private_method_config.get(service_class_name, set())
 
+    def _get_cacheable_methods(self, service_class_name: str) -> dict[str, str]:
+        """Get the response cache policy of operations whose responses may be cached, keyed by camelCase operation ID.
+
+        Operations can also opt in via the `x-algokit-cache` vendor extension, which takes precedence over this table.
+        """
+        # Default configuration for cacheable methods by service class
+        cacheable_method_config = {
+            "AlgodApi": {
+                # Immutable once the round is final
+                "Block": "immutable",
+                "BlockHash": "immutable",
+                "BlockTxIds": "immutable",
+                "Genesis": "immutable",
+                "LedgerStateDelta": "immutable",
+                "LightBlockHeaderProof": "immutable",
+                "StateProof": "immutable",
+                "TransactionGroupLedgerStateDeltasForRound": "immutable",
+                "TransactionProof": "immutable",
+                # Rarely change; applications aren't cached as their global state changes with every app call
+                "AssetByID": "slow-changing",
+                "Version": "slow-changing",  # Changes when the node is upgraded
+            },
+            "IndexerApi": {
+                "lookupBlock": "immutable",
+                "lookupTransactionByID": "immutable",
+                "lookupAssetByID": "slow-changing",
+            },
+            "KmdApi": {
+                "Version": "slow-changing",
+            },
+        }
+
+        return {
+            ts_camel_case(operation_id): policy
+            for operation_id, policy in cacheable_method_config.get(service_class_name, {}).items()
+        }
+
+    def _get_long_poll_methods(self, service_class_name: str) -> set[str]:
+        """Get the camelCase operation IDs of operations that wait on the server for something to happen (long polls).
+
+        Their latency reflects how long they waited rather than how fast the server is, so it's kept out of latency tracking.
+        """
+        long_poll_method_config = {
+            "AlgodApi": {
+                "StatusAfterBlock",  # Waits up to about a minute for the round after the given one
+            },
+        }
+
+        return {ts_camel_case(operation_id) for operation_id in long_poll_method_config.get(service_class_name, set())}
+
     def _initialize_model_names(self, spec: Schema) -> None:
         """Initialize set of model names from spec."""
 
@@ -864,6 +1073,10 @@ class OperationProcessor:
             returns_msgpack=returns_msgpack,
         )
 
+        cache_policy = op_input.operation.get(constants.X_ALGOKIT_CACHE)
+        if cache_policy in constants.CACHE_POLICIES:
+            context.cache_policy = cache_policy
+
         # Compute additional properties
         self._compute_force_msgpack_query(context, op_input.operation, op_input.spec)
         self._compute_import_types(context)
@@ -1148,6 +1361,8 @@ class CodeGenerator:
         package_name: str,
         *,
         custom_description: str | None = None,
+        emit_benchmarks: bool = False,
+        emit_mock_server: bool = False,
     ) -> FileMap:
         """Generate complete TypeScript client from OpenAPI spec."""
         # Parse specification
@@ -1252,6 +1467,20 @@ class CodeGenerator:
             files[index_path] = files[index_path] + extras
         files.update(self._generate_client_files(output_dir, client_class, service_class))
 
+        if emit_benchmarks:
+            response_models = self.operation_processor.collect_response_models(ops_by_tag, tags, used_types)
+            files[output_dir / constants.DirectoryName.TESTS / constants.CODEC_BENCH_FILE] = self.renderer.render(
+                constants.CODEC_BENCH_TEMPLATE,
+                {"client_class_name": client_class, "response_models": response_models},
+            )
+
+        if emit_mock_server:
+            mock_routes = self.operation_processor.collect_mock_routes(ops_by_tag, tags, used_types)
+            files[output_dir / constants.DirectoryName.TESTS / constants.MOCK_SERVER_FILE] = self.renderer.render(
+                constants.MOCK_SERVER_TEMPLATE,
+                {"client_class_name": client_class, "mock_routes": mock_routes},
+            )
+
         return files
 
     def _generate_runtime(
@@ -1280,9 +1509,19 @@ class CodeGenerator:
             core_dir / "fetch-http-request.ts": ("base/src/core/fetch-http-request.ts.j2", context),
             core_dir / "api-error.ts": ("base/src/core/api-error.ts.j2", context),
             core_dir / "request.ts": ("base/src/core/request.ts.j2", context),
+            core_dir / "request-coalescer.ts": ("base/src/core/request-coalescer.ts.j2", context),
+            core_dir / "response-cache.ts": ("base/src/core/response-cache.ts.j2", context),
+            core_dir / "http-transport.ts": ("base/src/core/http-transport.ts.j2", context),
+            core_dir / "node-http-transport.ts": ("base/src/core/node-http-transport.ts.j2", context),
+            core_dir / "recording-transport.ts": ("base/src/core/recording-transport.ts.j2", context),
+            core_dir / "request-scheduler.ts": ("base/src/core/request-scheduler.ts.j2", context),
+            core_dir / "request-hedger.ts": ("base/src/core/request-hedger.ts.j2", context),
+            core_dir / "endpoint-pool.ts": ("base/src/core/endpoint-pool.ts.j2", context),
+            core_dir / "instrumentation.ts": ("base/src/core/instrumentation.ts.j2", context),
             core_dir / "model-runtime.ts": ("base/src/core/model-runtime.ts.j2", context),
             # Project files
             src_dir / "index.ts": ("base/src/index.ts.j2", context),
+            src_dir / "node.ts": ("base/src/node.ts.j2", context),
         }
 
         return self.renderer.render_batch(template_map)
@@ -1,7 +1,8 @@
 import { Buffer } from 'buffer'
 import { describe, expect, test } from 'vitest'
-import { ABIMethod } from './abi-method'
+import { ABIMethod, getABIMethod } from './abi-method'
 import { parseTupleContent } from './abi-type'
+import { Arc56Contract } from './arc56-contract'
 
 describe('ABIMethod.fromSignature', () => {
   test.each([
@@ -60,3 +61,44 @@ describe('ABIMethod.getSignature round trip', () => {
     expect(regeneratedSignature).toBe(signature)
   })
 })
+
+describe('getABIMethod', () => {
+  const appSpec = {
+    name: 'Test',
+    methods: [
+      { name: 'add', args: [{ type: 'uint64' }, { type: 'uint64' }], returns: { type: 'uint64' }, actions: { create: [], call: ['NoOp'] } },
+      { name: 'echo', args: [{ type: 'string' }], returns: { type: 'string' }, actions: { create: [], call: ['NoOp'] } },
+      { name: 'echo', args: [{ type: 'uint64' }], returns: { type: 'uint64' }, actions: { create: [], call: ['NoOp'] } },
+    ],
+    structs: {},
+  } as unknown as Arc56Contract
+
+  test('should find a method by name or signature and return the same parsed method each time', () => {
+    const method = getABIMethod('add', appSpec)
+
+    expect(getABIMethod('add(uint64,uint64)uint64', appSpec)).toBe(method)
+    expect(getABIMethod('add', appSpec)).toBe(method)
+    expect(Buffer.from(method.getSelector()).toString('hex')).toBe('fe6bdf69')
+    expect(getABIMethod('echo(uint64)uint64', appSpec).getSignature()).toBe('echo(uint64)uint64')
+  })
+
+  test('should throw for an unknown or ambiguous method', () => {
+    expect(() => getABIMethod('missing', appSpec)).toThrow('Unable to find method missing in Test app.')
+    expect(() => getABIMethod('add(uint64)uint64', appSpec)).toThrow('Unable to find method add(uint64)uint64 in Test app.')
+    expect(() => getABIMethod('echo', appSpec)).toThrow(
+      'please pass in an ABI signature instead: add(uint64,uint64)uint64, echo(string)string, echo(uint64)uint64',
+    )
+  })
+
+  test('should return the first of the methods with the same signature', () => {
+    const duplicated = {
+      ...appSpec,
+      methods: [
+        { ...appSpec.methods[0], desc: 'first' },
+        { ...appSpec.methods[0], desc: 'second' },
+      ],
+    } as Arc56Contract
+
+    expect(getABIMethod('add(uint64,uint64)uint64', duplicated).description).toBe('first')
+  })
+})
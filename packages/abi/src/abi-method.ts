@@ -100,6 +100,8 @@ export class ABIMethod {
    * @returns The signature, e.g. `my_method(unit64,string)bytes`
    */
   getSignature(): string {
+    const indexed = indexedMethodKeys.get(this)
+    if (indexed) return indexed.signature
     const args = this.args
       .map((arg) => {
         if (argTypeIsTransaction(arg.type) || argTypeIsReference(arg.type)) return arg.type
@@ -115,6 +117,8 @@ export class ABIMethod {
    * @returns The 4-byte method selector
    */
   getSelector(): Uint8Array {
+    const indexed = indexedMethodKeys.get(this)
+    if (indexed) return indexed.selector.slice()
     const hash = sha512_256(new TextEncoder().encode(this.getSignature()))
     return new Uint8Array(hash.slice(0, 4))
   }
@@ -174,31 +178,71 @@ export class ABIMethod {
   }
 }
 
+/** The methods of an ARC-56 app spec, parsed once and looked up by name or signature. */
+interface Arc56MethodIndex {
+  /** The `methods` of the app spec the index was built from */
+  methods: Arc56Method[]
+  /** The signatures of the methods, in app spec order */
+  signatures: string[]
+  byName: Map<string, ABIMethod[]>
+  bySignature: Map<string, ABIMethod>
+}
+
+const methodIndexes = new WeakMap<Arc56Contract, Arc56MethodIndex>()
+// The signature and selector of each method in an index, so they aren't rebuilt and hashed on every call
+const indexedMethodKeys = new WeakMap<ABIMethod, { signature: string; selector: Uint8Array }>()
+
+function getArc56MethodIndex(appSpec: Arc56Contract): Arc56MethodIndex {
+  const existing = methodIndexes.get(appSpec)
+  // Rebuild the index if the methods of the app spec have been replaced since it was built
+  if (existing && existing.methods === appSpec.methods && existing.signatures.length === appSpec.methods.length) {
+    return existing
+  }
+
+  const index: Arc56MethodIndex = { methods: appSpec.methods, signatures: [], byName: new Map(), bySignature: new Map() }
+  for (const m of appSpec.methods) {
+    const method = arc56MethodToABIMethod(m, appSpec)
+    const signature = getArc56MethodSignature(m)
+    const abiSignature = method.getSignature()
+    const hash = sha512_256(new TextEncoder().encode(abiSignature))
+    indexedMethodKeys.set(method, { signature: abiSignature, selector: new Uint8Array(hash.slice(0, 4)) })
+
+    index.signatures.push(signature)
+    index.byName.set(m.name, [...(index.byName.get(m.name) ?? []), method])
+    // The first method with a given signature wins, as it always has
+    if (!index.bySignature.has(signature)) index.bySignature.set(signature, method)
+  }
+  methodIndexes.set(appSpec, index)
+  return index
+}
+
 /**
  * Returns the ABI method object for a given method name or signature and ARC-56 app spec.
+ *
+ * The methods of the app spec are parsed once and indexed by name and signature, so repeated lookups are cheap; the
+ * returned `ABIMethod` is shared between lookups and shouldn't be modified.
  * @param methodNameOrSignature The method name or method signature to call if an ABI call is being emitted.
  * e.g. `my_method` or `my_method(unit64,string)bytes`
  * @param appSpec The app spec for the app
  * @returns The `ABIMethod`
  */
 export function getABIMethod(methodNameOrSignature: string, appSpec: Arc56Contract): ABIMethod {
+  const index = getArc56MethodIndex(appSpec)
   if (!methodNameOrSignature.includes('(')) {
-    const methods = appSpec.methods.filter((m) => m.name === methodNameOrSignature)
+    const methods = index.byName.get(methodNameOrSignature) ?? []
     if (methods.length === 0) throw new Error(`Unable to find method ${methodNameOrSignature} in ${appSpec.name} app.`)
     if (methods.length > 1) {
       throw new Error(
         `Received a call to method ${methodNameOrSignature} in contract ${
           appSpec.name
-        }, but this resolved to multiple methods; please pass in an ABI signature instead: ${appSpec.methods
-          .map((m) => getArc56MethodSignature(m))
-          .join(', ')}`,
+        }, but this resolved to multiple methods; please pass in an ABI signature instead: ${index.signatures.join(', ')}`,
       )
     }
-    return arc56MethodToABIMethod(methods[0], appSpec)
+    return methods[0]
   } else {
-    const method = appSpec.methods.find((m) => getArc56MethodSignature(m) === methodNameOrSignature)
+    const method = index.bySignature.get(methodNameOrSignature)
     if (!method) throw new Error(`Unable to find method ${methodNameOrSignature} in ${appSpec.name} app.`)
-    return arc56MethodToABIMethod(method, appSpec)
+    return method
   }
 }
 
@@ -1,5 +1,5 @@
-import type { BaseHttpRequest } from '../core/base-http-request'
-import { encodeMsgpack, decodeJson, decodeMsgpack } from '../core/model-runtime'
+import { compileUrl, type BaseHttpRequest, type RequestOptions } from '../core/base-http-request'
+import { encodeMsgpack, decodeJson, decodeMsgpack, type DecodeOptions } from '../core/model-runtime'
 import { ReadableAddress, type EncodingFormat } from '@algorandfoundation/algokit-common'
 import { concatArrays } from '@algorandfoundation/algokit-common'
 import { decodeSignedTransaction } from '@algorandfoundation/algokit-transact'
@@ -67,6 +67,46 @@ import {
   VersionMeta,
 } from '../models/model-meta'
 
+/** URL builders for each operation, compiled once rather than on every request. */
+const urlBuilders = {
+  accountApplicationInformation: compileUrl('/v2/accounts/{address}/applications/{application-id}'),
+  accountAssetInformation: compileUrl('/v2/accounts/{address}/assets/{asset-id}'),
+  accountInformation: compileUrl('/v2/accounts/{address}', ['exclude']),
+  applicationBoxByName: compileUrl('/v2/applications/{application-id}/box', ['name']),
+  applicationBoxes: compileUrl('/v2/applications/{application-id}/boxes', ['max']),
+  applicationById: compileUrl('/v2/applications/{application-id}'),
+  assetById: compileUrl('/v2/assets/{asset-id}'),
+  block: compileUrl('/v2/blocks/{round}', ['header-only', 'format']),
+  blockHash: compileUrl('/v2/blocks/{round}/hash'),
+  blockTimeStampOffset: compileUrl('/v2/devmode/blocks/offset'),
+  blockTxIds: compileUrl('/v2/blocks/{round}/txids'),
+  genesis: compileUrl('/genesis'),
+  healthCheck: compileUrl('/health'),
+  ledgerStateDelta: compileUrl('/v2/deltas/{round}', ['format']),
+  ledgerStateDeltaForTransactionGroup: compileUrl('/v2/deltas/txn/group/{id}', ['format']),
+  lightBlockHeaderProof: compileUrl('/v2/blocks/{round}/lightheader/proof'),
+  pendingTransactionInformation: compileUrl('/v2/transactions/pending/{txid}', ['format']),
+  pendingTransactions: compileUrl('/v2/transactions/pending', ['max', 'format']),
+  pendingTransactionsByAddress: compileUrl('/v2/accounts/{address}/transactions/pending', ['max', 'format']),
+  rawTransaction: compileUrl('/v2/transactions'),
+  ready: compileUrl('/ready'),
+  setBlockTimeStampOffset: compileUrl('/v2/devmode/blocks/offset/{offset}'),
+  setSyncRound: compileUrl('/v2/ledger/sync/{round}'),
+  simulateTransactions: compileUrl('/v2/transactions/simulate', ['format']),
+  stateProof: compileUrl('/v2/stateproofs/{round}'),
+  status: compileUrl('/v2/status'),
+  statusAfterBlock: compileUrl('/v2/status/wait-for-block-after/{round}'),
+  supply: compileUrl('/v2/ledger/supply'),
+  syncRound: compileUrl('/v2/ledger/sync'),
+  tealCompile: compileUrl('/v2/teal/compile', ['sourcemap']),
+  tealDisassemble: compileUrl('/v2/teal/disassemble'),
+  transactionGroupLedgerStateDeltasForRound: compileUrl('/v2/deltas/{round}/txn/group', ['format']),
+  transactionParams: compileUrl('/v2/transactions/params'),
+  transactionProof: compileUrl('/v2/blocks/{round}/transactions/{txid}/proof', ['hashtype']),
+  unsetSyncRound: compileUrl('/v2/ledger/sync'),
+  version: compileUrl('/versions'),
+}
+
 export class AlgodApi {
   constructor(public readonly httpRequest: BaseHttpRequest) {}
 
@@ -74,238 +114,291 @@ export class AlgodApi {
     return format === 'json' ? 'application/json' : format === 'msgpack' ? 'application/msgpack' : 'text/plain'
   }
 
+  private get decodeOptions(): DecodeOptions {
+    return { lazy: this.httpRequest.config.lazyDecoding }
+  }
+
   /**
    * Given a specific account public key and application ID, this call returns the account's application local state and global state (AppLocalState and AppParams, if either exists). Global state will only be returned if the provided address is the application's creator.
    */
-  async accountApplicationInformation(address: ReadableAddress, applicationId: number | bigint): Promise<AccountApplicationResponse> {
+  async accountApplicationInformation(
+    address: ReadableAddress,
+    applicationId: number | bigint,
+    requestOptions?: RequestOptions,
+  ): Promise<AccountApplicationResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AccountApplicationResponse>({
       method: 'GET',
       url: '/v2/accounts/{address}/applications/{application-id}',
+      buildUrl: urlBuilders.accountApplicationInformation,
       path: { address: address, 'application-id': applicationId },
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AccountApplicationResponseMeta, this.decodeOptions),
+      operationId: 'accountApplicationInformation',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AccountApplicationResponseMeta)
   }
 
   /**
    * Given a specific account public key and asset ID, this call returns the account's asset holding and asset parameters (if either exist). Asset parameters will only be returned if the provided address is the asset's creator.
    */
-  async accountAssetInformation(address: ReadableAddress, assetId: number | bigint): Promise<AccountAssetResponse> {
+  async accountAssetInformation(
+    address: ReadableAddress,
+    assetId: number | bigint,
+    requestOptions?: RequestOptions,
+  ): Promise<AccountAssetResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AccountAssetResponse>({
       method: 'GET',
       url: '/v2/accounts/{address}/assets/{asset-id}',
+      buildUrl: urlBuilders.accountAssetInformation,
       path: { address: address, 'asset-id': assetId },
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AccountAssetResponseMeta, this.decodeOptions),
+      operationId: 'accountAssetInformation',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AccountAssetResponseMeta)
   }
 
   /**
    * Given a specific account public key, this call returns the account's status, balance and spendable amounts
    */
-  async accountInformation(address: ReadableAddress, params?: { exclude?: 'all' | 'none' }): Promise<Account> {
+  async accountInformation(
+    address: ReadableAddress,
+    params?: { exclude?: 'all' | 'none' },
+    requestOptions?: RequestOptions,
+  ): Promise<Account> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Account>({
       method: 'GET',
       url: '/v2/accounts/{address}',
+      buildUrl: urlBuilders.accountInformation,
       path: { address: address },
       query: { exclude: params?.exclude },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AccountMeta, this.decodeOptions),
+      operationId: 'accountInformation',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AccountMeta)
   }
 
   /**
    * Given an application ID and box name, it returns the round, box name, and value (each base64 encoded). Box names must be in the goal app call arg encoding form 'encoding:value'. For ints, use the form 'int:1234'. For raw bytes, use the form 'b64:A=='. For printable strings, use the form 'str:hello'. For addresses, use the form 'addr:XYZ...'.
    */
-  private async _applicationBoxByName(applicationId: number | bigint, params?: { name: string }): Promise<Box> {
+  private async _applicationBoxByName(
+    applicationId: number | bigint,
+    params?: { name: string },
+    requestOptions?: RequestOptions,
+  ): Promise<Box> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Box>({
       method: 'GET',
       url: '/v2/applications/{application-id}/box',
+      buildUrl: urlBuilders.applicationBoxByName,
       path: { 'application-id': applicationId },
       query: { name: params?.name },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BoxMeta, this.decodeOptions),
+      operationId: 'applicationBoxByName',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BoxMeta)
   }
 
   /**
    * Given an application ID, return all Box names. No particular ordering is guaranteed. Request fails when client or server-side configured limits prevent returning all Box names.
    */
-  async applicationBoxes(applicationId: number | bigint, params?: { max?: number }): Promise<BoxesResponse> {
+  async applicationBoxes(
+    applicationId: number | bigint,
+    params?: { max?: number },
+    requestOptions?: RequestOptions,
+  ): Promise<BoxesResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<BoxesResponse>({
       method: 'GET',
       url: '/v2/applications/{application-id}/boxes',
+      buildUrl: urlBuilders.applicationBoxes,
       path: { 'application-id': applicationId },
       query: { max: params?.max },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BoxesResponseMeta, this.decodeOptions),
+      operationId: 'applicationBoxes',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BoxesResponseMeta)
   }
 
   /**
    * Given a application ID, it returns application information including creator, approval and clear programs, global and local schemas, and global state.
    */
-  async applicationById(applicationId: number | bigint): Promise<Application> {
+  async applicationById(applicationId: number | bigint, requestOptions?: RequestOptions): Promise<Application> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Application>({
       method: 'GET',
       url: '/v2/applications/{application-id}',
+      buildUrl: urlBuilders.applicationById,
       path: { 'application-id': applicationId },
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ApplicationMeta, this.decodeOptions),
+      operationId: 'applicationById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ApplicationMeta)
   }
 
   /**
    * Given a asset ID, it returns asset information including creator, name, total supply and special addresses.
    */
-  async assetById(assetId: number | bigint): Promise<Asset> {
+  async assetById(assetId: number | bigint, requestOptions?: RequestOptions): Promise<Asset> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Asset>({
       method: 'GET',
       url: '/v2/assets/{asset-id}',
+      buildUrl: urlBuilders.assetById,
       path: { 'asset-id': assetId },
       query: {},
       headers,
       body: undefined,
+      cache: 'slow-changing',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AssetMeta, this.decodeOptions),
+      operationId: 'assetById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AssetMeta)
   }
 
-  async block(round: number | bigint, params?: { headerOnly?: boolean }): Promise<BlockResponse> {
+  async block(round: number | bigint, params?: { headerOnly?: boolean }, requestOptions?: RequestOptions): Promise<BlockResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<BlockResponse>({
       method: 'GET',
       url: '/v2/blocks/{round}',
+      buildUrl: urlBuilders.block,
       path: { round: round },
       query: { 'header-only': params?.headerOnly, format: 'msgpack' },
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, BlockResponseMeta, this.decodeOptions),
+      operationId: 'block',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, BlockResponseMeta)
   }
 
-  async blockHash(round: number | bigint): Promise<BlockHashResponse> {
+  async blockHash(round: number | bigint, requestOptions?: RequestOptions): Promise<BlockHashResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<BlockHashResponse>({
       method: 'GET',
       url: '/v2/blocks/{round}/hash',
+      buildUrl: urlBuilders.blockHash,
       path: { round: round },
       query: {},
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BlockHashResponseMeta, this.decodeOptions),
+      operationId: 'blockHash',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BlockHashResponseMeta)
   }
 
   /**
    * Gets the current timestamp offset.
    */
-  async blockTimeStampOffset(): Promise<GetBlockTimeStampOffsetResponse> {
+  async blockTimeStampOffset(requestOptions?: RequestOptions): Promise<GetBlockTimeStampOffsetResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<GetBlockTimeStampOffsetResponse>({
       method: 'GET',
       url: '/v2/devmode/blocks/offset',
+      buildUrl: urlBuilders.blockTimeStampOffset,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, GetBlockTimeStampOffsetResponseMeta, this.decodeOptions),
+      operationId: 'blockTimeStampOffset',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, GetBlockTimeStampOffsetResponseMeta)
   }
 
-  async blockTxIds(round: number | bigint): Promise<BlockTxidsResponse> {
+  async blockTxIds(round: number | bigint, requestOptions?: RequestOptions): Promise<BlockTxidsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<BlockTxidsResponse>({
       method: 'GET',
       url: '/v2/blocks/{round}/txids',
+      buildUrl: urlBuilders.blockTxIds,
       path: { round: round },
       query: {},
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BlockTxidsResponseMeta, this.decodeOptions),
+      operationId: 'blockTxIds',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BlockTxidsResponseMeta)
   }
 
   /**
    * Returns the entire genesis file in json.
    */
-  async genesis(): Promise<Genesis> {
+  async genesis(requestOptions?: RequestOptions): Promise<Genesis> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Genesis>({
       method: 'GET',
       url: '/genesis',
+      buildUrl: urlBuilders.genesis,
       path: {},
       query: {},
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, GenesisMeta, this.decodeOptions),
+      operationId: 'genesis',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, GenesisMeta)
   }
 
-  async healthCheck(): Promise<void> {
+  async healthCheck(requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -313,68 +406,79 @@ export class AlgodApi {
     await this.httpRequest.request<void>({
       method: 'GET',
       url: '/health',
+      buildUrl: urlBuilders.healthCheck,
       path: {},
       query: {},
       headers,
       body: undefined,
+      operationId: 'healthCheck',
+      ...requestOptions,
     })
   }
 
   /**
    * Get ledger deltas for a round.
    */
-  async ledgerStateDelta(round: number | bigint): Promise<LedgerStateDelta> {
+  async ledgerStateDelta(round: number | bigint, requestOptions?: RequestOptions): Promise<LedgerStateDelta> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<LedgerStateDelta>({
       method: 'GET',
       url: '/v2/deltas/{round}',
+      buildUrl: urlBuilders.ledgerStateDelta,
       path: { round: round },
       query: { format: 'msgpack' },
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, LedgerStateDeltaMeta, this.decodeOptions),
+      operationId: 'ledgerStateDelta',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, LedgerStateDeltaMeta)
   }
 
   /**
    * Get a ledger delta for a given transaction group.
    */
-  async ledgerStateDeltaForTransactionGroup(id: string): Promise<LedgerStateDelta> {
+  async ledgerStateDeltaForTransactionGroup(id: string, requestOptions?: RequestOptions): Promise<LedgerStateDelta> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<LedgerStateDelta>({
       method: 'GET',
       url: '/v2/deltas/txn/group/{id}',
+      buildUrl: urlBuilders.ledgerStateDeltaForTransactionGroup,
       path: { id: id },
       query: { format: 'msgpack' },
       headers,
       body: undefined,
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, LedgerStateDeltaMeta, this.decodeOptions),
+      operationId: 'ledgerStateDeltaForTransactionGroup',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, LedgerStateDeltaMeta)
   }
 
-  async lightBlockHeaderProof(round: number | bigint): Promise<LightBlockHeaderProof> {
+  async lightBlockHeaderProof(round: number | bigint, requestOptions?: RequestOptions): Promise<LightBlockHeaderProof> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<LightBlockHeaderProof>({
       method: 'GET',
       url: '/v2/blocks/{round}/lightheader/proof',
+      buildUrl: urlBuilders.lightBlockHeaderProof,
       path: { round: round },
       query: {},
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, LightBlockHeaderProofMeta, this.decodeOptions),
+      operationId: 'lightBlockHeaderProof',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, LightBlockHeaderProofMeta)
   }
 
   /**
@@ -384,64 +488,74 @@ export class AlgodApi {
    * - transaction removed from pool due to error (committed round = 0, pool error != "")
    * Or the transaction may have happened sufficiently long ago that the node no longer remembers it, and this will return an error.
    */
-  async pendingTransactionInformation(txId: string): Promise<PendingTransactionResponse> {
+  async pendingTransactionInformation(txId: string, requestOptions?: RequestOptions): Promise<PendingTransactionResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<PendingTransactionResponse>({
       method: 'GET',
       url: '/v2/transactions/pending/{txid}',
+      buildUrl: urlBuilders.pendingTransactionInformation,
       path: { txid: txId },
       query: { format: 'msgpack' },
       headers,
       body: undefined,
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, PendingTransactionResponseMeta, this.decodeOptions),
+      operationId: 'pendingTransactionInformation',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, PendingTransactionResponseMeta)
   }
 
   /**
    * Get the list of pending transactions, sorted by priority, in decreasing order, truncated at the end at MAX. If MAX = 0, returns all pending transactions.
    */
-  async pendingTransactions(params?: { max?: number }): Promise<PendingTransactionsResponse> {
+  async pendingTransactions(params?: { max?: number }, requestOptions?: RequestOptions): Promise<PendingTransactionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<PendingTransactionsResponse>({
       method: 'GET',
       url: '/v2/transactions/pending',
+      buildUrl: urlBuilders.pendingTransactions,
       path: {},
       query: { max: params?.max, format: 'msgpack' },
       headers,
       body: undefined,
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, PendingTransactionsResponseMeta, this.decodeOptions),
+      operationId: 'pendingTransactions',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, PendingTransactionsResponseMeta)
   }
 
   /**
    * Get the list of pending transactions by address, sorted by priority, in decreasing order, truncated at the end at MAX. If MAX = 0, returns all pending transactions.
    */
-  async pendingTransactionsByAddress(address: ReadableAddress, params?: { max?: number }): Promise<PendingTransactionsResponse> {
+  async pendingTransactionsByAddress(
+    address: ReadableAddress,
+    params?: { max?: number },
+    requestOptions?: RequestOptions,
+  ): Promise<PendingTransactionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<PendingTransactionsResponse>({
       method: 'GET',
       url: '/v2/accounts/{address}/transactions/pending',
+      buildUrl: urlBuilders.pendingTransactionsByAddress,
       path: { address: address },
       query: { max: params?.max, format: 'msgpack' },
       headers,
       body: undefined,
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, PendingTransactionsResponseMeta, this.decodeOptions),
+      operationId: 'pendingTransactionsByAddress',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, PendingTransactionsResponseMeta)
   }
 
-  private async _rawTransaction(body: Uint8Array): Promise<PostTransactionsResponse> {
+  private async _rawTransaction(body: Uint8Array, requestOptions?: RequestOptions): Promise<PostTransactionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -450,19 +564,21 @@ export class AlgodApi {
     const mediaType = 'application/x-binary'
     headers['Content-Type'] = mediaType
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<PostTransactionsResponse>({
       method: 'POST',
       url: '/v2/transactions',
+      buildUrl: urlBuilders.rawTransaction,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, PostTransactionsResponseMeta, this.decodeOptions),
+      operationId: 'rawTransaction',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, PostTransactionsResponseMeta)
   }
 
-  async ready(): Promise<void> {
+  async ready(requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -470,17 +586,20 @@ export class AlgodApi {
     await this.httpRequest.request<void>({
       method: 'GET',
       url: '/ready',
+      buildUrl: urlBuilders.ready,
       path: {},
       query: {},
       headers,
       body: undefined,
+      operationId: 'ready',
+      ...requestOptions,
     })
   }
 
   /**
    * Sets the timestamp offset (seconds) for blocks in dev mode. Providing an offset of 0 will unset this value and try to use the real clock for the timestamp.
    */
-  async setBlockTimeStampOffset(offset: number): Promise<void> {
+  async setBlockTimeStampOffset(offset: number, requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -488,17 +607,20 @@ export class AlgodApi {
     await this.httpRequest.request<void>({
       method: 'POST',
       url: '/v2/devmode/blocks/offset/{offset}',
+      buildUrl: urlBuilders.setBlockTimeStampOffset,
       path: { offset: offset },
       query: {},
       headers,
       body: undefined,
+      operationId: 'setBlockTimeStampOffset',
+      ...requestOptions,
     })
   }
 
   /**
    * Sets the minimum sync round on the ledger.
    */
-  async setSyncRound(round: number | bigint): Promise<void> {
+  async setSyncRound(round: number | bigint, requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -506,14 +628,17 @@ export class AlgodApi {
     await this.httpRequest.request<void>({
       method: 'POST',
       url: '/v2/ledger/sync/{round}',
+      buildUrl: urlBuilders.setSyncRound,
       path: { round: round },
       query: {},
       headers,
       body: undefined,
+      operationId: 'setSyncRound',
+      ...requestOptions,
     })
   }
 
-  async simulateTransactions(body: SimulateRequest): Promise<SimulateResponse> {
+  async simulateTransactions(body: SimulateRequest, requestOptions?: RequestOptions): Promise<SimulateResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -523,113 +648,127 @@ export class AlgodApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeMsgpack(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<SimulateResponse>({
       method: 'POST',
       url: '/v2/transactions/simulate',
+      buildUrl: urlBuilders.simulateTransactions,
       path: {},
       query: { format: 'msgpack' },
       headers,
       body: serializedBody,
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, SimulateResponseMeta, this.decodeOptions),
+      operationId: 'simulateTransactions',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, SimulateResponseMeta)
   }
 
-  async stateProof(round: number | bigint): Promise<StateProof> {
+  async stateProof(round: number | bigint, requestOptions?: RequestOptions): Promise<StateProof> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<StateProof>({
       method: 'GET',
       url: '/v2/stateproofs/{round}',
+      buildUrl: urlBuilders.stateProof,
       path: { round: round },
       query: {},
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, StateProofMeta, this.decodeOptions),
+      operationId: 'stateProof',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, StateProofMeta)
   }
 
-  async status(): Promise<NodeStatusResponse> {
+  async status(requestOptions?: RequestOptions): Promise<NodeStatusResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<NodeStatusResponse>({
       method: 'GET',
       url: '/v2/status',
+      buildUrl: urlBuilders.status,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, NodeStatusResponseMeta, this.decodeOptions),
+      operationId: 'status',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, NodeStatusResponseMeta)
   }
 
   /**
    * Waits for a block to appear after round {round} and returns the node's status at the time. There is a 1 minute timeout, when reached the current status is returned regardless of whether or not it is the round after the given round.
    */
-  async statusAfterBlock(round: number | bigint): Promise<NodeStatusResponse> {
+  async statusAfterBlock(round: number | bigint, requestOptions?: RequestOptions): Promise<NodeStatusResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<NodeStatusResponse>({
       method: 'GET',
       url: '/v2/status/wait-for-block-after/{round}',
+      buildUrl: urlBuilders.statusAfterBlock,
       path: { round: round },
       query: {},
       headers,
       body: undefined,
+      longPoll: true,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, NodeStatusResponseMeta, this.decodeOptions),
+      operationId: 'statusAfterBlock',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, NodeStatusResponseMeta)
   }
 
-  async supply(): Promise<SupplyResponse> {
+  async supply(requestOptions?: RequestOptions): Promise<SupplyResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<SupplyResponse>({
       method: 'GET',
       url: '/v2/ledger/supply',
+      buildUrl: urlBuilders.supply,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, SupplyResponseMeta, this.decodeOptions),
+      operationId: 'supply',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, SupplyResponseMeta)
   }
 
   /**
    * Gets the minimum sync round for the ledger.
    */
-  async syncRound(): Promise<GetSyncRoundResponse> {
+  async syncRound(requestOptions?: RequestOptions): Promise<GetSyncRoundResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<GetSyncRoundResponse>({
       method: 'GET',
       url: '/v2/ledger/sync',
+      buildUrl: urlBuilders.syncRound,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, GetSyncRoundResponseMeta, this.decodeOptions),
+      operationId: 'syncRound',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, GetSyncRoundResponseMeta)
   }
 
   /**
    * Given TEAL source code in plain text, return base64 encoded program bytes and base32 SHA512_256 hash of program bytes (Address style). This endpoint is only enabled when a node's configuration file sets EnableDeveloperAPI to true.
    */
-  async tealCompile(body: string, params?: { sourcemap?: boolean }): Promise<CompileResponse> {
+  async tealCompile(body: string, params?: { sourcemap?: boolean }, requestOptions?: RequestOptions): Promise<CompileResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -639,22 +778,24 @@ export class AlgodApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<CompileResponse>({
       method: 'POST',
       url: '/v2/teal/compile',
+      buildUrl: urlBuilders.tealCompile,
       path: {},
       query: { sourcemap: params?.sourcemap },
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, CompileResponseMeta, this.decodeOptions),
+      operationId: 'tealCompile',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, CompileResponseMeta)
   }
 
   /**
    * Given the program bytes, return the TEAL source code in plain text. This endpoint is only enabled when a node's configuration file sets EnableDeveloperAPI to true.
    */
-  async tealDisassemble(body: Uint8Array): Promise<DisassembleResponse> {
+  async tealDisassemble(body: Uint8Array, requestOptions?: RequestOptions): Promise<DisassembleResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -663,76 +804,94 @@ export class AlgodApi {
     const mediaType = 'application/x-binary'
     headers['Content-Type'] = mediaType
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<DisassembleResponse>({
       method: 'POST',
       url: '/v2/teal/disassemble',
+      buildUrl: urlBuilders.tealDisassemble,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, DisassembleResponseMeta, this.decodeOptions),
+      operationId: 'tealDisassemble',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, DisassembleResponseMeta)
   }
 
   /**
    * Get ledger deltas for transaction groups in a given round.
    */
-  async transactionGroupLedgerStateDeltasForRound(round: number | bigint): Promise<TransactionGroupLedgerStateDeltasForRoundResponse> {
+  async transactionGroupLedgerStateDeltasForRound(
+    round: number | bigint,
+    requestOptions?: RequestOptions,
+  ): Promise<TransactionGroupLedgerStateDeltasForRoundResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'msgpack'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Uint8Array>({
+    return this.httpRequest.request<TransactionGroupLedgerStateDeltasForRoundResponse>({
       method: 'GET',
       url: '/v2/deltas/{round}/txn/group',
+      buildUrl: urlBuilders.transactionGroupLedgerStateDeltasForRound,
       path: { round: round },
       query: { format: 'msgpack' },
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Uint8Array) => decodeMsgpack(payload, TransactionGroupLedgerStateDeltasForRoundResponseMeta, this.decodeOptions),
+      operationId: 'transactionGroupLedgerStateDeltasForRound',
+      ...requestOptions,
     })
-
-    return decodeMsgpack(payload, TransactionGroupLedgerStateDeltasForRoundResponseMeta)
   }
 
-  private async _transactionParams(): Promise<TransactionParametersResponse> {
+  private async _transactionParams(requestOptions?: RequestOptions): Promise<TransactionParametersResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<TransactionParametersResponse>({
       method: 'GET',
       url: '/v2/transactions/params',
+      buildUrl: urlBuilders.transactionParams,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, TransactionParametersResponseMeta, this.decodeOptions),
+      operationId: 'transactionParams',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, TransactionParametersResponseMeta)
   }
 
-  async transactionProof(round: number | bigint, txId: string, params?: { hashtype?: 'sha512_256' | 'sha256' }): Promise<TransactionProof> {
+  async transactionProof(
+    round: number | bigint,
+    txId: string,
+    params?: { hashtype?: 'sha512_256' | 'sha256' },
+    requestOptions?: RequestOptions,
+  ): Promise<TransactionProof> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<TransactionProof>({
       method: 'GET',
       url: '/v2/blocks/{round}/transactions/{txid}/proof',
+      buildUrl: urlBuilders.transactionProof,
       path: { round: round, txid: txId },
       query: { hashtype: params?.hashtype },
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, TransactionProofMeta, this.decodeOptions),
+      operationId: 'transactionProof',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, TransactionProofMeta)
   }
 
   /**
    * Unset the ledger sync round.
    */
-  async unsetSyncRound(): Promise<void> {
+  async unsetSyncRound(requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -740,37 +899,43 @@ export class AlgodApi {
     await this.httpRequest.request<void>({
       method: 'DELETE',
       url: '/v2/ledger/sync',
+      buildUrl: urlBuilders.unsetSyncRound,
       path: {},
       query: {},
       headers,
       body: undefined,
+      operationId: 'unsetSyncRound',
+      ...requestOptions,
     })
   }
 
   /**
    * Retrieves the supported API versions, binary build versions, and genesis information.
    */
-  async version(): Promise<Version> {
+  async version(requestOptions?: RequestOptions): Promise<Version> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Version>({
       method: 'GET',
       url: '/versions',
+      buildUrl: urlBuilders.version,
       path: {},
       query: {},
       headers,
       body: undefined,
+      cache: 'slow-changing',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, VersionMeta, this.decodeOptions),
+      operationId: 'version',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, VersionMeta)
   }
 
   /**
    * Send a signed transaction or array of signed transactions to the network.
    */
-  async sendRawTransaction(stxOrStxs: Uint8Array | Uint8Array[]): Promise<PostTransactionsResponse> {
+  async sendRawTransaction(stxOrStxs: Uint8Array | Uint8Array[], requestOptions?: RequestOptions): Promise<PostTransactionsResponse> {
     let rawTransactions = stxOrStxs
     if (Array.isArray(stxOrStxs)) {
       if (!stxOrStxs.every((a) => a instanceof Uint8Array)) {
@@ -780,22 +945,22 @@ export class AlgodApi {
     } else if (!(rawTransactions instanceof Uint8Array)) {
       throw new Error('Argument must be byte array')
     }
-    return this._rawTransaction(rawTransactions)
+    return this._rawTransaction(rawTransactions, requestOptions)
   }
 
   /**
    * Given an application ID and box name, it returns the round, box name, and value.
    */
-  async applicationBoxByName(applicationId: number | bigint, boxName: Uint8Array): Promise<Box> {
+  async applicationBoxByName(applicationId: number | bigint, boxName: Uint8Array, requestOptions?: RequestOptions): Promise<Box> {
     const name = `b64:${Buffer.from(boxName).toString('base64')}`
-    return this._applicationBoxByName(applicationId, { name })
+    return this._applicationBoxByName(applicationId, { name }, requestOptions)
   }
 
   /**
    * Returns the common needed parameters for a new transaction.
    */
-  async suggestedParams(): Promise<SuggestedParams> {
-    const txnParams = await this._transactionParams()
+  async suggestedParams(requestOptions?: RequestOptions): Promise<SuggestedParams> {
+    const txnParams = await this._transactionParams(requestOptions)
 
     return {
       flatFee: false,
@@ -812,21 +977,24 @@ export class AlgodApi {
   /**
    * Returns the common needed parameters for a new transaction.
    */
-  async transactionParams(): Promise<SuggestedParams> {
-    return await this.suggestedParams()
+  async transactionParams(requestOptions?: RequestOptions): Promise<SuggestedParams> {
+    return await this.suggestedParams(requestOptions)
   }
 
   /**
    * Simulate an encoded signed transaction or array of encoded signed transactions.
    */
-  async simulateRawTransactions(stxOrStxs: Uint8Array | Uint8Array[]): Promise<SimulateResponse> {
+  async simulateRawTransactions(stxOrStxs: Uint8Array | Uint8Array[], requestOptions?: RequestOptions): Promise<SimulateResponse> {
     const txns = Array.isArray(stxOrStxs) ? stxOrStxs.map((stxn) => decodeSignedTransaction(stxn)) : [decodeSignedTransaction(stxOrStxs)]
-    return this.simulateTransactions({
-      txnGroups: [
-        {
-          txns,
-        },
-      ],
-    })
+    return this.simulateTransactions(
+      {
+        txnGroups: [
+          {
+            txns,
+          },
+        ],
+      },
+      requestOptions,
+    )
   }
 }
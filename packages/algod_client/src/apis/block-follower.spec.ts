@@ -0,0 +1,133 @@
+import { describe, expect, test, vi } from 'vitest'
+import type { RequestOptions } from '../core/base-http-request'
+import type { BlockResponse } from '../models/index'
+import type { AlgodApi } from './api-service'
+import { FollowedBlock, followBlocks } from './block-follower'
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+const abortable = (ms: number, signal?: AbortSignal) =>
+  new Promise<void>((resolve, reject) => {
+    const timer = setTimeout(resolve, ms)
+    signal?.addEventListener('abort', () => {
+      clearTimeout(timer)
+      reject(signal.reason)
+    })
+  })
+
+// A node at `lastRound` that makes a new round every time one is waited for, and takes longer to return earlier blocks
+// (so later blocks arrive first)
+const fakeAlgod = (lastRound = 100n) => {
+  let inFlight = 0
+  const node = {
+    lastRound,
+    maxInFlight: 0,
+    failing: new Set<bigint>(),
+    status: vi.fn(async () => ({ lastRound: node.lastRound })),
+    statusAfterBlock: vi.fn(async (round: number | bigint, requestOptions?: RequestOptions) => {
+      await abortable(5, requestOptions?.signal)
+      if (node.lastRound <= BigInt(round)) node.lastRound = BigInt(round) + 1n
+      return { lastRound: node.lastRound }
+    }),
+    block: vi.fn(async (round: number | bigint, _params?: { headerOnly?: boolean }, requestOptions?: RequestOptions) => {
+      node.maxInFlight = Math.max(node.maxInFlight, ++inFlight)
+      try {
+        await abortable(Math.max(1, 10 - (Number(round) % 10)), requestOptions?.signal)
+        if (node.failing.has(BigInt(round))) throw new Error(`block ${round} failed`)
+        return { block: { header: { round: BigInt(round) } } } as unknown as BlockResponse
+      } finally {
+        inFlight -= 1
+      }
+    }),
+  }
+  return { node, algod: node as unknown as AlgodApi }
+}
+
+const collect = async (blocks: AsyncIterable<FollowedBlock>) => {
+  const rounds: bigint[] = []
+  for await (const { round, block } of blocks) {
+    expect((block.block as unknown as { header: { round: bigint } }).header.round).toBe(round)
+    rounds.push(round)
+  }
+  return rounds
+}
+
+describe('followBlocks', () => {
+  test('catches up in round order, fetching up to prefetchRounds blocks at a time', async () => {
+    const { node, algod } = fakeAlgod()
+
+    const rounds = await collect(followBlocks(algod, { startRound: 81, endRound: 100, prefetchRounds: 4 }))
+
+    expect(rounds).toEqual(Array.from({ length: 20 }, (_, i) => BigInt(81 + i)))
+    expect(node.maxInFlight).toBe(4)
+    expect(node.statusAfterBlock).not.toHaveBeenCalled()
+  })
+
+  test('starts after the last round by default, and waits for each new round at the tip', async () => {
+    const { node, algod } = fakeAlgod()
+
+    const rounds = await collect(followBlocks(algod, { endRound: 103 }))
+
+    expect(rounds).toEqual([101n, 102n, 103n])
+    expect(node.statusAfterBlock.mock.calls.map(([round]) => round)).toEqual([100n, 101n, 102n])
+  })
+
+  test('only fetches blocks as a slow consumer makes room for them', async () => {
+    const { node, algod } = fakeAlgod()
+
+    for await (const { round } of followBlocks(algod, { startRound: 51, prefetchRounds: 3 })) {
+      await sleep(20)
+      expect(node.block.mock.calls.length).toBeLessThanOrEqual(Number(round - 51n) + 4)
+      if (round === 55n) break
+    }
+  })
+
+  test('passes headerOnly on to the block requests', async () => {
+    const { node, algod } = fakeAlgod()
+
+    await collect(followBlocks(algod, { startRound: 99, endRound: 100, headerOnly: true }))
+
+    expect(node.block.mock.calls.map(([, params]) => params)).toEqual([{ headerOnly: true }, { headerOnly: true }])
+  })
+
+  test('throws the error of a block that fails once the blocks before it are delivered', async () => {
+    const { node, algod } = fakeAlgod()
+    node.failing.add(95n)
+    const rounds: bigint[] = []
+
+    await expect(
+      (async () => {
+        for await (const { round } of followBlocks(algod, { startRound: 91, endRound: 100 })) rounds.push(round)
+      })(),
+    ).rejects.toThrow('block 95 failed')
+    expect(rounds).toEqual([91n, 92n, 93n, 94n])
+  })
+
+  test('abandons the blocks being prefetched when the consumer stops early', async () => {
+    const { node, algod } = fakeAlgod()
+
+    for await (const { round } of followBlocks(algod, { startRound: 1, prefetchRounds: 8 })) {
+      expect(round).toBe(1n)
+      break
+    }
+    const signals = node.block.mock.calls.map(([, , requestOptions]) => requestOptions?.signal)
+
+    expect(signals).toHaveLength(8)
+    expect(signals.every((signal) => signal?.aborted)).toBe(true)
+    await sleep(20)
+    expect(node.block).toHaveBeenCalledTimes(8)
+  })
+
+  test('stops following without an error when the caller aborts', async () => {
+    const { algod } = fakeAlgod()
+    const controller = new AbortController()
+    const rounds: bigint[] = []
+
+    for await (const { round } of followBlocks(algod, { requestOptions: { signal: controller.signal } })) {
+      rounds.push(round)
+      if (round === 102n) controller.abort()
+    }
+
+    expect(rounds).toEqual([101n, 102n])
+  })
+})
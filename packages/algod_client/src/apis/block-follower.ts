@@ -0,0 +1,104 @@
+import type { RequestOptions } from '../core/base-http-request'
+import type { BlockResponse } from '../models/index'
+import type { AlgodApi } from './api-service'
+
+export interface BlockFollowerOptions {
+  /** The first round to deliver. Defaults to the round after the node's last round, i.e. the next block to be made. */
+  startRound?: number | bigint
+  /** The last round to deliver. Defaults to following the chain indefinitely. */
+  endRound?: number | bigint
+  /**
+   * The number of rounds requested ahead of the round being delivered while catching up; this also caps how many fetched
+   * blocks wait for the consumer. Defaults to 8.
+   */
+  prefetchRounds?: number
+  /** Only fetch the block headers. Defaults to `false`. */
+  headerOnly?: boolean
+  /** Options for each request; its `signal` stops following */
+  requestOptions?: RequestOptions
+}
+
+/** A block delivered by `followBlocks`. */
+export interface FollowedBlock {
+  /** The round of the block */
+  round: bigint
+  /** The block */
+  block: BlockResponse
+}
+
+export const DEFAULT_BLOCK_FOLLOWER_OPTIONS: Required<Pick<BlockFollowerOptions, 'prefetchRounds' | 'headerOnly'>> = {
+  prefetchRounds: 8,
+  headerOnly: false,
+}
+
+/**
+ * Follows the chain, delivering each block strictly in round order.
+ *
+ * While catching up, up to `prefetchRounds` blocks after the one being delivered are requested (and decoded) concurrently,
+ * so catching up isn't bound to one round trip per round and decoding happens while earlier blocks are being consumed.
+ * Once it reaches the node's last round it long-polls with `statusAfterBlock` for the next one. Blocks are only requested
+ * as the consumer makes room in the window, so a slow consumer holds back fetching rather than blocks piling up.
+ *
+ * Stop following by breaking out of the loop or aborting `requestOptions.signal`; blocks still being prefetched are then
+ * abandoned.
+ *
+ * @example
+ * ```typescript
+ * for await (const { round, block } of followBlocks(algod, { startRound: 1000n })) {
+ *   await processBlock(round, block)
+ * }
+ * ```
+ */
+export async function* followBlocks(algod: AlgodApi, options: BlockFollowerOptions = {}): AsyncGenerator<FollowedBlock> {
+  const { prefetchRounds, headerOnly } = { ...DEFAULT_BLOCK_FOLLOWER_OPTIONS, ...options }
+  const endRound = options.endRound === undefined ? undefined : BigInt(options.endRound)
+
+  // Prefetches are abandoned once the consumer stops, as well as when the caller aborts
+  const abort = new AbortController()
+  const callerSignal = options.requestOptions?.signal
+  const onCallerAbort = () => abort.abort(callerSignal?.reason)
+  if (callerSignal?.aborted) onCallerAbort()
+  callerSignal?.addEventListener('abort', onCallerAbort)
+  const requestOptions: RequestOptions = { ...options.requestOptions, signal: abort.signal }
+
+  const window = new Map<bigint, Promise<BlockResponse>>()
+  try {
+    let lastRound = BigInt((await algod.status(requestOptions)).lastRound)
+    let round = options.startRound === undefined ? lastRound + 1n : BigInt(options.startRound)
+    let nextToRequest = round
+
+    while (!abort.signal.aborted && (endRound === undefined || round <= endRound)) {
+      // Fill the window with the rounds the node already has
+      while (
+        nextToRequest < round + BigInt(Math.max(1, prefetchRounds)) &&
+        nextToRequest <= lastRound &&
+        (endRound === undefined || nextToRequest <= endRound)
+      ) {
+        const block = algod.block(nextToRequest, { headerOnly }, requestOptions)
+        // Failures surface when the round is delivered
+        block.catch(() => {})
+        window.set(nextToRequest, block)
+        nextToRequest += 1n
+      }
+
+      const pending = window.get(round)
+      if (!pending) {
+        // At the tip: wait for the node to make the next round
+        const status = await algod.statusAfterBlock(round - 1n, requestOptions)
+        if (BigInt(status.lastRound) > lastRound) lastRound = BigInt(status.lastRound)
+        continue
+      }
+
+      const block = await pending
+      window.delete(round)
+      yield { round, block }
+      round += 1n
+    }
+  } catch (e) {
+    // Aborting just stops following
+    if (!abort.signal.aborted) throw e
+  } finally {
+    callerSignal?.removeEventListener('abort', onCallerAbort)
+    abort.abort()
+  }
+}
@@ -1,2 +1,4 @@
 // Barrel file for services
 export { AlgodApi } from './api-service'
+export * from './block-follower'
+export * from './suggested-params-provider'
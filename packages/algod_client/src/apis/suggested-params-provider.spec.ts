@@ -0,0 +1,117 @@
+import { describe, expect, test, vi } from 'vitest'
+import type { SuggestedParams } from '../models/index'
+import type { AlgodApi } from './api-service'
+import { SuggestedParamsProvider } from './suggested-params-provider'
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+// A node whose suggested params move on by a round on every fetch
+const fakeAlgod = () => {
+  let round = 100n
+  const algod = {
+    suggestedParams: vi.fn(async () => ({ firstValid: ++round, lastValid: round + 1000n, minFee: 1000n }) as unknown as SuggestedParams),
+    statusAfterBlock: vi.fn(async (after: number | bigint, options?: { signal?: AbortSignal }) => {
+      await new Promise((resolve, reject) => {
+        const timer = setTimeout(resolve, 5)
+        options?.signal?.addEventListener('abort', () => {
+          clearTimeout(timer)
+          reject(options.signal!.reason)
+        })
+      })
+      return { lastRound: BigInt(after) + 1n }
+    }),
+  }
+  return { algod: algod as unknown as AlgodApi, fake: algod }
+}
+
+describe('SuggestedParamsProvider', () => {
+  test('serves fresh params from memory', async () => {
+    const { algod, fake } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod)
+
+    const first = await provider.get()
+    const second = await provider.get()
+
+    expect(second).toEqual(first)
+    expect(second).not.toBe(first)
+    expect(fake.suggestedParams).toHaveBeenCalledTimes(1)
+    expect(provider.stats).toEqual({ hits: 1, staleHits: 0, misses: 1, refreshes: 1, refreshErrors: 0 })
+  })
+
+  test('serves stale params while refreshing them in the background', async () => {
+    const { algod, fake } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod, { maxAgeMs: 5, staleWhileRevalidateMs: 1_000 })
+
+    await provider.get()
+    await sleep(10)
+    const [stale, alsoStale] = await Promise.all([provider.get(), provider.get()])
+
+    expect(stale.firstValid).toBe(101n)
+    expect(alsoStale.firstValid).toBe(101n)
+    await vi.waitFor(() => expect(fake.suggestedParams).toHaveBeenCalledTimes(2))
+    expect((await provider.get()).firstValid).toBe(102n)
+    expect(provider.stats).toMatchObject({ hits: 1, staleHits: 2, misses: 1, refreshes: 2 })
+  })
+
+  test('waits for a refresh once the params are too stale to serve', async () => {
+    const { algod } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod, { maxAgeMs: 1, staleWhileRevalidateMs: 1 })
+
+    await provider.get()
+    await sleep(10)
+
+    expect((await provider.get()).firstValid).toBe(102n)
+    expect(provider.stats).toMatchObject({ staleHits: 0, misses: 2 })
+  })
+
+  test('shares a refresh between concurrent callers', async () => {
+    const { algod, fake } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod)
+
+    await Promise.all([provider.get(), provider.get(), provider.refresh()])
+
+    expect(fake.suggestedParams).toHaveBeenCalledTimes(1)
+  })
+
+  test("doesn't fail the callers sharing a refresh when one of them aborts", async () => {
+    const { algod, fake } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod)
+    const controller = new AbortController()
+
+    const aborted = provider.get({ signal: controller.signal, timeoutMs: 1_000 })
+    const other = provider.get()
+    controller.abort(new Error('cancelled'))
+
+    await expect(aborted).rejects.toThrow('cancelled')
+    await expect(other).resolves.toMatchObject({ firstValid: 101n })
+    expect(fake.suggestedParams).toHaveBeenCalledTimes(1)
+    expect(fake.suggestedParams).toHaveBeenCalledWith({ timeoutMs: 1_000 })
+  })
+
+  test('keeps serving stale params when a background refresh fails', async () => {
+    const { algod, fake } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod, { maxAgeMs: 5 })
+
+    await provider.get()
+    await sleep(10)
+    fake.suggestedParams.mockRejectedValueOnce(new Error('unavailable'))
+
+    expect((await provider.get()).firstValid).toBe(101n)
+    await vi.waitFor(() => expect(provider.stats.refreshErrors).toBe(1))
+    expect((await provider.get()).firstValid).toBe(101n)
+  })
+
+  test('refreshes the params on each new round until closed', async () => {
+    const { algod, fake } = fakeAlgod()
+    const provider = new SuggestedParamsProvider(algod, { refreshOnNewRound: true })
+
+    await provider.get()
+    await vi.waitFor(() => expect(fake.suggestedParams.mock.calls.length).toBeGreaterThanOrEqual(3))
+    provider.close()
+    const refreshes = fake.suggestedParams.mock.calls.length
+    await sleep(20)
+
+    expect(fake.suggestedParams).toHaveBeenCalledTimes(refreshes)
+    expect(fake.statusAfterBlock.mock.calls[0][0]).toBe(101n)
+  })
+})
@@ -0,0 +1,165 @@
+import type { RequestOptions } from '../core/base-http-request'
+import type { SuggestedParams } from '../models/index'
+import type { AlgodApi } from './api-service'
+
+export interface SuggestedParamsProviderOptions {
+  /** How long fetched params are served as fresh, in milliseconds. Defaults to 3 seconds. */
+  maxAgeMs?: number
+  /**
+   * How much longer than `maxAgeMs` the params are still served while they're refreshed in the background, in milliseconds.
+   * Callers past this wait for the refresh. Defaults to 30 seconds.
+   */
+  staleWhileRevalidateMs?: number
+  /**
+   * Refreshes the params in the background each time the node reaches a new round, so `firstValid` keeps up with the
+   * chain without callers waiting. Follows the rounds with `statusAfterBlock` until `close()` is called. Defaults to `false`.
+   */
+  refreshOnNewRound?: boolean
+}
+
+/** Counters describing how suggested params were served. */
+export interface SuggestedParamsProviderStats {
+  /** Calls served with fresh params */
+  hits: number
+  /** Calls served with stale params while a refresh was in flight */
+  staleHits: number
+  /** Calls that waited for params to be fetched */
+  misses: number
+  /** Fetches of `/v2/transactions/params` */
+  refreshes: number
+  /** Background refreshes that failed; the stale params keep being served until they expire */
+  refreshErrors: number
+}
+
+export const DEFAULT_SUGGESTED_PARAMS_PROVIDER_OPTIONS: Required<SuggestedParamsProviderOptions> = {
+  maxAgeMs: 3_000,
+  staleWhileRevalidateMs: 30_000,
+  refreshOnNewRound: false,
+}
+
+// Waits for the promise, but rejects with the signal's reason as soon as the signal is aborted
+const untilAborted = <T>(promise: Promise<T>, signal: AbortSignal): Promise<T> =>
+  new Promise<T>((resolve, reject) => {
+    const onAbort = () => reject(signal.reason)
+    if (signal.aborted) return onAbort()
+    signal.addEventListener('abort', onAbort, { once: true })
+    promise.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort))
+  })
+
+/**
+ * Serves suggested params from memory with stale-while-revalidate semantics, so building transactions doesn't need a
+ * request to `/v2/transactions/params` each time.
+ *
+ * Fresh params are served as is. Once they're older than `maxAgeMs`, they're still served (for up to
+ * `staleWhileRevalidateMs` more) while a single refresh runs in the background; concurrent callers share that refresh.
+ *
+ * @example
+ * ```typescript
+ * const provider = new SuggestedParamsProvider(algod, { refreshOnNewRound: true })
+ * const composer = new TransactionComposer({ algod, getSuggestedParams: () => provider.get() })
+ * // ...
+ * provider.close()
+ * ```
+ */
+export class SuggestedParamsProvider {
+  private readonly options: Required<SuggestedParamsProviderOptions>
+  private params?: SuggestedParams
+  private fetchedAt = 0
+  private refreshing?: Promise<SuggestedParams>
+  private following?: AbortController
+  private closed = false
+  private counters: SuggestedParamsProviderStats = { hits: 0, staleHits: 0, misses: 0, refreshes: 0, refreshErrors: 0 }
+
+  constructor(private readonly algod: AlgodApi, options: SuggestedParamsProviderOptions = {}) {
+    this.options = { ...DEFAULT_SUGGESTED_PARAMS_PROVIDER_OPTIONS, ...options }
+  }
+
+  /** A snapshot of the counters. */
+  get stats(): SuggestedParamsProviderStats {
+    return { ...this.counters }
+  }
+
+  /** Resets the counters. */
+  resetStats(): void {
+    this.counters = { hits: 0, staleHits: 0, misses: 0, refreshes: 0, refreshErrors: 0 }
+  }
+
+  /**
+   * Returns the suggested params, fetching them only if there are none that can be served.
+   * @param requestOptions Options for the request, if the params have to be fetched
+   * @returns A copy of the suggested params
+   */
+  async get(requestOptions?: RequestOptions): Promise<SuggestedParams> {
+    if (this.options.refreshOnNewRound && !this.following && !this.closed) {
+      this.followRounds()
+    }
+
+    const age = performance.now() - this.fetchedAt
+    if (this.params && age <= this.options.maxAgeMs) {
+      this.counters.hits += 1
+      return { ...this.params }
+    }
+    if (this.params && age <= this.options.maxAgeMs + this.options.staleWhileRevalidateMs) {
+      this.counters.staleHits += 1
+      this.refresh().catch(() => {
+        this.counters.refreshErrors += 1
+      })
+      return { ...this.params }
+    }
+    this.counters.misses += 1
+    return { ...(await this.refresh(requestOptions)) }
+  }
+
+  /**
+   * Fetches the suggested params, sharing a refresh that's already in flight.
+   *
+   * The shared refresh isn't tied to any caller's `signal`: aborting only stops that caller waiting for it.
+   * @param requestOptions Options for the request; the `signal` only applies to this caller's wait
+   * @returns The fetched params
+   */
+  refresh(requestOptions?: RequestOptions): Promise<SuggestedParams> {
+    const { signal, ...sharedOptions } = requestOptions ?? {}
+    this.refreshing ??= (async () => {
+      try {
+        this.counters.refreshes += 1
+        const params = await this.algod.suggestedParams(sharedOptions)
+        this.params = params
+        this.fetchedAt = performance.now()
+        return params
+      } finally {
+        this.refreshing = undefined
+      }
+    })()
+    return signal ? untilAborted(this.refreshing, signal) : this.refreshing
+  }
+
+  /** Stops following rounds (see `refreshOnNewRound`) and forgets the cached params; later calls fetch params as needed. */
+  close(): void {
+    this.closed = true
+    this.following?.abort()
+    this.following = undefined
+    this.params = undefined
+    this.fetchedAt = 0
+  }
+
+  private followRounds() {
+    const following = new AbortController()
+    this.following = following
+    void (async () => {
+      while (!following.signal.aborted) {
+        try {
+          const round = this.params?.firstValid ?? (await this.refresh()).firstValid
+          const status = await this.algod.statusAfterBlock(round, { signal: following.signal })
+          if (!following.signal.aborted && status.lastRound > round) {
+            await this.refresh()
+          }
+        } catch {
+          if (following.signal.aborted) return
+          this.counters.refreshErrors += 1
+          // Back off before following again, so an unreachable node isn't polled in a tight loop
+          await new Promise((resolve) => setTimeout(resolve, this.options.maxAgeMs))
+        }
+      }
+    })()
+  }
+}
@@ -2,8 +2,9 @@ export class ApiError<T = unknown> extends Error {
   public readonly url: string
   public readonly status: number
   public readonly body: T | undefined
+  public readonly headers: Headers | undefined
 
-  constructor(url: string, status: number, body?: T) {
+  constructor(url: string, status: number, body?: T, headers?: Headers) {
     let message = `Request to ${url} failed with status ${status}`
     if (body && typeof body === 'object' && 'message' in body && body.message) {
       message += `: ${body.message}`
@@ -13,5 +14,23 @@ export class ApiError<T = unknown> extends Error {
     this.url = url
     this.status = status
     this.body = body
+    this.headers = headers
+  }
+}
+
+/**
+ * Thrown when a request attempt doesn't complete within its timeout.
+ * It's retried like other transient network errors (`code` is `ETIMEDOUT`).
+ */
+export class RequestTimeoutError extends Error {
+  public readonly url: string
+  public readonly timeoutMs: number
+  public readonly code = 'ETIMEDOUT'
+
+  constructor(url: string, timeoutMs: number) {
+    super(`Request to ${url} timed out after ${timeoutMs}ms`)
+    this.name = 'RequestTimeoutError'
+    this.url = url
+    this.timeoutMs = timeoutMs
   }
 }
@@ -0,0 +1,111 @@
+import { describe, expect, test } from 'vitest'
+import { AlgodApi } from '../apis/api-service'
+import { BaseHttpRequest, compileUrl, inputValueAsString, type ApiRequestOptions } from './base-http-request'
+
+type Path = Parameters<ReturnType<typeof compileUrl>>[0]
+type Query = Parameters<ReturnType<typeof compileUrl>>[1]
+
+// How request URLs were built before they were compiled per operation
+const previousUrl = (template: string, path: Path, query: Query): URL => {
+  let rawPath = template.endsWith('/') ? template.slice(0, -1) : template
+  for (const [key, value] of Object.entries(path ?? {})) {
+    rawPath = rawPath.replace(`{${key}}`, encodeURI(inputValueAsString(value)).replace(/%5B/g, '[').replace(/%5D/g, ']'))
+  }
+  const url = new URL(rawPath, 'http://localhost')
+  for (const [key, value] of Object.entries(query ?? {})) {
+    if (value === undefined || value === null) continue
+    url.searchParams.set(key, Array.isArray(value) ? value.map((v) => inputValueAsString(v)).join(',') : inputValueAsString(value))
+  }
+  return url
+}
+
+// Builds the URL both ways and checks they address the same resource
+const expectParity = (template: string, path: Path, query: Query) => {
+  const built = compileUrl(template, Object.keys(query ?? {}))(path, query)
+  const url = new URL(built, 'http://localhost')
+  const previous = previousUrl(template, path, query)
+
+  expect(url.pathname).toBe(previous.pathname)
+  expect([...url.searchParams]).toEqual([...previous.searchParams])
+  return built
+}
+
+// Answers every request with the given payload, as a custom request implementation would
+class StubHttpRequest extends BaseHttpRequest {
+  readonly requests: ApiRequestOptions[] = []
+
+  constructor(private readonly payload: unknown) {
+    super({ baseUrl: 'http://localhost' })
+  }
+
+  protected async fetchPayload(options: ApiRequestOptions): Promise<unknown> {
+    this.requests.push(options)
+    return this.payload
+  }
+}
+
+describe('BaseHttpRequest', () => {
+  test('decodes the payload of a custom request implementation into the response model', async () => {
+    const httpRequest = new StubHttpRequest({ 'last-round': 101, 'time-since-last-round': 0 })
+
+    const status = await new AlgodApi(httpRequest).statusAfterBlock(100)
+
+    expect(status).toMatchObject({ lastRound: 101n, timeSinceLastRound: 0n })
+    expect(httpRequest.requests).toMatchObject([{ method: 'GET', operationId: 'statusAfterBlock' }])
+  })
+
+  test('returns the payload as is for requests without a decoder', async () => {
+    const httpRequest = new StubHttpRequest({ raw: true })
+
+    await expect(httpRequest.request({ method: 'GET', url: '/raw' })).resolves.toEqual({ raw: true })
+  })
+})
+
+describe('compileUrl', () => {
+  test('encodes path values, keeping square brackets', () => {
+    expect(expectParity('/v2/accounts/{address}/assets/{asset-id}', { address: 'A B[0]é', 'asset-id': 1234n }, {})).toBe(
+      '/v2/accounts/A%20B[0]%C3%A9/assets/1234',
+    )
+  })
+
+  test('uses the address of address values', () => {
+    const address = { addr: { toString: () => 'ADDRESS' } } as unknown as NonNullable<Path>[string]
+
+    expect(expectParity('/v2/accounts/{address}', { address }, { 'auth-addr': address })).toBe('/v2/accounts/ADDRESS?auth-addr=ADDRESS')
+  })
+
+  test('joins array query values with commas', () => {
+    expect(expectParity('/v2/transactions', {}, { 'tx-type': ['pay', 'axfer'], round: [1n, 2] })).toBe(
+      '/v2/transactions?tx-type=pay%2Caxfer&round=1%2C2',
+    )
+  })
+
+  test('skips undefined and null query values', () => {
+    const query = { limit: 10, next: undefined, 'include-all': false, prefix: null } as unknown as Query
+
+    expect(expectParity('/v2/assets', {}, query)).toBe('/v2/assets?limit=10&include-all=false')
+    expect(expectParity('/v2/assets', {}, { next: undefined })).toBe('/v2/assets')
+  })
+
+  test('encodes query values as URI components', () => {
+    expect(expectParity('/v2/transactions', {}, { 'note-prefix': 'a+b/c=d&e', 'x y': 'z' })).toBe(
+      '/v2/transactions?note-prefix=a%2Bb%2Fc%3Dd%26e&x%20y=z',
+    )
+  })
+
+  test('strips a trailing slash from the template', () => {
+    expect(expectParity('/v2/teal/compile/', {}, { sourcemap: true })).toBe('/v2/teal/compile?sourcemap=true')
+  })
+
+  test('leaves placeholders without a path value in place', () => {
+    expect(expectParity('/v2/blocks/{round}/hash', {}, {})).toBe('/v2/blocks/{round}/hash')
+    expect(expectParity('/v2/blocks/{round}/txids/{txid}', { txid: 'T' }, {})).toBe('/v2/blocks/{round}/txids/T')
+  })
+
+  test('appends the query values in the order of the compiled names, ignoring others', () => {
+    const buildUrl = compileUrl('/v2/accounts', ['limit', 'next'])
+
+    expect(buildUrl({}, { next: 'abc', other: 1, limit: 5 })).toBe('/v2/accounts?limit=5&next=abc')
+    expect(buildUrl(undefined, undefined)).toBe('/v2/accounts')
+  })
+})
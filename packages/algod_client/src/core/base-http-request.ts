@@ -1,5 +1,7 @@
 import { ReadableAddress } from '@algorandfoundation/algokit-common'
 import type { ClientConfig } from './client-config'
+import type { OperationMetrics } from './instrumentation'
+import type { CachePolicy } from './response-cache'
 
 type PathValue = string | number | bigint | ReadableAddress
 type QueryValue = string | number | bigint | boolean | ReadableAddress
@@ -7,18 +9,63 @@ type QueryParams = Record<string, QueryValue | QueryValue[] | undefined>
 
 type BodyValue = Uint8Array | Record<string, unknown> | unknown[] | string | number | boolean | null
 
-export interface ApiRequestOptions {
+/** Per-call options accepted by every generated service method. */
+export interface RequestOptions {
+  /** Aborts the request, including any pending retries, when signalled */
+  signal?: AbortSignal
+  /** Timeout for each attempt in milliseconds; overrides the client's `timeoutMs` and `operationTimeouts` */
+  timeoutMs?: number
+  /** The scheduler lane for this request; defaults to the client's `priority` */
+  priority?: string
+  /** The number of times to retry the request on a transient error; overrides the client's `maxRetries` */
+  maxRetries?: number
+}
+
+export interface ApiRequestOptions extends RequestOptions {
+  /** The name of the service method that issued the request, e.g. `block` */
+  operationId?: string
   method: string
   url: string
   path?: Record<string, PathValue>
   query?: QueryParams
   headers?: Record<string, string>
   body?: BodyValue
+  /** Marks the response as cacheable by the client's response cache, if one is configured */
+  cache?: CachePolicy
+  /** Marks a long poll, which waits on the server for something to happen (e.g. the next round) before responding */
+  longPoll?: boolean
+  /** Builds the path and query string from `path` and `query`; generated services pass one compiled per operation */
+  buildUrl?: UrlBuilder
+  /**
+   * Decodes the response payload into the value the request resolves to. Applied to every caller's copy of the payload,
+   * after the response cache and request coalescing, and timed by the client's instrumentation.
+   */
+  decode?: (payload: never) => unknown
+  /** Collects the metrics of the call; set by the client when instrumentation is configured */
+  metrics?: OperationMetrics
 }
 
+/**
+ * Sends the requests of a generated service.
+ *
+ * Subclasses implement `fetchPayload`, which resolves to the raw response payload; `request` decodes it with the
+ * request's `decode`, so a custom subclass returns the same models as the built-in `FetchHttpRequest`. A subclass that
+ * overrides `request` has to apply `decode` itself.
+ */
 export abstract class BaseHttpRequest {
   constructor(public readonly config: ClientConfig) {}
-  abstract request<T>(options: ApiRequestOptions): Promise<T>
+
+  /** Sends the request and resolves to its response, decoded with `options.decode` if the request has one. */
+  async request<T>(options: ApiRequestOptions): Promise<T> {
+    const payload = await this.fetchPayload(options)
+    return (options.decode ? options.decode(payload as never) : payload) as T
+  }
+
+  /**
+   * Sends the request and resolves to its raw response payload: the parsed body of a JSON response, the body bytes of
+   * a msgpack or binary response and `undefined` for an empty response.
+   */
+  protected abstract fetchPayload(options: ApiRequestOptions): Promise<unknown>
 }
 
 export const inputValueAsString = (value: PathValue | QueryValue): string => {
@@ -27,3 +74,70 @@ export const inputValueAsString = (value: PathValue | QueryValue): string => {
   }
   return value.toString()
 }
+
+/** Builds the path and query string of a request URL from its path and query parameters. */
+export type UrlBuilder = (path: Record<string, PathValue> | undefined, query: QueryParams | undefined) => string
+
+const encodePathValue = (value: PathValue): string => encodeURI(inputValueAsString(value)).replace(/%5B/g, '[').replace(/%5D/g, ']')
+
+const encodeQueryValue = (value: QueryValue | QueryValue[]): string =>
+  encodeURIComponent(Array.isArray(value) ? value.map((v) => inputValueAsString(v)).join(',') : inputValueAsString(value))
+
+/**
+ * Compiles a URL template (e.g. `/v2/accounts/{address}`) and its query parameter names into a `UrlBuilder`, so that
+ * building each request's URL is just string concatenation.
+ * @param template The URL path template, with path parameters in braces
+ * @param queryNames The query parameters, in the order they're appended to the URL
+ */
+export function compileUrl(template: string, queryNames: readonly string[] = []): UrlBuilder {
+  // Alternates between static segments and path parameter names, e.g. ['/v2/accounts/', 'address', '']
+  const parts = (template.endsWith('/') ? template.slice(0, -1) : template).split(/\{([^}]+)\}/)
+  const encodedQueryNames = queryNames.map((name) => encodeURIComponent(name))
+
+  return (path, query) => {
+    let url = parts[0]
+    for (let i = 1; i < parts.length; i += 2) {
+      const value = path?.[parts[i]]
+      url += (value === undefined ? `{${parts[i]}}` : encodePathValue(value)) + parts[i + 1]
+    }
+    let separator = '?'
+    for (let i = 0; i < queryNames.length; i++) {
+      const value = query?.[queryNames[i]]
+      if (value === undefined || value === null) continue
+      url += `${separator}${encodedQueryNames[i]}=${encodeQueryValue(value)}`
+      separator = '&'
+    }
+    return url
+  }
+}
+
+const IDEMPOTENT_METHODS = ['GET', 'HEAD']
+
+/** Whether the request is safe to repeat or share, i.e. a `GET` or `HEAD` request. */
+export const isIdempotentRequest = (options: ApiRequestOptions): boolean =>
+  IDEMPOTENT_METHODS.includes(options.method.toUpperCase())
+
+const sortedEntries = (record: Record<string, unknown> | undefined): [string, unknown][] =>
+  Object.entries(record ?? {})
+    .filter(([, value]) => value !== undefined && value !== null)
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0))
+
+const keyValue = (value: unknown): string => {
+  if (Array.isArray(value)) {
+    return value.map((v) => keyValue(v)).join(',')
+  }
+  return inputValueAsString(value as PathValue | QueryValue)
+}
+
+/**
+ * A stable identity for a request, built from its method, URL template, path and query parameters and headers
+ * (including `Accept`). The request body is not part of the key.
+ */
+export const requestKey = (options: ApiRequestOptions): string => {
+  const path = sortedEntries(options.path).map(([k, v]) => `${k}=${keyValue(v)}`)
+  const query = sortedEntries(options.query).map(([k, v]) => `${k}=${keyValue(v)}`)
+  const headers = Object.entries(options.headers ?? {})
+    .map(([k, v]) => `${k.toLowerCase()}=${v}`)
+    .sort()
+  return [options.method.toUpperCase(), options.url, path.join('&'), query.join('&'), headers.join('&')].join('\n')
+}
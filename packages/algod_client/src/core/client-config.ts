@@ -1,4 +1,11 @@
 import { Logger } from '@algorandfoundation/algokit-common'
+import type { EndpointPool } from './endpoint-pool'
+import type { HttpTransport } from './http-transport'
+import type { RequestInstrumentation } from './instrumentation'
+import type { RequestCoalescer } from './request-coalescer'
+import type { RequestHedger } from './request-hedger'
+import type { RequestScheduler } from './request-scheduler'
+import type { ResponseCache } from './response-cache'
 
 export interface ClientConfig {
   baseUrl: string
@@ -8,4 +15,56 @@ export interface ClientConfig {
   /** Optional override for retry attempts. Defaults to 4 retries. Set to 0 to disable retries. */
   maxRetries?: number
   logger?: Logger
+  /**
+   * Opt-in coalescing of concurrent identical `GET`/`HEAD` requests into a single HTTP round trip.
+   * Pass `true` to use a coalescer owned by this client, or a `RequestCoalescer` instance to share it (and its stats).
+   */
+  coalesceRequests?: boolean | RequestCoalescer
+  /**
+   * Optional cache for the responses of operations tagged as cacheable (e.g. blocks, genesis, asset params).
+   * Use `LruResponseCache` or provide your own `ResponseCache` implementation.
+   */
+  responseCache?: ResponseCache
+  /**
+   * Optional `fetch`-compatible function used to send requests, e.g. `createPooledTransport()` (from the Node.js only `node`
+   * entry point) for tuned keep-alive connection pooling and TLS session reuse. Defaults to the global `fetch`.
+   */
+  transport?: HttpTransport
+  /**
+   * Optional undici `Dispatcher` (e.g. an `Agent` or `Pool`) passed through to Node.js' built-in `fetch`,
+   * to tune connection reuse, sockets per host and pipelining without replacing the transport.
+   */
+  dispatcher?: unknown
+  /**
+   * Optional scheduler that limits requests in flight, rate limits them and dispatches them by priority lane.
+   * Share one scheduler between clients that talk to the same node so they respect the same limits.
+   */
+  scheduler?: RequestScheduler
+  /** The scheduler lane used for requests from this client, e.g. `'interactive'` or `'background'`. */
+  priority?: string
+  /** Optional timeout for each request attempt in milliseconds; timed out attempts are retried. Defaults to no timeout. */
+  timeoutMs?: number
+  /** Optional per-operation attempt timeouts in milliseconds, keyed by service method name, e.g. `{ statusAfterBlock: 70_000 }`. */
+  operationTimeouts?: Record<string, number>
+  /**
+   * Opt-in hedging of idempotent requests: when a request is slower than the operation's usual latency, a duplicate is
+   * sent and the first response wins. Pass `true` to use a hedger owned by this client, or a `RequestHedger` instance.
+   */
+  hedgeRequests?: boolean | RequestHedger
+  /**
+   * Optional replicas (base URLs including the port, e.g. `https://node-2.example.com:443`) to spread idempotent
+   * requests across, with latency-aware balancing and failover; non-idempotent requests always go to `baseUrl`.
+   * Pass an `EndpointPool` to configure the balancing strategy and health probes.
+   */
+  endpoints?: string[] | EndpointPool
+  /**
+   * Opt-in lazy decoding of responses: nested objects, arrays and maps are decoded on first access (and memoised)
+   * rather than up front, which makes reading a few fields of a large response (e.g. a block header) much cheaper.
+   */
+  lazyDecoding?: boolean
+  /**
+   * Optional hooks that receive the timings (queueing, time to first byte, body read, parse and decode), sizes, retries
+   * and cache or coalescing outcome of each service method call, e.g. `tracingInstrumentation(tracer)` for OpenTelemetry.
+   */
+  instrumentation?: RequestInstrumentation
 }
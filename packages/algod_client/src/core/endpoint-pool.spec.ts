@@ -0,0 +1,132 @@
+import { TEST_GENESIS, jsonResponse, sleep } from '@algorandfoundation/algokit-testing'
+import { afterEach, beforeEach, describe, expect, test, vi } from 'vitest'
+import { AlgodClient } from '../client'
+import { EndpointPool } from './endpoint-pool'
+import type { HttpTransport } from './http-transport'
+
+const first = 'http://algod-1.example.com'
+const second = 'http://algod-2.example.com'
+
+const probed = (transport: ReturnType<typeof vi.fn<HttpTransport>>) =>
+  transport.mock.calls.filter(([url]) => String(url) === `${first}/health`)
+
+describe('EndpointPool', () => {
+  beforeEach(() => {
+    vi.useFakeTimers()
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  test('fails over to another endpoint when one fails with a transient error', async () => {
+    const transport = vi.fn<HttpTransport>(async (url) =>
+      String(url).startsWith(first) ? jsonResponse({ message: 'unavailable' }, 503) : jsonResponse(TEST_GENESIS),
+    )
+    const endpoints = new EndpointPool([first, second])
+    const algod = new AlgodClient({ baseUrl: first, transport, endpoints })
+
+    await expect(algod.genesis()).resolves.toMatchObject({ network: 'testnet' })
+    await algod.genesis()
+    endpoints.close()
+
+    expect(transport.mock.calls.map(([url]) => String(url))).toEqual([`${first}/genesis`, `${second}/genesis`, `${second}/genesis`])
+    expect(endpoints.stats).toMatchObject([
+      { baseUrl: first, healthy: false, requests: 1, failures: 1 },
+      { baseUrl: second, healthy: true, requests: 2, failures: 0 },
+    ])
+  })
+
+  test('prefers the endpoint with the lowest moving average latency', async () => {
+    const pool = new EndpointPool([first, second])
+    const latencies: Record<string, number> = { [first]: 30, [second]: 1 }
+    const execute = async (baseUrl: string) => {
+      await sleep(latencies[baseUrl])
+      return baseUrl
+    }
+
+    const run = async () => {
+      const result = Promise.all([pool.run(execute, () => false), pool.run(execute, () => false)])
+      await vi.advanceTimersByTimeAsync(30)
+      return result
+    }
+
+    await run()
+    const routed = await run()
+
+    expect(routed).toEqual([second, second])
+    expect(pool.stats.map(({ ewmaMs }) => ewmaMs)).toEqual([30, 1])
+    expect(pool.stats[0].ewmaMs).toBeGreaterThan(pool.stats[1].ewmaMs)
+  })
+
+  test('leaves long polls out of the latency average and outstanding requests', async () => {
+    const pool = new EndpointPool([first])
+    let outstanding: number | undefined
+
+    const longPoll = pool.run(
+      async () => {
+        outstanding = pool.stats[0].outstanding
+        await sleep(20)
+      },
+      () => false,
+      { longPoll: true },
+    )
+    await vi.advanceTimersByTimeAsync(20)
+    await longPoll
+
+    expect(outstanding).toBe(0)
+    expect(pool.stats[0]).toMatchObject({ ewmaMs: 0, requests: 1 })
+  })
+
+  test('still routes requests when every endpoint is ejected', async () => {
+    const pool = new EndpointPool([first], { probe: async () => false })
+    const unavailable = Object.assign(new Error('unavailable'), { status: 503 })
+
+    await expect(pool.run(() => Promise.reject(unavailable), () => true)).rejects.toThrow('unavailable')
+    await expect(pool.run(async (baseUrl) => baseUrl, () => true)).resolves.toBe(first)
+    pool.close()
+
+    expect(pool.stats[0]).toMatchObject({ healthy: false, failures: 1, requests: 2 })
+  })
+
+  test('probes ejected endpoints through the client transport and token', async () => {
+    let available = false
+    const transport = vi.fn<HttpTransport>(async (url) =>
+      String(url).startsWith(first) && !available ? jsonResponse({ message: 'unavailable' }, 503) : jsonResponse(TEST_GENESIS),
+    )
+    const endpoints = new EndpointPool([first, second], { probeIntervalMs: 5 })
+    const algod = new AlgodClient({ baseUrl: first, token: 'secret', transport, endpoints })
+
+    await algod.genesis()
+    expect(endpoints.stats[0].healthy).toBe(false)
+
+    await vi.advanceTimersByTimeAsync(5)
+    expect(probed(transport)).toHaveLength(1)
+    expect(endpoints.stats[0].healthy).toBe(false)
+    available = true
+    await vi.advanceTimersByTimeAsync(5)
+    expect(endpoints.stats[0].healthy).toBe(true)
+    endpoints.close()
+
+    const [, probeInit] = probed(transport)[0]
+    expect(probeInit.method).toBe('GET')
+    expect(probeInit.headers).toMatchObject({ 'X-Algo-API-Token': 'secret' })
+  })
+
+  test('keeps a custom probe', async () => {
+    const probe = vi.fn(async () => true)
+    const transport = vi.fn<HttpTransport>(async (url) =>
+      String(url).startsWith(first) ? jsonResponse({ message: 'unavailable' }, 503) : jsonResponse(TEST_GENESIS),
+    )
+    const endpoints = new EndpointPool([first, second], { probeIntervalMs: 5, probe })
+    const algod = new AlgodClient({ baseUrl: first, transport, endpoints })
+
+    await algod.genesis()
+    await vi.advanceTimersByTimeAsync(5)
+    expect(endpoints.stats[0].healthy).toBe(true)
+    endpoints.close()
+
+    expect(probe).toHaveBeenCalledWith(first)
+    expect(transport.mock.calls.some(([url]) => String(url).endsWith('/health'))).toBe(false)
+  })
+})
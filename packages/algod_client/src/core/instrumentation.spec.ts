@@ -0,0 +1,157 @@
+import { TEST_GENESIS, jsonResponse } from '@algorandfoundation/algokit-testing'
+import { describe, expect, test, vi } from 'vitest'
+import { AlgodClient } from '../client'
+import type { ClientConfig } from './client-config'
+import type { HttpTransport } from './http-transport'
+import { tracingInstrumentation, type InstrumentationSpan, type OperationContext, type OperationMetrics } from './instrumentation'
+import { LruResponseCache } from './response-cache'
+
+const genesisBytes = new TextEncoder().encode(JSON.stringify(TEST_GENESIS)).byteLength
+
+// A client whose instrumentation collects the metrics of every call
+const instrumentedClient = (config: Partial<ClientConfig> & { transport: HttpTransport }) => {
+  const ended: { context: OperationContext; metrics: OperationMetrics }[] = []
+  const onOperationStart = vi.fn<(context: OperationContext) => void>()
+  const algod = new AlgodClient({
+    baseUrl: 'http://localhost',
+    ...config,
+    instrumentation: { onOperationStart, onOperationEnd: (context, metrics) => ended.push({ context, metrics }) },
+  })
+  return { algod, ended, onOperationStart }
+}
+
+describe('request instrumentation', () => {
+  test('reports the timings and sizes of a network call', async () => {
+    const { algod, ended, onOperationStart } = instrumentedClient({ transport: vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS)) })
+
+    await algod.genesis()
+
+    expect(onOperationStart).toHaveBeenCalledTimes(1)
+    expect(ended).toHaveLength(1)
+    const { context, metrics } = ended[0]
+    expect(context).toBe(onOperationStart.mock.calls[0][0])
+    expect(context).toEqual({ operationId: 'genesis', method: 'GET', url: '/genesis' })
+    expect(metrics).toMatchObject({ outcome: 'network', retries: 0, status: 200, responseBytes: genesisBytes, error: undefined })
+    for (const timing of ['totalMs', 'sendMs', 'timeToFirstByteMs', 'bodyReadMs', 'parseMs', 'decodeMs'] as const) {
+      expect(metrics[timing]).toBeGreaterThanOrEqual(0)
+    }
+    expect(metrics.totalMs).toBeGreaterThanOrEqual(metrics.sendMs!)
+    expect(metrics.queueMs).toBeUndefined()
+  })
+
+  test('reports calls served from the response cache', async () => {
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS))
+    const { algod, ended } = instrumentedClient({ transport, responseCache: new LruResponseCache() })
+
+    await algod.genesis()
+    await algod.genesis()
+
+    expect(ended.map(({ metrics }) => metrics.outcome)).toEqual(['network', 'cache'])
+    expect(ended[1].metrics.sendMs).toBeUndefined()
+    expect(transport).toHaveBeenCalledTimes(1)
+  })
+
+  test('reports calls that shared an in-flight request', async () => {
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS))
+    const { algod, ended } = instrumentedClient({ transport, coalesceRequests: true })
+
+    await Promise.all([algod.genesis(), algod.genesis()])
+
+    expect(ended.map(({ metrics }) => metrics.outcome).sort()).toEqual(['coalesced', 'network'])
+    expect(transport).toHaveBeenCalledTimes(1)
+  })
+
+  test('reports retries, and the error of a failed call', async () => {
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse({ message: 'not found' }, 404))
+    transport.mockResolvedValueOnce(jsonResponse({ message: 'unavailable' }, 503))
+    const { algod, ended } = instrumentedClient({ transport })
+
+    await expect(algod.genesis()).rejects.toThrow()
+
+    const { metrics } = ended[0]
+    expect(metrics).toMatchObject({ outcome: 'network', retries: 1, status: 404 })
+    expect(metrics.error).toBeInstanceOf(Error)
+    expect(metrics.decodeMs).toBeUndefined()
+  })
+
+  test("doesn't let a failing hook break the call", async () => {
+    const warn = vi.fn()
+    const algod = new AlgodClient({
+      baseUrl: 'http://localhost',
+      transport: async () => jsonResponse(TEST_GENESIS),
+      logger: { error: vi.fn(), warn, info: vi.fn(), verbose: vi.fn(), debug: vi.fn() },
+      instrumentation: {
+        onOperationStart: () => {
+          throw new Error('start hook failed')
+        },
+        onOperationEnd: () => {
+          throw new Error('end hook failed')
+        },
+      },
+    })
+
+    await expect(algod.genesis()).resolves.toMatchObject({ network: 'testnet' })
+    expect(warn).toHaveBeenCalledTimes(2)
+  })
+})
+
+describe('tracingInstrumentation', () => {
+  const tracer = () => {
+    const spans: (InstrumentationSpan & { name: string; attributes: Record<string, unknown> })[] = []
+    return {
+      spans,
+      startSpan: (name: string, options?: { attributes?: Record<string, string | number | boolean> }) => {
+        const span = {
+          name,
+          attributes: { ...options?.attributes } as Record<string, unknown>,
+          setAttributes: vi.fn((attributes: Record<string, unknown>) => Object.assign(span.attributes, attributes)),
+          setStatus: vi.fn(),
+          recordException: vi.fn(),
+          end: vi.fn(),
+        }
+        spans.push(span)
+        return span
+      },
+    }
+  }
+
+  test('records a span with the metrics of each call', async () => {
+    const spanTracer = tracer()
+    const algod = new AlgodClient({
+      baseUrl: 'http://localhost',
+      transport: async () => jsonResponse(TEST_GENESIS),
+      instrumentation: tracingInstrumentation(spanTracer),
+    })
+
+    await algod.genesis()
+
+    const [span] = spanTracer.spans
+    expect(span.name).toBe('genesis')
+    expect(span.attributes).toMatchObject({
+      'http.request.method': 'GET',
+      'url.template': '/genesis',
+      'algokit.outcome': 'network',
+      'algokit.retries': 0,
+      'http.response.status_code': 200,
+      'http.response.body.size': genesisBytes,
+    })
+    expect(span.end).toHaveBeenCalledTimes(1)
+    expect(span.setStatus).not.toHaveBeenCalled()
+  })
+
+  test('records the error of a failed call on its span', async () => {
+    const spanTracer = tracer()
+    const algod = new AlgodClient({
+      baseUrl: 'http://localhost',
+      transport: async () => jsonResponse({ message: 'not found' }, 404),
+      instrumentation: tracingInstrumentation(spanTracer),
+    })
+
+    await expect(algod.genesis()).rejects.toThrow()
+
+    const [span] = spanTracer.spans
+    expect(span.recordException).toHaveBeenCalledTimes(1)
+    expect(span.setStatus).toHaveBeenCalledWith(expect.objectContaining({ code: 2 }))
+    expect(span.end).toHaveBeenCalledTimes(1)
+  })
+})
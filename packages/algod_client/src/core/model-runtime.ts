@@ -6,18 +6,85 @@ import {
   type ObjectModelMetadata,
 } from '@algorandfoundation/algokit-common'
 
+const codecs = new WeakMap<object, ObjectModelCodec<Record<string, unknown>>>()
+
+/** Returns the codec for a model, created once per model rather than on every request. */
+function codecFor<T extends Record<string, unknown>>(meta: ObjectModelMetadata<T>): ObjectModelCodec<T> {
+  let codec = codecs.get(meta) as ObjectModelCodec<T> | undefined
+  if (!codec) {
+    codec = new ObjectModelCodec<T>(meta)
+    codecs.set(meta, codec as unknown as ObjectModelCodec<Record<string, unknown>>)
+  }
+  return codec
+}
+
 export function encodeJson<T extends Record<string, unknown>>(value: T, meta: ObjectModelMetadata<T>, space?: string | number): string {
-  const wire = new ObjectModelCodec(meta).encode(value, 'json')
+  const wire = codecFor(meta).encode(value, 'json')
   return stringifyJson(wire, undefined, space)
 }
 export function encodeMsgpack<T extends Record<string, unknown>>(value: T, meta: ObjectModelMetadata<T>): Uint8Array {
-  const wire = new ObjectModelCodec(meta).encode(value, 'msgpack')
+  const wire = codecFor(meta).encode(value, 'msgpack')
   return rawEncodeMsgpack(wire)
 }
-export function decodeJson<T extends Record<string, unknown>>(value: Record<string, unknown>, meta: ObjectModelMetadata<T>): T {
-  return new ObjectModelCodec<T>(meta).decode(value, 'json')
+/** Options for decoding responses into models. */
+export interface DecodeOptions {
+  /**
+   * Decode nested objects, arrays and maps on first access (memoised) rather than up front; scalar fields are always
+   * decoded straight away. Useful for large responses (e.g. blocks) of which only a few fields are read.
+   */
+  lazy?: boolean
 }
-export function decodeMsgpack<T extends Record<string, unknown>>(value: Uint8Array, meta: ObjectModelMetadata<T>): T {
+
+export function decodeJson<T extends Record<string, unknown>>(
+  value: Record<string, unknown>,
+  meta: ObjectModelMetadata<T>,
+  options?: DecodeOptions,
+): T {
+  const codec = codecFor(meta)
+  return options?.lazy ? codec.decodeLazy(value, 'json') : codec.decode(value, 'json')
+}
+export function decodeMsgpack<T extends Record<string, unknown>>(
+  value: Uint8Array,
+  meta: ObjectModelMetadata<T>,
+  options?: DecodeOptions,
+): T {
   const wire = rawDecodeMsgpack(value)
-  return new ObjectModelCodec<T>(meta).decode(wire, 'msgpack')
+  const codec = codecFor(meta)
+  return options?.lazy ? codec.decodeLazy(wire, 'msgpack') : codec.decode(wire, 'msgpack')
+}
+
+/**
+ * Decodes only the given fields of a model, skipping the decoding of all other fields.
+ * @param payload A JSON response object, or msgpack response bytes
+ */
+export function decodeFields<T extends Record<string, unknown>, K extends keyof T & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  meta: ObjectModelMetadata<T>,
+  fields: readonly K[],
+): Pick<T, K> {
+  const projection = codecFor(meta).project(fields)
+  return payload instanceof Uint8Array ? projection.decode(rawDecodeMsgpack(payload), 'msgpack') : projection.decode(payload, 'json')
+}
+
+/** Returns a copy of the model with only the given fields. */
+export function pickFields<T extends Record<string, unknown>, K extends keyof T & string>(value: T, fields: readonly K[]): Pick<T, K> {
+  const picked: Partial<Pick<T, K>> = {}
+  for (const field of fields) {
+    if (value[field] !== undefined) picked[field] = value[field]
+  }
+  return picked as Pick<T, K>
+}
+
+/**
+ * Returns the candidates (wire keys of the model's fields, e.g. the values of indexer's `exclude` parameter) that
+ * aren't selected, so the server can leave them out of the response.
+ */
+export function unselectedWireKeys<T extends Record<string, unknown>, E extends string>(
+  meta: ObjectModelMetadata<T>,
+  fields: readonly (keyof T & string)[],
+  candidates: readonly E[],
+): E[] {
+  const selected = new Set<string>(fields)
+  const selectedWireKeys = new Set(meta.fields.filter((field) => selected.has(field.name)).map((field) => field.wireKey ?? field.name))
+  return candidates.filter((candidate) => !selectedWireKeys.has(candidate))
 }
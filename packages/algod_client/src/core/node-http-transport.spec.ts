@@ -0,0 +1,113 @@
+import { startLocalMockServer, type LocalMockServer } from '@algorandfoundation/algokit-testing'
+import { mkdtemp, rm } from 'node:fs/promises'
+import { createServer, type Server } from 'node:http'
+import type { AddressInfo } from 'node:net'
+import { tmpdir } from 'node:os'
+import { join } from 'node:path'
+import { afterEach, describe, expect, test } from 'vitest'
+import { routes } from '../../tests/mock-server'
+import { AlgodClient } from '../client'
+import { createPooledTransport, loadReplayTransport, saveRecording, type PooledHttpTransport } from './node-http-transport'
+import { createRecordingTransport } from './recording-transport'
+
+// An echo server that counts the connections it accepts and the most it had open at once
+const startEchoServer = async () => {
+  let open = 0
+  const counts = { connections: 0, maxOpen: 0 }
+  const server = createServer((req, res) => {
+    const chunks: Buffer[] = []
+    req.on('data', (chunk: Buffer) => chunks.push(chunk))
+    req.on('end', () => {
+      setTimeout(() => {
+        res.writeHead(200, { 'content-type': 'application/octet-stream', 'x-method': req.method ?? '' })
+        res.end(Buffer.concat(chunks))
+      }, 10)
+    })
+  })
+  server.on('connection', (socket) => {
+    counts.connections += 1
+    counts.maxOpen = Math.max(counts.maxOpen, ++open)
+    socket.on('close', () => (open -= 1))
+  })
+  await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve))
+  return { server, counts, url: `http://127.0.0.1:${(server.address() as AddressInfo).port}` }
+}
+
+describe('createPooledTransport', () => {
+  let transport: PooledHttpTransport | undefined
+  let mockServer: LocalMockServer | undefined
+  let echoServer: Server | undefined
+
+  afterEach(async () => {
+    transport?.close()
+    await mockServer?.close()
+    const server = echoServer
+    if (server) {
+      await new Promise((resolve) => {
+        server.close(resolve)
+        server.closeAllConnections()
+      })
+    }
+    transport = mockServer = echoServer = undefined
+  })
+
+  test('sends requests through the client', async () => {
+    mockServer = await startLocalMockServer(routes)
+    transport = createPooledTransport()
+    const algod = new AlgodClient({ baseUrl: mockServer.baseUrl, transport })
+
+    const genesis = await algod.genesis()
+    const response = await transport(`${mockServer.baseUrl}/v2/unknown`, { method: 'GET' })
+
+    expect(genesis.network).toBe('')
+    expect(response.status).toBe(404)
+    expect(mockServer.stats.operations).toMatchObject({ genesis: 1, unmatched: 1 })
+  })
+
+  test('reuses connections and sends at most maxSockets requests at a time', async () => {
+    const echo = await startEchoServer()
+    echoServer = echo.server
+    transport = createPooledTransport({ maxSockets: 2 })
+
+    const responses = await Promise.all(
+      Array.from({ length: 10 }, (_, i) => transport!(`${echo.url}/echo`, { method: 'POST', body: new Uint8Array([i]) })),
+    )
+    const bodies = await Promise.all(responses.map(async (response) => new Uint8Array(await response.arrayBuffer())))
+    await transport(`${echo.url}/echo`, { method: 'GET' })
+
+    expect(bodies).toEqual(Array.from({ length: 10 }, (_, i) => new Uint8Array([i])))
+    expect(responses[0].headers.get('x-method')).toBe('POST')
+    expect(echo.counts.maxOpen).toBeLessThanOrEqual(2)
+    expect(echo.counts.connections).toBeLessThanOrEqual(2)
+  })
+
+  test('aborts requests when signalled', async () => {
+    const echo = await startEchoServer()
+    echoServer = echo.server
+    transport = createPooledTransport()
+
+    const controller = new AbortController()
+    const response = transport(`${echo.url}/echo`, { method: 'GET', signal: controller.signal })
+    controller.abort()
+
+    await expect(response).rejects.toThrow()
+  })
+})
+
+describe('saveRecording and loadReplayTransport', () => {
+  test('save and load archives', async () => {
+    const dir = await mkdtemp(join(tmpdir(), 'recording-'))
+    try {
+      const recording = createRecordingTransport({ transport: async () => new Response('saved', { status: 200 }) })
+      await recording('http://localhost/v2/status', { method: 'GET' })
+      await saveRecording(recording, join(dir, 'status.rec'))
+
+      const replay = await loadReplayTransport(join(dir, 'status.rec'), { timeScale: 0 })
+      const response = await replay('http://replay/v2/status', { method: 'GET' })
+
+      expect(await response.text()).toBe('saved')
+    } finally {
+      await rm(dir, { recursive: true, force: true })
+    }
+  })
+})
@@ -0,0 +1,105 @@
+import { startLocalMockServer } from '@algorandfoundation/algokit-testing'
+import { describe, expect, test, vi } from 'vitest'
+import { routes } from '../../tests/mock-server'
+import { AlgodClient } from '../client'
+import type { HttpTransport } from './http-transport'
+import {
+  createRecordingTransport,
+  createReplayTransport,
+  decodeRecordingArchive,
+  encodeRecordingArchive,
+  type RecordedExchange,
+} from './recording-transport'
+
+const exchange = (overrides: Partial<RecordedExchange> = {}): RecordedExchange => ({
+  method: 'GET',
+  url: '/v2/status',
+  status: 200,
+  statusText: 'OK',
+  headers: [['content-type', 'application/json']],
+  body: new TextEncoder().encode('{"round":1}'),
+  startMs: 0,
+  timeToFirstByteMs: 1,
+  durationMs: 2,
+  ...overrides,
+})
+
+const textTransport = (text: string) => vi.fn<HttpTransport>(async () => new Response(text, { status: 200 }))
+
+describe('recording archives', () => {
+  test('round trip the recorded exchanges, including binary bodies', () => {
+    const exchanges = [
+      exchange(),
+      exchange({ method: 'POST', url: '/v2/transactions', requestBodyHash: '0000beef', body: new Uint8Array([0, 255, 1]) }),
+      exchange({ status: 204, statusText: 'No Content', body: new Uint8Array() }),
+    ]
+
+    expect(decodeRecordingArchive(encodeRecordingArchive(exchanges))).toEqual(exchanges)
+  })
+
+  test('reject data that is not an archive, or an archive of an unknown version', () => {
+    const archive = encodeRecordingArchive([exchange()])
+    archive[4] = 99
+
+    expect(() => decodeRecordingArchive(new Uint8Array([1, 2, 3, 4, 5, 6, 7, 8, 9]))).toThrow('Not a recording archive')
+    expect(() => decodeRecordingArchive(archive)).toThrow('Unsupported recording archive version 99')
+  })
+})
+
+describe('record and replay', () => {
+  test('replays the responses recorded from a server', async () => {
+    const server = await startLocalMockServer(routes)
+    const recording = createRecordingTransport({ transport: fetch })
+    try {
+      const recorded = await new AlgodClient({ baseUrl: server.baseUrl, transport: recording }).genesis()
+      const archive = recording.toArchive()
+
+      const replay = createReplayTransport(archive, { timeScale: 0 })
+      const replayed = await new AlgodClient({ baseUrl: 'http://replay', transport: replay }).genesis()
+
+      expect(replayed).toEqual(recorded)
+      expect(recording.exchanges).toMatchObject([{ method: 'GET', url: '/genesis', status: 200 }])
+      expect(server.stats.operations).toMatchObject({ genesis: 1 })
+      expect(replay.misses).toBe(0)
+    } finally {
+      await server.close()
+    }
+  })
+
+  test('matches requests on their body, and replays the recordings of a request in order', async () => {
+    const inner = vi.fn<HttpTransport>(async (_, init) => new Response(`reply to ${init.body}`))
+    const recording = createRecordingTransport({ transport: inner })
+    await recording('http://localhost/echo', { method: 'POST', body: 'a' })
+    await recording('http://localhost/echo', { method: 'POST', body: 'b' })
+    await recording('http://localhost/echo', { method: 'POST', body: 'a' })
+    const exchanges = recording.exchanges.map((e, i) => (i === 2 ? { ...e, body: new TextEncoder().encode('again') } : e))
+
+    const replay = createReplayTransport(exchanges, { timeScale: 0, loop: false })
+    const reply = async (body: string) => (await replay('http://other/echo', { method: 'POST', body })).text()
+
+    expect(await reply('b')).toBe('reply to b')
+    expect(await reply('a')).toBe('reply to a')
+    expect(await reply('a')).toBe('again')
+    await expect(reply('a')).rejects.toThrow('No recorded response for POST /echo')
+    await expect(reply('c')).rejects.toThrow('No recorded response')
+    expect(replay.misses).toBe(2)
+  })
+
+  test('loops over the recordings of a request by default', async () => {
+    const replay = createReplayTransport([exchange()], { timeScale: 0 })
+
+    await replay('http://replay/v2/status', { method: 'GET' })
+    const response = await replay('http://replay/v2/status', { method: 'GET' })
+
+    expect(await response.json()).toEqual({ round: 1 })
+  })
+
+  test('replays the recorded response times, scaled by timeScale', async () => {
+    const replay = createReplayTransport([exchange({ durationMs: 40 })], { timeScale: 0.5 })
+
+    const start = Date.now()
+    await replay('http://replay/v2/status', { method: 'GET' })
+
+    expect(Date.now() - start).toBeGreaterThanOrEqual(15)
+  })
+})
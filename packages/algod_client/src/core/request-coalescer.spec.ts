@@ -0,0 +1,75 @@
+import { TEST_GENESIS, jsonResponse } from '@algorandfoundation/algokit-testing'
+import { describe, expect, test, vi } from 'vitest'
+import { AlgodClient } from '../client'
+import type { HttpTransport } from './http-transport'
+import { RequestCoalescer } from './request-coalescer'
+
+// A transport that holds every response until `release` is called, so requests overlap
+const deferredTransport = (respond: () => Response = () => jsonResponse(TEST_GENESIS)) => {
+  let release = () => {}
+  const released = new Promise<void>((resolve) => (release = resolve))
+  const transport = vi.fn<HttpTransport>(async () => {
+    await released
+    return respond()
+  })
+  return { transport, release }
+}
+
+describe('RequestCoalescer', () => {
+  test('concurrent identical requests share one round trip and get independent results', async () => {
+    const { transport, release } = deferredTransport()
+    const coalescer = new RequestCoalescer()
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, coalesceRequests: coalescer })
+
+    const results = [algod.genesis(), algod.genesis(), algod.genesis()]
+    release()
+    const [first, second, third] = await Promise.all(results)
+
+    expect(transport).toHaveBeenCalledTimes(1)
+    expect(second).toEqual(first)
+    expect(third).toEqual(first)
+    first.alloc.push({ addr: 'addr', comment: 'mutated', state: { algo: 0n } } as never)
+    expect(second.alloc).toHaveLength(0)
+    expect(coalescer.stats).toEqual({ started: 1, coalesced: 2, inFlight: 0 })
+  })
+
+  test('requests for different parameters are not coalesced', async () => {
+    const { transport, release } = deferredTransport(() => jsonResponse({ params: {}, index: 1 }))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, coalesceRequests: true })
+
+    const results = [algod.assetById(1), algod.assetById(2), algod.assetById(1)]
+    release()
+    await Promise.all(results)
+
+    expect(transport).toHaveBeenCalledTimes(2)
+  })
+
+  test('requests with an abort signal or a body are not coalesced', async () => {
+    const coalescer = new RequestCoalescer()
+
+    expect(coalescer.keyFor({ method: 'GET', url: '/genesis' })).toBeDefined()
+    expect(coalescer.keyFor({ method: 'GET', url: '/genesis', signal: new AbortController().signal })).toBeUndefined()
+    expect(coalescer.keyFor({ method: 'POST', url: '/v2/transactions', body: new Uint8Array([1]) })).toBeUndefined()
+    expect(coalescer.keyFor({ method: 'GET', url: '/v2/accounts/{address}', path: { address: 'A' } })).not.toBe(
+      coalescer.keyFor({ method: 'GET', url: '/v2/accounts/{address}', path: { address: 'B' } }),
+    )
+  })
+
+  test('a failure is shared by every joined caller and the next request is sent again', async () => {
+    const { transport, release } = deferredTransport(() => jsonResponse({ message: 'bad request' }, 400))
+    const coalescer = new RequestCoalescer()
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, coalesceRequests: coalescer })
+
+    const results = [algod.genesis(), algod.genesis()]
+    release()
+
+    await expect(results[0]).rejects.toThrow()
+    await expect(results[1]).rejects.toThrow()
+    expect(transport).toHaveBeenCalledTimes(1)
+
+    transport.mockResolvedValueOnce(jsonResponse(TEST_GENESIS))
+    await algod.genesis()
+    expect(transport).toHaveBeenCalledTimes(2)
+    expect(coalescer.stats.inFlight).toBe(0)
+  })
+})
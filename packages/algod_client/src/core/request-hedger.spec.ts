@@ -0,0 +1,162 @@
+import { TEST_GENESIS, hangingResponse, jsonResponse, sleep } from '@algorandfoundation/algokit-testing'
+import { afterEach, beforeEach, describe, expect, test, vi } from 'vitest'
+import { AlgodClient } from '../client'
+import { RequestTimeoutError } from './api-error'
+import type { HttpTransport } from './http-transport'
+import { RequestHedger } from './request-hedger'
+
+beforeEach(() => {
+  vi.useFakeTimers()
+})
+
+afterEach(() => {
+  vi.useRealTimers()
+})
+
+describe('request timeouts', () => {
+  test('fail an attempt that takes longer than the timeout', async () => {
+    const transport = vi.fn<HttpTransport>(async (_, init) => hangingResponse(init))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, timeoutMs: 20, maxRetries: 0 })
+
+    const result = expect(algod.genesis()).rejects.toThrow(RequestTimeoutError)
+    await vi.advanceTimersByTimeAsync(19)
+    expect(transport.mock.calls[0][1].signal?.aborted).toBe(false)
+    await vi.advanceTimersByTimeAsync(1)
+
+    await result
+    expect(transport).toHaveBeenCalledTimes(1)
+  })
+
+  test('retry timed out attempts', async () => {
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS))
+    transport.mockImplementationOnce(async (_, init) => hangingResponse(init))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, timeoutMs: 20, maxRetries: 1 })
+
+    const result = algod.genesis()
+    await vi.advanceTimersByTimeAsync(20)
+
+    await expect(result).resolves.toMatchObject({ network: 'testnet' })
+    expect(transport).toHaveBeenCalledTimes(2)
+  })
+
+  test("use the per-call maxRetries over the client's", async () => {
+    const transport = vi.fn<HttpTransport>(async (_, init) => hangingResponse(init))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, timeoutMs: 20, maxRetries: 3 })
+
+    const result = expect(algod.genesis({ maxRetries: 0 })).rejects.toThrow(RequestTimeoutError)
+    await vi.advanceTimersByTimeAsync(20)
+
+    await result
+    expect(transport).toHaveBeenCalledTimes(1)
+  })
+
+  test('use the per-call timeout over the per-operation timeout over the client timeout', async () => {
+    const transport = vi.fn<HttpTransport>(async (_, init) => hangingResponse(init))
+    const algod = new AlgodClient({
+      baseUrl: 'http://localhost',
+      transport,
+      timeoutMs: 1_000,
+      operationTimeouts: { genesis: 10 },
+      maxRetries: 0,
+    })
+
+    const results = [
+      expect(algod.genesis()).rejects.toThrow('timed out after 10ms'),
+      expect(algod.genesis({ timeoutMs: 5 })).rejects.toThrow('timed out after 5ms'),
+    ]
+    await vi.advanceTimersByTimeAsync(10)
+
+    await Promise.all(results)
+  })
+
+  test("aren't retried when the caller aborts", async () => {
+    const transport = vi.fn<HttpTransport>(async (_, init) => hangingResponse(init))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, timeoutMs: 1_000 })
+    const controller = new AbortController()
+
+    const result = algod.genesis({ signal: controller.signal })
+    controller.abort(new Error('cancelled'))
+
+    await expect(result).rejects.toThrow('cancelled')
+    expect(transport).toHaveBeenCalledTimes(1)
+  })
+})
+
+describe('RequestHedger', () => {
+  test('only hedges operations with enough observed latencies, after their latency percentile', () => {
+    const hedger = new RequestHedger({ minSamples: 4, percentile: 0.75, minDelayMs: 1 })
+    for (const latency of [10, 20, 30]) hedger.record('block', latency)
+    expect(hedger.delayFor('block')).toBeUndefined()
+
+    hedger.record('block', 40)
+    expect(hedger.delayFor('block')).toBe(30)
+    expect(hedger.delayFor('status')).toBeUndefined()
+  })
+
+  test('sends a duplicate of a slow request and uses whichever responds first', async () => {
+    const hedger = new RequestHedger({ minSamples: 1, minDelayMs: 10 })
+    hedger.record('genesis', 10)
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS))
+    transport.mockImplementationOnce(async (_, init) => hangingResponse(init))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, hedgeRequests: hedger })
+
+    const result = algod.genesis()
+    await vi.advanceTimersByTimeAsync(9)
+    expect(transport).toHaveBeenCalledTimes(1)
+    await vi.advanceTimersByTimeAsync(1)
+
+    await expect(result).resolves.toMatchObject({ network: 'testnet' })
+
+    expect(transport).toHaveBeenCalledTimes(2)
+    expect(transport.mock.calls[0][1].signal?.aborted).toBe(true)
+    expect(hedger.stats).toEqual({ requests: 1, hedged: 1, hedgeWins: 1 })
+  })
+
+  test("doesn't hedge requests that respond in time", async () => {
+    const hedger = new RequestHedger({ minSamples: 1, minDelayMs: 20 })
+    hedger.record('genesis', 20)
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, hedgeRequests: hedger })
+
+    await algod.genesis()
+    await vi.advanceTimersByTimeAsync(30)
+
+    expect(transport).toHaveBeenCalledTimes(1)
+    expect(hedger.stats).toEqual({ requests: 1, hedged: 0, hedgeWins: 0 })
+  })
+
+  test("doesn't hedge long polls", async () => {
+    const hedger = new RequestHedger({ minSamples: 1, minDelayMs: 1 })
+    hedger.record('statusAfterBlock', 1)
+    const transport = vi.fn<HttpTransport>(async () => {
+      await sleep(20)
+      return jsonResponse({ 'last-round': 101, 'time-since-last-round': 0 })
+    })
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, hedgeRequests: hedger })
+
+    const status = algod.statusAfterBlock(100)
+    await vi.advanceTimersByTimeAsync(20)
+
+    await expect(status).resolves.toMatchObject({ lastRound: 101n })
+
+    expect(transport).toHaveBeenCalledTimes(1)
+    expect(hedger.stats).toEqual({ requests: 0, hedged: 0, hedgeWins: 0 })
+  })
+
+  test('rejects with the first error when every request fails', async () => {
+    const hedger = new RequestHedger({ minSamples: 1, minDelayMs: 1 })
+    hedger.record('op', 1)
+    let attempt = 0
+
+    const result = hedger.run('op', async () => {
+      const n = ++attempt
+      await sleep(n === 1 ? 20 : 1)
+      throw new Error(`attempt ${n}`)
+    })
+    const rejected = expect(result).rejects.toThrow('attempt 2')
+    await vi.advanceTimersByTimeAsync(20)
+
+    await rejected
+    expect(hedger.stats.hedged).toBe(1)
+  })
+})
@@ -0,0 +1,149 @@
+export interface RequestHedgerOptions {
+  /** The latency percentile (0-1) after which a duplicate request is sent. Defaults to 0.95. */
+  percentile?: number
+  /** Number of recent latencies kept per operation. Defaults to 100. */
+  sampleSize?: number
+  /** Latencies needed for an operation before it's hedged. Defaults to 20. */
+  minSamples?: number
+  /** Lower bound for the hedging delay in milliseconds, so fast operations aren't duplicated on jitter. Defaults to 10. */
+  minDelayMs?: number
+}
+
+/** Counters describing how often requests were hedged, and how often the hedge won. */
+export interface HedgingStats {
+  /** Requests that went through the hedger */
+  requests: number
+  /** Requests for which a duplicate was sent */
+  hedged: number
+  /** Requests answered by the duplicate rather than the original */
+  hedgeWins: number
+}
+
+/**
+ * Cuts tail latency of idempotent requests: once a request has been outstanding for longer than the configured latency
+ * percentile of its operation, an identical request is sent and whichever response arrives first is used; the other
+ * request is aborted.
+ *
+ * Latencies are tracked per operation, and an operation is only hedged once enough latencies have been observed.
+ */
+export class RequestHedger {
+  private readonly percentile: number
+  private readonly sampleSize: number
+  private readonly minSamples: number
+  private readonly minDelayMs: number
+  private readonly latencies = new Map<string, number[]>()
+  private requests = 0
+  private hedged = 0
+  private hedgeWins = 0
+
+  constructor(options: RequestHedgerOptions = {}) {
+    this.percentile = Math.min(Math.max(options.percentile ?? 0.95, 0), 1)
+    this.sampleSize = Math.max(1, options.sampleSize ?? 100)
+    this.minSamples = Math.min(this.sampleSize, Math.max(1, options.minSamples ?? 20))
+    this.minDelayMs = options.minDelayMs ?? 10
+  }
+
+  /** A snapshot of the hedging counters. */
+  get stats(): HedgingStats {
+    return { requests: this.requests, hedged: this.hedged, hedgeWins: this.hedgeWins }
+  }
+
+  /** Resets the counters; observed latencies are kept. */
+  resetStats(): void {
+    this.requests = 0
+    this.hedged = 0
+    this.hedgeWins = 0
+  }
+
+  /**
+   * Returns how long to wait before hedging a request for the given operation, or `undefined` if there aren't enough
+   * observed latencies yet.
+   */
+  delayFor(key: string): number | undefined {
+    const samples = this.latencies.get(key)
+    if (!samples || samples.length < this.minSamples) {
+      return undefined
+    }
+    const sorted = [...samples].sort((a, b) => a - b)
+    const index = Math.min(sorted.length - 1, Math.ceil(this.percentile * sorted.length) - 1)
+    return Math.max(this.minDelayMs, sorted[Math.max(0, index)])
+  }
+
+  /** Records the latency of a successful request for the given operation. */
+  record(key: string, latencyMs: number): void {
+    let samples = this.latencies.get(key)
+    if (!samples) {
+      samples = []
+      this.latencies.set(key, samples)
+    }
+    samples.push(latencyMs)
+    if (samples.length > this.sampleSize) {
+      samples.shift()
+    }
+  }
+
+  /**
+   * Runs the request, sending a duplicate if it's slower than the operation's latency percentile.
+   * @param key The operation the request belongs to
+   * @param attempt Sends the request; it must stop when the given signal is aborted
+   * @param signal Aborts all outstanding requests
+   * @returns The first successful response; if every request fails, the first error
+   */
+  run<T>(key: string, attempt: (signal: AbortSignal) => Promise<T>, signal?: AbortSignal): Promise<T> {
+    this.requests += 1
+    const delayMs = this.delayFor(key)
+    const controllers: AbortController[] = []
+
+    return new Promise<T>((resolve, reject) => {
+      let settled = false
+      let outstanding = 0
+      let firstError: unknown
+      let timer: ReturnType<typeof setTimeout> | undefined
+
+      const abortAll = () => {
+        for (const controller of controllers) controller.abort(signal?.reason)
+      }
+      signal?.addEventListener('abort', abortAll, { once: true })
+
+      const settle = () => {
+        settled = true
+        clearTimeout(timer)
+        signal?.removeEventListener('abort', abortAll)
+      }
+
+      const launch = (index: number) => {
+        const controller = new AbortController()
+        controllers.push(controller)
+        if (signal?.aborted) controller.abort(signal.reason)
+        outstanding += 1
+        const startedAt = Date.now()
+        attempt(controller.signal).then(
+          (value) => {
+            if (settled) return
+            settle()
+            this.record(key, Date.now() - startedAt)
+            if (index > 0) this.hedgeWins += 1
+            controllers.forEach((other, i) => i !== index && other.abort())
+            resolve(value)
+          },
+          (error) => {
+            outstanding -= 1
+            if (firstError === undefined) firstError = error
+            if (settled || outstanding > 0) return
+            settle()
+            reject(firstError)
+          },
+        )
+      }
+
+      launch(0)
+      if (delayMs !== undefined) {
+        timer = setTimeout(() => {
+          if (settled) return
+          this.hedged += 1
+          launch(1)
+        }, delayMs)
+      }
+    })
+  }
+}
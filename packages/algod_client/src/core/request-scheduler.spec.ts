@@ -0,0 +1,100 @@
+import { TEST_GENESIS, jsonResponse, sleep } from '@algorandfoundation/algokit-testing'
+import { afterEach, describe, expect, test, vi } from 'vitest'
+import { AlgodClient } from '../client'
+import type { HttpTransport } from './http-transport'
+import { RequestScheduler } from './request-scheduler'
+
+const deferred = () => {
+  let resolve = () => {}
+  const promise = new Promise<void>((r) => (resolve = r))
+  return { promise, resolve }
+}
+
+describe('RequestScheduler', () => {
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  test('runs at most maxInFlight tasks at a time', async () => {
+    vi.useFakeTimers()
+    const scheduler = new RequestScheduler({ maxInFlight: 2 })
+    let running = 0
+    let maxRunning = 0
+    const task = async () => {
+      maxRunning = Math.max(maxRunning, ++running)
+      await sleep(5)
+      running -= 1
+    }
+
+    const tasks = Promise.all(Array.from({ length: 6 }, () => scheduler.schedule(task)))
+    await vi.advanceTimersByTimeAsync(15)
+    await tasks
+
+    expect(maxRunning).toBe(2)
+    expect(scheduler.stats).toMatchObject({ inFlight: 0, queued: 0, dispatched: 6 })
+  })
+
+  test('dispatches higher priority lanes first', async () => {
+    const scheduler = new RequestScheduler({ maxInFlight: 1 })
+    const blocker = deferred()
+    const order: string[] = []
+
+    const first = scheduler.schedule(() => blocker.promise)
+    const background = scheduler.schedule(async () => order.push('background'), 'background')
+    const interactive = scheduler.schedule(async () => order.push('interactive'), 'interactive')
+    const unknownLane = scheduler.schedule(async () => order.push('default'), 'unknown')
+    expect(scheduler.stats.queuedByLane).toEqual({ interactive: 2, background: 1 })
+
+    blocker.resolve()
+    await Promise.all([first, background, interactive, unknownLane])
+
+    expect(order).toEqual(['interactive', 'default', 'background'])
+  })
+
+  test('frees the slot of a failed task', async () => {
+    const scheduler = new RequestScheduler({ maxInFlight: 1 })
+
+    await expect(scheduler.schedule(() => Promise.reject(new Error('failed')))).rejects.toThrow('failed')
+    await expect(scheduler.schedule(async () => 'ok')).resolves.toBe('ok')
+  })
+
+  test('rate limits dispatching to requestsPerSecond after the burst', async () => {
+    vi.useFakeTimers()
+    const scheduler = new RequestScheduler({ requestsPerSecond: 50, burst: 1 })
+
+    const tasks = Promise.all(Array.from({ length: 3 }, () => scheduler.schedule(async () => {})))
+    expect(scheduler.stats.dispatched).toBe(1)
+    await vi.advanceTimersByTimeAsync(19)
+    expect(scheduler.stats.dispatched).toBe(1)
+    await vi.advanceTimersByTimeAsync(1)
+    expect(scheduler.stats.dispatched).toBe(2)
+    await vi.advanceTimersByTimeAsync(20)
+    await tasks
+
+    expect(scheduler.stats.dispatched).toBe(3)
+  })
+
+  test('pauses dispatching for the Retry-After of a throttled response', async () => {
+    vi.useFakeTimers()
+    const scheduler = new RequestScheduler()
+    const transport = vi.fn<HttpTransport>(async () => jsonResponse(TEST_GENESIS))
+    transport.mockResolvedValueOnce(jsonResponse({ message: 'Too many requests' }, 429, { 'retry-after': '0.1' }))
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, scheduler })
+
+    const throttled = algod.genesis()
+    await vi.waitFor(() => expect(scheduler.stats.pausedUntil).toBeDefined(), { interval: 1 })
+    const other = algod.genesis({ priority: 'background' })
+    await vi.advanceTimersByTimeAsync(90)
+    expect(transport).toHaveBeenCalledTimes(1)
+    await vi.advanceTimersByTimeAsync(20)
+
+    await Promise.all([throttled, other])
+
+    expect(transport).toHaveBeenCalledTimes(3)
+    expect(scheduler.stats.maxWaitMs).toBeGreaterThanOrEqual(50)
+  })
+
+  test('rejects a default lane that is not configured', () => {
+    expect(() => new RequestScheduler({ lanes: ['a'], defaultLane: 'b' })).toThrow('Default lane b is not one of the configured lanes')
+  })
+})
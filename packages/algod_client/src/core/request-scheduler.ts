@@ -0,0 +1,179 @@
+export interface RequestSchedulerOptions {
+  /** Maximum number of requests in flight at once. Defaults to 16. */
+  maxInFlight?: number
+  /** Sustained request rate limit (token bucket refill rate). Defaults to no rate limit. */
+  requestsPerSecond?: number
+  /** Maximum burst above the sustained rate (token bucket capacity). Defaults to `requestsPerSecond`. */
+  burst?: number
+  /** Priority lanes, highest priority first. Defaults to `['interactive', 'background']`. */
+  lanes?: string[]
+  /** The lane used for requests that don't specify one. Defaults to the first lane. */
+  defaultLane?: string
+}
+
+/** Observable state of a `RequestScheduler`. */
+export interface RequestSchedulerStats {
+  inFlight: number
+  /** Requests waiting to be dispatched */
+  queued: number
+  /** Requests waiting to be dispatched, per lane */
+  queuedByLane: Record<string, number>
+  /** Requests dispatched since creation (or the last `resetStats`) */
+  dispatched: number
+  /** Average time dispatched requests spent queued, in milliseconds */
+  averageWaitMs: number
+  /** Longest time a dispatched request spent queued, in milliseconds */
+  maxWaitMs: number
+  /** When dispatching resumes after a `Retry-After` pause (epoch milliseconds), if paused */
+  pausedUntil?: number
+}
+
+interface QueuedTask {
+  run: () => void
+  enqueuedAt: number
+}
+
+/**
+ * Schedules requests with a maximum number in flight, an optional token-bucket rate limit and priority lanes.
+ *
+ * A scheduler can be shared between clients (e.g. an interactive and a backfill client pointing at the same node),
+ * and can be paused, e.g. when the node responds with a `Retry-After` header.
+ */
+export class RequestScheduler {
+  private readonly maxInFlight: number
+  private readonly requestsPerSecond: number
+  private readonly burst: number
+  private readonly lanes: string[]
+  private readonly defaultLane: string
+  private readonly queues = new Map<string, QueuedTask[]>()
+  private inFlight = 0
+  private tokens: number
+  private lastRefill = Date.now()
+  private pausedUntil = 0
+  private timer: ReturnType<typeof setTimeout> | undefined
+  private dispatched = 0
+  private totalWaitMs = 0
+  private maxWaitMs = 0
+
+  constructor(options: RequestSchedulerOptions = {}) {
+    this.maxInFlight = Math.max(1, options.maxInFlight ?? 16)
+    this.requestsPerSecond = options.requestsPerSecond ?? Number.POSITIVE_INFINITY
+    this.burst = Math.max(1, options.burst ?? this.requestsPerSecond)
+    this.tokens = this.burst
+    this.lanes = options.lanes?.length ? options.lanes : ['interactive', 'background']
+    this.defaultLane = options.defaultLane ?? this.lanes[0]
+    for (const lane of this.lanes) this.queues.set(lane, [])
+    if (!this.queues.has(this.defaultLane)) {
+      throw new Error(`Default lane ${this.defaultLane} is not one of the configured lanes: ${this.lanes.join(', ')}`)
+    }
+  }
+
+  /** A snapshot of the scheduler state. */
+  get stats(): RequestSchedulerStats {
+    const queuedByLane = Object.fromEntries([...this.queues].map(([lane, queue]) => [lane, queue.length]))
+    return {
+      inFlight: this.inFlight,
+      queued: Object.values(queuedByLane).reduce((sum, count) => sum + count, 0),
+      queuedByLane,
+      dispatched: this.dispatched,
+      averageWaitMs: this.dispatched === 0 ? 0 : this.totalWaitMs / this.dispatched,
+      maxWaitMs: this.maxWaitMs,
+      pausedUntil: this.pausedUntil > Date.now() ? this.pausedUntil : undefined,
+    }
+  }
+
+  /** Resets the dispatch and wait time counters. */
+  resetStats(): void {
+    this.dispatched = 0
+    this.totalWaitMs = 0
+    this.maxWaitMs = 0
+  }
+
+  /**
+   * Runs the task once a slot (and rate limit token) is available, ahead of any queued tasks in lower priority lanes.
+   * @param task The request to run
+   * @param lane The priority lane; defaults to the scheduler's default lane (unknown lanes also use the default lane)
+   * @returns The result of the task
+   */
+  schedule<T>(task: () => Promise<T>, lane?: string): Promise<T> {
+    const queue = this.queues.get(lane ?? this.defaultLane) ?? this.queues.get(this.defaultLane)!
+    return new Promise<T>((resolve, reject) => {
+      queue.push({
+        enqueuedAt: Date.now(),
+        run: () => {
+          Promise.resolve()
+            .then(task)
+            .then(resolve, reject)
+            .finally(() => {
+              this.inFlight -= 1
+              this.drain()
+            })
+        },
+      })
+      this.drain()
+    })
+  }
+
+  /**
+   * Stops dispatching new requests for the given duration, e.g. to honour a `Retry-After` response header.
+   * Requests already in flight are unaffected.
+   * @param ms How long to pause for, in milliseconds
+   */
+  pause(ms: number): void {
+    this.pausedUntil = Math.max(this.pausedUntil, Date.now() + ms)
+    this.drain()
+  }
+
+  private refill(now: number): void {
+    if (this.requestsPerSecond === Number.POSITIVE_INFINITY) {
+      this.tokens = this.burst
+      return
+    }
+    this.tokens = Math.min(this.burst, this.tokens + ((now - this.lastRefill) / 1000) * this.requestsPerSecond)
+    this.lastRefill = now
+  }
+
+  private nextTask(): QueuedTask | undefined {
+    for (const lane of this.lanes) {
+      const task = this.queues.get(lane)!.shift()
+      if (task) return task
+    }
+    return undefined
+  }
+
+  private hasQueuedTasks(): boolean {
+    return this.lanes.some((lane) => this.queues.get(lane)!.length > 0)
+  }
+
+  private drain(): void {
+    while (this.inFlight < this.maxInFlight && this.hasQueuedTasks()) {
+      const now = Date.now()
+      if (this.pausedUntil > now) {
+        this.wakeUpIn(this.pausedUntil - now)
+        return
+      }
+      this.refill(now)
+      if (this.tokens < 1) {
+        this.wakeUpIn(Math.ceil(((1 - this.tokens) / this.requestsPerSecond) * 1000))
+        return
+      }
+
+      const task = this.nextTask()!
+      this.tokens -= 1
+      this.inFlight += 1
+      const waitMs = now - task.enqueuedAt
+      this.dispatched += 1
+      this.totalWaitMs += waitMs
+      this.maxWaitMs = Math.max(this.maxWaitMs, waitMs)
+      task.run()
+    }
+  }
+
+  private wakeUpIn(ms: number): void {
+    if (this.timer) return
+    this.timer = setTimeout(() => {
+      this.timer = undefined
+      this.drain()
+    }, ms)
+  }
+}
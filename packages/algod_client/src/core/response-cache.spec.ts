@@ -0,0 +1,88 @@
+import { TEST_GENESIS, jsonResponse } from '@algorandfoundation/algokit-testing'
+import { afterEach, describe, expect, test, vi } from 'vitest'
+import { AlgodClient } from '../client'
+import type { HttpTransport } from './http-transport'
+import { LruResponseCache, estimatePayloadSize } from './response-cache'
+
+const jsonTransport = (body: unknown) => vi.fn<HttpTransport>(async () => jsonResponse(body))
+
+describe('LruResponseCache', () => {
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  test('serves cacheable operations from the cache', async () => {
+    const transport = jsonTransport(TEST_GENESIS)
+    const responseCache = new LruResponseCache()
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, responseCache })
+
+    const first = await algod.genesis()
+    const second = await algod.genesis()
+
+    expect(transport).toHaveBeenCalledTimes(1)
+    expect(second).toEqual(first)
+    expect(responseCache.stats).toMatchObject({ hits: 1, misses: 1, entries: 1 })
+  })
+
+  test("doesn't cache applications, whose global state changes with every app call", async () => {
+    const transport = jsonTransport({ id: 1, params: { 'approval-program': '', 'clear-state-program': '' } })
+    const algod = new AlgodClient({ baseUrl: 'http://localhost', transport, responseCache: new LruResponseCache() })
+
+    await algod.applicationById(1)
+    await algod.applicationById(1)
+
+    expect(transport).toHaveBeenCalledTimes(2)
+  })
+
+  test('expires slow-changing responses after their TTL', async () => {
+    vi.useFakeTimers()
+    const cache = new LruResponseCache({ slowChangingTtlMs: 20 })
+    cache.set('immutable', 'block', 'immutable')
+    cache.set('slow', 'version', 'slow-changing')
+
+    await vi.advanceTimersByTimeAsync(19)
+    expect(cache.get('slow')).toBe('version')
+    await vi.advanceTimersByTimeAsync(1)
+
+    expect(cache.get('slow')).toBeUndefined()
+    expect(cache.get('immutable')).toBe('block')
+    expect(cache.stats).toMatchObject({ expirations: 1, entries: 1 })
+  })
+
+  test('evicts the least recently used entries to respect the entry and byte bounds', () => {
+    const cache = new LruResponseCache({ maxEntries: 2, maxBytes: 100 })
+    cache.set('a', new Uint8Array(10), 'immutable')
+    cache.set('b', new Uint8Array(10), 'immutable')
+    cache.get('a')
+    cache.set('c', new Uint8Array(10), 'immutable')
+
+    expect(cache.get('b')).toBeUndefined()
+    expect(cache.get('a')).toBeDefined()
+    expect(cache.get('c')).toBeDefined()
+
+    cache.set('d', new Uint8Array(95), 'immutable')
+    expect(cache.stats).toMatchObject({ entries: 1, bytes: 95, evictions: 3 })
+
+    cache.set('too-big', new Uint8Array(101), 'immutable')
+    expect(cache.get('too-big')).toBeUndefined()
+    expect(cache.get('d')).toBeDefined()
+  })
+
+  test('copies payloads on the way in and out', () => {
+    const cache = new LruResponseCache()
+    const payload = { round: 1, txns: [new Uint8Array([1, 2])] }
+    cache.set('key', payload, 'immutable')
+    payload.txns[0][0] = 9
+
+    const cached = cache.get('key') as typeof payload
+    cached.txns.push(new Uint8Array())
+
+    expect(cache.get('key')).toEqual({ round: 1, txns: [new Uint8Array([1, 2])] })
+  })
+
+  test('estimates payload sizes', () => {
+    expect(estimatePayloadSize(new Uint8Array(32))).toBe(32)
+    expect(estimatePayloadSize('ab')).toBe(4)
+    expect(estimatePayloadSize({ a: 1n, b: [true] })).toBe(2 + 8 + 2 + 4)
+  })
+})
@@ -4,6 +4,7 @@ import type { ApplicationLocalState } from './application-local-state'
 import { ApplicationLocalStateMeta } from './application-local-state'
 import type { ApplicationParams } from './application-params'
 import { ApplicationParamsMeta } from './application-params'
+import { decodeFields } from '../core/model-runtime'
 
 export type AccountApplicationResponse = {
   /**
@@ -38,3 +39,14 @@ export const AccountApplicationResponseMeta: ObjectModelMetadata<AccountApplicat
     },
   ],
 }
+
+/**
+ * Decodes only the given `AccountApplicationResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccountApplicationResponse<K extends keyof AccountApplicationResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AccountApplicationResponse, K> {
+  return decodeFields(payload, AccountApplicationResponseMeta, fields)
+}
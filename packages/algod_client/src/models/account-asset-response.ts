@@ -4,6 +4,7 @@ import type { AssetHolding } from './asset-holding'
 import { AssetHoldingMeta } from './asset-holding'
 import type { AssetParams } from './asset-params'
 import { AssetParamsMeta } from './asset-params'
+import { decodeFields } from '../core/model-runtime'
 
 export type AccountAssetResponse = {
   /**
@@ -38,3 +39,14 @@ export const AccountAssetResponseMeta: ObjectModelMetadata<AccountAssetResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `AccountAssetResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccountAssetResponse<K extends keyof AccountAssetResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AccountAssetResponse, K> {
+  return decodeFields(payload, AccountAssetResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-c
 import { addressCodec, ArrayModelCodec } from '@algorandfoundation/algokit-common'
 import type { StateDelta } from './state-delta'
 import { StateDeltaMeta } from './state-delta'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Application state delta.
@@ -29,3 +30,14 @@ export const AccountStateDeltaMeta: ObjectModelMetadata<AccountStateDelta> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AccountStateDelta` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccountStateDelta<K extends keyof AccountStateDelta & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AccountStateDelta, K> {
+  return decodeFields(payload, AccountStateDeltaMeta, fields)
+}
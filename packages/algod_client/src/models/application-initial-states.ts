@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { ApplicationKvStorage } from './application-kv-storage'
 import { ApplicationKvStorageMeta } from './application-kv-storage'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * An application's initial global/local/box states that were accessed during simulation.
@@ -50,3 +51,14 @@ export const ApplicationInitialStatesMeta: ObjectModelMetadata<ApplicationInitia
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationInitialStates` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationInitialStates<K extends keyof ApplicationInitialStates & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationInitialStates, K> {
+  return decodeFields(payload, ApplicationInitialStatesMeta, fields)
+}
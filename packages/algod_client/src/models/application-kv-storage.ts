@@ -2,6 +2,7 @@ import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-c
 import { addressCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AvmKeyValue } from './avm-key-value'
 import { AvmKeyValueMeta } from './avm-key-value'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * An application's global/local/box state.
@@ -36,3 +37,14 @@ export const ApplicationKvStorageMeta: ObjectModelMetadata<ApplicationKvStorage>
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationKvStorage` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationKvStorage<K extends keyof ApplicationKvStorage & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationKvStorage, K> {
+  return decodeFields(payload, ApplicationKvStorageMeta, fields)
+}
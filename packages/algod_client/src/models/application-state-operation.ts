@@ -2,6 +2,7 @@ import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-c
 import { stringCodec, bytesCodec, addressCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AvmValue } from './avm-value'
 import { AvmValueMeta } from './avm-value'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * An operation against an application's global/local/box state.
@@ -65,3 +66,14 @@ export const ApplicationStateOperationMeta: ObjectModelMetadata<ApplicationState
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationStateOperation` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationStateOperation<K extends keyof ApplicationStateOperation & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationStateOperation, K> {
+  return decodeFields(payload, ApplicationStateOperationMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Specifies maximums on the number of each type that may be stored.
@@ -34,3 +35,14 @@ export const ApplicationStateSchemaMeta: ObjectModelMetadata<ApplicationStateSch
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationStateSchema` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationStateSchema<K extends keyof ApplicationStateSchema & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationStateSchema, K> {
+  return decodeFields(payload, ApplicationStateSchemaMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { ApplicationParams } from './application-params'
 import { ApplicationParamsMeta } from './application-params'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Application index and its parameters
@@ -32,3 +33,14 @@ export const ApplicationMeta: ObjectModelMetadata<Application> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Application` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplication<K extends keyof Application & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Application, K> {
+  return decodeFields(payload, ApplicationMeta, fields)
+}
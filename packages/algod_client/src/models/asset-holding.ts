@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Describes an asset held by an account.
@@ -48,3 +49,14 @@ export const AssetHoldingMeta: ObjectModelMetadata<AssetHolding> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AssetHolding` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAssetHolding<K extends keyof AssetHolding & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AssetHolding, K> {
+  return decodeFields(payload, AssetHoldingMeta, fields)
+}
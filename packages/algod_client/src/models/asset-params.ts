@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, bigIntCodec, booleanCodec, bytesCodec, fixedBytes32Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * AssetParams specifies the parameters for an asset.
@@ -182,3 +183,14 @@ export const AssetParamsMeta: ObjectModelMetadata<AssetParams> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AssetParams` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAssetParams<K extends keyof AssetParams & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AssetParams, K> {
+  return decodeFields(payload, AssetParamsMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AvmValue } from './avm-value'
 import { AvmValueMeta } from './avm-value'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents an AVM key-value pair in an application store.
@@ -29,3 +30,14 @@ export const AvmKeyValueMeta: ObjectModelMetadata<AvmKeyValue> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AvmKeyValue` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAvmKeyValue<K extends keyof AvmKeyValue & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AvmKeyValue, K> {
+  return decodeFields(payload, AvmKeyValueMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents an AVM value.
@@ -45,3 +46,14 @@ export const AvmValueMeta: ObjectModelMetadata<AvmValue> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AvmValue` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAvmValue<K extends keyof AvmValue & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AvmValue, K> {
+  return decodeFields(payload, AvmValueMeta, fields)
+}
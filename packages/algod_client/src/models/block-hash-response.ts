@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type BlockHashResponse = {
   /**
@@ -20,3 +21,14 @@ export const BlockHashResponseMeta: ObjectModelMetadata<BlockHashResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BlockHashResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlockHashResponse<K extends keyof BlockHashResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BlockHashResponse, K> {
+  return decodeFields(payload, BlockHashResponseMeta, fields)
+}
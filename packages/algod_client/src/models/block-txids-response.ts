@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type BlockTxidsResponse = {
   /**
@@ -20,3 +21,14 @@ export const BlockTxidsResponseMeta: ObjectModelMetadata<BlockTxidsResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BlockTxidsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlockTxidsResponse<K extends keyof BlockTxidsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BlockTxidsResponse, K> {
+  return decodeFields(payload, BlockTxidsResponseMeta, fields)
+}
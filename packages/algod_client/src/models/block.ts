@@ -445,26 +445,63 @@ class BlockCodec extends ObjectModelCodec<Block> {
   protected fromEncoded(value: WireObject, format: EncodingFormat): Block {
     const block = super.fromEncoded(value, format)
 
-    // Populate genesis id and hash on transactions if required to ensure tx id's are correct
-    const genesisId = block.header.genesisId
-    const genesisHash = block.header.genesisHash
-
     for (const txnInBlock of block.payset ?? []) {
-      const txn = txnInBlock.signedTxn.signedTxn.txn
+      populateGenesis(txnInBlock, block.header)
+    }
 
-      if (txnInBlock.hasGenesisId && txn.genesisId === undefined) {
-        txn.genesisId = genesisId
-      }
+    return block
+  }
+
+  protected fromEncodedLazy(value: WireObject, format: EncodingFormat): Block {
+    const block = super.fromEncodedLazy(value, format)
 
-      // The following assumes that Consensus.RequireGenesisHash is true
-      // so assigns genesis hash unless explicitly set to false
-      if (txnInBlock.hasGenesisHash !== false && txn.genesisHash === undefined) {
-        txn.genesisHash = genesisHash
+    // Transactions are decoded on first access, so their genesis information is populated on first access too
+    afterDecode(block, 'payset', (payset) => {
+      for (const txnInBlock of payset ?? []) {
+        afterDecode(txnInBlock, 'signedTxn', () => populateGenesis(txnInBlock, block.header))
       }
-    }
+    })
 
     return block
   }
 }
 
+/**
+ * Populates genesis id and hash on a block transaction if required to ensure tx id's are correct.
+ */
+function populateGenesis(txnInBlock: SignedTxnInBlock, header: BlockHeader): void {
+  const txn = txnInBlock.signedTxn.signedTxn.txn
+
+  if (txnInBlock.hasGenesisId && txn.genesisId === undefined) {
+    txn.genesisId = header.genesisId
+  }
+
+  // The following assumes that Consensus.RequireGenesisHash is true
+  // so assigns genesis hash unless explicitly set to false
+  if (txnInBlock.hasGenesisHash !== false && txn.genesisHash === undefined) {
+    txn.genesisHash = header.genesisHash
+  }
+}
+
+/**
+ * Runs the callback once the (possibly lazily decoded) property has been decoded.
+ */
+function afterDecode<T extends object, K extends keyof T>(target: T, name: K, callback: (value: T[K]) => void): void {
+  const descriptor = Object.getOwnPropertyDescriptor(target, name)
+  if (!descriptor?.get) {
+    callback(target[name])
+    return
+  }
+
+  const decode = descriptor.get
+  Object.defineProperty(target, name, {
+    ...descriptor,
+    get() {
+      const value = decode.call(target)
+      callback(value)
+      return value
+    },
+  })
+}
+
 export const blockCodec = new BlockCodec()
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Box name and its content.
@@ -45,3 +46,11 @@ export const BoxMeta: ObjectModelMetadata<Box> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Box` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBox<K extends keyof Box & string>(payload: Record<string, unknown> | Uint8Array, fields: readonly K[]): Pick<Box, K> {
+  return decodeFields(payload, BoxMeta, fields)
+}
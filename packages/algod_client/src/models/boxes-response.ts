@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { BoxDescriptor } from './box-descriptor'
 import { BoxDescriptorMeta } from './box-descriptor'
+import { decodeFields } from '../core/model-runtime'
 
 export type BoxesResponse = {
   boxes: BoxDescriptor[]
@@ -19,3 +20,14 @@ export const BoxesResponseMeta: ObjectModelMetadata<BoxesResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BoxesResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBoxesResponse<K extends keyof BoxesResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BoxesResponse, K> {
+  return decodeFields(payload, BoxesResponseMeta, fields)
+}
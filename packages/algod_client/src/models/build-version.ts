@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type BuildVersion = {
   branch: string
@@ -52,3 +53,14 @@ export const BuildVersionMeta: ObjectModelMetadata<BuildVersion> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BuildVersion` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBuildVersion<K extends keyof BuildVersion & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BuildVersion, K> {
+  return decodeFields(payload, BuildVersionMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { SourceMap } from './source-map'
 import { SourceMapMeta } from './source-map'
+import { decodeFields } from '../core/model-runtime'
 
 export type CompileResponse = {
   /**
@@ -40,3 +41,14 @@ export const CompileResponseMeta: ObjectModelMetadata<CompileResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `CompileResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeCompileResponse<K extends keyof CompileResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<CompileResponse, K> {
+  return decodeFields(payload, CompileResponseMeta, fields)
+}
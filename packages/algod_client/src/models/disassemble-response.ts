@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type DisassembleResponse = {
   /**
@@ -20,3 +21,14 @@ export const DisassembleResponseMeta: ObjectModelMetadata<DisassembleResponse> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `DisassembleResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeDisassembleResponse<K extends keyof DisassembleResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<DisassembleResponse, K> {
+  return decodeFields(payload, DisassembleResponseMeta, fields)
+}
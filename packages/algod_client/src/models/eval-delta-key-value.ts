@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesBase64Codec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { EvalDelta } from './eval-delta'
 import { EvalDeltaMeta } from './eval-delta'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Key-value pairs for StateDelta.
@@ -29,3 +30,14 @@ export const EvalDeltaKeyValueMeta: ObjectModelMetadata<EvalDeltaKeyValue> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `EvalDeltaKeyValue` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeEvalDeltaKeyValue<K extends keyof EvalDeltaKeyValue & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<EvalDeltaKeyValue, K> {
+  return decodeFields(payload, EvalDeltaKeyValueMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 const GenesisAllocationStateMeta: ObjectModelMetadata<GenesisAllocation['state']> = {
   name: 'GenesisAllocationStateMeta',
@@ -95,3 +96,14 @@ export const GenesisAllocationMeta: ObjectModelMetadata<GenesisAllocation> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `GenesisAllocation` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeGenesisAllocation<K extends keyof GenesisAllocation & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<GenesisAllocation, K> {
+  return decodeFields(payload, GenesisAllocationMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, booleanCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { GenesisAllocation } from './genesis-allocation'
 import { GenesisAllocationMeta } from './genesis-allocation'
+import { decodeFields } from '../core/model-runtime'
 
 export type Genesis = {
   alloc: GenesisAllocation[]
@@ -75,3 +76,14 @@ export const GenesisMeta: ObjectModelMetadata<Genesis> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Genesis` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeGenesis<K extends keyof Genesis & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Genesis, K> {
+  return decodeFields(payload, GenesisMeta, fields)
+}
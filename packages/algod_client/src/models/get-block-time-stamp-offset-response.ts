@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type GetBlockTimeStampOffsetResponse = {
   /**
@@ -20,3 +21,14 @@ export const GetBlockTimeStampOffsetResponseMeta: ObjectModelMetadata<GetBlockTi
     },
   ],
 }
+
+/**
+ * Decodes only the given `GetBlockTimeStampOffsetResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeGetBlockTimeStampOffsetResponse<K extends keyof GetBlockTimeStampOffsetResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<GetBlockTimeStampOffsetResponse, K> {
+  return decodeFields(payload, GetBlockTimeStampOffsetResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type GetSyncRoundResponse = {
   /**
@@ -20,3 +21,14 @@ export const GetSyncRoundResponseMeta: ObjectModelMetadata<GetSyncRoundResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `GetSyncRoundResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeGetSyncRoundResponse<K extends keyof GetSyncRoundResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<GetSyncRoundResponse, K> {
+  return decodeFields(payload, GetSyncRoundResponseMeta, fields)
+}
@@ -63,6 +63,64 @@ export type { DisassembleResponse } from './disassemble-response'
 export type { SourceMap } from './source-map'
 export { encodeSimulateResponseToJson } from './simulate-response'
 export { decodeSimulateResponseFromJson } from './simulate-response'
+export { decodeGenesisAllocation } from './genesis-allocation'
+export { decodeGenesis } from './genesis'
+export { decodeLedgerStateDeltaForTransactionGroup } from './ledger-state-delta-for-transaction-group'
+export { decodeAccount } from './account'
+export { decodeAccountParticipation } from './account-participation'
+export { decodeAsset } from './asset'
+export { decodeAssetHolding } from './asset-holding'
+export { decodeAssetParams } from './asset-params'
+export { decodeApplicationStateSchema } from './application-state-schema'
+export { decodeApplicationLocalState } from './application-local-state'
+export { decodeTealKeyValue } from './teal-key-value'
+export { decodeTealValue } from './teal-value'
+export { decodeAvmValue } from './avm-value'
+export { decodeAvmKeyValue } from './avm-key-value'
+export { decodeAccountStateDelta } from './account-state-delta'
+export { decodeEvalDeltaKeyValue } from './eval-delta-key-value'
+export { decodeEvalDelta } from './eval-delta'
+export { decodeApplication } from './application'
+export { decodeApplicationParams } from './application-params'
+export { decodeSimulateRequest } from './simulate-request'
+export { decodeSimulateRequestTransactionGroup } from './simulate-request-transaction-group'
+export { decodeSimulateTraceConfig } from './simulate-trace-config'
+export { decodeBox } from './box'
+export { decodeBoxDescriptor } from './box-descriptor'
+export { decodeVersion } from './version'
+export { decodeBuildVersion } from './build-version'
+export { decodePendingTransactionResponse } from './pending-transaction-response'
+export { decodeSimulateTransactionGroupResult } from './simulate-transaction-group-result'
+export { decodeSimulateTransactionResult } from './simulate-transaction-result'
+export { decodeStateProof } from './state-proof'
+export { decodeLightBlockHeaderProof } from './light-block-header-proof'
+export { decodeStateProofMessage } from './state-proof-message'
+export { decodeSimulationEvalOverrides } from './simulation-eval-overrides'
+export { decodeScratchChange } from './scratch-change'
+export { decodeApplicationStateOperation } from './application-state-operation'
+export { decodeApplicationKvStorage } from './application-kv-storage'
+export { decodeApplicationInitialStates } from './application-initial-states'
+export { decodeSimulationOpcodeTraceUnit } from './simulation-opcode-trace-unit'
+export { decodeSimulationTransactionExecTrace } from './simulation-transaction-exec-trace'
+export { decodeSimulateUnnamedResourcesAccessed } from './simulate-unnamed-resources-accessed'
+export { decodeSimulateInitialStates } from './simulate-initial-states'
+export { decodeTransactionProof } from './transaction-proof'
+export { decodeGetBlockTimeStampOffsetResponse } from './get-block-time-stamp-offset-response'
+export { decodeGetSyncRoundResponse } from './get-sync-round-response'
+export { decodeAccountAssetResponse } from './account-asset-response'
+export { decodeAccountApplicationResponse } from './account-application-response'
+export { decodeBlockTxidsResponse } from './block-txids-response'
+export { decodeBlockHashResponse } from './block-hash-response'
+export { decodeNodeStatusResponse } from './node-status-response'
+export { decodePendingTransactionsResponse } from './pending-transactions-response'
+export { decodePostTransactionsResponse } from './post-transactions-response'
+export { decodeSimulateResponse } from './simulate-response'
+export { decodeSupplyResponse } from './supply-response'
+export { decodeTransactionParametersResponse } from './transaction-parameters-response'
+export { decodeBoxesResponse } from './boxes-response'
+export { decodeCompileResponse } from './compile-response'
+export { decodeDisassembleResponse } from './disassemble-response'
+export { decodeSourceMap } from './source-map'
 export type { SuggestedParams, SuggestedParamsMeta } from './suggested-params'
 export type { Block } from './block'
 export type { BlockHeader } from './block'
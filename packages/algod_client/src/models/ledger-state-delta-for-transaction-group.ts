@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { LedgerStateDelta } from './ledger-state-delta'
 import { LedgerStateDeltaMeta } from './ledger-state-delta'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Contains a ledger delta for a single transaction group
@@ -29,3 +30,14 @@ export const LedgerStateDeltaForTransactionGroupMeta: ObjectModelMetadata<Ledger
     },
   ],
 }
+
+/**
+ * Decodes only the given `LedgerStateDeltaForTransactionGroup` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeLedgerStateDeltaForTransactionGroup<K extends keyof LedgerStateDeltaForTransactionGroup & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<LedgerStateDeltaForTransactionGroup, K> {
+  return decodeFields(payload, LedgerStateDeltaForTransactionGroupMeta, fields)
+}
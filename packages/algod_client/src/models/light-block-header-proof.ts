@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Proof of membership and position of a light block header.
@@ -45,3 +46,14 @@ export const LightBlockHeaderProofMeta: ObjectModelMetadata<LightBlockHeaderProo
     },
   ],
 }
+
+/**
+ * Decodes only the given `LightBlockHeaderProof` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeLightBlockHeaderProof<K extends keyof LightBlockHeaderProof & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<LightBlockHeaderProof, K> {
+  return decodeFields(payload, LightBlockHeaderProofMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, bigIntCodec, booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * NodeStatus contains the information about a node status
@@ -298,3 +299,14 @@ export const NodeStatusResponseMeta: ObjectModelMetadata<NodeStatusResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `NodeStatusResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeNodeStatusResponse<K extends keyof NodeStatusResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<NodeStatusResponse, K> {
+  return decodeFields(payload, NodeStatusResponseMeta, fields)
+}
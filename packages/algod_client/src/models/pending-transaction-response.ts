@@ -13,6 +13,7 @@ import type { AccountStateDelta } from './account-state-delta'
 import { AccountStateDeltaMeta } from './account-state-delta'
 import type { StateDelta } from './state-delta'
 import { StateDeltaMeta } from './state-delta'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Details about a pending transaction. If the transaction was recently confirmed, includes confirmation details like the round and reward details.
@@ -175,3 +176,14 @@ export const PendingTransactionResponseMeta: ObjectModelMetadata<PendingTransact
     },
   ],
 }
+
+/**
+ * Decodes only the given `PendingTransactionResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodePendingTransactionResponse<K extends keyof PendingTransactionResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<PendingTransactionResponse, K> {
+  return decodeFields(payload, PendingTransactionResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { SignedTransaction } from '@algorandfoundation/algokit-transact'
 import { SignedTransactionMeta } from '@algorandfoundation/algokit-transact'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * PendingTransactions is an array of signed transactions exactly as they were submitted.
@@ -36,3 +37,14 @@ export const PendingTransactionsResponseMeta: ObjectModelMetadata<PendingTransac
     },
   ],
 }
+
+/**
+ * Decodes only the given `PendingTransactionsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodePendingTransactionsResponse<K extends keyof PendingTransactionsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<PendingTransactionsResponse, K> {
+  return decodeFields(payload, PendingTransactionsResponseMeta, fields)
+}
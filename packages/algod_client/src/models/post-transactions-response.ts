@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type PostTransactionsResponse = {
   /**
@@ -20,3 +21,14 @@ export const PostTransactionsResponseMeta: ObjectModelMetadata<PostTransactionsR
     },
   ],
 }
+
+/**
+ * Decodes only the given `PostTransactionsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodePostTransactionsResponse<K extends keyof PostTransactionsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<PostTransactionsResponse, K> {
+  return decodeFields(payload, PostTransactionsResponseMeta, fields)
+}
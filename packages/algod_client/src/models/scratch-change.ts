@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AvmValue } from './avm-value'
 import { AvmValueMeta } from './avm-value'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * A write operation into a scratch slot.
@@ -32,3 +33,14 @@ export const ScratchChangeMeta: ObjectModelMetadata<ScratchChange> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ScratchChange` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeScratchChange<K extends keyof ScratchChange & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ScratchChange, K> {
+  return decodeFields(payload, ScratchChangeMeta, fields)
+}
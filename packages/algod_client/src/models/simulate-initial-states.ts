@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { ApplicationInitialStates } from './application-initial-states'
 import { ApplicationInitialStatesMeta } from './application-initial-states'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Initial states of resources that were accessed during simulation.
@@ -25,3 +26,14 @@ export const SimulateInitialStatesMeta: ObjectModelMetadata<SimulateInitialState
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateInitialStates` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateInitialStates<K extends keyof SimulateInitialStates & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateInitialStates, K> {
+  return decodeFields(payload, SimulateInitialStatesMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { SignedTransaction } from '@algorandfoundation/algokit-transact'
 import { SignedTransactionMeta } from '@algorandfoundation/algokit-transact'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * A transaction group to simulate.
@@ -25,3 +26,14 @@ export const SimulateRequestTransactionGroupMeta: ObjectModelMetadata<SimulateRe
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateRequestTransactionGroup` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateRequestTransactionGroup<K extends keyof SimulateRequestTransactionGroup & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateRequestTransactionGroup, K> {
+  return decodeFields(payload, SimulateRequestTransactionGroupMeta, fields)
+}
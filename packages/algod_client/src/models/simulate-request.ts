@@ -4,6 +4,7 @@ import type { SimulateRequestTransactionGroup } from './simulate-request-transac
 import { SimulateRequestTransactionGroupMeta } from './simulate-request-transaction-group'
 import type { SimulateTraceConfig } from './simulate-trace-config'
 import { SimulateTraceConfigMeta } from './simulate-trace-config'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Request type for simulation endpoint.
@@ -100,3 +101,14 @@ export const SimulateRequestMeta: ObjectModelMetadata<SimulateRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateRequest<K extends keyof SimulateRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateRequest, K> {
+  return decodeFields(payload, SimulateRequestMeta, fields)
+}
@@ -8,6 +8,7 @@ import type { SimulateTransactionGroupResult } from './simulate-transaction-grou
 import { SimulateTransactionGroupResultMeta } from './simulate-transaction-group-result'
 import type { SimulationEvalOverrides } from './simulation-eval-overrides'
 import { SimulationEvalOverridesMeta } from './simulation-eval-overrides'
+import { decodeFields } from '../core/model-runtime'
 import { encodeJson, decodeJson } from '../core/model-runtime'
 
 export type SimulateResponse = {
@@ -73,6 +74,17 @@ export const SimulateResponseMeta: ObjectModelMetadata<SimulateResponse> = {
   ],
 }
 
+/**
+ * Decodes only the given `SimulateResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateResponse<K extends keyof SimulateResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateResponse, K> {
+  return decodeFields(payload, SimulateResponseMeta, fields)
+}
+
 export function encodeSimulateResponseToJson(simulateResponse: SimulateResponse): string {
   return encodeJson(simulateResponse, SimulateResponseMeta, 2)
 }
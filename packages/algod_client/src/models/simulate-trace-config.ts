@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * An object that configures simulation execution trace.
@@ -56,3 +57,14 @@ export const SimulateTraceConfigMeta: ObjectModelMetadata<SimulateTraceConfig> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateTraceConfig` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateTraceConfig<K extends keyof SimulateTraceConfig & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateTraceConfig, K> {
+  return decodeFields(payload, SimulateTraceConfigMeta, fields)
+}
@@ -4,6 +4,7 @@ import type { SimulateTransactionResult } from './simulate-transaction-result'
 import { SimulateTransactionResultMeta } from './simulate-transaction-result'
 import type { SimulateUnnamedResourcesAccessed } from './simulate-unnamed-resources-accessed'
 import { SimulateUnnamedResourcesAccessedMeta } from './simulate-unnamed-resources-accessed'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Simulation result for an atomic transaction group
@@ -78,3 +79,14 @@ export const SimulateTransactionGroupResultMeta: ObjectModelMetadata<SimulateTra
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateTransactionGroupResult` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateTransactionGroupResult<K extends keyof SimulateTransactionGroupResult & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateTransactionGroupResult, K> {
+  return decodeFields(payload, SimulateTransactionGroupResultMeta, fields)
+}
@@ -6,6 +6,7 @@ import type { SimulateUnnamedResourcesAccessed } from './simulate-unnamed-resour
 import { SimulateUnnamedResourcesAccessedMeta } from './simulate-unnamed-resources-accessed'
 import type { SimulationTransactionExecTrace } from './simulation-transaction-exec-trace'
 import { SimulationTransactionExecTraceMeta } from './simulation-transaction-exec-trace'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Simulation result for an individual transaction
@@ -73,3 +74,14 @@ export const SimulateTransactionResultMeta: ObjectModelMetadata<SimulateTransact
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateTransactionResult` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateTransactionResult<K extends keyof SimulateTransactionResult & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateTransactionResult, K> {
+  return decodeFields(payload, SimulateTransactionResultMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-c
 import { numberCodec, ArrayCodec, bigIntArrayCodec, addressArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { BoxReference, HoldingReference, LocalsReference } from '@algorandfoundation/algokit-transact'
 import { BoxReferenceMeta, HoldingReferenceMeta, LocalsReferenceMeta } from '@algorandfoundation/algokit-transact'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * These are resources that were accessed by this group that would normally have caused failure, but were allowed in simulation. Depending on where this object is in the response, the unnamed resources it contains may or may not qualify for group resource sharing. If this is a field in SimulateTransactionGroupResult, the resources do qualify, but if this is a field in SimulateTransactionResult, they do not qualify. In order to make this group valid for actual submission, resources that qualify for group sharing can be made available by any transaction of the group; otherwise, resources must be placed in the same transaction which accessed them.
@@ -91,3 +92,14 @@ export const SimulateUnnamedResourcesAccessedMeta: ObjectModelMetadata<SimulateU
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulateUnnamedResourcesAccessed` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulateUnnamedResourcesAccessed<K extends keyof SimulateUnnamedResourcesAccessed & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulateUnnamedResourcesAccessed, K> {
+  return decodeFields(payload, SimulateUnnamedResourcesAccessedMeta, fields)
+}
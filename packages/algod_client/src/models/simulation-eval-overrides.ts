@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The set of parameters and limits override during simulation. If this set of parameters is present, then evaluation parameters may differ from standard evaluation in certain ways.
@@ -78,3 +79,14 @@ export const SimulationEvalOverridesMeta: ObjectModelMetadata<SimulationEvalOver
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulationEvalOverrides` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulationEvalOverrides<K extends keyof SimulationEvalOverrides & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulationEvalOverrides, K> {
+  return decodeFields(payload, SimulationEvalOverridesMeta, fields)
+}
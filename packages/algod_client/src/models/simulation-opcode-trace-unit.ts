@@ -6,6 +6,7 @@ import type { AvmValue } from './avm-value'
 import { AvmValueMeta } from './avm-value'
 import type { ScratchChange } from './scratch-change'
 import { ScratchChangeMeta } from './scratch-change'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The set of trace information and effect from evaluating a single opcode.
@@ -84,3 +85,14 @@ export const SimulationOpcodeTraceUnitMeta: ObjectModelMetadata<SimulationOpcode
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulationOpcodeTraceUnit` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulationOpcodeTraceUnit<K extends keyof SimulationOpcodeTraceUnit & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulationOpcodeTraceUnit, K> {
+  return decodeFields(payload, SimulationOpcodeTraceUnitMeta, fields)
+}
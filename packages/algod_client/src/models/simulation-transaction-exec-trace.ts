@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, booleanCodec, bytesCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { SimulationOpcodeTraceUnit } from './simulation-opcode-trace-unit'
 import { SimulationOpcodeTraceUnitMeta } from './simulation-opcode-trace-unit'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The execution trace of calling an app or a logic sig, containing the inner app call trace in a recursive way.
@@ -113,3 +114,14 @@ export const SimulationTransactionExecTraceMeta: ObjectModelMetadata<SimulationT
     },
   ],
 }
+
+/**
+ * Decodes only the given `SimulationTransactionExecTrace` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSimulationTransactionExecTrace<K extends keyof SimulationTransactionExecTrace & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SimulationTransactionExecTrace, K> {
+  return decodeFields(payload, SimulationTransactionExecTraceMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, stringArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Source map for the program
@@ -53,3 +54,14 @@ export const SourceMapMeta: ObjectModelMetadata<SourceMap> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `SourceMap` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSourceMap<K extends keyof SourceMap & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SourceMap, K> {
+  return decodeFields(payload, SourceMapMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents the message that the state proofs are attesting to.
@@ -67,3 +68,14 @@ export const StateProofMessageMeta: ObjectModelMetadata<StateProofMessage> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofMessage` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofMessage<K extends keyof StateProofMessage & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofMessage, K> {
+  return decodeFields(payload, StateProofMessageMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { StateProofMessage } from './state-proof-message'
 import { StateProofMessageMeta } from './state-proof-message'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents a state proof and its corresponding message
@@ -33,3 +34,14 @@ export const StateProofMeta: ObjectModelMetadata<StateProof> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProof` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProof<K extends keyof StateProof & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProof, K> {
+  return decodeFields(payload, StateProofMeta, fields)
+}
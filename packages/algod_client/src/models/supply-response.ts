@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Supply represents the current supply of MicroAlgos in the system
@@ -45,3 +46,14 @@ export const SupplyResponseMeta: ObjectModelMetadata<SupplyResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `SupplyResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSupplyResponse<K extends keyof SupplyResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SupplyResponse, K> {
+  return decodeFields(payload, SupplyResponseMeta, fields)
+}
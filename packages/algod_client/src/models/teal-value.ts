@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents a TEAL value.
@@ -45,3 +46,14 @@ export const TealValueMeta: ObjectModelMetadata<TealValue> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `TealValue` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTealValue<K extends keyof TealValue & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TealValue, K> {
+  return decodeFields(payload, TealValueMeta, fields)
+}
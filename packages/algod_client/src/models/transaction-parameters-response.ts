@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, fixedBytes32Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * TransactionParams contains the parameters that help a client construct
@@ -84,3 +85,14 @@ export const TransactionParametersResponseMeta: ObjectModelMetadata<TransactionP
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionParametersResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionParametersResponse<K extends keyof TransactionParametersResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionParametersResponse, K> {
+  return decodeFields(payload, TransactionParametersResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Proof of transaction in a block.
@@ -69,3 +70,14 @@ export const TransactionProofMeta: ObjectModelMetadata<TransactionProof> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionProof` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionProof<K extends keyof TransactionProof & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionProof, K> {
+  return decodeFields(payload, TransactionProofMeta, fields)
+}
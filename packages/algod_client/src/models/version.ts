@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesCodec, stringArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { BuildVersion } from './build-version'
 import { BuildVersionMeta } from './build-version'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * algod version information.
@@ -43,3 +44,14 @@ export const VersionMeta: ObjectModelMetadata<Version> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Version` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeVersion<K extends keyof Version & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Version, K> {
+  return decodeFields(payload, VersionMeta, fields)
+}
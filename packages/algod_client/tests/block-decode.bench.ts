@@ -0,0 +1,72 @@
+import { encodeMsgpack } from '@algorandfoundation/algokit-common'
+import { bench, describe } from 'vitest'
+import { AlgodClient } from '../src/client'
+
+// Compares eager and lazy (`lazyDecoding: true`) decoding of a mainnet-sized block (a full 5 MB block holds ~20,000
+// payment transactions) for callers that read only the header, the first few transactions, or the whole block.
+
+const TXN_COUNT = 20_000
+
+const bytes = (length: number, fill: number) => new Uint8Array(length).fill(fill)
+
+const BLOCK = new Uint8Array(
+  encodeMsgpack({
+    block: {
+      rnd: 45_000_000,
+      gen: 'mainnet-v1.0',
+      gh: bytes(32, 1),
+      prev: bytes(32, 2),
+      seed: bytes(32, 3),
+      ts: 1_700_000_000,
+      txns: Array.from({ length: TXN_COUNT }, (_, i) => ({
+        txn: { type: 'pay', snd: bytes(32, 4), rcv: bytes(32, 5), amt: 1_000 + i, fee: 1_000, fv: 44_999_000, lv: 45_000_000 },
+        sig: bytes(64, 6),
+        hgi: true,
+      })),
+    },
+  }),
+)
+
+const client = (lazyDecoding: boolean) =>
+  new AlgodClient({
+    baseUrl: 'http://localhost',
+    maxRetries: 0,
+    lazyDecoding,
+    transport: async () => new Response(BLOCK, { headers: { 'content-type': 'application/msgpack' } }),
+  })
+
+const eager = client(false)
+const lazy = client(true)
+
+describe('block: header only', () => {
+  bench('eager', async () => {
+    const { block } = await eager.block(1)
+    void block.header.round
+  })
+  bench('lazy', async () => {
+    const { block } = await lazy.block(1)
+    void block.header.round
+  })
+})
+
+describe('block: first 10 transactions', () => {
+  const read = async (algod: AlgodClient) => {
+    const { block } = await algod.block(1)
+    for (const txnInBlock of block.payset.slice(0, 10)) {
+      void txnInBlock.signedTxn.signedTxn.txn.sender
+    }
+  }
+  bench('eager', () => read(eager))
+  bench('lazy', () => read(lazy))
+})
+
+describe('block: every transaction', () => {
+  const read = async (algod: AlgodClient) => {
+    const { block } = await algod.block(1)
+    for (const txnInBlock of block.payset) {
+      void txnInBlock.signedTxn.signedTxn.txn.sender
+    }
+  }
+  bench('eager', () => read(eager))
+  bench('lazy', () => read(lazy))
+})
@@ -0,0 +1,26 @@
+import { bench, describe } from 'vitest'
+import { AlgodClient } from '../src/client'
+
+// Measures the overhead of request instrumentation on a cheap call: no hooks (the default) against no-op hooks.
+
+const RESPONSE = JSON.stringify({ blockHash: 'JBR3KGFEWPEE5SAQ6IWU6EEBZMHXD4CZU6WCBXWGF57XBZIJHIRA' })
+
+const client = (instrumented: boolean) =>
+  new AlgodClient({
+    baseUrl: 'http://localhost',
+    maxRetries: 0,
+    instrumentation: instrumented ? { onOperationStart: () => {}, onOperationEnd: () => {} } : undefined,
+    transport: async () => new Response(RESPONSE, { headers: { 'content-type': 'application/json' } }),
+  })
+
+const plain = client(false)
+const instrumented = client(true)
+
+describe('blockHash', () => {
+  bench('no instrumentation', async () => {
+    await plain.blockHash(1)
+  })
+  bench('no-op instrumentation hooks', async () => {
+    await instrumented.blockHash(1)
+  })
+})
@@ -0,0 +1,262 @@
+import { ObjectModelCodec, type ObjectModelMetadata } from '@algorandfoundation/algokit-common'
+import { startLocalMockServer, type LocalMockServer, type LocalMockServerOptions, type MockRoute } from '@algorandfoundation/algokit-testing'
+import { encodeJson, encodeMsgpack } from '../src/core/model-runtime'
+import {
+  AccountMeta,
+  AccountApplicationResponseMeta,
+  AccountAssetResponseMeta,
+  ApplicationMeta,
+  AssetMeta,
+  BlockHashResponseMeta,
+  BlockResponseMeta,
+  BlockTxidsResponseMeta,
+  BoxMeta,
+  BoxesResponseMeta,
+  CompileResponseMeta,
+  DisassembleResponseMeta,
+  GenesisMeta,
+  GetBlockTimeStampOffsetResponseMeta,
+  GetSyncRoundResponseMeta,
+  LedgerStateDeltaMeta,
+  LightBlockHeaderProofMeta,
+  NodeStatusResponseMeta,
+  PendingTransactionResponseMeta,
+  PendingTransactionsResponseMeta,
+  PostTransactionsResponseMeta,
+  SimulateResponseMeta,
+  StateProofMeta,
+  SupplyResponseMeta,
+  TransactionGroupLedgerStateDeltasForRoundResponseMeta,
+  TransactionParametersResponseMeta,
+  TransactionProofMeta,
+  VersionMeta,
+} from '../src/models/model-meta'
+
+// A stand-in for the API behind AlgodClient, for load testing without a node. It serves every operation of the client, each
+// with a schema-valid (default valued) response in the operation's wire format; recorded responses can be served instead with the
+// `fixturesDir` option. See `startLocalMockServer` for the latency, error and rate limit injection options.
+
+type Meta = ObjectModelMetadata<Record<string, unknown>>
+
+const defaultValue = (meta: Meta) => new ObjectModelCodec(meta).defaultValue()
+
+const json = (meta: Meta): MockRoute['response'] => ({ format: 'json', body: () => encodeJson(defaultValue(meta), meta) })
+const msgpack = (meta: Meta): MockRoute['response'] => ({ format: 'msgpack', body: () => encodeMsgpack(defaultValue(meta), meta) })
+
+/** The route of every AlgodClient operation. */
+export const routes: MockRoute[] = [
+  {
+    operationId: 'accountApplicationInformation',
+    method: 'GET',
+    path: '/v2/accounts/{address}/applications/{application-id}',
+    response: json(AccountApplicationResponseMeta as Meta),
+  },
+  {
+    operationId: 'accountAssetInformation',
+    method: 'GET',
+    path: '/v2/accounts/{address}/assets/{asset-id}',
+    response: json(AccountAssetResponseMeta as Meta),
+  },
+  {
+    operationId: 'accountInformation',
+    method: 'GET',
+    path: '/v2/accounts/{address}',
+    response: json(AccountMeta as Meta),
+  },
+  {
+    operationId: 'applicationBoxByName',
+    method: 'GET',
+    path: '/v2/applications/{application-id}/box',
+    response: json(BoxMeta as Meta),
+  },
+  {
+    operationId: 'applicationBoxes',
+    method: 'GET',
+    path: '/v2/applications/{application-id}/boxes',
+    response: json(BoxesResponseMeta as Meta),
+  },
+  {
+    operationId: 'applicationById',
+    method: 'GET',
+    path: '/v2/applications/{application-id}',
+    response: json(ApplicationMeta as Meta),
+  },
+  {
+    operationId: 'assetById',
+    method: 'GET',
+    path: '/v2/assets/{asset-id}',
+    response: json(AssetMeta as Meta),
+  },
+  {
+    operationId: 'block',
+    method: 'GET',
+    path: '/v2/blocks/{round}',
+    response: msgpack(BlockResponseMeta as Meta),
+  },
+  {
+    operationId: 'blockHash',
+    method: 'GET',
+    path: '/v2/blocks/{round}/hash',
+    response: json(BlockHashResponseMeta as Meta),
+  },
+  {
+    operationId: 'blockTimeStampOffset',
+    method: 'GET',
+    path: '/v2/devmode/blocks/offset',
+    response: json(GetBlockTimeStampOffsetResponseMeta as Meta),
+  },
+  {
+    operationId: 'blockTxIds',
+    method: 'GET',
+    path: '/v2/blocks/{round}/txids',
+    response: json(BlockTxidsResponseMeta as Meta),
+  },
+  {
+    operationId: 'genesis',
+    method: 'GET',
+    path: '/genesis',
+    response: json(GenesisMeta as Meta),
+  },
+  {
+    operationId: 'healthCheck',
+    method: 'GET',
+    path: '/health',
+  },
+  {
+    operationId: 'ledgerStateDelta',
+    method: 'GET',
+    path: '/v2/deltas/{round}',
+    response: msgpack(LedgerStateDeltaMeta as Meta),
+  },
+  {
+    operationId: 'ledgerStateDeltaForTransactionGroup',
+    method: 'GET',
+    path: '/v2/deltas/txn/group/{id}',
+    response: msgpack(LedgerStateDeltaMeta as Meta),
+  },
+  {
+    operationId: 'lightBlockHeaderProof',
+    method: 'GET',
+    path: '/v2/blocks/{round}/lightheader/proof',
+    response: json(LightBlockHeaderProofMeta as Meta),
+  },
+  {
+    operationId: 'pendingTransactionInformation',
+    method: 'GET',
+    path: '/v2/transactions/pending/{txid}',
+    response: msgpack(PendingTransactionResponseMeta as Meta),
+  },
+  {
+    operationId: 'pendingTransactions',
+    method: 'GET',
+    path: '/v2/transactions/pending',
+    response: msgpack(PendingTransactionsResponseMeta as Meta),
+  },
+  {
+    operationId: 'pendingTransactionsByAddress',
+    method: 'GET',
+    path: '/v2/accounts/{address}/transactions/pending',
+    response: msgpack(PendingTransactionsResponseMeta as Meta),
+  },
+  {
+    operationId: 'rawTransaction',
+    method: 'POST',
+    path: '/v2/transactions',
+    response: json(PostTransactionsResponseMeta as Meta),
+  },
+  {
+    operationId: 'ready',
+    method: 'GET',
+    path: '/ready',
+  },
+  {
+    operationId: 'setBlockTimeStampOffset',
+    method: 'POST',
+    path: '/v2/devmode/blocks/offset/{offset}',
+  },
+  {
+    operationId: 'setSyncRound',
+    method: 'POST',
+    path: '/v2/ledger/sync/{round}',
+  },
+  {
+    operationId: 'simulateTransactions',
+    method: 'POST',
+    path: '/v2/transactions/simulate',
+    response: msgpack(SimulateResponseMeta as Meta),
+  },
+  {
+    operationId: 'stateProof',
+    method: 'GET',
+    path: '/v2/stateproofs/{round}',
+    response: json(StateProofMeta as Meta),
+  },
+  {
+    operationId: 'status',
+    method: 'GET',
+    path: '/v2/status',
+    response: json(NodeStatusResponseMeta as Meta),
+  },
+  {
+    operationId: 'statusAfterBlock',
+    method: 'GET',
+    path: '/v2/status/wait-for-block-after/{round}',
+    response: json(NodeStatusResponseMeta as Meta),
+  },
+  {
+    operationId: 'supply',
+    method: 'GET',
+    path: '/v2/ledger/supply',
+    response: json(SupplyResponseMeta as Meta),
+  },
+  {
+    operationId: 'syncRound',
+    method: 'GET',
+    path: '/v2/ledger/sync',
+    response: json(GetSyncRoundResponseMeta as Meta),
+  },
+  {
+    operationId: 'tealCompile',
+    method: 'POST',
+    path: '/v2/teal/compile',
+    response: json(CompileResponseMeta as Meta),
+  },
+  {
+    operationId: 'tealDisassemble',
+    method: 'POST',
+    path: '/v2/teal/disassemble',
+    response: json(DisassembleResponseMeta as Meta),
+  },
+  {
+    operationId: 'transactionGroupLedgerStateDeltasForRound',
+    method: 'GET',
+    path: '/v2/deltas/{round}/txn/group',
+    response: msgpack(TransactionGroupLedgerStateDeltasForRoundResponseMeta as Meta),
+  },
+  {
+    operationId: 'transactionParams',
+    method: 'GET',
+    path: '/v2/transactions/params',
+    response: json(TransactionParametersResponseMeta as Meta),
+  },
+  {
+    operationId: 'transactionProof',
+    method: 'GET',
+    path: '/v2/blocks/{round}/transactions/{txid}/proof',
+    response: json(TransactionProofMeta as Meta),
+  },
+  {
+    operationId: 'unsetSyncRound',
+    method: 'DELETE',
+    path: '/v2/ledger/sync',
+  },
+  {
+    operationId: 'version',
+    method: 'GET',
+    path: '/versions',
+    response: json(VersionMeta as Meta),
+  },
+]
+
+/** Starts a local mock server for the API behind AlgodClient; see `startLocalMockServer` for the options. */
+export const startMockServer = (options?: LocalMockServerOptions): Promise<LocalMockServer> => startLocalMockServer(routes, options)
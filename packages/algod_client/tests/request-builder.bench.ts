@@ -0,0 +1,46 @@
+import { bench, describe } from 'vitest'
+import { compileUrl, inputValueAsString } from '../src/core/base-http-request'
+
+// Compares building the URL and headers of an `accountInformation` request (`/v2/accounts/{address}`) the way every
+// request used to (template substitution, `new URL` and `searchParams` on each call) with the precompiled builder.
+
+const BASE_URL = 'http://localhost:4001'
+const TEMPLATE = '/v2/accounts/{address}'
+const PATH = { address: 'XBYLS2E6YI6XXL5BWCAMOA4GTWHXWENZMX5UHXMRNWWUQ7BXCY5WC5TEPA' }
+const QUERY = { exclude: 'all', format: 'json' }
+const CONFIG_HEADERS = { 'User-Agent': 'bench' }
+const REQUEST_HEADERS = { Accept: 'application/json' }
+const TOKEN = 'a'.repeat(64)
+
+const perCall = () => {
+  let rawPath = TEMPLATE
+  for (const [key, value] of Object.entries(PATH)) {
+    rawPath = rawPath.replace(`{${key}}`, encodeURI(inputValueAsString(value)).replace(/%5B/g, '[').replace(/%5D/g, ']'))
+  }
+  const url = new URL(rawPath, BASE_URL)
+  url.port = '4001'
+  for (const [key, value] of Object.entries(QUERY)) {
+    url.searchParams.set(key, inputValueAsString(value))
+  }
+  const headers: Record<string, string> = { ...CONFIG_HEADERS, ...REQUEST_HEADERS }
+  headers['X-Algo-API-Token'] = TOKEN
+  return [url.toString(), headers] as const
+}
+
+const buildUrl = compileUrl(TEMPLATE, ['exclude', 'format'])
+const origin = new URL(BASE_URL).origin
+const tokenHeaders = { 'X-Algo-API-Token': TOKEN }
+
+const precompiled = () => {
+  const headers: Record<string, string> = { ...CONFIG_HEADERS, ...REQUEST_HEADERS, ...tokenHeaders }
+  return [origin + buildUrl(PATH, QUERY), headers] as const
+}
+
+describe('accountInformation: URL and headers', () => {
+  bench('per call', () => {
+    perCall()
+  })
+  bench('precompiled', () => {
+    precompiled()
+  })
+})
@@ -3,7 +3,7 @@ import { defineConfig } from 'vitest/config'
 export default defineConfig({
   appType: 'custom',
   test: {
-    include: ['tests/**/*.test.ts'],
+    include: ['tests/**/*.test.ts', 'src/**/*.spec.ts'],
     exclude: ['node_modules'],
     globalSetup: ['./tests/globalSetup.ts'],
     testTimeout: 30_000,
@@ -63,6 +63,31 @@ export abstract class Codec<T, TEncoded = T, TWireEncoded = TEncoded> {
     return this.fromEncoded(value, format)
   }
 
+  /**
+   * Decode a value from wire format, deferring the decoding of nested objects, arrays and maps until they are first accessed.
+   * Codecs that don't support lazy decoding decode eagerly.
+   * @param value - The wire value
+   * @param format - The wire format (json or msgpack)
+   * @returns The decoded application value
+   */
+  public decodeLazy(value: TWireEncoded | undefined | null, format: EncodingFormat): T {
+    if (value === undefined || value === null) return this.defaultValue()
+    const decoded = this.fromEncodedLazy(value, format)
+    if (this.isDefaultValue(decoded)) return this.defaultValue()
+    return decoded
+  }
+
+  /**
+   * Lazily decode an optional value from wire format (preserves undefined vs default distinction)
+   * @param value - The wire value
+   * @param format - The wire format (json or msgpack)
+   * @returns The decoded application value, or undefined if wire value was undefined
+   */
+  public decodeOptionalLazy(value: TWireEncoded | undefined | null, format: EncodingFormat): T | undefined {
+    if (value === undefined || value === null) return undefined
+    return this.fromEncodedLazy(value, format)
+  }
+
   /**
    * Transform application value to wire format
    * Override this method to implement encoding logic, otherwise defaults to pass-through
@@ -85,6 +110,17 @@ export abstract class Codec<T, TEncoded = T, TWireEncoded = TEncoded> {
     return value as unknown as T
   }
 
+  /**
+   * Transform wire format to application value, deferring the decoding of nested values where possible
+   * Override this method to implement lazy decoding, otherwise defaults to `fromEncoded`
+   * @param value - The wire value (guaranteed to not be undefined)
+   * @param format - The wire format
+   * @returns The decoded value
+   */
+  protected fromEncodedLazy(value: TWireEncoded, format: EncodingFormat): T {
+    return this.fromEncoded(value, format)
+  }
+
   /**
    * Check if a value equals the default value (determines if it should be omitted during encoding)
    * Override this method for custom default comparison logic, otherwise defaults to default value equality
@@ -27,6 +27,10 @@ export class ArrayCodec<T, TEncoded = T> extends Codec<T[], TEncoded[]> {
     return value.map((item) => this.itemCodec.decode(item, format))
   }
 
+  protected fromEncodedLazy(value: TEncoded[], format: EncodingFormat): T[] {
+    return value.map((item) => this.itemCodec.decodeLazy(item, format))
+  }
+
   public isDefaultValue(value: T[]): boolean {
     return value.length === 0
   }
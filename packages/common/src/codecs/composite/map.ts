@@ -57,6 +57,14 @@ export class MapCodec<K, V, KEncoded = K, VEncoded = V> extends Codec<Map<K, V>,
   }
 
   protected fromEncoded(value: Map<KEncoded, VEncoded> | Record<string, VEncoded>, format: EncodingFormat): Map<K, V> {
+    return this.decodeEntries(value, format, false)
+  }
+
+  protected fromEncodedLazy(value: Map<KEncoded, VEncoded> | Record<string, VEncoded>, format: EncodingFormat): Map<K, V> {
+    return this.decodeEntries(value, format, true)
+  }
+
+  private decodeEntries(value: Map<KEncoded, VEncoded> | Record<string, VEncoded>, format: EncodingFormat, lazy: boolean): Map<K, V> {
     this.ensureKeyIsSupported(format)
 
     const result = new Map<K, V>()
@@ -74,7 +82,7 @@ export class MapCodec<K, V, KEncoded = K, VEncoded = V> extends Codec<Map<K, V>,
         keyToDecode = BigInt(encodedKey) as KEncoded
       }
       const key = this.keyCodec.decode(keyToDecode, format)
-      const val = this.valueCodec.decode(encodedValue, format)
+      const val = lazy ? this.valueCodec.decodeLazy(encodedValue, format) : this.valueCodec.decode(encodedValue, format)
       result.set(key, val)
     }
 
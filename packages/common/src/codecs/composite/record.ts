@@ -27,6 +27,15 @@ export class RecordCodec<V, VEncoded = V> extends Codec<Record<string, V>, Recor
   }
 
   protected fromEncoded(value: WireObject<VEncoded>, format: EncodingFormat): Record<string, V> {
+    return this.decodeEntries(value, format, false)
+  }
+
+  protected fromEncodedLazy(value: WireObject<VEncoded>, format: EncodingFormat): Record<string, V> {
+    return this.decodeEntries(value, format, true)
+  }
+
+  private decodeEntries(value: WireObject<VEncoded>, format: EncodingFormat, lazy: boolean): Record<string, V> {
+    const decode = (val: VEncoded) => (lazy ? this.valueCodec.decodeLazy(val, format) : this.valueCodec.decode(val, format))
     const result: Record<string, V> = {}
     if (value instanceof Map) {
       for (const [_key, val] of value.entries()) {
@@ -35,11 +44,11 @@ export class RecordCodec<V, VEncoded = V> extends Codec<Record<string, V>, Recor
           throw new Error(`RecordCodec received a non-string key of type ${keyType}`)
         }
         const key = _key instanceof Uint8Array ? Buffer.from(_key).toString('utf-8') : String(_key)
-        result[key] = this.valueCodec.decode(val, format)
+        result[key] = decode(val)
       }
     } else {
       for (const [key, val] of Object.entries(value)) {
-        result[key] = this.valueCodec.decode(val, format)
+        result[key] = decode(val)
       }
     }
 
@@ -44,4 +44,14 @@ export class ArrayModelCodec<T extends unknown[] = unknown[]> extends Codec<T, u
     const metadata = this.getMetadata()
     return metadata.codec.decodeOptional(value, format) as T | undefined
   }
+
+  public decodeLazy(value: unknown[] | undefined | null, format: EncodingFormat): T {
+    const metadata = this.getMetadata()
+    return metadata.codec.decodeLazy(value, format) as T
+  }
+
+  public decodeOptionalLazy(value: unknown[] | undefined | null, format: EncodingFormat): T | undefined {
+    const metadata = this.getMetadata()
+    return metadata.codec.decodeOptionalLazy(value, format) as T | undefined
+  }
 }
@@ -1,5 +1,6 @@
 import { Buffer } from 'buffer'
 import { describe, expect, test } from 'vitest'
+import { ArrayCodec } from '../composite/array'
 import { numberCodec } from '../primitives/number'
 import { stringCodec } from '../primitives/string'
 import type { ObjectModelMetadata } from '../types'
@@ -2057,4 +2058,118 @@ describe('ObjectModelCodec', () => {
       })
     })
   })
+
+  describe('Lazy decoding', () => {
+    type Household = {
+      name: string
+      address?: AddressWithAllFieldsOptional
+      residents: AddressWithAllFieldsRequired[]
+    }
+
+    const addressMetadata: ObjectModelMetadata<AddressWithAllFieldsOptional> = {
+      name: 'Address',
+      kind: 'object',
+      fields: [
+        { name: 'suite', wireKey: 's', codec: stringCodec, optional: true },
+        { name: 'street', wireKey: 'st', codec: stringCodec, optional: true },
+        { name: 'city', wireKey: 'c', codec: stringCodec, optional: true },
+        { name: 'postcode', wireKey: 'p', codec: numberCodec, optional: true },
+      ],
+    }
+
+    const metadata: ObjectModelMetadata<Household> = {
+      name: 'Household',
+      kind: 'object',
+      fields: [
+        { name: 'name', wireKey: 'n', codec: stringCodec, optional: false },
+        { name: 'address', wireKey: 'a', codec: new ObjectModelCodec(addressMetadata), optional: true },
+        { name: 'residents', wireKey: 'r', codec: new ArrayCodec(new ObjectModelCodec(addressMetadata)), optional: false },
+      ],
+    }
+
+    const codec = new ObjectModelCodec(metadata)
+
+    const wireData = {
+      n: 'Home',
+      a: { st: 'Main St', c: 'Springfield', p: 12345 },
+      r: [
+        { s: '1', st: 'Main St', c: 'Springfield', p: 12345 },
+        { s: '2', st: 'Main St', c: 'Springfield', p: 12345 },
+      ],
+    }
+
+    test.each([{ wireType: 'object' }, { wireType: 'map', toMap: objectToMapWithByteKeys }])(
+      'should decode the same value as eager decoding ($wireType)',
+      ({ toMap }) => {
+        const wire = toMap ? toMap(wireData) : wireData
+        expect(codec.decodeLazy(wire, 'json')).toEqual(codec.decode(wire, 'json'))
+        expect(codec.decodeLazy(wire, 'msgpack')).toEqual(codec.decode(wire, 'msgpack'))
+      },
+    )
+
+    test('should defer decoding nested fields until they are accessed', () => {
+      const decoded = codec.decodeLazy(wireData, 'json')
+
+      expect(Object.getOwnPropertyDescriptor(decoded, 'name')?.value).toBe('Home')
+      expect(Object.getOwnPropertyDescriptor(decoded, 'address')?.get).toBeDefined()
+      expect(Object.getOwnPropertyDescriptor(decoded, 'residents')?.get).toBeDefined()
+      expect(Object.keys(decoded)).toEqual(['name', 'address', 'residents'])
+    })
+
+    test('should memoise nested fields once accessed', () => {
+      const decoded = codec.decodeLazy(wireData, 'json')
+
+      const residents = decoded.residents
+      expect(decoded.residents).toBe(residents)
+      expect(Object.getOwnPropertyDescriptor(decoded, 'residents')?.value).toBe(residents)
+      expect(Object.getOwnPropertyDescriptor(residents[0], 'suite')?.value).toBe('1')
+    })
+
+    test('should allow nested fields to be assigned before they are accessed', () => {
+      const decoded = codec.decodeLazy(wireData, 'json')
+
+      decoded.residents = []
+      expect(decoded.residents).toEqual([])
+    })
+
+    test('should read empty optional nested objects as undefined', () => {
+      const decoded = codec.decodeLazy({ ...wireData, a: {} }, 'json')
+
+      expect(decoded.address).toBeUndefined()
+    })
+
+    test('should handle undefined and null input', () => {
+      expect(codec.decodeLazy(undefined, 'json')).toEqual({ name: '', residents: [] })
+      expect(codec.decodeOptionalLazy(null, 'msgpack')).toBeUndefined()
+    })
+  })
+
+  describe('Projection', () => {
+    const metadata: ObjectModelMetadata<Address> = {
+      name: 'Address',
+      kind: 'object',
+      fields: [
+        { name: 'suite', wireKey: 's', codec: stringCodec, optional: true },
+        { name: 'street', wireKey: 'st', codec: stringCodec, optional: false },
+        { name: 'city', wireKey: 'c', codec: stringCodec, optional: false },
+        { name: 'postcode', wireKey: 'p', codec: numberCodec, optional: false },
+      ],
+    }
+
+    const codec = new ObjectModelCodec(metadata)
+
+    test.each([{ wireType: 'object' }, { wireType: 'map', toMap: objectToMapWithByteKeys }])(
+      'should only decode the selected fields ($wireType)',
+      ({ toMap }) => {
+        const wireData = addressToWireFormat({ suite: '10A', street: 'Main St', city: 'Springfield', postcode: 12345 }, toMap)
+
+        expect(codec.project(['city', 'postcode']).decode(wireData, 'json')).toEqual({ city: 'Springfield', postcode: 12345 })
+        expect(codec.project(['suite']).decode(wireData, 'msgpack')).toEqual({ suite: '10A' })
+      },
+    )
+
+    test('should reuse projections of the same fields', () => {
+      expect(codec.project(['city', 'street'])).toBe(codec.project(['street', 'city']))
+    })
+  })
 })
@@ -11,6 +11,29 @@ function isEmptyObject(value: unknown): boolean {
   return keys.length === 0 || keys.every((key) => (value as Record<string, unknown>)[key] === undefined)
 }
 
+function isNestedWireValue(value: unknown): boolean {
+  return typeof value === 'object' && value !== null && !(value instanceof Uint8Array)
+}
+
+/**
+ * Defines a property that is decoded on first access and then memoised as a plain (writable) value.
+ */
+function defineLazyProperty(target: Record<string, unknown>, name: string, decode: () => unknown): void {
+  const memoise = (value: unknown) => Object.defineProperty(target, name, { value, writable: true, enumerable: true, configurable: true })
+  Object.defineProperty(target, name, {
+    enumerable: true,
+    configurable: true,
+    get() {
+      const value = decode()
+      memoise(value)
+      return value
+    },
+    set(value: unknown) {
+      memoise(value)
+    },
+  })
+}
+
 export class ObjectModelCodec<T extends Record<string, unknown> = Record<string, unknown>> extends Codec<
   T,
   Record<string, unknown>,
@@ -18,6 +41,7 @@ export class ObjectModelCodec<T extends Record<string, unknown> = Record<string,
 > {
   private resolvedMetadata: ObjectModelMetadata<T> | undefined = undefined
   private resolvedDefaultValue: T | undefined = undefined
+  private readonly projections = new Map<string, ObjectModelCodec>()
 
   constructor(private readonly metadata: ObjectModelMetadata<T> | (() => ObjectModelMetadata<T>)) {
     super()
@@ -29,6 +53,30 @@ export class ObjectModelCodec<T extends Record<string, unknown> = Record<string,
     return this.fromEncoded(value, format)
   }
 
+  // Lazily decoded objects are never compared to the default value, for the same reason as `decode`.
+  public decodeLazy(value: WireObject | undefined | null, format: EncodingFormat): T {
+    if (value === undefined || value === null) return this.defaultValue()
+    return this.fromEncodedLazy(value, format)
+  }
+
+  /**
+   * Returns a codec for a subset of this model's fields; the wire values of all other fields are skipped rather than decoded.
+   * Projections are cached, so repeated calls with the same fields are cheap.
+   */
+  public project<K extends keyof T & string>(fields: readonly K[]): ObjectModelCodec<Pick<T, K>> {
+    const key = [...fields].sort().join(',')
+    let projection = this.projections.get(key)
+    if (!projection) {
+      const selected = new Set<string>(fields)
+      projection = new ObjectModelCodec(() => {
+        const metadata = this.getMetadata()
+        return { ...metadata, fields: metadata.fields.filter((field) => selected.has(field.name)) }
+      })
+      this.projections.set(key, projection)
+    }
+    return projection as unknown as ObjectModelCodec<Pick<T, K>>
+  }
+
   private getMetadata(): ObjectModelMetadata<T> {
     if (!this.resolvedMetadata) {
       this.resolvedMetadata = typeof this.metadata === 'function' ? this.metadata() : this.metadata
@@ -121,6 +169,35 @@ export class ObjectModelCodec<T extends Record<string, unknown> = Record<string,
     return result as T
   }
 
+  /**
+   * Decodes scalar fields straight away, and defines nested object, array and map fields as properties that are decoded
+   * (lazily, recursively) on first access. Optional nested fields that decode to an empty value read as `undefined`.
+   */
+  protected fromEncodedLazy(value: WireObject, format: EncodingFormat): T {
+    const metadata = this.getMetadata()
+    const normalizedWireObject = normalizeWireObject(value)
+
+    const result: Record<string, unknown> = {}
+
+    for (const field of metadata.fields) {
+      const wireValue = field.flattened ? normalizedWireObject : normalizedWireObject[field.wireKey || field.name]
+      if (isNestedWireValue(wireValue)) {
+        defineLazyProperty(result, field.name, () => {
+          const decoded = field.optional ? field.codec.decodeOptionalLazy(wireValue, format) : field.codec.decodeLazy(wireValue, format)
+          return isEmptyObject(decoded) && field.optional ? undefined : decoded
+        })
+        continue
+      }
+
+      const decoded = this.decodeFieldValue(field, wireValue, format)
+      if (!isEmptyObject(decoded) || !field.optional) {
+        result[field.name] = decoded
+      }
+    }
+
+    return result as T
+  }
+
   private encodeFlattenedField(field: FieldMetadata, fieldValue: unknown, format: EncodingFormat): Record<string, unknown> | undefined {
     const encoded = field.codec.encodeOptional(fieldValue, format)
     if (encoded !== undefined && typeof encoded === 'object' && !Array.isArray(encoded)) {
@@ -44,4 +44,14 @@ export class PrimitiveModelCodec<T = unknown, TWire = T> extends Codec<T, TWire>
     const metadata = this.getMetadata()
     return metadata.codec.decodeOptional(value, format) as T | undefined
   }
+
+  public decodeLazy(value: TWire | undefined | null, format: EncodingFormat): T {
+    const metadata = this.getMetadata()
+    return metadata.codec.decodeLazy(value, format) as T
+  }
+
+  public decodeOptionalLazy(value: TWire | undefined | null, format: EncodingFormat): T | undefined {
+    const metadata = this.getMetadata()
+    return metadata.codec.decodeOptionalLazy(value, format) as T | undefined
+  }
 }
@@ -0,0 +1,65 @@
+import { Address } from '@algorandfoundation/algokit-common'
+import { describe, expect, test } from 'vitest'
+import { BaseHttpRequest, type ApiRequestOptions } from '../core/base-http-request'
+import { IndexerApi } from './api-service'
+
+const address = Address.zeroAddress().toString()
+
+// The wire form of an account; `auth-addr` isn't an address, so decoding it fails
+const account = { address, amount: 5, round: 100, status: 'Offline', 'auth-addr': 'not-an-address', assets: [] }
+
+// Answers every request with the given payload, as a custom request implementation would
+class StubHttpRequest extends BaseHttpRequest {
+  readonly requests: ApiRequestOptions[] = []
+
+  constructor(private readonly payload: unknown) {
+    super({ baseUrl: 'http://localhost' })
+  }
+
+  protected async fetchPayload(options: ApiRequestOptions): Promise<unknown> {
+    this.requests.push(options)
+    return this.payload
+  }
+}
+
+describe('IndexerApi.lookupAccountFieldsById', () => {
+  test('excludes the account fields that the server can leave out and that are not selected', async () => {
+    const httpRequest = new StubHttpRequest({ account, 'current-round': 101 })
+    const indexer = new IndexerApi(httpRequest)
+
+    await indexer.lookupAccountFieldsById(address, ['amount', 'assets'])
+    await indexer.lookupAccountFieldsById(address, ['amount', 'assets', 'createdAssets', 'appsLocalState', 'createdApps'])
+    await indexer.lookupAccountFieldsById(address, ['amount'], { round: 100 })
+
+    expect(httpRequest.requests.map(({ query }) => query?.exclude)).toEqual([
+      ['created-assets', 'apps-local-state', 'created-apps'],
+      undefined,
+      ['assets', 'created-assets', 'apps-local-state', 'created-apps'],
+    ])
+    expect(httpRequest.requests[2]).toMatchObject({ operationId: 'lookupAccountById', query: { round: 100 } })
+  })
+
+  test('only decodes the selected fields', async () => {
+    const indexer = new IndexerApi(new StubHttpRequest({ account, 'current-round': 101 }))
+
+    const response = await indexer.lookupAccountFieldsById(address, ['amount', 'round'])
+
+    expect(response).toEqual({ account: { amount: 5n, round: 100n }, currentRound: 101n })
+  })
+})
+
+describe('IndexerApi.searchForAccountsFields', () => {
+  test('excludes the unselected fields and only decodes the selected fields of each account', async () => {
+    const httpRequest = new StubHttpRequest({ accounts: [account, { ...account, amount: 6 }], 'current-round': 101, 'next-token': 'next' })
+
+    const response = await new IndexerApi(httpRequest).searchForAccountsFields(['amount'], { assetId: 1234n, limit: 2 })
+
+    expect(response).toEqual({ accounts: [{ amount: 5n }, { amount: 6n }], currentRound: 101n, nextToken: 'next' })
+    expect(httpRequest.requests).toMatchObject([
+      {
+        operationId: 'searchForAccounts',
+        query: { 'asset-id': 1234n, limit: 2, exclude: ['assets', 'created-assets', 'apps-local-state', 'created-apps'] },
+      },
+    ])
+  })
+})
@@ -1,6 +1,9 @@
-import type { BaseHttpRequest } from '../core/base-http-request'
-import { decodeJson } from '../core/model-runtime'
+import { compileUrl, type BaseHttpRequest, type RequestOptions } from '../core/base-http-request'
+import { decodeJson, type DecodeOptions } from '../core/model-runtime'
 import { ReadableAddress, type EncodingFormat } from '@algorandfoundation/algokit-common'
+import { decodeFields, unselectedWireKeys } from '../core/model-runtime'
+import type { Account } from '../models/index'
+import { AccountMeta } from '../models/model-meta'
 import type {
   AccountResponse,
   AccountsResponse,
@@ -40,6 +43,126 @@ import {
   TransactionsResponseMeta,
 } from '../models/model-meta'
 
+/** URL builders for each operation, compiled once rather than on every request. */
+const urlBuilders = {
+  healthCheck: compileUrl('/health'),
+  lookupAccountAppLocalStates: compileUrl('/v2/accounts/{account-id}/apps-local-state', ['application-id', 'include-all', 'limit', 'next']),
+  lookupAccountAssets: compileUrl('/v2/accounts/{account-id}/assets', ['asset-id', 'include-all', 'limit', 'next']),
+  lookupAccountById: compileUrl('/v2/accounts/{account-id}', ['round', 'include-all', 'exclude']),
+  lookupAccountCreatedApplications: compileUrl('/v2/accounts/{account-id}/created-applications', [
+    'application-id',
+    'include-all',
+    'limit',
+    'next',
+  ]),
+  lookupAccountCreatedAssets: compileUrl('/v2/accounts/{account-id}/created-assets', ['asset-id', 'include-all', 'limit', 'next']),
+  lookupAccountTransactions: compileUrl('/v2/accounts/{account-id}/transactions', [
+    'limit',
+    'next',
+    'note-prefix',
+    'tx-type',
+    'sig-type',
+    'txid',
+    'round',
+    'min-round',
+    'max-round',
+    'asset-id',
+    'before-time',
+    'after-time',
+    'currency-greater-than',
+    'currency-less-than',
+    'rekey-to',
+  ]),
+  lookupApplicationBoxByIdAndName: compileUrl('/v2/applications/{application-id}/box', ['name']),
+  lookupApplicationById: compileUrl('/v2/applications/{application-id}', ['include-all']),
+  lookupApplicationLogsById: compileUrl('/v2/applications/{application-id}/logs', [
+    'limit',
+    'next',
+    'txid',
+    'min-round',
+    'max-round',
+    'sender-address',
+  ]),
+  lookupAssetBalances: compileUrl('/v2/assets/{asset-id}/balances', [
+    'include-all',
+    'limit',
+    'next',
+    'currency-greater-than',
+    'currency-less-than',
+  ]),
+  lookupAssetById: compileUrl('/v2/assets/{asset-id}', ['include-all']),
+  lookupAssetTransactions: compileUrl('/v2/assets/{asset-id}/transactions', [
+    'limit',
+    'next',
+    'note-prefix',
+    'tx-type',
+    'sig-type',
+    'txid',
+    'round',
+    'min-round',
+    'max-round',
+    'before-time',
+    'after-time',
+    'currency-greater-than',
+    'currency-less-than',
+    'address',
+    'address-role',
+    'exclude-close-to',
+    'rekey-to',
+  ]),
+  lookupBlock: compileUrl('/v2/blocks/{round-number}', ['header-only']),
+  lookupTransactionById: compileUrl('/v2/transactions/{txid}'),
+  searchForAccounts: compileUrl('/v2/accounts', [
+    'asset-id',
+    'limit',
+    'next',
+    'currency-greater-than',
+    'include-all',
+    'exclude',
+    'currency-less-than',
+    'auth-addr',
+    'round',
+    'application-id',
+    'online-only',
+  ]),
+  searchForApplicationBoxes: compileUrl('/v2/applications/{application-id}/boxes', ['limit', 'next']),
+  searchForApplications: compileUrl('/v2/applications', ['application-id', 'creator', 'include-all', 'limit', 'next']),
+  searchForAssets: compileUrl('/v2/assets', ['include-all', 'limit', 'next', 'creator', 'name', 'unit', 'asset-id']),
+  searchForBlockHeaders: compileUrl('/v2/block-headers', [
+    'limit',
+    'next',
+    'min-round',
+    'max-round',
+    'before-time',
+    'after-time',
+    'proposers',
+    'expired',
+    'absent',
+  ]),
+  searchForTransactions: compileUrl('/v2/transactions', [
+    'limit',
+    'next',
+    'note-prefix',
+    'tx-type',
+    'sig-type',
+    'group-id',
+    'txid',
+    'round',
+    'min-round',
+    'max-round',
+    'asset-id',
+    'before-time',
+    'after-time',
+    'currency-greater-than',
+    'currency-less-than',
+    'address',
+    'address-role',
+    'exclude-close-to',
+    'rekey-to',
+    'application-id',
+  ]),
+}
+
 export class IndexerApi {
   constructor(public readonly httpRequest: BaseHttpRequest) {}
 
@@ -47,21 +170,27 @@ export class IndexerApi {
     return format === 'json' ? 'application/json' : format === 'msgpack' ? 'application/msgpack' : 'text/plain'
   }
 
-  async healthCheck(): Promise<HealthCheck> {
+  private get decodeOptions(): DecodeOptions {
+    return { lazy: this.httpRequest.config.lazyDecoding }
+  }
+
+  async healthCheck(requestOptions?: RequestOptions): Promise<HealthCheck> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<HealthCheck>({
       method: 'GET',
       url: '/health',
+      buildUrl: urlBuilders.healthCheck,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, HealthCheckMeta, this.decodeOptions),
+      operationId: 'healthCheck',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, HealthCheckMeta)
   }
 
   /**
@@ -70,21 +199,24 @@ export class IndexerApi {
   async lookupAccountAppLocalStates(
     account: ReadableAddress,
     params?: { applicationId?: number | bigint; includeAll?: boolean; limit?: number; next?: string },
+    requestOptions?: RequestOptions,
   ): Promise<ApplicationLocalStatesResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ApplicationLocalStatesResponse>({
       method: 'GET',
       url: '/v2/accounts/{account-id}/apps-local-state',
+      buildUrl: urlBuilders.lookupAccountAppLocalStates,
       path: { 'account-id': account },
       query: { 'application-id': params?.applicationId, 'include-all': params?.includeAll, limit: params?.limit, next: params?.next },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ApplicationLocalStatesResponseMeta, this.decodeOptions),
+      operationId: 'lookupAccountAppLocalStates',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ApplicationLocalStatesResponseMeta)
   }
 
   /**
@@ -93,21 +225,24 @@ export class IndexerApi {
   async lookupAccountAssets(
     account: ReadableAddress,
     params?: { assetId?: number | bigint; includeAll?: boolean; limit?: number; next?: string },
+    requestOptions?: RequestOptions,
   ): Promise<AssetHoldingsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AssetHoldingsResponse>({
       method: 'GET',
       url: '/v2/accounts/{account-id}/assets',
+      buildUrl: urlBuilders.lookupAccountAssets,
       path: { 'account-id': account },
       query: { 'asset-id': params?.assetId, 'include-all': params?.includeAll, limit: params?.limit, next: params?.next },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AssetHoldingsResponseMeta, this.decodeOptions),
+      operationId: 'lookupAccountAssets',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AssetHoldingsResponseMeta)
   }
 
   /**
@@ -118,23 +253,26 @@ export class IndexerApi {
     params?: {
       round?: number | bigint
       includeAll?: boolean
-      exclude?: 'all' | 'assets' | 'created-assets' | 'apps-local-state' | 'created-apps' | 'none'[]
+      exclude?: ('all' | 'assets' | 'created-assets' | 'apps-local-state' | 'created-apps' | 'none')[]
     },
+    requestOptions?: RequestOptions,
   ): Promise<AccountResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AccountResponse>({
       method: 'GET',
       url: '/v2/accounts/{account-id}',
+      buildUrl: urlBuilders.lookupAccountById,
       path: { 'account-id': account },
       query: { round: params?.round, 'include-all': params?.includeAll, exclude: params?.exclude },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AccountResponseMeta, this.decodeOptions),
+      operationId: 'lookupAccountById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AccountResponseMeta)
   }
 
   /**
@@ -143,21 +281,24 @@ export class IndexerApi {
   async lookupAccountCreatedApplications(
     account: ReadableAddress,
     params?: { applicationId?: number | bigint; includeAll?: boolean; limit?: number; next?: string },
+    requestOptions?: RequestOptions,
   ): Promise<ApplicationsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ApplicationsResponse>({
       method: 'GET',
       url: '/v2/accounts/{account-id}/created-applications',
+      buildUrl: urlBuilders.lookupAccountCreatedApplications,
       path: { 'account-id': account },
       query: { 'application-id': params?.applicationId, 'include-all': params?.includeAll, limit: params?.limit, next: params?.next },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ApplicationsResponseMeta, this.decodeOptions),
+      operationId: 'lookupAccountCreatedApplications',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ApplicationsResponseMeta)
   }
 
   /**
@@ -166,21 +307,24 @@ export class IndexerApi {
   async lookupAccountCreatedAssets(
     account: ReadableAddress,
     params?: { assetId?: number | bigint; includeAll?: boolean; limit?: number; next?: string },
+    requestOptions?: RequestOptions,
   ): Promise<AssetsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AssetsResponse>({
       method: 'GET',
       url: '/v2/accounts/{account-id}/created-assets',
+      buildUrl: urlBuilders.lookupAccountCreatedAssets,
       path: { 'account-id': account },
       query: { 'asset-id': params?.assetId, 'include-all': params?.includeAll, limit: params?.limit, next: params?.next },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AssetsResponseMeta, this.decodeOptions),
+      operationId: 'lookupAccountCreatedAssets',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AssetsResponseMeta)
   }
 
   /**
@@ -205,14 +349,16 @@ export class IndexerApi {
       currencyLessThan?: number | bigint
       rekeyTo?: boolean
     },
+    requestOptions?: RequestOptions,
   ): Promise<TransactionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<TransactionsResponse>({
       method: 'GET',
       url: '/v2/accounts/{account-id}/transactions',
+      buildUrl: urlBuilders.lookupAccountTransactions,
       path: { 'account-id': account },
       query: {
         limit: params?.limit,
@@ -233,49 +379,62 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, TransactionsResponseMeta, this.decodeOptions),
+      operationId: 'lookupAccountTransactions',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, TransactionsResponseMeta)
   }
 
   /**
    * Given an application ID and box name, returns base64 encoded box name and value. Box names must be in the goal app call arg form 'encoding:value'. For ints, use the form 'int:1234'. For raw bytes, encode base 64 and use 'b64' prefix as in 'b64:A=='. For printable strings, use the form 'str:hello'. For addresses, use the form 'addr:XYZ...'.
    */
-  private async _lookupApplicationBoxByIdAndName(applicationId: number | bigint, params?: { name: string }): Promise<Box> {
+  private async _lookupApplicationBoxByIdAndName(
+    applicationId: number | bigint,
+    params?: { name: string },
+    requestOptions?: RequestOptions,
+  ): Promise<Box> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Box>({
       method: 'GET',
       url: '/v2/applications/{application-id}/box',
+      buildUrl: urlBuilders.lookupApplicationBoxByIdAndName,
       path: { 'application-id': applicationId },
       query: { name: params?.name },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BoxMeta, this.decodeOptions),
+      operationId: 'lookupApplicationBoxByIdAndName',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BoxMeta)
   }
 
   /**
    * Lookup application.
    */
-  async lookupApplicationById(applicationId: number | bigint, params?: { includeAll?: boolean }): Promise<ApplicationResponse> {
+  async lookupApplicationById(
+    applicationId: number | bigint,
+    params?: { includeAll?: boolean },
+    requestOptions?: RequestOptions,
+  ): Promise<ApplicationResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ApplicationResponse>({
       method: 'GET',
       url: '/v2/applications/{application-id}',
+      buildUrl: urlBuilders.lookupApplicationById,
       path: { 'application-id': applicationId },
       query: { 'include-all': params?.includeAll },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ApplicationResponseMeta, this.decodeOptions),
+      operationId: 'lookupApplicationById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ApplicationResponseMeta)
   }
 
   /**
@@ -291,14 +450,16 @@ export class IndexerApi {
       maxRound?: number | bigint
       senderAddress?: ReadableAddress
     },
+    requestOptions?: RequestOptions,
   ): Promise<ApplicationLogsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ApplicationLogsResponse>({
       method: 'GET',
       url: '/v2/applications/{application-id}/logs',
+      buildUrl: urlBuilders.lookupApplicationLogsById,
       path: { 'application-id': applicationId },
       query: {
         limit: params?.limit,
@@ -310,9 +471,10 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ApplicationLogsResponseMeta, this.decodeOptions),
+      operationId: 'lookupApplicationLogsById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ApplicationLogsResponseMeta)
   }
 
   /**
@@ -327,14 +489,16 @@ export class IndexerApi {
       currencyGreaterThan?: number | bigint
       currencyLessThan?: number | bigint
     },
+    requestOptions?: RequestOptions,
   ): Promise<AssetBalancesResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AssetBalancesResponse>({
       method: 'GET',
       url: '/v2/assets/{asset-id}/balances',
+      buildUrl: urlBuilders.lookupAssetBalances,
       path: { 'asset-id': assetId },
       query: {
         'include-all': params?.includeAll,
@@ -345,29 +509,37 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AssetBalancesResponseMeta, this.decodeOptions),
+      operationId: 'lookupAssetBalances',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AssetBalancesResponseMeta)
   }
 
   /**
    * Lookup asset information.
    */
-  async lookupAssetById(assetId: number | bigint, params?: { includeAll?: boolean }): Promise<AssetResponse> {
+  async lookupAssetById(
+    assetId: number | bigint,
+    params?: { includeAll?: boolean },
+    requestOptions?: RequestOptions,
+  ): Promise<AssetResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AssetResponse>({
       method: 'GET',
       url: '/v2/assets/{asset-id}',
+      buildUrl: urlBuilders.lookupAssetById,
       path: { 'asset-id': assetId },
       query: { 'include-all': params?.includeAll },
       headers,
       body: undefined,
+      cache: 'slow-changing',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AssetResponseMeta, this.decodeOptions),
+      operationId: 'lookupAssetById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AssetResponseMeta)
   }
 
   /**
@@ -394,14 +566,16 @@ export class IndexerApi {
       excludeCloseTo?: boolean
       rekeyTo?: boolean
     },
+    requestOptions?: RequestOptions,
   ): Promise<TransactionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<TransactionsResponse>({
       method: 'GET',
       url: '/v2/assets/{asset-id}/transactions',
+      buildUrl: urlBuilders.lookupAssetTransactions,
       path: { 'asset-id': assetId },
       query: {
         limit: params?.limit,
@@ -424,74 +598,85 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, TransactionsResponseMeta, this.decodeOptions),
+      operationId: 'lookupAssetTransactions',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, TransactionsResponseMeta)
   }
 
   /**
    * Lookup block.
    */
-  async lookupBlock(roundNumber: number | bigint, params?: { headerOnly?: boolean }): Promise<Block> {
+  async lookupBlock(roundNumber: number | bigint, params?: { headerOnly?: boolean }, requestOptions?: RequestOptions): Promise<Block> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<Block>({
       method: 'GET',
       url: '/v2/blocks/{round-number}',
+      buildUrl: urlBuilders.lookupBlock,
       path: { 'round-number': roundNumber },
       query: { 'header-only': params?.headerOnly },
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BlockMeta, this.decodeOptions),
+      operationId: 'lookupBlock',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BlockMeta)
   }
 
   /**
    * Lookup a single transaction.
    */
-  async lookupTransactionById(txId: string): Promise<TransactionResponse> {
+  async lookupTransactionById(txId: string, requestOptions?: RequestOptions): Promise<TransactionResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<TransactionResponse>({
       method: 'GET',
       url: '/v2/transactions/{txid}',
+      buildUrl: urlBuilders.lookupTransactionById,
       path: { txid: txId },
       query: {},
       headers,
       body: undefined,
+      cache: 'immutable',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, TransactionResponseMeta, this.decodeOptions),
+      operationId: 'lookupTransactionById',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, TransactionResponseMeta)
   }
 
   /**
    * Search for accounts.
    */
-  async searchForAccounts(params?: {
+  async searchForAccounts(
+    params?: {
     assetId?: number | bigint
     limit?: number
     next?: string
     currencyGreaterThan?: number | bigint
     includeAll?: boolean
-    exclude?: 'all' | 'assets' | 'created-assets' | 'apps-local-state' | 'created-apps' | 'none'[]
+    exclude?: ('all' | 'assets' | 'created-assets' | 'apps-local-state' | 'created-apps' | 'none')[]
     currencyLessThan?: number | bigint
     authAddr?: ReadableAddress
     round?: number | bigint
     applicationId?: number | bigint
     onlineOnly?: boolean
-  }): Promise<AccountsResponse> {
+  },
+    requestOptions?: RequestOptions,
+  ): Promise<AccountsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AccountsResponse>({
       method: 'GET',
       url: '/v2/accounts',
+      buildUrl: urlBuilders.searchForAccounts,
       path: {},
       query: {
         'asset-id': params?.assetId,
@@ -508,48 +693,59 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AccountsResponseMeta, this.decodeOptions),
+      operationId: 'searchForAccounts',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AccountsResponseMeta)
   }
 
   /**
    * Given an application ID, returns the box names of that application sorted lexicographically.
    */
-  async searchForApplicationBoxes(applicationId: number | bigint, params?: { limit?: number; next?: string }): Promise<BoxesResponse> {
+  async searchForApplicationBoxes(
+    applicationId: number | bigint,
+    params?: { limit?: number; next?: string },
+    requestOptions?: RequestOptions,
+  ): Promise<BoxesResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<BoxesResponse>({
       method: 'GET',
       url: '/v2/applications/{application-id}/boxes',
+      buildUrl: urlBuilders.searchForApplicationBoxes,
       path: { 'application-id': applicationId },
       query: { limit: params?.limit, next: params?.next },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BoxesResponseMeta, this.decodeOptions),
+      operationId: 'searchForApplicationBoxes',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BoxesResponseMeta)
   }
 
   /**
    * Search for applications
    */
-  async searchForApplications(params?: {
+  async searchForApplications(
+    params?: {
     applicationId?: number | bigint
     creator?: string
     includeAll?: boolean
     limit?: number
     next?: string
-  }): Promise<ApplicationsResponse> {
+  },
+    requestOptions?: RequestOptions,
+  ): Promise<ApplicationsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ApplicationsResponse>({
       method: 'GET',
       url: '/v2/applications',
+      buildUrl: urlBuilders.searchForApplications,
       path: {},
       query: {
         'application-id': params?.applicationId,
@@ -560,15 +756,17 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ApplicationsResponseMeta, this.decodeOptions),
+      operationId: 'searchForApplications',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ApplicationsResponseMeta)
   }
 
   /**
    * Search for assets.
    */
-  async searchForAssets(params?: {
+  async searchForAssets(
+    params?: {
     includeAll?: boolean
     limit?: number
     next?: string
@@ -576,14 +774,17 @@ export class IndexerApi {
     name?: string
     unit?: string
     assetId?: number | bigint
-  }): Promise<AssetsResponse> {
+  },
+    requestOptions?: RequestOptions,
+  ): Promise<AssetsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<AssetsResponse>({
       method: 'GET',
       url: '/v2/assets',
+      buildUrl: urlBuilders.searchForAssets,
       path: {},
       query: {
         'include-all': params?.includeAll,
@@ -596,15 +797,17 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, AssetsResponseMeta, this.decodeOptions),
+      operationId: 'searchForAssets',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, AssetsResponseMeta)
   }
 
   /**
    * Search for block headers. Block headers are returned in ascending round order. Transactions are not included in the output.
    */
-  async searchForBlockHeaders(params?: {
+  async searchForBlockHeaders(
+    params?: {
     limit?: number
     next?: string
     minRound?: number | bigint
@@ -614,14 +817,17 @@ export class IndexerApi {
     proposers?: ReadableAddress[]
     expired?: ReadableAddress[]
     absent?: ReadableAddress[]
-  }): Promise<BlockHeadersResponse> {
+  },
+    requestOptions?: RequestOptions,
+  ): Promise<BlockHeadersResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<BlockHeadersResponse>({
       method: 'GET',
       url: '/v2/block-headers',
+      buildUrl: urlBuilders.searchForBlockHeaders,
       path: {},
       query: {
         limit: params?.limit,
@@ -636,15 +842,17 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, BlockHeadersResponseMeta, this.decodeOptions),
+      operationId: 'searchForBlockHeaders',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, BlockHeadersResponseMeta)
   }
 
   /**
    * Search for transactions. Transactions are returned oldest to newest unless the address parameter is used, in which case results are returned newest to oldest.
    */
-  async searchForTransactions(params?: {
+  async searchForTransactions(
+    params?: {
     limit?: number
     next?: string
     notePrefix?: string
@@ -665,14 +873,17 @@ export class IndexerApi {
     excludeCloseTo?: boolean
     rekeyTo?: boolean
     applicationId?: number | bigint
-  }): Promise<TransactionsResponse> {
+  },
+    requestOptions?: RequestOptions,
+  ): Promise<TransactionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<TransactionsResponse>({
       method: 'GET',
       url: '/v2/transactions',
+      buildUrl: urlBuilders.searchForTransactions,
       path: {},
       query: {
         limit: params?.limit,
@@ -698,16 +909,99 @@ export class IndexerApi {
       },
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, TransactionsResponseMeta, this.decodeOptions),
+      operationId: 'searchForTransactions',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, TransactionsResponseMeta)
   }
 
   /**
    * Given an application ID and box name, it returns the round, box name, and value.
    */
-  async lookupApplicationBoxByIdAndName(applicationId: number | bigint, boxName: Uint8Array): Promise<Box> {
+  async lookupApplicationBoxByIdAndName(
+    applicationId: number | bigint,
+    boxName: Uint8Array,
+    requestOptions?: RequestOptions,
+  ): Promise<Box> {
     const name = `b64:${Buffer.from(boxName).toString('base64')}`
-    return this._lookupApplicationBoxByIdAndName(applicationId, { name })
+    return this._lookupApplicationBoxByIdAndName(applicationId, { name }, requestOptions)
+  }
+
+  /**
+   * Looks up account information with only the given account fields.
+   * Asset holdings, application local states and created assets and applications that aren't selected are excluded by the server,
+   * and only the selected fields are decoded.
+   */
+  async lookupAccountFieldsById<K extends keyof Account & string>(
+    account: ReadableAddress,
+    fields: readonly K[],
+    params?: { round?: number | bigint; includeAll?: boolean },
+    requestOptions?: RequestOptions,
+  ): Promise<{ account: Pick<Account, K>; currentRound: bigint }> {
+    const headers: Record<string, string> = {}
+    headers['Accept'] = this.mimeTypeFor('json')
+
+    return this.httpRequest.request<{ account: Pick<Account, K>; currentRound: bigint }>({
+      method: 'GET',
+      url: '/v2/accounts/{account-id}',
+      buildUrl: urlBuilders.lookupAccountById,
+      path: { 'account-id': account },
+      query: { round: params?.round, 'include-all': params?.includeAll, exclude: this.accountExclusions(fields) },
+      headers,
+      body: undefined,
+      decode: (payload: Record<string, unknown>) => ({
+        ...decodeFields(payload, AccountResponseMeta, ['currentRound']),
+        account: decodeFields(payload['account'] as Record<string, unknown>, AccountMeta, fields),
+      }),
+      operationId: 'lookupAccountById',
+      ...requestOptions,
+    })
+  }
+
+  /**
+   * Searches for accounts, returning only the given account fields.
+   * Asset holdings, application local states and created assets and applications that aren't selected are excluded by the server,
+   * and only the selected fields are decoded.
+   */
+  async searchForAccountsFields<K extends keyof Account & string>(
+    fields: readonly K[],
+    params?: Omit<NonNullable<Parameters<IndexerApi['searchForAccounts']>[0]>, 'exclude'>,
+    requestOptions?: RequestOptions,
+  ): Promise<Omit<AccountsResponse, 'accounts'> & { accounts: Pick<Account, K>[] }> {
+    const headers: Record<string, string> = {}
+    headers['Accept'] = this.mimeTypeFor('json')
+
+    return this.httpRequest.request<Omit<AccountsResponse, 'accounts'> & { accounts: Pick<Account, K>[] }>({
+      method: 'GET',
+      url: '/v2/accounts',
+      buildUrl: urlBuilders.searchForAccounts,
+      path: {},
+      query: {
+        'asset-id': params?.assetId,
+        limit: params?.limit,
+        next: params?.next,
+        'currency-greater-than': params?.currencyGreaterThan,
+        'include-all': params?.includeAll,
+        exclude: this.accountExclusions(fields),
+        'currency-less-than': params?.currencyLessThan,
+        'auth-addr': params?.authAddr,
+        round: params?.round,
+        'application-id': params?.applicationId,
+        'online-only': params?.onlineOnly,
+      },
+      headers,
+      body: undefined,
+      decode: (payload: Record<string, unknown>) => ({
+        ...decodeFields(payload, AccountsResponseMeta, ['currentRound', 'nextToken']),
+        accounts: ((payload['accounts'] ?? []) as Record<string, unknown>[]).map((account) => decodeFields(account, AccountMeta, fields)),
+      }),
+      operationId: 'searchForAccounts',
+      ...requestOptions,
+    })
+  }
+
+  private accountExclusions(fields: readonly (keyof Account & string)[]) {
+    const exclude = unselectedWireKeys(AccountMeta, fields, ['assets', 'created-assets', 'apps-local-state', 'created-apps'] as const)
+    return exclude.length > 0 ? exclude : undefined
   }
 }
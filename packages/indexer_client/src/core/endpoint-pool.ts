@@ -0,0 +1,213 @@
+/**
+ * How requests are spread across endpoints:
+ * - `ewma`: prefer the endpoint with the lowest exponentially weighted moving average latency, weighted by its outstanding requests
+ * - `least-outstanding`: prefer the endpoint with the fewest outstanding requests
+ */
+export type BalancingStrategy = 'ewma' | 'least-outstanding'
+
+export interface EndpointPoolOptions {
+  /** Defaults to `ewma`. */
+  strategy?: BalancingStrategy
+  /** Weight (0-1) of the latest latency in the moving average. Defaults to 0.3. */
+  ewmaAlpha?: number
+  /** Consecutive transient failures after which an endpoint is ejected. Defaults to 1. */
+  ejectAfterFailures?: number
+  /** How often ejected endpoints are probed, in milliseconds. Defaults to 10 seconds. */
+  probeIntervalMs?: number
+  /** Path requested to probe an ejected endpoint. Defaults to `/health`. */
+  probePath?: string
+  /**
+   * Custom health probe; resolves `true` when the endpoint can be used again. Defaults to a `GET` of `probePath`, sent
+   * with the transport and token of the client using the pool.
+   */
+  probe?: (baseUrl: string) => Promise<boolean>
+}
+
+/** Options for a request routed by an `EndpointPool`. */
+export interface EndpointRunOptions {
+  /**
+   * Whether the request waits on the server for something to happen (e.g. the next round). Its latency is how long it
+   * waited rather than how fast the endpoint is, so it's left out of the endpoint's moving average latency.
+   */
+  longPoll?: boolean
+}
+
+/** The state of one endpoint in an `EndpointPool`. */
+export interface EndpointStats {
+  baseUrl: string
+  healthy: boolean
+  outstanding: number
+  /** Moving average latency of successful requests, in milliseconds */
+  ewmaMs: number
+  requests: number
+  failures: number
+}
+
+interface Endpoint extends EndpointStats {
+  consecutiveFailures: number
+}
+
+/**
+ * Routes requests across several replicas of the same API (e.g. algod or indexer nodes) with latency-aware balancing.
+ *
+ * Endpoints that fail with a transient error are ejected, and periodically probed until they're healthy again.
+ * If every endpoint is ejected, requests are still routed (to the best ejected endpoint) rather than failed outright.
+ */
+export class EndpointPool {
+  private readonly endpoints: Endpoint[]
+  private readonly strategy: BalancingStrategy
+  private readonly ewmaAlpha: number
+  private readonly ejectAfterFailures: number
+  private readonly probeIntervalMs: number
+  private readonly probePath: string
+  private probe: (baseUrl: string) => Promise<boolean>
+  private readonly customProbe: boolean
+  private probeTimer: ReturnType<typeof setInterval> | undefined
+  private next = 0
+
+  constructor(baseUrls: string[], options: EndpointPoolOptions = {}) {
+    if (baseUrls.length === 0) {
+      throw new Error('An endpoint pool needs at least one endpoint')
+    }
+    this.endpoints = baseUrls.map((baseUrl) => ({
+      baseUrl,
+      healthy: true,
+      outstanding: 0,
+      ewmaMs: 0,
+      requests: 0,
+      failures: 0,
+      consecutiveFailures: 0,
+    }))
+    this.strategy = options.strategy ?? 'ewma'
+    this.ewmaAlpha = Math.min(Math.max(options.ewmaAlpha ?? 0.3, 0), 1)
+    this.ejectAfterFailures = Math.max(1, options.ejectAfterFailures ?? 1)
+    this.probeIntervalMs = options.probeIntervalMs ?? 10_000
+    this.probePath = options.probePath ?? '/health'
+    this.customProbe = options.probe !== undefined
+    this.probe =
+      options.probe ??
+      (async (baseUrl) => {
+        const response = await fetch(new URL(this.probePath, baseUrl))
+        return response.ok
+      })
+  }
+
+  /**
+   * Sends the default health probe (a `GET` of `probePath`) with the given function, so it goes through the same transport
+   * and authentication as the requests it routes. Clients call this with their own configuration; a custom `probe` is kept.
+   * @param get Sends a `GET` of the path to the given base URL, rejecting if the response isn't successful
+   */
+  probeWith(get: (baseUrl: string, path: string) => Promise<unknown>): void {
+    if (this.customProbe) return
+    this.probe = async (baseUrl) => {
+      await get(baseUrl, this.probePath)
+      return true
+    }
+  }
+
+  /** A snapshot of every endpoint's state. */
+  get stats(): EndpointStats[] {
+    return this.endpoints.map(({ baseUrl, healthy, outstanding, ewmaMs, requests, failures }) => ({
+      baseUrl,
+      healthy,
+      outstanding,
+      ewmaMs,
+      requests,
+      failures,
+    }))
+  }
+
+  /**
+   * Sends the request to the best endpoint and tracks its outcome.
+   * @param execute Sends the request to the given base URL
+   * @param isTransientError Whether an error indicates an unhealthy endpoint (and should count towards ejecting it)
+   * @param options How the request is tracked
+   */
+  async run<T>(
+    execute: (baseUrl: string) => Promise<T>,
+    isTransientError: (error: unknown) => boolean,
+    options: EndpointRunOptions = {},
+  ): Promise<T> {
+    const endpoint = this.select()
+    // Long polls sit on the endpoint for as long as they wait, so they don't count as outstanding load either
+    const tracked = !options.longPoll
+    if (tracked) endpoint.outstanding += 1
+    endpoint.requests += 1
+    const startedAt = Date.now()
+    try {
+      const result = await execute(endpoint.baseUrl)
+      if (tracked) {
+        const latency = Date.now() - startedAt
+        endpoint.ewmaMs = endpoint.ewmaMs === 0 ? latency : this.ewmaAlpha * latency + (1 - this.ewmaAlpha) * endpoint.ewmaMs
+      }
+      endpoint.consecutiveFailures = 0
+      return result
+    } catch (error) {
+      if (isTransientError(error)) {
+        endpoint.failures += 1
+        endpoint.consecutiveFailures += 1
+        if (endpoint.healthy && endpoint.consecutiveFailures >= this.ejectAfterFailures) {
+          this.eject(endpoint)
+        }
+      }
+      throw error
+    } finally {
+      if (tracked) endpoint.outstanding -= 1
+    }
+  }
+
+  /** Stops probing ejected endpoints. */
+  close(): void {
+    clearInterval(this.probeTimer)
+    this.probeTimer = undefined
+  }
+
+  private select(): Endpoint {
+    const healthy = this.endpoints.filter((e) => e.healthy)
+    const candidates = healthy.length > 0 ? healthy : this.endpoints
+    // Rotate the starting point so ties are spread across endpoints
+    const start = this.next++ % candidates.length
+    let best = candidates[start]
+    for (let i = 1; i < candidates.length; i++) {
+      const candidate = candidates[(start + i) % candidates.length]
+      if (this.cost(candidate) < this.cost(best)) best = candidate
+    }
+    return best
+  }
+
+  private cost(endpoint: Endpoint): number {
+    if (this.strategy === 'least-outstanding') {
+      return endpoint.outstanding
+    }
+    return endpoint.ewmaMs * (endpoint.outstanding + 1)
+  }
+
+  private eject(endpoint: Endpoint): void {
+    endpoint.healthy = false
+    if (this.probeTimer) return
+    this.probeTimer = setInterval(() => void this.probeEjected(), this.probeIntervalMs)
+    // Don't keep the process alive just to probe endpoints
+    const timer = this.probeTimer as unknown as { unref?: () => void }
+    timer.unref?.()
+  }
+
+  private async probeEjected(): Promise<void> {
+    // Restored endpoints start at the best healthy latency, so they get traffic without being flooded by it
+    const bestEwmaMs = Math.min(...this.endpoints.filter((e) => e.healthy && e.ewmaMs > 0).map((e) => e.ewmaMs))
+    await Promise.all(
+      this.endpoints
+        .filter((e) => !e.healthy)
+        .map(async (endpoint) => {
+          const healthy = await this.probe(endpoint.baseUrl).catch(() => false)
+          if (healthy) {
+            endpoint.healthy = true
+            endpoint.consecutiveFailures = 0
+            endpoint.ewmaMs = Number.isFinite(bestEwmaMs) ? bestEwmaMs : 0
+          }
+        }),
+    )
+    if (this.endpoints.every((e) => e.healthy)) {
+      this.close()
+    }
+  }
+}
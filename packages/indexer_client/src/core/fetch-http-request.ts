@@ -1,4 +1,10 @@
-import { BaseHttpRequest, type ApiRequestOptions } from './base-http-request'
+import { RequestTimeoutError } from './api-error'
+import { BaseHttpRequest, isIdempotentRequest, requestKey, type ApiRequestOptions } from './base-http-request'
+import type { ClientConfig } from './client-config'
+import { EndpointPool } from './endpoint-pool'
+import type { OperationContext, OperationMetrics, RequestInstrumentation } from './instrumentation'
+import { RequestCoalescer, type CoalescingStats } from './request-coalescer'
+import { RequestHedger, type HedgingStats } from './request-hedger'
 import { request } from './request'
 
 const RETRY_STATUS_CODES = [408, 413, 429, 500, 502, 503, 504]
@@ -16,6 +22,7 @@ const RETRY_ERROR_CODES = [
 
 const DEFAULT_MAX_TRIES = 5
 const MAX_BACKOFF_MS = 10_000
+const MAX_RETRY_AFTER_MS = 60_000
 
 const toNumber = (value: unknown): number | undefined => {
   if (typeof value === 'number') {
@@ -45,6 +52,29 @@ const extractCode = (error: unknown): string | undefined => {
   return typeof raw === 'string' ? raw : undefined
 }
 
+const isTransientError = (error: unknown): boolean => {
+  const status = extractStatus(error)
+  if (status !== undefined && RETRY_STATUS_CODES.includes(status)) {
+    return true
+  }
+  const code = extractCode(error)
+  return code !== undefined && RETRY_ERROR_CODES.includes(code)
+}
+
+const extractRetryAfterMs = (error: unknown): number | undefined => {
+  if (!error || typeof error !== 'object') {
+    return undefined
+  }
+  const candidate = error as { headers?: { get?: (name: string) => string | null } }
+  const raw = typeof candidate.headers?.get === 'function' ? candidate.headers.get('retry-after') : null
+  if (!raw) {
+    return undefined
+  }
+  const seconds = Number(raw)
+  const ms = Number.isNaN(seconds) ? Date.parse(raw) - Date.now() : seconds * 1000
+  return Number.isNaN(ms) ? undefined : Math.min(Math.max(ms, 0), MAX_RETRY_AFTER_MS)
+}
+
 const delay = async (ms: number): Promise<void> =>
   new Promise((resolve) => {
     setTimeout(resolve, ms)
@@ -59,51 +89,225 @@ const calculateMaxNumberOfTries = (maxRetries?: number): number => {
 }
 
 export class FetchHttpRequest extends BaseHttpRequest {
+  private readonly coalescer?: RequestCoalescer
+  private readonly hedger?: RequestHedger
+  private readonly endpointPool?: EndpointPool
+  private readonly endpointConfigs = new Map<string, ClientConfig>()
+
+  constructor(config: ClientConfig) {
+    super(config)
+    if (config.coalesceRequests instanceof RequestCoalescer) {
+      this.coalescer = config.coalesceRequests
+    } else if (config.coalesceRequests) {
+      this.coalescer = new RequestCoalescer()
+    }
+    if (config.hedgeRequests instanceof RequestHedger) {
+      this.hedger = config.hedgeRequests
+    } else if (config.hedgeRequests) {
+      this.hedger = new RequestHedger()
+    }
+    if (config.endpoints instanceof EndpointPool) {
+      this.endpointPool = config.endpoints
+    } else if (config.endpoints?.length) {
+      this.endpointPool = new EndpointPool(config.endpoints)
+    }
+    this.endpointPool?.probeWith((baseUrl, path) => request(this.endpointConfig(baseUrl), { method: 'GET', url: path }))
+  }
+
+  /** Counters for coalesced requests, or `undefined` when coalescing is not enabled. */
+  get coalescingStats(): CoalescingStats | undefined {
+    return this.coalescer?.stats
+  }
+
+  /** Counters for hedged requests, or `undefined` when hedging is not enabled. */
+  get hedgingStats(): HedgingStats | undefined {
+    return this.hedger?.stats
+  }
+
   async request<T>(options: ApiRequestOptions): Promise<T> {
-    const maxTries = calculateMaxNumberOfTries(this.config.maxRetries)
+    const instrumentation = this.config.instrumentation
+    if (instrumentation) {
+      return this.instrumentedRequest<T>(instrumentation, options)
+    }
+    return super.request<T>(options)
+  }
+
+  private async instrumentedRequest<T>(instrumentation: RequestInstrumentation, options: ApiRequestOptions): Promise<T> {
+    const context: OperationContext = { operationId: options.operationId ?? options.url, method: options.method, url: options.url }
+    const metrics: OperationMetrics = { outcome: 'network', retries: 0, totalMs: 0 }
+    const start = performance.now()
+    this.notify(() => instrumentation.onOperationStart?.(context))
+    try {
+      const payload = await this.fetchPayload({ ...options, metrics })
+      if (!options.decode) {
+        return payload as T
+      }
+      const decodeStart = performance.now()
+      const value = options.decode(payload as never) as T
+      metrics.decodeMs = performance.now() - decodeStart
+      return value
+    } catch (error) {
+      metrics.error = error
+      throw error
+    } finally {
+      metrics.totalMs = performance.now() - start
+      this.notify(() => instrumentation.onOperationEnd?.(context, metrics))
+    }
+  }
+
+  // Instrumentation hooks must not break requests
+  private notify(hook: () => void): void {
+    try {
+      hook()
+    } catch (error) {
+      this.config.logger?.warn(`Request instrumentation hook failed: ${error}`)
+    }
+  }
+
+  protected async fetchPayload(options: ApiRequestOptions): Promise<unknown> {
+    const metrics = options.metrics
+    const cache = options.cache && isIdempotentRequest(options) ? this.config.responseCache : undefined
+    const cacheKey = cache ? requestKey(options) : undefined
+    if (cache && cacheKey !== undefined) {
+      const cached = cache.get(cacheKey)
+      if (cached !== undefined) {
+        if (metrics) metrics.outcome = 'cache'
+        return cached
+      }
+    }
+
+    let sent = false
+    const execute = async () => {
+      sent = true
+      const sendStart = metrics ? performance.now() : 0
+      try {
+        const payload = await this.requestWithRetries<unknown>(options)
+        if (cache && cacheKey !== undefined && options.cache) {
+          cache.set(cacheKey, payload, options.cache)
+        }
+        return payload
+      } finally {
+        if (metrics) metrics.sendMs = performance.now() - sendStart
+      }
+    }
+
+    const key = this.coalescer?.keyFor(options)
+    if (this.coalescer && key !== undefined) {
+      try {
+        return await this.coalescer.run(key, execute)
+      } finally {
+        if (metrics && !sent) metrics.outcome = 'coalesced'
+      }
+    }
+    return execute()
+  }
+
+  private async requestWithRetries<T>(options: ApiRequestOptions): Promise<T> {
+    const maxTries = calculateMaxNumberOfTries(options.maxRetries ?? this.config.maxRetries)
 
     let attempt = 1
     let lastError: unknown
     while (attempt <= maxTries) {
+      options.signal?.throwIfAborted()
       try {
-        return await request(this.config, options)
+        return await this.send<T>(options)
       } catch (error) {
         lastError = error
-        if (!this.shouldRetry(error, attempt, maxTries)) {
+        const retryAfter = extractRetryAfterMs(error)
+        if (retryAfter !== undefined) {
+          this.config.scheduler?.pause(retryAfter)
+        }
+        if (options.signal?.aborted || !this.shouldRetry(error, attempt, maxTries)) {
           throw error
         }
 
-        const backoff = attempt === 1 ? 0 : Math.min(1000 * 2 ** (attempt - 1), MAX_BACKOFF_MS)
+        const backoff = retryAfter ?? (attempt === 1 ? 0 : Math.min(1000 * 2 ** (attempt - 1), MAX_BACKOFF_MS))
         if (backoff > 0) {
           await delay(backoff)
         }
         this.config.logger?.warn(`Request failed ${attempt} times. Retrying in ${backoff}ms: ${error}`)
         attempt += 1
+        if (options.metrics) options.metrics.retries += 1
       }
     }
 
     throw lastError ?? new Error(`Request failed after ${maxTries} attempt(s)`)
   }
 
-  private shouldRetry(error: unknown, attempt: number, maxTries: number): boolean {
-    if (attempt >= maxTries) {
-      return false
+  private async send<T>(options: ApiRequestOptions): Promise<T> {
+    const operationTimeout = options.operationId !== undefined ? this.config.operationTimeouts?.[options.operationId] : undefined
+    const timeoutMs = options.timeoutMs ?? operationTimeout ?? this.config.timeoutMs
+    // A long poll's latency is set by when the node has something to respond with, so hedging it only doubles the load
+    const hedger = this.hedger && isIdempotentRequest(options) && !options.longPoll ? this.hedger : undefined
+    if (timeoutMs === undefined && !hedger) {
+      return this.dispatch<T>(options)
     }
 
-    const status = extractStatus(error)
-    if (status !== undefined) {
-      if (RETRY_STATUS_CODES.includes(status)) {
-        return true
-      }
+    const controller = new AbortController()
+    const abort = () => controller.abort(options.signal?.reason)
+    if (options.signal?.aborted) {
+      abort()
+    } else {
+      options.signal?.addEventListener('abort', abort, { once: true })
     }
+    const timeout = timeoutMs !== undefined ? new RequestTimeoutError(options.url, timeoutMs) : undefined
+    const timer = timeout ? setTimeout(() => controller.abort(timeout), timeout.timeoutMs) : undefined
 
-    const code = extractCode(error)
-    if (code) {
-      if (RETRY_ERROR_CODES.includes(code)) {
-        return true
+    try {
+      if (hedger) {
+        return await hedger.run(
+          options.operationId ?? options.url,
+          (signal) => this.dispatch<T>({ ...options, signal }),
+          controller.signal,
+        )
       }
+      return await this.dispatch<T>({ ...options, signal: controller.signal })
+    } catch (error) {
+      throw timeout && controller.signal.reason === timeout ? timeout : error
+    } finally {
+      clearTimeout(timer)
+      options.signal?.removeEventListener('abort', abort)
+    }
+  }
+
+  private dispatch<T>(options: ApiRequestOptions): Promise<T> {
+    const scheduler = this.config.scheduler
+    if (!scheduler) {
+      return this.route(options)
+    }
+    const queuedAt = options.metrics ? performance.now() : 0
+    return scheduler.schedule(() => {
+      if (options.metrics) options.metrics.queueMs = performance.now() - queuedAt
+      options.signal?.throwIfAborted()
+      return this.route<T>(options)
+    }, options.priority ?? this.config.priority)
+  }
+
+  private route<T>(options: ApiRequestOptions): Promise<T> {
+    // Non-idempotent requests (e.g. submitting transactions) stay pinned to `baseUrl`
+    if (!this.endpointPool || !isIdempotentRequest(options)) {
+      return request(this.config, options)
+    }
+    return this.endpointPool.run((baseUrl) => request<T>(this.endpointConfig(baseUrl), options), isTransientError, {
+      longPoll: options.longPoll,
+    })
+  }
+
+  // One config per endpoint, so the request runtime can reuse what it works out per config (e.g. the URL origin)
+  private endpointConfig(baseUrl: string): ClientConfig {
+    let config = this.endpointConfigs.get(baseUrl)
+    if (!config) {
+      config = { ...this.config, baseUrl, port: undefined }
+      this.endpointConfigs.set(baseUrl, config)
+    }
+    return config
+  }
+
+  private shouldRetry(error: unknown, attempt: number, maxTries: number): boolean {
+    if (attempt >= maxTries) {
+      return false
     }
 
-    return false
+    return isTransientError(error)
   }
 }
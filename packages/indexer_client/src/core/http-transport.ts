@@ -0,0 +1,5 @@
+/**
+ * A `fetch`-compatible function used to send HTTP requests.
+ * Defaults to the global `fetch`.
+ */
+export type HttpTransport = (url: string, init: RequestInit) => Promise<Response>
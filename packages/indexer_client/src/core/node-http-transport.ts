@@ -0,0 +1,172 @@
+// Node.js only: this module is exported from the `node` entry point rather than the main index, so browser builds of the
+// client don't need to resolve `node:` modules
+
+import type { Agent as HttpAgent, IncomingMessage } from 'node:http'
+import type { Agent as HttpsAgent } from 'node:https'
+import type { HttpTransport } from './http-transport'
+import {
+  createReplayTransport,
+  encodeRecordingArchive,
+  type RecordingHttpTransport,
+  type ReplayHttpTransport,
+  type ReplayTransportOptions,
+} from './recording-transport'
+
+/** A pooled keep-alive `HttpTransport` that can release its sockets. */
+export type PooledHttpTransport = HttpTransport & {
+  /** Destroys all pooled sockets; in-flight requests are aborted. */
+  close(): void
+}
+
+export interface PooledTransportOptions {
+  /** Maximum number of sockets (and therefore concurrent requests) per host. Defaults to 32. */
+  maxSockets?: number
+  /** Maximum number of idle sockets kept open per host. Defaults to 16. */
+  maxFreeSockets?: number
+  /** How long an idle socket is kept open before it's closed, in milliseconds. Defaults to 30 seconds. */
+  idleTimeoutMs?: number
+  /** Number of TLS sessions cached for resumption, avoiding full TLS handshakes on new sockets. Defaults to 100. */
+  maxCachedSessions?: number
+}
+
+export const DEFAULT_POOLED_TRANSPORT_OPTIONS: Required<PooledTransportOptions> = {
+  maxSockets: 32,
+  maxFreeSockets: 16,
+  idleTimeoutMs: 30_000,
+  maxCachedSessions: 100,
+}
+
+const readBody = async (message: IncomingMessage): Promise<Uint8Array> => {
+  const chunks: Uint8Array[] = []
+  let length = 0
+  for await (const chunk of message) {
+    chunks.push(chunk as Uint8Array)
+    length += (chunk as Uint8Array).byteLength
+  }
+  if (chunks.length === 1) {
+    return chunks[0]
+  }
+  const body = new Uint8Array(length)
+  let offset = 0
+  for (const chunk of chunks) {
+    body.set(chunk, offset)
+    offset += chunk.byteLength
+  }
+  return body
+}
+
+const toHeaders = (message: IncomingMessage): Headers => {
+  const headers = new Headers()
+  for (const [name, value] of Object.entries(message.headers)) {
+    if (value === undefined) continue
+    for (const v of Array.isArray(value) ? value : [value]) headers.append(name, v)
+  }
+  return headers
+}
+
+const toRequestBody = (body: RequestInit['body']): string | Uint8Array | undefined => {
+  if (body === undefined || body === null) return undefined
+  if (typeof body === 'string' || body instanceof Uint8Array) return body
+  if (body instanceof ArrayBuffer) return new Uint8Array(body)
+  if (ArrayBuffer.isView(body)) return new Uint8Array(body.buffer, body.byteOffset, body.byteLength)
+  throw new Error('Unsupported request body type for the pooled transport')
+}
+
+/**
+ * Creates a Node.js `HttpTransport` that reuses TCP connections (and TLS sessions) across requests via keep-alive agents.
+ *
+ * This avoids paying TCP and TLS handshakes for every request on bursty workloads. Requests to the same host share a pool
+ * of at most `maxSockets` sockets; additional requests wait for a free socket. HTTP pipelining is not supported; if you
+ * need it, pass an undici `Agent` with `pipelining` set via the `dispatcher` client config instead.
+ *
+ * @param options The pool configuration; see `DEFAULT_POOLED_TRANSPORT_OPTIONS` for the defaults
+ * @returns The transport, to be passed as the `transport` client config
+ * @example
+ * ```typescript
+ * const transport = createPooledTransport({ maxSockets: 64 })
+ * const algod = new AlgodClient({ baseUrl: 'https://mainnet-api.algonode.cloud', transport })
+ * // ...
+ * transport.close()
+ * ```
+ */
+export function createPooledTransport(options: PooledTransportOptions = {}): PooledHttpTransport {
+  const { maxSockets, maxFreeSockets, idleTimeoutMs, maxCachedSessions } = { ...DEFAULT_POOLED_TRANSPORT_OPTIONS, ...options }
+  let agents: Promise<{ http: HttpAgent; https: HttpsAgent }> | undefined
+
+  const getAgents = () => {
+    agents ??= Promise.all([import('node:http'), import('node:https')]).then(([http, https]) => ({
+      http: new http.Agent({ keepAlive: true, maxSockets, maxFreeSockets, timeout: idleTimeoutMs }),
+      https: new https.Agent({ keepAlive: true, maxSockets, maxFreeSockets, timeout: idleTimeoutMs, maxCachedSessions }),
+    }))
+    return agents
+  }
+
+  const transport = async (url: string, init: RequestInit): Promise<Response> => {
+    const target = new URL(url)
+    const isHttps = target.protocol === 'https:'
+    const [{ http, https }, client] = await Promise.all([getAgents(), isHttps ? import('node:https') : import('node:http')])
+    const body = toRequestBody(init.body)
+
+    return new Promise<Response>((resolve, reject) => {
+      const req = client.request(
+        target,
+        {
+          method: init.method ?? 'GET',
+          headers: init.headers as Record<string, string> | undefined,
+          agent: isHttps ? https : http,
+          signal: init.signal ?? undefined,
+        },
+        (message) => {
+          readBody(message)
+            .then((responseBody) => {
+              const status = message.statusCode ?? 0
+              const hasBody = status !== 204 && status !== 304 && init.method !== 'HEAD'
+              resolve(
+                new Response(hasBody ? (responseBody as BodyInit) : null, {
+                  status,
+                  statusText: message.statusMessage,
+                  headers: toHeaders(message),
+                }),
+              )
+            })
+            .catch(reject)
+        },
+      )
+      req.on('error', reject)
+      req.end(body)
+    })
+  }
+
+  return Object.assign(transport, {
+    close: () => {
+      void agents?.then(({ http, https }) => {
+        http.destroy()
+        https.destroy()
+      })
+      agents = undefined
+    },
+  })
+}
+
+/**
+ * Writes the exchanges recorded by a recording transport so far to an archive file, to be replayed with `loadReplayTransport`.
+ *
+ * @param recording The recording transport
+ * @param path The path of the archive
+ */
+export async function saveRecording(recording: RecordingHttpTransport, path: string): Promise<void> {
+  const { writeFile } = await import('node:fs/promises')
+  await writeFile(path, encodeRecordingArchive(recording.exchanges))
+}
+
+/**
+ * Creates a replay transport from an archive file saved by a recording transport.
+ *
+ * @param path The path of the archive
+ * @param options How to replay the recorded response times
+ * @returns The replay transport
+ */
+export async function loadReplayTransport(path: string, options: ReplayTransportOptions = {}): Promise<ReplayHttpTransport> {
+  const { readFile } = await import('node:fs/promises')
+  return createReplayTransport(new Uint8Array(await readFile(path)), options)
+}
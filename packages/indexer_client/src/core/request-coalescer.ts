@@ -0,0 +1,81 @@
+import { type ApiRequestOptions, isIdempotentRequest, requestKey } from './base-http-request'
+
+/** Counters describing how many requests were served by a shared in-flight request. */
+export interface CoalescingStats {
+  /** Requests that were sent to the network */
+  started: number
+  /** Requests that joined an identical request that was already in flight */
+  coalesced: number
+  /** Distinct requests currently in flight */
+  inFlight: number
+}
+
+/**
+ * Gives every caller an independent copy of a shared response payload, so decoded models never share state.
+ */
+export const clonePayload = <T>(payload: T): T => {
+  if (payload === null || payload === undefined || typeof payload !== 'object') {
+    return payload
+  }
+  if (payload instanceof Uint8Array) {
+    return payload.slice() as T
+  }
+  return structuredClone(payload)
+}
+
+/**
+ * Shares a single in-flight promise between concurrent identical idempotent requests.
+ *
+ * Two requests are identical when they have the same method, URL template, path parameters, query parameters and headers
+ * (which includes the `Accept` header). Only `GET` and `HEAD` requests are coalesced.
+ */
+export class RequestCoalescer {
+  private readonly pending = new Map<string, Promise<unknown>>()
+  private started = 0
+  private coalesced = 0
+
+  /** A snapshot of the coalescing counters. */
+  get stats(): CoalescingStats {
+    return { started: this.started, coalesced: this.coalesced, inFlight: this.pending.size }
+  }
+
+  /** Resets the counters; requests currently in flight are unaffected. */
+  resetStats(): void {
+    this.started = 0
+    this.coalesced = 0
+  }
+
+  /**
+   * Returns the coalescing key for the given request, or `undefined` if the request must not be coalesced.
+   * Requests with an abort signal aren't coalesced, so aborting one caller never aborts another.
+   */
+  keyFor(options: ApiRequestOptions): string | undefined {
+    if (!isIdempotentRequest(options) || options.body != null || options.signal) {
+      return undefined
+    }
+    return requestKey(options)
+  }
+
+  /**
+   * Executes the request, or joins an identical request that is already in flight.
+   *
+   * Joined callers receive their own copy of the payload, taken as soon as the shared request settles and before the
+   * original caller can decode (and potentially mutate) it.
+   * @param key The coalescing key from `keyFor`
+   * @param execute Performs the request when no identical request is in flight
+   */
+  run<T>(key: string, execute: () => Promise<T>): Promise<T> {
+    const existing = this.pending.get(key) as Promise<T> | undefined
+    if (existing) {
+      this.coalesced += 1
+      return existing.then((payload) => clonePayload(payload))
+    }
+
+    this.started += 1
+    const promise = execute().finally(() => {
+      this.pending.delete(key)
+    })
+    this.pending.set(key, promise)
+    return promise
+  }
+}
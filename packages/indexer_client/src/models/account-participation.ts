@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, fixedBytes32Codec, fixedBytes64Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * AccountParticipation describes the parameters used by this account in consensus protocol.
@@ -78,3 +79,14 @@ export const AccountParticipationMeta: ObjectModelMetadata<AccountParticipation>
     },
   ],
 }
+
+/**
+ * Decodes only the given `AccountParticipation` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccountParticipation<K extends keyof AccountParticipation & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AccountParticipation, K> {
+  return decodeFields(payload, AccountParticipationMeta, fields)
+}
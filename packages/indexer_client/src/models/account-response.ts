@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Account } from './account'
 import { AccountMeta } from './account'
+import { decodeFields } from '../core/model-runtime'
 
 export type AccountResponse = {
   account: Account
@@ -30,3 +31,14 @@ export const AccountResponseMeta: ObjectModelMetadata<AccountResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AccountResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccountResponse<K extends keyof AccountResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AccountResponse, K> {
+  return decodeFields(payload, AccountResponseMeta, fields)
+}
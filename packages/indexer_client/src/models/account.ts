@@ -20,6 +20,7 @@ import type { Asset } from './asset'
 import { AssetMeta } from './asset'
 import type { AssetHolding } from './asset-holding'
 import { AssetHoldingMeta } from './asset-holding'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Account information at a given round.
@@ -374,3 +375,14 @@ export const AccountMeta: ObjectModelMetadata<Account> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Account` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccount<K extends keyof Account & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Account, K> {
+  return decodeFields(payload, AccountMeta, fields)
+}
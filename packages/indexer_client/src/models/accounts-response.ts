@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Account } from './account'
 import { AccountMeta } from './account'
+import { decodeFields } from '../core/model-runtime'
 
 export type AccountsResponse = {
   accounts: Account[]
@@ -41,3 +42,14 @@ export const AccountsResponseMeta: ObjectModelMetadata<AccountsResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AccountsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAccountsResponse<K extends keyof AccountsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AccountsResponse, K> {
+  return decodeFields(payload, AccountsResponseMeta, fields)
+}
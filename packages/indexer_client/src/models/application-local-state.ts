@@ -4,6 +4,7 @@ import type { ApplicationStateSchema } from './application-state-schema'
 import { ApplicationStateSchemaMeta } from './application-state-schema'
 import type { TealKeyValueStore } from './teal-key-value-store'
 import { TealKeyValueStoreMeta } from './teal-key-value-store'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Stores local state associated with an application.
@@ -74,3 +75,14 @@ export const ApplicationLocalStateMeta: ObjectModelMetadata<ApplicationLocalStat
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationLocalState` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationLocalState<K extends keyof ApplicationLocalState & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationLocalState, K> {
+  return decodeFields(payload, ApplicationLocalStateMeta, fields)
+}
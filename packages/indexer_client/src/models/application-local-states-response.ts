@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { ApplicationLocalState } from './application-local-state'
 import { ApplicationLocalStateMeta } from './application-local-state'
+import { decodeFields } from '../core/model-runtime'
 
 export type ApplicationLocalStatesResponse = {
   appsLocalStates: ApplicationLocalState[]
@@ -41,3 +42,14 @@ export const ApplicationLocalStatesResponseMeta: ObjectModelMetadata<Application
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationLocalStatesResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationLocalStatesResponse<K extends keyof ApplicationLocalStatesResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationLocalStatesResponse, K> {
+  return decodeFields(payload, ApplicationLocalStatesResponseMeta, fields)
+}
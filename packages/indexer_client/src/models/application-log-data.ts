@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Stores the global information associated with an application.
@@ -34,3 +35,14 @@ export const ApplicationLogDataMeta: ObjectModelMetadata<ApplicationLogData> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationLogData` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationLogData<K extends keyof ApplicationLogData & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationLogData, K> {
+  return decodeFields(payload, ApplicationLogDataMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { ApplicationLogData } from './application-log-data'
 import { ApplicationLogDataMeta } from './application-log-data'
+import { decodeFields } from '../core/model-runtime'
 
 export type ApplicationLogsResponse = {
   /**
@@ -51,3 +52,14 @@ export const ApplicationLogsResponseMeta: ObjectModelMetadata<ApplicationLogsRes
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationLogsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationLogsResponse<K extends keyof ApplicationLogsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationLogsResponse, K> {
+  return decodeFields(payload, ApplicationLogsResponseMeta, fields)
+}
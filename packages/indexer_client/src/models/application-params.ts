@@ -4,6 +4,7 @@ import type { ApplicationStateSchema } from './application-state-schema'
 import { ApplicationStateSchemaMeta } from './application-state-schema'
 import type { TealKeyValueStore } from './teal-key-value-store'
 import { TealKeyValueStoreMeta } from './teal-key-value-store'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Stores the global information associated with an application.
@@ -92,3 +93,14 @@ export const ApplicationParamsMeta: ObjectModelMetadata<ApplicationParams> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationParams` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationParams<K extends keyof ApplicationParams & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationParams, K> {
+  return decodeFields(payload, ApplicationParamsMeta, fields)
+}
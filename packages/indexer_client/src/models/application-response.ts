@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Application } from './application'
 import { ApplicationMeta } from './application'
+import { decodeFields } from '../core/model-runtime'
 
 export type ApplicationResponse = {
   application?: Application
@@ -30,3 +31,14 @@ export const ApplicationResponseMeta: ObjectModelMetadata<ApplicationResponse> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationResponse<K extends keyof ApplicationResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationResponse, K> {
+  return decodeFields(payload, ApplicationResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Application } from './application'
 import { ApplicationMeta } from './application'
+import { decodeFields } from '../core/model-runtime'
 
 export type ApplicationsResponse = {
   applications: Application[]
@@ -41,3 +42,14 @@ export const ApplicationsResponseMeta: ObjectModelMetadata<ApplicationsResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `ApplicationsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeApplicationsResponse<K extends keyof ApplicationsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ApplicationsResponse, K> {
+  return decodeFields(payload, ApplicationsResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { MiniAssetHolding } from './mini-asset-holding'
 import { MiniAssetHoldingMeta } from './mini-asset-holding'
+import { decodeFields } from '../core/model-runtime'
 
 export type AssetBalancesResponse = {
   balances: MiniAssetHolding[]
@@ -41,3 +42,14 @@ export const AssetBalancesResponseMeta: ObjectModelMetadata<AssetBalancesRespons
     },
   ],
 }
+
+/**
+ * Decodes only the given `AssetBalancesResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAssetBalancesResponse<K extends keyof AssetBalancesResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AssetBalancesResponse, K> {
+  return decodeFields(payload, AssetBalancesResponseMeta, fields)
+}
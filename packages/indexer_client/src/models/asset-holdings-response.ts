@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AssetHolding } from './asset-holding'
 import { AssetHoldingMeta } from './asset-holding'
+import { decodeFields } from '../core/model-runtime'
 
 export type AssetHoldingsResponse = {
   /**
@@ -40,3 +41,14 @@ export const AssetHoldingsResponseMeta: ObjectModelMetadata<AssetHoldingsRespons
     },
   ],
 }
+
+/**
+ * Decodes only the given `AssetHoldingsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAssetHoldingsResponse<K extends keyof AssetHoldingsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AssetHoldingsResponse, K> {
+  return decodeFields(payload, AssetHoldingsResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Asset } from './asset'
 import { AssetMeta } from './asset'
+import { decodeFields } from '../core/model-runtime'
 
 export type AssetResponse = {
   asset: Asset
@@ -30,3 +31,14 @@ export const AssetResponseMeta: ObjectModelMetadata<AssetResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AssetResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAssetResponse<K extends keyof AssetResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AssetResponse, K> {
+  return decodeFields(payload, AssetResponseMeta, fields)
+}
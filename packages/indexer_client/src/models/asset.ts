@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, booleanCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AssetParams } from './asset-params'
 import { AssetParamsMeta } from './asset-params'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Specifies both the unique identifier and the parameters for an asset
@@ -65,3 +66,14 @@ export const AssetMeta: ObjectModelMetadata<Asset> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Asset` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAsset<K extends keyof Asset & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Asset, K> {
+  return decodeFields(payload, AssetMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Asset } from './asset'
 import { AssetMeta } from './asset'
+import { decodeFields } from '../core/model-runtime'
 
 export type AssetsResponse = {
   assets: Asset[]
@@ -41,3 +42,14 @@ export const AssetsResponseMeta: ObjectModelMetadata<AssetsResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `AssetsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeAssetsResponse<K extends keyof AssetsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<AssetsResponse, K> {
+  return decodeFields(payload, AssetsResponseMeta, fields)
+}
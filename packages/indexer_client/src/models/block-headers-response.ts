@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Block } from './block'
 import { BlockMeta } from './block'
+import { decodeFields } from '../core/model-runtime'
 
 export type BlockHeadersResponse = {
   /**
@@ -40,3 +41,14 @@ export const BlockHeadersResponseMeta: ObjectModelMetadata<BlockHeadersResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `BlockHeadersResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlockHeadersResponse<K extends keyof BlockHeadersResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BlockHeadersResponse, K> {
+  return decodeFields(payload, BlockHeadersResponseMeta, fields)
+}
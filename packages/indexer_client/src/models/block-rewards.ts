@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields relating to rewards,
@@ -78,3 +79,14 @@ export const BlockRewardsMeta: ObjectModelMetadata<BlockRewards> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BlockRewards` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlockRewards<K extends keyof BlockRewards & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BlockRewards, K> {
+  return decodeFields(payload, BlockRewardsMeta, fields)
+}
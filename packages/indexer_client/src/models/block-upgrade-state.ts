@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, bigIntCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields relating to a protocol upgrade.
@@ -67,3 +68,14 @@ export const BlockUpgradeStateMeta: ObjectModelMetadata<BlockUpgradeState> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BlockUpgradeState` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlockUpgradeState<K extends keyof BlockUpgradeState & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BlockUpgradeState, K> {
+  return decodeFields(payload, BlockUpgradeStateMeta, fields)
+}
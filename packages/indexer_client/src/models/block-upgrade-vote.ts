@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields relating to voting for a protocol upgrade.
@@ -45,3 +46,14 @@ export const BlockUpgradeVoteMeta: ObjectModelMetadata<BlockUpgradeVote> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BlockUpgradeVote` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlockUpgradeVote<K extends keyof BlockUpgradeVote & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BlockUpgradeVote, K> {
+  return decodeFields(payload, BlockUpgradeVoteMeta, fields)
+}
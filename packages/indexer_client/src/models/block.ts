@@ -21,6 +21,7 @@ import type { StateProofTracking } from './state-proof-tracking'
 import { StateProofTrackingMeta } from './state-proof-tracking'
 import type { Transaction } from './transaction'
 import { TransactionMeta } from './transaction'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Block information.
@@ -253,3 +254,14 @@ export const BlockMeta: ObjectModelMetadata<Block> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Block` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBlock<K extends keyof Block & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Block, K> {
+  return decodeFields(payload, BlockMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Box descriptor describes an app box without a value.
@@ -23,3 +24,14 @@ export const BoxDescriptorMeta: ObjectModelMetadata<BoxDescriptor> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BoxDescriptor` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBoxDescriptor<K extends keyof BoxDescriptor & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BoxDescriptor, K> {
+  return decodeFields(payload, BoxDescriptorMeta, fields)
+}
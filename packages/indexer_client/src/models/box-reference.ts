@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * BoxReference names a box by its name and the application ID it belongs to.
@@ -34,3 +35,14 @@ export const BoxReferenceMeta: ObjectModelMetadata<BoxReference> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `BoxReference` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeBoxReference<K extends keyof BoxReference & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<BoxReference, K> {
+  return decodeFields(payload, BoxReferenceMeta, fields)
+}
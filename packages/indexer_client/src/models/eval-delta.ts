@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents a TEAL value delta.
@@ -45,3 +46,14 @@ export const EvalDeltaMeta: ObjectModelMetadata<EvalDelta> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `EvalDelta` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeEvalDelta<K extends keyof EvalDelta & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<EvalDelta, K> {
+  return decodeFields(payload, EvalDeltaMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type HashFactory = {
   /**
@@ -20,3 +21,14 @@ export const HashFactoryMeta: ObjectModelMetadata<HashFactory> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `HashFactory` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeHashFactory<K extends keyof HashFactory & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<HashFactory, K> {
+  return decodeFields(payload, HashFactoryMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { fixedBytes32Codec, fixedBytes64Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * \[hbprf\] HbProof is a signature using HeartbeatAddress's partkey, thereby showing it is online.
@@ -67,3 +68,14 @@ export const HbProofFieldsMeta: ObjectModelMetadata<HbProofFields> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `HbProofFields` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeHbProofFields<K extends keyof HbProofFields & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<HbProofFields, K> {
+  return decodeFields(payload, HbProofFieldsMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, booleanCodec, stringArrayCodec, RecordCodec, unknownCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * A health check response.
@@ -65,3 +66,14 @@ export const HealthCheckMeta: ObjectModelMetadata<HealthCheck> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `HealthCheck` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeHealthCheck<K extends keyof HealthCheck & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<HealthCheck, K> {
+  return decodeFields(payload, HealthCheckMeta, fields)
+}
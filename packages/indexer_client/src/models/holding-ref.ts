@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * HoldingRef names a holding by referring to an Address and Asset it belongs to.
@@ -34,3 +35,14 @@ export const HoldingRefMeta: ObjectModelMetadata<HoldingRef> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `HoldingRef` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeHoldingRef<K extends keyof HoldingRef & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<HoldingRef, K> {
+  return decodeFields(payload, HoldingRefMeta, fields)
+}
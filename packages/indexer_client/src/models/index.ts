@@ -68,3 +68,70 @@ export type { AssetsResponse } from './assets-response'
 export type { BlockHeadersResponse } from './block-headers-response'
 export type { TransactionResponse } from './transaction-response'
 export type { TransactionsResponse } from './transactions-response'
+export { decodeAccount } from './account'
+export { decodeAccountParticipation } from './account-participation'
+export { decodeApplicationStateSchema } from './application-state-schema'
+export { decodeApplicationLocalState } from './application-local-state'
+export { decodeTealKeyValue } from './teal-key-value'
+export { decodeTealValue } from './teal-value'
+export { decodeApplication } from './application'
+export { decodeApplicationParams } from './application-params'
+export { decodeApplicationLogData } from './application-log-data'
+export { decodeAsset } from './asset'
+export { decodeAssetHolding } from './asset-holding'
+export { decodeAssetParams } from './asset-params'
+export { decodeBlock } from './block'
+export { decodeBlockRewards } from './block-rewards'
+export { decodeBlockUpgradeState } from './block-upgrade-state'
+export { decodeBlockUpgradeVote } from './block-upgrade-vote'
+export { decodeBox } from './box'
+export { decodeBoxDescriptor } from './box-descriptor'
+export { decodeBoxReference } from './box-reference'
+export { decodeHealthCheck } from './health-check'
+export { decodeHoldingRef } from './holding-ref'
+export { decodeLocalsRef } from './locals-ref'
+export { decodeMiniAssetHolding } from './mini-asset-holding'
+export { decodeParticipationUpdates } from './participation-updates'
+export { decodeResourceRef } from './resource-ref'
+export { decodeAccountStateDelta } from './account-state-delta'
+export { decodeEvalDeltaKeyValue } from './eval-delta-key-value'
+export { decodeEvalDelta } from './eval-delta'
+export { decodeStateSchema } from './state-schema'
+export { decodeTransaction } from './transaction'
+export { decodeTransactionApplication } from './transaction-application'
+export { decodeTransactionAssetConfig } from './transaction-asset-config'
+export { decodeTransactionAssetFreeze } from './transaction-asset-freeze'
+export { decodeTransactionStateProof } from './transaction-state-proof'
+export { decodeTransactionHeartbeat } from './transaction-heartbeat'
+export { decodeTransactionAssetTransfer } from './transaction-asset-transfer'
+export { decodeTransactionKeyreg } from './transaction-keyreg'
+export { decodeTransactionPayment } from './transaction-payment'
+export { decodeTransactionSignature } from './transaction-signature'
+export { decodeTransactionSignatureLogicsig } from './transaction-signature-logicsig'
+export { decodeTransactionSignatureMultisig } from './transaction-signature-multisig'
+export { decodeTransactionSignatureMultisigSubsignature } from './transaction-signature-multisig-subsignature'
+export { decodeStateProofFields } from './state-proof-fields'
+export { decodeHbProofFields } from './hb-proof-fields'
+export { decodeIndexerStateProofMessage } from './indexer-state-proof-message'
+export { decodeStateProofReveal } from './state-proof-reveal'
+export { decodeStateProofSigSlot } from './state-proof-sig-slot'
+export { decodeStateProofSignature } from './state-proof-signature'
+export { decodeStateProofParticipant } from './state-proof-participant'
+export { decodeStateProofVerifier } from './state-proof-verifier'
+export { decodeStateProofTracking } from './state-proof-tracking'
+export { decodeMerkleArrayProof } from './merkle-array-proof'
+export { decodeHashFactory } from './hash-factory'
+export { decodeAccountResponse } from './account-response'
+export { decodeAssetHoldingsResponse } from './asset-holdings-response'
+export { decodeAccountsResponse } from './accounts-response'
+export { decodeAssetBalancesResponse } from './asset-balances-response'
+export { decodeApplicationResponse } from './application-response'
+export { decodeApplicationsResponse } from './applications-response'
+export { decodeApplicationLogsResponse } from './application-logs-response'
+export { decodeApplicationLocalStatesResponse } from './application-local-states-response'
+export { decodeAssetResponse } from './asset-response'
+export { decodeBoxesResponse } from './boxes-response'
+export { decodeAssetsResponse } from './assets-response'
+export { decodeBlockHeadersResponse } from './block-headers-response'
+export { decodeTransactionResponse } from './transaction-response'
+export { decodeTransactionsResponse } from './transactions-response'
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type IndexerStateProofMessage = {
   /**
@@ -64,3 +65,14 @@ export const IndexerStateProofMessageMeta: ObjectModelMetadata<IndexerStateProof
     },
   ],
 }
+
+/**
+ * Decodes only the given `IndexerStateProofMessage` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeIndexerStateProofMessage<K extends keyof IndexerStateProofMessage & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<IndexerStateProofMessage, K> {
+  return decodeFields(payload, IndexerStateProofMessageMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * LocalsRef names a local state by referring to an Address and App it belongs to.
@@ -34,3 +35,14 @@ export const LocalsRefMeta: ObjectModelMetadata<LocalsRef> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `LocalsRef` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeLocalsRef<K extends keyof LocalsRef & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<LocalsRef, K> {
+  return decodeFields(payload, LocalsRefMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bytesArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { HashFactory } from './hash-factory'
 import { HashFactoryMeta } from './hash-factory'
+import { decodeFields } from '../core/model-runtime'
 
 export type MerkleArrayProof = {
   /**
@@ -40,3 +41,14 @@ export const MerkleArrayProofMeta: ObjectModelMetadata<MerkleArrayProof> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `MerkleArrayProof` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeMerkleArrayProof<K extends keyof MerkleArrayProof & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<MerkleArrayProof, K> {
+  return decodeFields(payload, MerkleArrayProofMeta, fields)
+}
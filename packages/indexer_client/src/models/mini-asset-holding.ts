@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * A simplified version of AssetHolding
@@ -67,3 +68,14 @@ export const MiniAssetHoldingMeta: ObjectModelMetadata<MiniAssetHolding> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `MiniAssetHolding` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeMiniAssetHolding<K extends keyof MiniAssetHolding & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<MiniAssetHolding, K> {
+  return decodeFields(payload, MiniAssetHoldingMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Participation account data that needs to be checked/acted on by the network.
@@ -34,3 +35,14 @@ export const ParticipationUpdatesMeta: ObjectModelMetadata<ParticipationUpdates>
     },
   ],
 }
+
+/**
+ * Decodes only the given `ParticipationUpdates` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeParticipationUpdates<K extends keyof ParticipationUpdates & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ParticipationUpdates, K> {
+  return decodeFields(payload, ParticipationUpdatesMeta, fields)
+}
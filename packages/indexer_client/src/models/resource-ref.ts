@@ -6,6 +6,7 @@ import type { HoldingRef } from './holding-ref'
 import { HoldingRefMeta } from './holding-ref'
 import type { LocalsRef } from './locals-ref'
 import { LocalsRefMeta } from './locals-ref'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ResourceRef names a single resource. Only one of the fields should be set.
@@ -74,3 +75,14 @@ export const ResourceRefMeta: ObjectModelMetadata<ResourceRef> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ResourceRef` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeResourceRef<K extends keyof ResourceRef & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ResourceRef, K> {
+  return decodeFields(payload, ResourceRefMeta, fields)
+}
@@ -4,6 +4,7 @@ import type { MerkleArrayProof } from './merkle-array-proof'
 import { MerkleArrayProofMeta } from './merkle-array-proof'
 import type { StateProofReveal } from './state-proof-reveal'
 import { StateProofRevealMeta } from './state-proof-reveal'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * \[sp\] represents a state proof.
@@ -88,3 +89,14 @@ export const StateProofFieldsMeta: ObjectModelMetadata<StateProofFields> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofFields` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofFields<K extends keyof StateProofFields & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofFields, K> {
+  return decodeFields(payload, StateProofFieldsMeta, fields)
+}
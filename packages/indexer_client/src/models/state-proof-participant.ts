@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { StateProofVerifier } from './state-proof-verifier'
 import { StateProofVerifierMeta } from './state-proof-verifier'
+import { decodeFields } from '../core/model-runtime'
 
 export type StateProofParticipant = {
   verifier?: StateProofVerifier
@@ -30,3 +31,14 @@ export const StateProofParticipantMeta: ObjectModelMetadata<StateProofParticipan
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofParticipant` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofParticipant<K extends keyof StateProofParticipant & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofParticipant, K> {
+  return decodeFields(payload, StateProofParticipantMeta, fields)
+}
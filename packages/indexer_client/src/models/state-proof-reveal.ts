@@ -4,6 +4,7 @@ import type { StateProofParticipant } from './state-proof-participant'
 import { StateProofParticipantMeta } from './state-proof-participant'
 import type { StateProofSigSlot } from './state-proof-sig-slot'
 import { StateProofSigSlotMeta } from './state-proof-sig-slot'
+import { decodeFields } from '../core/model-runtime'
 
 export type StateProofReveal = {
   /**
@@ -38,3 +39,14 @@ export const StateProofRevealMeta: ObjectModelMetadata<StateProofReveal> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofReveal` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofReveal<K extends keyof StateProofReveal & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofReveal, K> {
+  return decodeFields(payload, StateProofRevealMeta, fields)
+}
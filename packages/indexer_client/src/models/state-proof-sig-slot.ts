@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { StateProofSignature } from './state-proof-signature'
 import { StateProofSignatureMeta } from './state-proof-signature'
+import { decodeFields } from '../core/model-runtime'
 
 export type StateProofSigSlot = {
   signature?: StateProofSignature
@@ -30,3 +31,14 @@ export const StateProofSigSlotMeta: ObjectModelMetadata<StateProofSigSlot> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofSigSlot` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofSigSlot<K extends keyof StateProofSigSlot & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofSigSlot, K> {
+  return decodeFields(payload, StateProofSigSlotMeta, fields)
+}
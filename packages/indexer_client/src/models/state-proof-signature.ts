@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bytesCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { MerkleArrayProof } from './merkle-array-proof'
 import { MerkleArrayProofMeta } from './merkle-array-proof'
+import { decodeFields } from '../core/model-runtime'
 
 export type StateProofSignature = {
   falconSignature?: Uint8Array
@@ -44,3 +45,14 @@ export const StateProofSignatureMeta: ObjectModelMetadata<StateProofSignature> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofSignature` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofSignature<K extends keyof StateProofSignature & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofSignature, K> {
+  return decodeFields(payload, StateProofSignatureMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bigIntCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type StateProofTracking = {
   /**
@@ -53,3 +54,14 @@ export const StateProofTrackingMeta: ObjectModelMetadata<StateProofTracking> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofTracking` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofTracking<K extends keyof StateProofTracking & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofTracking, K> {
+  return decodeFields(payload, StateProofTrackingMeta, fields)
+}
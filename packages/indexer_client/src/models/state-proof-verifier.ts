@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, fixedBytes64Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type StateProofVerifier = {
   /**
@@ -31,3 +32,14 @@ export const StateProofVerifierMeta: ObjectModelMetadata<StateProofVerifier> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateProofVerifier` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateProofVerifier<K extends keyof StateProofVerifier & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateProofVerifier, K> {
+  return decodeFields(payload, StateProofVerifierMeta, fields)
+}
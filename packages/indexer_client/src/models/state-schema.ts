@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents a \[apls\] local-state or \[apgs\] global-state schema. These schemas determine how much storage may be used in a local-state or global-state for an application. The more space used, the larger minimum balance must be maintained in the account holding the data.
@@ -34,3 +35,14 @@ export const StateSchemaMeta: ObjectModelMetadata<StateSchema> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `StateSchema` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeStateSchema<K extends keyof StateSchema & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<StateSchema, K> {
+  return decodeFields(payload, StateSchemaMeta, fields)
+}
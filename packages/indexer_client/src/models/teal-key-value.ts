@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { TealValue } from './teal-value'
 import { TealValueMeta } from './teal-value'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Represents a key-value pair in an application store.
@@ -29,3 +30,14 @@ export const TealKeyValueMeta: ObjectModelMetadata<TealKeyValue> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `TealKeyValue` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTealKeyValue<K extends keyof TealKeyValue & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TealKeyValue, K> {
+  return decodeFields(payload, TealKeyValueMeta, fields)
+}
@@ -18,6 +18,7 @@ import type { ResourceRef } from './resource-ref'
 import { ResourceRefMeta } from './resource-ref'
 import type { StateSchema } from './state-schema'
 import { StateSchemaMeta } from './state-schema'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for application transactions.
@@ -175,3 +176,14 @@ export const TransactionApplicationMeta: ObjectModelMetadata<TransactionApplicat
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionApplication` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionApplication<K extends keyof TransactionApplication & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionApplication, K> {
+  return decodeFields(payload, TransactionApplicationMeta, fields)
+}
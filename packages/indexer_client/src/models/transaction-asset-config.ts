@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { AssetParams } from './asset-params'
 import { AssetParamsMeta } from './asset-params'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for asset allocation, re-configuration, and destruction.
@@ -39,3 +40,14 @@ export const TransactionAssetConfigMeta: ObjectModelMetadata<TransactionAssetCon
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionAssetConfig` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionAssetConfig<K extends keyof TransactionAssetConfig & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionAssetConfig, K> {
+  return decodeFields(payload, TransactionAssetConfigMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, booleanCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for an asset freeze transaction.
@@ -48,3 +49,14 @@ export const TransactionAssetFreezeMeta: ObjectModelMetadata<TransactionAssetFre
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionAssetFreeze` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionAssetFreeze<K extends keyof TransactionAssetFreeze & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionAssetFreeze, K> {
+  return decodeFields(payload, TransactionAssetFreezeMeta, fields)
+}
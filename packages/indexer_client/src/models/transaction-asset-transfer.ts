@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for an asset transfer transaction.
@@ -81,3 +82,14 @@ export const TransactionAssetTransferMeta: ObjectModelMetadata<TransactionAssetT
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionAssetTransfer` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionAssetTransfer<K extends keyof TransactionAssetTransfer & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionAssetTransfer, K> {
+  return decodeFields(payload, TransactionAssetTransferMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, bytesCodec, ObjectModelCodec, fixedBytes32Codec } from '@algorandfoundation/algokit-common'
 import type { HbProofFields } from './hb-proof-fields'
 import { HbProofFieldsMeta } from './hb-proof-fields'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for a heartbeat transaction.
@@ -68,3 +69,14 @@ export const TransactionHeartbeatMeta: ObjectModelMetadata<TransactionHeartbeat>
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionHeartbeat` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionHeartbeat<K extends keyof TransactionHeartbeat & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionHeartbeat, K> {
+  return decodeFields(payload, TransactionHeartbeatMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, booleanCodec, fixedBytes32Codec, fixedBytes64Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for a keyreg transaction.
@@ -92,3 +93,14 @@ export const TransactionKeyregMeta: ObjectModelMetadata<TransactionKeyreg> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionKeyreg` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionKeyreg<K extends keyof TransactionKeyreg & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionKeyreg, K> {
+  return decodeFields(payload, TransactionKeyregMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for a payment transaction.
@@ -59,3 +60,14 @@ export const TransactionPaymentMeta: ObjectModelMetadata<TransactionPayment> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionPayment` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionPayment<K extends keyof TransactionPayment & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionPayment, K> {
+  return decodeFields(payload, TransactionPaymentMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bigIntCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Transaction } from './transaction'
 import { TransactionMeta } from './transaction'
+import { decodeFields } from '../core/model-runtime'
 
 export type TransactionResponse = {
   transaction: Transaction
@@ -30,3 +31,14 @@ export const TransactionResponseMeta: ObjectModelMetadata<TransactionResponse> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionResponse<K extends keyof TransactionResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionResponse, K> {
+  return decodeFields(payload, TransactionResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec, bytesArrayCodec, ObjectModelCodec, fixedBytes64Codec } from '@algorandfoundation/algokit-common'
 import type { TransactionSignatureMultisig } from './transaction-signature-multisig'
 import { TransactionSignatureMultisigMeta } from './transaction-signature-multisig'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * \[lsig\] Programatic transaction signature.
@@ -64,3 +65,14 @@ export const TransactionSignatureLogicsigMeta: ObjectModelMetadata<TransactionSi
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionSignatureLogicsig` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionSignatureLogicsig<K extends keyof TransactionSignatureLogicsig & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionSignatureLogicsig, K> {
+  return decodeFields(payload, TransactionSignatureLogicsigMeta, fields)
+}
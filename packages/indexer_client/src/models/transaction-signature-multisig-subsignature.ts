@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { fixedBytes32Codec, fixedBytes64Codec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 export type TransactionSignatureMultisigSubsignature = {
   /**
@@ -31,3 +32,14 @@ export const TransactionSignatureMultisigSubsignatureMeta: ObjectModelMetadata<T
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionSignatureMultisigSubsignature` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionSignatureMultisigSubsignature<K extends keyof TransactionSignatureMultisigSubsignature & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionSignatureMultisigSubsignature, K> {
+  return decodeFields(payload, TransactionSignatureMultisigSubsignatureMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { TransactionSignatureMultisigSubsignature } from './transaction-signature-multisig-subsignature'
 import { TransactionSignatureMultisigSubsignatureMeta } from './transaction-signature-multisig-subsignature'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * structure holding multiple subsignatures.
@@ -50,3 +51,14 @@ export const TransactionSignatureMultisigMeta: ObjectModelMetadata<TransactionSi
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionSignatureMultisig` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionSignatureMultisig<K extends keyof TransactionSignatureMultisig & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionSignatureMultisig, K> {
+  return decodeFields(payload, TransactionSignatureMultisigMeta, fields)
+}
@@ -4,6 +4,7 @@ import type { TransactionSignatureLogicsig } from './transaction-signature-logic
 import { TransactionSignatureLogicsigMeta } from './transaction-signature-logicsig'
 import type { TransactionSignatureMultisig } from './transaction-signature-multisig'
 import { TransactionSignatureMultisigMeta } from './transaction-signature-multisig'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Validation signature associated with some data. Only one of the signatures should be provided.
@@ -42,3 +43,14 @@ export const TransactionSignatureMeta: ObjectModelMetadata<TransactionSignature>
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionSignature` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionSignature<K extends keyof TransactionSignature & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionSignature, K> {
+  return decodeFields(payload, TransactionSignatureMeta, fields)
+}
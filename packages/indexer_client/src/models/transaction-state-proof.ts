@@ -4,6 +4,7 @@ import type { IndexerStateProofMessage } from './indexer-state-proof-message'
 import { IndexerStateProofMessageMeta } from './indexer-state-proof-message'
 import type { StateProofFields } from './state-proof-fields'
 import { StateProofFieldsMeta } from './state-proof-fields'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Fields for a state proof transaction.
@@ -44,3 +45,14 @@ export const TransactionStateProofMeta: ObjectModelMetadata<TransactionStateProo
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionStateProof` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionStateProof<K extends keyof TransactionStateProof & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionStateProof, K> {
+  return decodeFields(payload, TransactionStateProofMeta, fields)
+}
@@ -33,6 +33,7 @@ import type { TransactionSignature } from './transaction-signature'
 import { TransactionSignatureMeta } from './transaction-signature'
 import type { TransactionStateProof } from './transaction-state-proof'
 import { TransactionStateProofMeta } from './transaction-state-proof'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Contains all fields common to all transactions and serves as an envelope to all transactions type. Represents both regular and inner transactions.
@@ -405,3 +406,14 @@ export const TransactionMeta: ObjectModelMetadata<Transaction> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Transaction` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransaction<K extends keyof Transaction & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Transaction, K> {
+  return decodeFields(payload, TransactionMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bigIntCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Transaction } from './transaction'
 import { TransactionMeta } from './transaction'
+import { decodeFields } from '../core/model-runtime'
 
 export type TransactionsResponse = {
   /**
@@ -40,3 +41,14 @@ export const TransactionsResponseMeta: ObjectModelMetadata<TransactionsResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `TransactionsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeTransactionsResponse<K extends keyof TransactionsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<TransactionsResponse, K> {
+  return decodeFields(payload, TransactionsResponseMeta, fields)
+}
@@ -0,0 +1,2 @@
+// Node.js only exports
+export * from './core/node-http-transport'
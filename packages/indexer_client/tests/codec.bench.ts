@@ -0,0 +1,112 @@
+import { parseJson, type ObjectModelMetadata } from '@algorandfoundation/algokit-common'
+import { existsSync, readFileSync } from 'node:fs'
+import { afterAll, bench, describe } from 'vitest'
+import { decodeJson, decodeMsgpack, encodeJson, encodeMsgpack, type DecodeOptions } from '../src/core/model-runtime'
+import {
+  AccountResponseMeta,
+  AccountsResponseMeta,
+  ApplicationLocalStatesResponseMeta,
+  ApplicationLogsResponseMeta,
+  ApplicationResponseMeta,
+  ApplicationsResponseMeta,
+  AssetBalancesResponseMeta,
+  AssetHoldingsResponseMeta,
+  AssetResponseMeta,
+  AssetsResponseMeta,
+  BlockMeta,
+  BlockHeadersResponseMeta,
+  BoxMeta,
+  BoxesResponseMeta,
+  HealthCheckMeta,
+  TransactionResponseMeta,
+  TransactionsResponseMeta,
+} from '../src/models/model-meta'
+
+// Decode and encode throughput of the IndexerClient response models through the model runtime, measured on
+// recorded response bodies saved as `fixtures/codec/<Model>.json` or `fixtures/codec/<Model>.msgpack`, e.g. the body of
+// a `GET /v2/blocks/{round}?format=msgpack` response as `BlockResponse.msgpack`. Models without a fixture are skipped.
+//
+// JSON decoding includes parsing the body. To compare generator versions or codec paths, save a baseline with
+// `vitest bench --run --outputJson baseline.json` and compare against it with `vitest bench --run --compare baseline.json`.
+
+type Format = 'json' | 'msgpack'
+type Meta = ObjectModelMetadata<Record<string, unknown>>
+
+const RESPONSE_MODELS: [string, Meta, Format][] = [
+  ['AccountResponse', AccountResponseMeta as Meta, 'json'],
+  ['AccountsResponse', AccountsResponseMeta as Meta, 'json'],
+  ['ApplicationLocalStatesResponse', ApplicationLocalStatesResponseMeta as Meta, 'json'],
+  ['ApplicationLogsResponse', ApplicationLogsResponseMeta as Meta, 'json'],
+  ['ApplicationResponse', ApplicationResponseMeta as Meta, 'json'],
+  ['ApplicationsResponse', ApplicationsResponseMeta as Meta, 'json'],
+  ['AssetBalancesResponse', AssetBalancesResponseMeta as Meta, 'json'],
+  ['AssetHoldingsResponse', AssetHoldingsResponseMeta as Meta, 'json'],
+  ['AssetResponse', AssetResponseMeta as Meta, 'json'],
+  ['AssetsResponse', AssetsResponseMeta as Meta, 'json'],
+  ['Block', BlockMeta as Meta, 'json'],
+  ['BlockHeadersResponse', BlockHeadersResponseMeta as Meta, 'json'],
+  ['Box', BoxMeta as Meta, 'json'],
+  ['BoxesResponse', BoxesResponseMeta as Meta, 'json'],
+  ['HealthCheck', HealthCheckMeta as Meta, 'json'],
+  ['TransactionResponse', TransactionResponseMeta as Meta, 'json'],
+  ['TransactionsResponse', TransactionsResponseMeta as Meta, 'json'],
+]
+
+// The ways a response can be decoded; lazy decoding only decodes nested values when they're read, so it measures the up-front cost
+const DECODE_PATHS: Record<string, DecodeOptions> = {
+  metadata: {},
+  lazy: { lazy: true },
+}
+
+const textDecoder = new TextDecoder()
+const textEncoder = new TextEncoder()
+
+const loadFixture = (model: string, format: Format): Uint8Array | undefined => {
+  const path = new URL(`./fixtures/codec/${model}.${format}`, import.meta.url)
+  return existsSync(path) ? new Uint8Array(readFileSync(path)) : undefined
+}
+
+const decode = (body: Uint8Array, meta: Meta, format: Format, options: DecodeOptions) => {
+  if (format === 'msgpack') {
+    return decodeMsgpack(body, meta, options)
+  }
+  return decodeJson(parseJson(textDecoder.decode(body)) as Record<string, unknown>, meta, options)
+}
+
+const encode = (value: Record<string, unknown>, meta: Meta, format: Format): Uint8Array =>
+  format === 'json' ? textEncoder.encode(encodeJson(value, meta)) : encodeMsgpack(value, meta)
+
+const throughput = new Map<string, { bytes: number; ms: number }>()
+
+// Wraps a benchmark to also track the bytes it processes, so bytes/sec can be reported next to ops/sec
+const measured = (name: string, bytes: number, run: () => unknown) => () => {
+  const start = performance.now()
+  run()
+  const stats = throughput.get(name) ?? { bytes: 0, ms: 0 }
+  stats.bytes += bytes
+  stats.ms += performance.now() - start
+  throughput.set(name, stats)
+}
+
+for (const [model, meta, format] of RESPONSE_MODELS) {
+  const fixture = loadFixture(model, format)
+
+  describe.skipIf(fixture === undefined)(`${model} (${format}, ${fixture?.byteLength ?? 0} bytes)`, () => {
+    if (fixture === undefined) return
+    const value = decode(fixture, meta, format, {})
+    const encodedBytes = encode(value, meta, format).byteLength
+
+    for (const [path, options] of Object.entries(DECODE_PATHS)) {
+      const name = `${model} (${format}) decode (${path})`
+      bench(`decode (${path})`, measured(name, fixture.byteLength, () => decode(fixture, meta, format, options)))
+    }
+    bench('encode', measured(`${model} (${format}) encode`, encodedBytes, () => encode(value, meta, format)))
+  })
+}
+
+afterAll(() => {
+  for (const [name, { bytes, ms }] of throughput) {
+    // eslint-disable-next-line no-console
+    console.info(`${name}: ${ms > 0 ? (bytes / 1024 / 1024 / (ms / 1000)).toFixed(1) : '-'} MiB/s`)
+  }
+})
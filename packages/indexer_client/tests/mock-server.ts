@@ -0,0 +1,166 @@
+import { ObjectModelCodec, type ObjectModelMetadata } from '@algorandfoundation/algokit-common'
+import { startLocalMockServer, type LocalMockServer, type LocalMockServerOptions, type MockRoute } from '@algorandfoundation/algokit-testing'
+import { encodeJson, encodeMsgpack } from '../src/core/model-runtime'
+import {
+  AccountResponseMeta,
+  AccountsResponseMeta,
+  ApplicationLocalStatesResponseMeta,
+  ApplicationLogsResponseMeta,
+  ApplicationResponseMeta,
+  ApplicationsResponseMeta,
+  AssetBalancesResponseMeta,
+  AssetHoldingsResponseMeta,
+  AssetResponseMeta,
+  AssetsResponseMeta,
+  BlockMeta,
+  BlockHeadersResponseMeta,
+  BoxMeta,
+  BoxesResponseMeta,
+  HealthCheckMeta,
+  TransactionResponseMeta,
+  TransactionsResponseMeta,
+} from '../src/models/model-meta'
+
+// A stand-in for the API behind IndexerClient, for load testing without a node. It serves every operation of the client, each
+// with a schema-valid (default valued) response in the operation's wire format; recorded responses can be served instead with the
+// `fixturesDir` option. See `startLocalMockServer` for the latency, error and rate limit injection options.
+
+type Meta = ObjectModelMetadata<Record<string, unknown>>
+
+const defaultValue = (meta: Meta) => new ObjectModelCodec(meta).defaultValue()
+
+const json = (meta: Meta): MockRoute['response'] => ({ format: 'json', body: () => encodeJson(defaultValue(meta), meta) })
+const msgpack = (meta: Meta): MockRoute['response'] => ({ format: 'msgpack', body: () => encodeMsgpack(defaultValue(meta), meta) })
+
+/** The route of every IndexerClient operation. */
+export const routes: MockRoute[] = [
+  {
+    operationId: 'healthCheck',
+    method: 'GET',
+    path: '/health',
+    response: json(HealthCheckMeta as Meta),
+  },
+  {
+    operationId: 'lookupAccountAppLocalStates',
+    method: 'GET',
+    path: '/v2/accounts/{account-id}/apps-local-state',
+    response: json(ApplicationLocalStatesResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAccountAssets',
+    method: 'GET',
+    path: '/v2/accounts/{account-id}/assets',
+    response: json(AssetHoldingsResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAccountById',
+    method: 'GET',
+    path: '/v2/accounts/{account-id}',
+    response: json(AccountResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAccountCreatedApplications',
+    method: 'GET',
+    path: '/v2/accounts/{account-id}/created-applications',
+    response: json(ApplicationsResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAccountCreatedAssets',
+    method: 'GET',
+    path: '/v2/accounts/{account-id}/created-assets',
+    response: json(AssetsResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAccountTransactions',
+    method: 'GET',
+    path: '/v2/accounts/{account-id}/transactions',
+    response: json(TransactionsResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupApplicationBoxByIdAndName',
+    method: 'GET',
+    path: '/v2/applications/{application-id}/box',
+    response: json(BoxMeta as Meta),
+  },
+  {
+    operationId: 'lookupApplicationById',
+    method: 'GET',
+    path: '/v2/applications/{application-id}',
+    response: json(ApplicationResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupApplicationLogsById',
+    method: 'GET',
+    path: '/v2/applications/{application-id}/logs',
+    response: json(ApplicationLogsResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAssetBalances',
+    method: 'GET',
+    path: '/v2/assets/{asset-id}/balances',
+    response: json(AssetBalancesResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAssetById',
+    method: 'GET',
+    path: '/v2/assets/{asset-id}',
+    response: json(AssetResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupAssetTransactions',
+    method: 'GET',
+    path: '/v2/assets/{asset-id}/transactions',
+    response: json(TransactionsResponseMeta as Meta),
+  },
+  {
+    operationId: 'lookupBlock',
+    method: 'GET',
+    path: '/v2/blocks/{round-number}',
+    response: json(BlockMeta as Meta),
+  },
+  {
+    operationId: 'lookupTransactionById',
+    method: 'GET',
+    path: '/v2/transactions/{txid}',
+    response: json(TransactionResponseMeta as Meta),
+  },
+  {
+    operationId: 'searchForAccounts',
+    method: 'GET',
+    path: '/v2/accounts',
+    response: json(AccountsResponseMeta as Meta),
+  },
+  {
+    operationId: 'searchForApplicationBoxes',
+    method: 'GET',
+    path: '/v2/applications/{application-id}/boxes',
+    response: json(BoxesResponseMeta as Meta),
+  },
+  {
+    operationId: 'searchForApplications',
+    method: 'GET',
+    path: '/v2/applications',
+    response: json(ApplicationsResponseMeta as Meta),
+  },
+  {
+    operationId: 'searchForAssets',
+    method: 'GET',
+    path: '/v2/assets',
+    response: json(AssetsResponseMeta as Meta),
+  },
+  {
+    operationId: 'searchForBlockHeaders',
+    method: 'GET',
+    path: '/v2/block-headers',
+    response: json(BlockHeadersResponseMeta as Meta),
+  },
+  {
+    operationId: 'searchForTransactions',
+    method: 'GET',
+    path: '/v2/transactions',
+    response: json(TransactionsResponseMeta as Meta),
+  },
+]
+
+/** Starts a local mock server for the API behind IndexerClient; see `startLocalMockServer` for the options. */
+export const startMockServer = (options?: LocalMockServerOptions): Promise<LocalMockServer> => startLocalMockServer(routes, options)
@@ -1,5 +1,5 @@
-import type { BaseHttpRequest } from '../core/base-http-request'
-import { encodeJson, decodeJson } from '../core/model-runtime'
+import { compileUrl, type BaseHttpRequest, type RequestOptions } from '../core/base-http-request'
+import { encodeJson, decodeJson, type DecodeOptions } from '../core/model-runtime'
 import { type EncodingFormat } from '@algorandfoundation/algokit-common'
 import { encodeTransactionRaw } from '@algorandfoundation/algokit-transact'
 import type { SignMultisigRequest, SignTransactionRequest } from '../models/index'
@@ -86,6 +86,32 @@ import {
   WalletInfoResponseMeta,
 } from '../models/model-meta'
 
+/** URL builders for each operation, compiled once rather than on every request. */
+const urlBuilders = {
+  createWallet: compileUrl('/v1/wallet'),
+  deleteKey: compileUrl('/v1/key'),
+  deleteMultisig: compileUrl('/v1/multisig'),
+  exportKey: compileUrl('/v1/key/export'),
+  exportMasterKey: compileUrl('/v1/master-key/export'),
+  exportMultisig: compileUrl('/v1/multisig/export'),
+  generateKey: compileUrl('/v1/key'),
+  importKey: compileUrl('/v1/key/import'),
+  importMultisig: compileUrl('/v1/multisig/import'),
+  initWalletHandle: compileUrl('/v1/wallet/init'),
+  listKeysInWallet: compileUrl('/v1/key/list'),
+  listMultisig: compileUrl('/v1/multisig/list'),
+  listWallets: compileUrl('/v1/wallets'),
+  releaseWalletHandleToken: compileUrl('/v1/wallet/release'),
+  renameWallet: compileUrl('/v1/wallet/rename'),
+  renewWalletHandleToken: compileUrl('/v1/wallet/renew'),
+  signMultisigProgram: compileUrl('/v1/multisig/signprogram'),
+  signMultisigTransaction: compileUrl('/v1/multisig/sign'),
+  signProgram: compileUrl('/v1/program/sign'),
+  signTransaction: compileUrl('/v1/transaction/sign'),
+  version: compileUrl('/versions'),
+  walletInfo: compileUrl('/v1/wallet/info'),
+}
+
 export class KmdApi {
   constructor(public readonly httpRequest: BaseHttpRequest) {}
 
@@ -93,10 +119,14 @@ export class KmdApi {
     return format === 'json' ? 'application/json' : format === 'msgpack' ? 'application/msgpack' : 'text/plain'
   }
 
+  private get decodeOptions(): DecodeOptions {
+    return { lazy: this.httpRequest.config.lazyDecoding }
+  }
+
   /**
    * Create a new wallet (collection of keys) with the given parameters.
    */
-  private async _createWallet(body: CreateWalletRequest): Promise<CreateWalletResponse> {
+  private async _createWallet(body: CreateWalletRequest, requestOptions?: RequestOptions): Promise<CreateWalletResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -106,22 +136,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<CreateWalletResponse>({
       method: 'POST',
       url: '/v1/wallet',
+      buildUrl: urlBuilders.createWallet,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, CreateWalletResponseMeta, this.decodeOptions),
+      operationId: 'createWallet',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, CreateWalletResponseMeta)
   }
 
   /**
    * Deletes the key with the passed public key from the wallet.
    */
-  async deleteKey(body: DeleteKeyRequest): Promise<void> {
+  async deleteKey(body: DeleteKeyRequest, requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -134,17 +166,20 @@ export class KmdApi {
     await this.httpRequest.request<void>({
       method: 'DELETE',
       url: '/v1/key',
+      buildUrl: urlBuilders.deleteKey,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      operationId: 'deleteKey',
+      ...requestOptions,
     })
   }
 
   /**
    * Deletes multisig preimage information for the passed address from the wallet.
    */
-  async deleteMultisig(body: DeleteMultisigRequest): Promise<void> {
+  async deleteMultisig(body: DeleteMultisigRequest, requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -157,17 +192,20 @@ export class KmdApi {
     await this.httpRequest.request<void>({
       method: 'DELETE',
       url: '/v1/multisig',
+      buildUrl: urlBuilders.deleteMultisig,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      operationId: 'deleteMultisig',
+      ...requestOptions,
     })
   }
 
   /**
    * Export the secret key associated with the passed public key.
    */
-  async exportKey(body: ExportKeyRequest): Promise<ExportKeyResponse> {
+  async exportKey(body: ExportKeyRequest, requestOptions?: RequestOptions): Promise<ExportKeyResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -177,22 +215,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ExportKeyResponse>({
       method: 'POST',
       url: '/v1/key/export',
+      buildUrl: urlBuilders.exportKey,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ExportKeyResponseMeta, this.decodeOptions),
+      operationId: 'exportKey',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ExportKeyResponseMeta)
   }
 
   /**
    * Export the master derivation key from the wallet. This key is a master "backup" key for the underlying wallet. With it, you can regenerate all of the wallets that have been generated with this wallet's `POST /v1/key` endpoint. This key will not allow you to recover keys imported from other wallets, however.
    */
-  async exportMasterKey(body: ExportMasterKeyRequest): Promise<ExportMasterKeyResponse> {
+  async exportMasterKey(body: ExportMasterKeyRequest, requestOptions?: RequestOptions): Promise<ExportMasterKeyResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -202,22 +242,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ExportMasterKeyResponse>({
       method: 'POST',
       url: '/v1/master-key/export',
+      buildUrl: urlBuilders.exportMasterKey,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ExportMasterKeyResponseMeta, this.decodeOptions),
+      operationId: 'exportMasterKey',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ExportMasterKeyResponseMeta)
   }
 
   /**
    * Given a multisig address whose preimage this wallet stores, returns the information used to generate the address, including public keys, threshold, and multisig version.
    */
-  async exportMultisig(body: ExportMultisigRequest): Promise<ExportMultisigResponse> {
+  async exportMultisig(body: ExportMultisigRequest, requestOptions?: RequestOptions): Promise<ExportMultisigResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -227,22 +269,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ExportMultisigResponse>({
       method: 'POST',
       url: '/v1/multisig/export',
+      buildUrl: urlBuilders.exportMultisig,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ExportMultisigResponseMeta, this.decodeOptions),
+      operationId: 'exportMultisig',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ExportMultisigResponseMeta)
   }
 
   /**
    * Generates the next key in the deterministic key sequence (as determined by the master derivation key) and adds it to the wallet, returning the public key.
    */
-  async generateKey(body: GenerateKeyRequest): Promise<GenerateKeyResponse> {
+  async generateKey(body: GenerateKeyRequest, requestOptions?: RequestOptions): Promise<GenerateKeyResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -252,22 +296,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<GenerateKeyResponse>({
       method: 'POST',
       url: '/v1/key',
+      buildUrl: urlBuilders.generateKey,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, GenerateKeyResponseMeta, this.decodeOptions),
+      operationId: 'generateKey',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, GenerateKeyResponseMeta)
   }
 
   /**
    * Import an externally generated key into the wallet. Note that if you wish to back up the imported key, you must do so by backing up the entire wallet database, because imported keys were not derived from the wallet's master derivation key.
    */
-  async importKey(body: ImportKeyRequest): Promise<ImportKeyResponse> {
+  async importKey(body: ImportKeyRequest, requestOptions?: RequestOptions): Promise<ImportKeyResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -277,22 +323,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ImportKeyResponse>({
       method: 'POST',
       url: '/v1/key/import',
+      buildUrl: urlBuilders.importKey,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ImportKeyResponseMeta, this.decodeOptions),
+      operationId: 'importKey',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ImportKeyResponseMeta)
   }
 
   /**
    * Generates a multisig account from the passed public keys array and multisig metadata, and stores all of this in the wallet.
    */
-  async importMultisig(body: ImportMultisigRequest): Promise<ImportMultisigResponse> {
+  async importMultisig(body: ImportMultisigRequest, requestOptions?: RequestOptions): Promise<ImportMultisigResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -302,22 +350,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ImportMultisigResponse>({
       method: 'POST',
       url: '/v1/multisig/import',
+      buildUrl: urlBuilders.importMultisig,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ImportMultisigResponseMeta, this.decodeOptions),
+      operationId: 'importMultisig',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ImportMultisigResponseMeta)
   }
 
   /**
    * Unlock the wallet and return a wallet handle token that can be used for subsequent operations. These tokens expire periodically and must be renewed. You can `POST` the token to `/v1/wallet/info` to see how much time remains until expiration, and renew it with `/v1/wallet/renew`. When you're done, you can invalidate the token with `/v1/wallet/release`.
    */
-  async initWalletHandle(body: InitWalletHandleTokenRequest): Promise<InitWalletHandleTokenResponse> {
+  async initWalletHandle(body: InitWalletHandleTokenRequest, requestOptions?: RequestOptions): Promise<InitWalletHandleTokenResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -327,22 +377,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<InitWalletHandleTokenResponse>({
       method: 'POST',
       url: '/v1/wallet/init',
+      buildUrl: urlBuilders.initWalletHandle,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, InitWalletHandleTokenResponseMeta, this.decodeOptions),
+      operationId: 'initWalletHandle',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, InitWalletHandleTokenResponseMeta)
   }
 
   /**
    * Lists all of the public keys in this wallet. All of them have a stored private key.
    */
-  async listKeysInWallet(body: ListKeysRequest): Promise<ListKeysResponse> {
+  async listKeysInWallet(body: ListKeysRequest, requestOptions?: RequestOptions): Promise<ListKeysResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -352,22 +404,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ListKeysResponse>({
       method: 'POST',
       url: '/v1/key/list',
+      buildUrl: urlBuilders.listKeysInWallet,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ListKeysResponseMeta, this.decodeOptions),
+      operationId: 'listKeysInWallet',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ListKeysResponseMeta)
   }
 
   /**
    * Lists all of the multisig accounts whose preimages this wallet stores
    */
-  async listMultisig(body: ListMultisigRequest): Promise<ListMultisigResponse> {
+  async listMultisig(body: ListMultisigRequest, requestOptions?: RequestOptions): Promise<ListMultisigResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -377,42 +431,46 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ListMultisigResponse>({
       method: 'POST',
       url: '/v1/multisig/list',
+      buildUrl: urlBuilders.listMultisig,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ListMultisigResponseMeta, this.decodeOptions),
+      operationId: 'listMultisig',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ListMultisigResponseMeta)
   }
 
   /**
    * Lists all of the wallets that kmd is aware of.
    */
-  async listWallets(): Promise<ListWalletsResponse> {
+  async listWallets(requestOptions?: RequestOptions): Promise<ListWalletsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<ListWalletsResponse>({
       method: 'GET',
       url: '/v1/wallets',
+      buildUrl: urlBuilders.listWallets,
       path: {},
       query: {},
       headers,
       body: undefined,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, ListWalletsResponseMeta, this.decodeOptions),
+      operationId: 'listWallets',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, ListWalletsResponseMeta)
   }
 
   /**
    * Invalidate the passed wallet handle token, making it invalid for use in subsequent requests.
    */
-  async releaseWalletHandleToken(body: ReleaseWalletHandleTokenRequest): Promise<void> {
+  async releaseWalletHandleToken(body: ReleaseWalletHandleTokenRequest, requestOptions?: RequestOptions): Promise<void> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -425,17 +483,20 @@ export class KmdApi {
     await this.httpRequest.request<void>({
       method: 'POST',
       url: '/v1/wallet/release',
+      buildUrl: urlBuilders.releaseWalletHandleToken,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      operationId: 'releaseWalletHandleToken',
+      ...requestOptions,
     })
   }
 
   /**
    * Rename the underlying wallet to something else
    */
-  async renameWallet(body: RenameWalletRequest): Promise<RenameWalletResponse> {
+  async renameWallet(body: RenameWalletRequest, requestOptions?: RequestOptions): Promise<RenameWalletResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -445,22 +506,27 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<RenameWalletResponse>({
       method: 'POST',
       url: '/v1/wallet/rename',
+      buildUrl: urlBuilders.renameWallet,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, RenameWalletResponseMeta, this.decodeOptions),
+      operationId: 'renameWallet',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, RenameWalletResponseMeta)
   }
 
   /**
    * Renew a wallet handle token, increasing its expiration duration to its initial value
    */
-  async renewWalletHandleToken(body: RenewWalletHandleTokenRequest): Promise<RenewWalletHandleTokenResponse> {
+  async renewWalletHandleToken(
+    body: RenewWalletHandleTokenRequest,
+    requestOptions?: RequestOptions,
+  ): Promise<RenewWalletHandleTokenResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -470,22 +536,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<RenewWalletHandleTokenResponse>({
       method: 'POST',
       url: '/v1/wallet/renew',
+      buildUrl: urlBuilders.renewWalletHandleToken,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, RenewWalletHandleTokenResponseMeta, this.decodeOptions),
+      operationId: 'renewWalletHandleToken',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, RenewWalletHandleTokenResponseMeta)
   }
 
   /**
    * Start a multisig signature, or add a signature to a partially completed multisig signature object.
    */
-  async signMultisigProgram(body: SignProgramMultisigRequest): Promise<SignProgramMultisigResponse> {
+  async signMultisigProgram(body: SignProgramMultisigRequest, requestOptions?: RequestOptions): Promise<SignProgramMultisigResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -495,22 +563,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<SignProgramMultisigResponse>({
       method: 'POST',
       url: '/v1/multisig/signprogram',
+      buildUrl: urlBuilders.signMultisigProgram,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, SignProgramMultisigResponseMeta, this.decodeOptions),
+      operationId: 'signMultisigProgram',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, SignProgramMultisigResponseMeta)
   }
 
   /**
    * Start a multisig signature, or add a signature to a partially completed multisig signature object.
    */
-  private async _signMultisigTransaction(body: SignMultisigTxnRequest): Promise<SignMultisigResponse> {
+  private async _signMultisigTransaction(body: SignMultisigTxnRequest, requestOptions?: RequestOptions): Promise<SignMultisigResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -520,22 +590,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<SignMultisigResponse>({
       method: 'POST',
       url: '/v1/multisig/sign',
+      buildUrl: urlBuilders.signMultisigTransaction,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, SignMultisigResponseMeta, this.decodeOptions),
+      operationId: 'signMultisigTransaction',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, SignMultisigResponseMeta)
   }
 
   /**
    * Signs the passed program with a key from the wallet, determined by the account named in the request.
    */
-  async signProgram(body: SignProgramRequest): Promise<SignProgramResponse> {
+  async signProgram(body: SignProgramRequest, requestOptions?: RequestOptions): Promise<SignProgramResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -545,22 +617,24 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<SignProgramResponse>({
       method: 'POST',
       url: '/v1/program/sign',
+      buildUrl: urlBuilders.signProgram,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, SignProgramResponseMeta, this.decodeOptions),
+      operationId: 'signProgram',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, SignProgramResponseMeta)
   }
 
   /**
    * Signs the passed transaction with a key from the wallet, determined by the sender encoded in the transaction.
    */
-  private async _signTransaction(body: SignTxnRequest): Promise<SignTransactionResponse> {
+  private async _signTransaction(body: SignTxnRequest, requestOptions?: RequestOptions): Promise<SignTransactionResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -570,39 +644,44 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<SignTransactionResponse>({
       method: 'POST',
       url: '/v1/transaction/sign',
+      buildUrl: urlBuilders.signTransaction,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, SignTransactionResponseMeta, this.decodeOptions),
+      operationId: 'signTransaction',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, SignTransactionResponseMeta)
   }
 
-  async version(): Promise<VersionsResponse> {
+  async version(requestOptions?: RequestOptions): Promise<VersionsResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<VersionsResponse>({
       method: 'GET',
       url: '/versions',
+      buildUrl: urlBuilders.version,
       path: {},
       query: {},
       headers,
       body: undefined,
+      cache: 'slow-changing',
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, VersionsResponseMeta, this.decodeOptions),
+      operationId: 'version',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, VersionsResponseMeta)
   }
 
   /**
    * Returns information about the wallet associated with the passed wallet handle token. Additionally returns expiration information about the token itself.
    */
-  async walletInfo(body: WalletInfoRequest): Promise<WalletInfoResponse> {
+  async walletInfo(body: WalletInfoRequest, requestOptions?: RequestOptions): Promise<WalletInfoResponse> {
     const headers: Record<string, string> = {}
     const responseFormat: EncodingFormat = 'json'
     headers['Accept'] = this.mimeTypeFor(responseFormat)
@@ -612,27 +691,29 @@ export class KmdApi {
     if (mediaType) headers['Content-Type'] = mediaType
     const serializedBody = body ? encodeJson(body, bodyMeta) : undefined
 
-    const payload = await this.httpRequest.request<Record<string, unknown>>({
+    return this.httpRequest.request<WalletInfoResponse>({
       method: 'POST',
       url: '/v1/wallet/info',
+      buildUrl: urlBuilders.walletInfo,
       path: {},
       query: {},
       headers,
       body: serializedBody,
+      decode: (payload: Record<string, unknown>) => decodeJson(payload, WalletInfoResponseMeta, this.decodeOptions),
+      operationId: 'walletInfo',
+      ...requestOptions,
     })
-
-    return decodeJson(payload, WalletInfoResponseMeta)
   }
 
   /**
    * Create a new wallet (collection of keys) with the given parameters.
    */
-  async createWallet(body: CreateWalletRequest): Promise<CreateWalletResponse> {
+  async createWallet(body: CreateWalletRequest, requestOptions?: RequestOptions): Promise<CreateWalletResponse> {
     const requestBody = {
       ...body,
       walletDriverName: body.walletDriverName ?? 'sqlite',
     }
-    return await this._createWallet(requestBody)
+    return await this._createWallet(requestBody, requestOptions)
   }
 
   /**
@@ -641,12 +722,12 @@ export class KmdApi {
    * When a signer is provided it is used to resolve the private key and sign the transaction, enabling rekeyed account signing.
    * @returns A multisig signature or partial signature, which can be used to form a signed transaction.
    */
-  async signMultisigTransaction(body: SignMultisigRequest): Promise<SignMultisigResponse> {
+  async signMultisigTransaction(body: SignMultisigRequest, requestOptions?: RequestOptions): Promise<SignMultisigResponse> {
     const requestBody = {
       ...body,
       transaction: encodeTransactionRaw(body.transaction),
     } satisfies SignMultisigTxnRequest
-    return this._signMultisigTransaction(requestBody)
+    return this._signMultisigTransaction(requestBody, requestOptions)
   }
 
   /**
@@ -654,11 +735,11 @@ export class KmdApi {
    * When a public key is provided it is used to resolve the private key and sign the transaction, enabling rekeyed account signing.
    * @returns An encoded, signed transaction.
    */
-  async signTransaction(body: SignTransactionRequest): Promise<SignTransactionResponse> {
+  async signTransaction(body: SignTransactionRequest, requestOptions?: RequestOptions): Promise<SignTransactionResponse> {
     const requestBody = {
       ...body,
       transaction: encodeTransactionRaw(body.transaction),
     } satisfies SignTxnRequest
-    return this._signTransaction(requestBody)
+    return this._signTransaction(requestBody, requestOptions)
   }
 }
@@ -0,0 +1,122 @@
+/** Identifies the service method call that a set of metrics belongs to. */
+export interface OperationContext {
+  /** The name of the service method, e.g. `accountInformation`; the URL template if the request didn't name one */
+  operationId: string
+  method: string
+  /** The URL template, e.g. `/v2/accounts/{address}` */
+  url: string
+}
+
+/**
+ * Where a service method call's response came from: sent over the network, served from the response cache, or shared
+ * with an identical request that was already in flight.
+ */
+export type OperationOutcome = 'network' | 'cache' | 'coalesced'
+
+/**
+ * Timings (in milliseconds) and sizes of a service method call. Network timings describe the attempt that produced the
+ * response (or the last failed attempt), and are `undefined` for phases the call didn't go through.
+ */
+export interface OperationMetrics {
+  outcome: OperationOutcome
+  /** Attempts made after the first one */
+  retries: number
+  /** From the start of the call until the response was decoded, or the call failed */
+  totalMs: number
+  /** Sending the request and receiving the response, across all attempts including retry backoff */
+  sendMs?: number
+  /** Waiting in the scheduler's queue */
+  queueMs?: number
+  /** From handing the request to the transport until the response status and headers were received */
+  timeToFirstByteMs?: number
+  /** Reading the response body */
+  bodyReadMs?: number
+  /** Parsing a JSON response body; msgpack bodies are parsed as part of decoding */
+  parseMs?: number
+  /** Decoding the response into a model */
+  decodeMs?: number
+  /** The size of the request body in bytes */
+  requestBytes?: number
+  /** The size of the response body in bytes */
+  responseBytes?: number
+  /** The HTTP status of the response */
+  status?: number
+  /** The error the call failed with */
+  error?: unknown
+}
+
+/**
+ * Hooks that observe the lifecycle of service method calls, e.g. to export metrics or traces.
+ * Hooks are called synchronously and shouldn't block; errors thrown by a hook are logged and otherwise ignored.
+ */
+export interface RequestInstrumentation {
+  /** Called when a service method call starts */
+  onOperationStart?(context: OperationContext): void
+  /** Called when a service method call completes or fails; `context` is the object passed to `onOperationStart` */
+  onOperationEnd?(context: OperationContext, metrics: OperationMetrics): void
+}
+
+type SpanAttributes = Record<string, string | number | boolean>
+
+/** The subset of an OpenTelemetry `Span` used by `tracingInstrumentation`. */
+export interface InstrumentationSpan {
+  setAttributes(attributes: SpanAttributes): unknown
+  setStatus(status: { code: number; message?: string }): unknown
+  recordException(exception: Error | string): unknown
+  end(): unknown
+}
+
+/** The subset of an OpenTelemetry `Tracer` used by `tracingInstrumentation`, e.g. `trace.getTracer('algokit')`. */
+export interface InstrumentationTracer {
+  startSpan(name: string, options?: { attributes?: SpanAttributes }): InstrumentationSpan
+}
+
+// `SpanStatusCode.ERROR` in `@opentelemetry/api`
+const SPAN_STATUS_ERROR = 2
+
+const METRIC_ATTRIBUTES: [keyof OperationMetrics, string][] = [
+  ['sendMs', 'algokit.send_ms'],
+  ['queueMs', 'algokit.queue_ms'],
+  ['timeToFirstByteMs', 'algokit.time_to_first_byte_ms'],
+  ['bodyReadMs', 'algokit.body_read_ms'],
+  ['parseMs', 'algokit.parse_ms'],
+  ['decodeMs', 'algokit.decode_ms'],
+  ['requestBytes', 'http.request.body.size'],
+  ['responseBytes', 'http.response.body.size'],
+  ['status', 'http.response.status_code'],
+]
+
+/**
+ * Creates instrumentation that records a span for each service method call with an OpenTelemetry-compatible tracer.
+ * Spans are named after the operation, and carry its metrics as attributes.
+ */
+export function tracingInstrumentation(tracer: InstrumentationTracer): RequestInstrumentation {
+  const spans = new WeakMap<OperationContext, InstrumentationSpan>()
+  return {
+    onOperationStart(context) {
+      spans.set(
+        context,
+        tracer.startSpan(context.operationId, {
+          attributes: { 'http.request.method': context.method, 'url.template': context.url },
+        }),
+      )
+    },
+    onOperationEnd(context, metrics) {
+      const span = spans.get(context)
+      if (!span) return
+      spans.delete(context)
+
+      const attributes: SpanAttributes = { 'algokit.outcome': metrics.outcome, 'algokit.retries': metrics.retries }
+      for (const [key, attribute] of METRIC_ATTRIBUTES) {
+        const value = metrics[key]
+        if (typeof value === 'number') attributes[attribute] = value
+      }
+      span.setAttributes(attributes)
+      if (metrics.error !== undefined) {
+        span.recordException(metrics.error instanceof Error ? metrics.error : String(metrics.error))
+        span.setStatus({ code: SPAN_STATUS_ERROR, message: metrics.error instanceof Error ? metrics.error.message : undefined })
+      }
+      span.end()
+    },
+  }
+}
@@ -0,0 +1,270 @@
+import type { HttpTransport } from './http-transport'
+
+/** A request/response pair captured by a recording transport. */
+export interface RecordedExchange {
+  method: string
+  /** The path and query of the request URL; the origin is left out, so recordings replay against any base URL */
+  url: string
+  /** A hash of the request body, if the request had one */
+  requestBodyHash?: string
+  status: number
+  statusText: string
+  headers: [string, string][]
+  /** The raw response body */
+  body: Uint8Array
+  /** When the request was sent, in milliseconds since the recording started */
+  startMs: number
+  /** Time from sending the request to receiving the response headers, in milliseconds */
+  timeToFirstByteMs: number
+  /** Time from sending the request to receiving the whole response body, in milliseconds */
+  durationMs: number
+}
+
+/** A `HttpTransport` that records every request/response pair it sends. */
+export type RecordingHttpTransport = HttpTransport & {
+  /** The exchanges recorded so far, in the order they completed */
+  readonly exchanges: readonly RecordedExchange[]
+  /** Encodes the recorded exchanges as an archive; see `encodeRecordingArchive` */
+  toArchive(): Uint8Array
+}
+
+export interface RecordingTransportOptions {
+  /** The transport that sends the requests being recorded. Defaults to the global `fetch`. */
+  transport?: HttpTransport
+}
+
+export interface ReplayTransportOptions {
+  /**
+   * Scales the recorded response times: `1` replays them as recorded, `0.5` at half of them and `0` responds immediately.
+   * Defaults to `1`.
+   */
+  timeScale?: number
+  /** Whether to start over from the first recording once all recordings of a request have been replayed. Defaults to `true`. */
+  loop?: boolean
+}
+
+/** A `HttpTransport` that replays recorded responses instead of sending requests. */
+export type ReplayHttpTransport = HttpTransport & {
+  /** The number of requests that had no recorded response */
+  readonly misses: number
+}
+
+// "AKRR" followed by the format version
+const ARCHIVE_MAGIC = [0x41, 0x4b, 0x52, 0x52]
+const ARCHIVE_VERSION = 1
+
+const textEncoder = new TextEncoder()
+const textDecoder = new TextDecoder()
+
+// FNV-1a, which is plenty to tell apart the request bodies of one recording
+const hashBytes = (bytes: Uint8Array): string => {
+  let hash = 0x811c9dc5
+  for (let i = 0; i < bytes.length; i++) {
+    hash = Math.imul(hash ^ bytes[i], 0x01000193)
+  }
+  return (hash >>> 0).toString(16).padStart(8, '0')
+}
+
+const requestBodyBytes = (body: RequestInit['body']): Uint8Array | undefined => {
+  if (body === undefined || body === null) return undefined
+  if (typeof body === 'string') return textEncoder.encode(body)
+  if (body instanceof Uint8Array) return body
+  if (body instanceof ArrayBuffer) return new Uint8Array(body)
+  if (ArrayBuffer.isView(body)) return new Uint8Array(body.buffer, body.byteOffset, body.byteLength)
+  throw new Error('Unsupported request body type for the recording transport')
+}
+
+const pathAndQuery = (url: string): string => {
+  const parsed = new URL(url)
+  return `${parsed.pathname}${parsed.search}`
+}
+
+const exchangeKey = (method: string, url: string, requestBodyHash: string | undefined): string =>
+  `${method.toUpperCase()} ${url}${requestBodyHash ? ` ${requestBodyHash}` : ''}`
+
+const toResponse = (exchange: RecordedExchange, method: string): Response => {
+  const hasBody = exchange.status !== 204 && exchange.status !== 304 && method !== 'HEAD'
+  return new Response(hasBody ? (exchange.body as BodyInit) : null, {
+    status: exchange.status,
+    statusText: exchange.statusText,
+    headers: exchange.headers,
+  })
+}
+
+const delay = (ms: number, signal?: AbortSignal | null): Promise<void> =>
+  new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(signal.reason)
+      return
+    }
+    const onAbort = () => {
+      clearTimeout(timer)
+      reject(signal?.reason)
+    }
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort)
+      resolve()
+    }, ms)
+    signal?.addEventListener('abort', onAbort, { once: true })
+  })
+
+/**
+ * Encodes recorded exchanges as a compact binary archive: a header followed by the raw response bodies, so binary
+ * (e.g. msgpack) bodies are stored as is rather than base64 encoded.
+ *
+ * @param exchanges The exchanges to encode
+ * @returns The archive
+ */
+export function encodeRecordingArchive(exchanges: readonly RecordedExchange[]): Uint8Array {
+  const header = textEncoder.encode(
+    JSON.stringify(exchanges.map(({ body, ...exchange }) => ({ ...exchange, bodyLength: body.byteLength }))),
+  )
+  const bodiesLength = exchanges.reduce((total, { body }) => total + body.byteLength, 0)
+  const archive = new Uint8Array(ARCHIVE_MAGIC.length + 5 + header.byteLength + bodiesLength)
+  const view = new DataView(archive.buffer)
+  archive.set(ARCHIVE_MAGIC, 0)
+  archive[ARCHIVE_MAGIC.length] = ARCHIVE_VERSION
+  view.setUint32(ARCHIVE_MAGIC.length + 1, header.byteLength)
+  let offset = ARCHIVE_MAGIC.length + 5
+  archive.set(header, offset)
+  offset += header.byteLength
+  for (const { body } of exchanges) {
+    archive.set(body, offset)
+    offset += body.byteLength
+  }
+  return archive
+}
+
+/**
+ * Decodes an archive created by `encodeRecordingArchive`.
+ *
+ * @param archive The archive
+ * @returns The recorded exchanges
+ */
+export function decodeRecordingArchive(archive: Uint8Array): RecordedExchange[] {
+  if (archive.byteLength < ARCHIVE_MAGIC.length + 5 || ARCHIVE_MAGIC.some((byte, i) => archive[i] !== byte)) {
+    throw new Error('Not a recording archive')
+  }
+  const version = archive[ARCHIVE_MAGIC.length]
+  if (version !== ARCHIVE_VERSION) {
+    throw new Error(`Unsupported recording archive version ${version}`)
+  }
+  const view = new DataView(archive.buffer, archive.byteOffset, archive.byteLength)
+  const headerLength = view.getUint32(ARCHIVE_MAGIC.length + 1)
+  let offset = ARCHIVE_MAGIC.length + 5
+  const header = JSON.parse(textDecoder.decode(archive.subarray(offset, offset + headerLength))) as (Omit<RecordedExchange, 'body'> & {
+    bodyLength: number
+  })[]
+  offset += headerLength
+  return header.map(({ bodyLength, ...exchange }) => {
+    const body = archive.slice(offset, offset + bodyLength)
+    offset += bodyLength
+    return { ...exchange, body }
+  })
+}
+
+/**
+ * Creates a `HttpTransport` that sends requests through another transport and records each request/response pair:
+ * the response status, headers, raw body and timing. Replay the recording with `createReplayTransport` to run
+ * benchmarks and tests offline against real responses.
+ *
+ * Request headers aren't recorded, so API tokens don't end up in the archive.
+ *
+ * @param options The transport to record; defaults to the global `fetch`
+ * @returns The recording transport, to be passed as the `transport` client config
+ * @example
+ * ```typescript
+ * const transport = createRecordingTransport()
+ * const algod = new AlgodClient({ baseUrl: 'https://mainnet-api.algonode.cloud', transport })
+ * // ... make the calls to record ...
+ * await writeFile('mainnet.rec', transport.toArchive())
+ * ```
+ */
+export function createRecordingTransport(options: RecordingTransportOptions = {}): RecordingHttpTransport {
+  const inner = options.transport ?? fetch
+  const exchanges: RecordedExchange[] = []
+  const startedAt = performance.now()
+
+  const transport = async (url: string, init: RequestInit): Promise<Response> => {
+    const method = init.method ?? 'GET'
+    const requestBody = requestBodyBytes(init.body)
+    const sentAt = performance.now()
+    const response = await inner(url, init)
+    const headersAt = performance.now()
+    const body = new Uint8Array(await response.arrayBuffer())
+    const exchange: RecordedExchange = {
+      method,
+      url: pathAndQuery(url),
+      requestBodyHash: requestBody ? hashBytes(requestBody) : undefined,
+      status: response.status,
+      statusText: response.statusText,
+      headers: [...response.headers],
+      body,
+      startMs: sentAt - startedAt,
+      timeToFirstByteMs: headersAt - sentAt,
+      durationMs: performance.now() - sentAt,
+    }
+    exchanges.push(exchange)
+    return toResponse(exchange, method)
+  }
+
+  return Object.assign(transport, {
+    exchanges,
+    toArchive: () => encodeRecordingArchive(exchanges),
+  })
+}
+
+/**
+ * Creates a `HttpTransport` that answers requests with recorded responses instead of sending them.
+ *
+ * Requests are matched on their method, path, query and body; the recordings of a request are replayed in the order
+ * they were recorded. Requests without a recording fail with an error (and are counted in `misses`).
+ *
+ * @param recording The archive created by a recording transport, or its decoded exchanges
+ * @param options How to replay the recorded response times
+ * @returns The replay transport, to be passed as the `transport` client config
+ * @example
+ * ```typescript
+ * const transport = createReplayTransport(await readFile('mainnet.rec'), { timeScale: 0 })
+ * const algod = new AlgodClient({ baseUrl: 'http://replay', transport })
+ * ```
+ */
+export function createReplayTransport(
+  recording: Uint8Array | readonly RecordedExchange[],
+  options: ReplayTransportOptions = {},
+): ReplayHttpTransport {
+  const timeScale = options.timeScale ?? 1
+  const loop = options.loop ?? true
+  const exchanges = recording instanceof Uint8Array ? decodeRecordingArchive(recording) : recording
+  const recorded = new Map<string, { exchanges: RecordedExchange[]; next: number }>()
+  for (const exchange of exchanges) {
+    const key = exchangeKey(exchange.method, exchange.url, exchange.requestBodyHash)
+    const entry = recorded.get(key)
+    if (entry) {
+      entry.exchanges.push(exchange)
+    } else {
+      recorded.set(key, { exchanges: [exchange], next: 0 })
+    }
+  }
+  let misses = 0
+
+  const transport = async (url: string, init: RequestInit): Promise<Response> => {
+    const method = init.method ?? 'GET'
+    const requestBody = requestBodyBytes(init.body)
+    const key = exchangeKey(method, pathAndQuery(url), requestBody ? hashBytes(requestBody) : undefined)
+    const entry = recorded.get(key)
+    if (!entry || (entry.next >= entry.exchanges.length && !loop)) {
+      misses += 1
+      throw new Error(`No recorded response for ${key}`)
+    }
+    const exchange = entry.exchanges[entry.next % entry.exchanges.length]
+    entry.next += 1
+    if (timeScale > 0) {
+      await delay(exchange.durationMs * timeScale, init.signal)
+    }
+    init.signal?.throwIfAborted()
+    return toResponse(exchange, method)
+  }
+
+  return Object.defineProperty(transport, 'misses', { get: () => misses }) as ReplayHttpTransport
+}
@@ -1,55 +1,71 @@
 import { decodeMsgpack, encodeMsgpack, parseJson, stringifyJson } from '@algorandfoundation/algokit-common'
 import { ApiError } from './api-error'
-import { ApiRequestOptions, inputValueAsString } from './base-http-request'
+import { ApiRequestOptions, compileUrl } from './base-http-request'
 import type { ClientConfig } from './client-config'
 
-const encodeURIPath = (path: string): string => encodeURI(path).replace(/%5B/g, '[').replace(/%5D/g, ']')
+/**
+ * Sends bytes as they are, without copying them; `fetch` takes its own copy of a body when the request is created.
+ * Only bytes backed by a `SharedArrayBuffer`, which aren't a valid request body, are copied.
+ */
+const asBodyBytes = (bytes: Uint8Array): BodyInit =>
+  (bytes.buffer instanceof ArrayBuffer ? bytes : new Uint8Array(bytes)) as BodyInit
 
-export async function request<T>(config: ClientConfig, options: ApiRequestOptions): Promise<T> {
-  let rawPath = options.url.endsWith('/') ? options.url.slice(0, -1) : options.url
-  if (options.path) {
-    for (const [key, value] of Object.entries(options.path)) {
-      const replace = encodeURIPath(inputValueAsString(value))
-      rawPath = rawPath.replace(`{${key}}`, replace)
-    }
-  }
+const textEncoder = new TextEncoder()
+const textDecoder = new TextDecoder()
 
-  const url = new URL(rawPath, config.baseUrl)
-  if (config.port !== undefined) {
-    url.port = config.port.toString()
-  }
+const byteLength = (body: BodyInit | undefined): number =>
+  body instanceof Uint8Array ? body.byteLength : typeof body === 'string' ? textEncoder.encode(body).byteLength : 0
 
-  if (options.query) {
-    for (const [key, value] of Object.entries(options.query)) {
-      if (value === undefined || value === null) continue
-      url.searchParams.set(key, Array.isArray(value) ? value.map((v) => inputValueAsString(v)).join(',') : inputValueAsString(value))
-    }
-  }
+interface ClientTarget {
+  /** The base URL's origin, including the port */
+  origin: string
+  headers: Record<string, string>
+  tokenHeaders: Record<string, string>
+}
+
+const clientTargets = new WeakMap<ClientConfig, ClientTarget>()
+
+/** The parts of a request that only depend on the client config, worked out once per config. */
+const clientTarget = (config: ClientConfig): ClientTarget => {
+  let target = clientTargets.get(config)
+  if (target) return target
 
-  const headers: Record<string, string> = {
-    ...(config.headers ?? {}),
-    ...(options.headers ?? {}),
+  const baseUrl = new URL(config.baseUrl)
+  if (config.port !== undefined) {
+    baseUrl.port = config.port.toString()
   }
 
+  const tokenHeaders: Record<string, string> = {}
   if (config.token) {
     if (typeof config.token === 'string') {
-      headers['X-KMD-API-Token'] = config.token
+      tokenHeaders['X-KMD-API-Token'] = config.token
     } else {
-      for (const [name, value] of Object.entries(config.token)) {
-        headers[name] = value
-      }
+      Object.assign(tokenHeaders, config.token)
     }
   }
 
+  target = { origin: baseUrl.origin, headers: config.headers ?? {}, tokenHeaders }
+  clientTargets.set(config, target)
+  return target
+}
+
+export async function request<T>(config: ClientConfig, options: ApiRequestOptions): Promise<T> {
+  const target = clientTarget(config)
+  const buildUrl = options.buildUrl ?? compileUrl(options.url, Object.keys(options.query ?? {}))
+  const pathAndQuery = buildUrl(options.path, options.query)
+  const url = target.origin + pathAndQuery
+
+  const headers: Record<string, string> = { ...target.headers, ...options.headers, ...target.tokenHeaders }
+
   const requestContentType = options.headers?.['Content-Type'] ?? options.headers?.['content-type']
   let bodyPayload: BodyInit | undefined = undefined
   if (options.body != null) {
     if (options.body instanceof Uint8Array) {
-      bodyPayload = options.body.slice().buffer
+      bodyPayload = asBodyBytes(options.body)
     } else if (typeof options.body === 'string') {
       bodyPayload = options.body
     } else if (requestContentType?.includes('msgpack')) {
-      bodyPayload = encodeMsgpack(options.body).slice().buffer
+      bodyPayload = asBodyBytes(encodeMsgpack(options.body))
     } else if (requestContentType?.includes('json')) {
       bodyPayload = stringifyJson(options.body)
     } else {
@@ -57,11 +73,21 @@ export async function request<T>(config: ClientConfig, options: ApiRequestOption
     }
   }
 
-  const response = await fetch(url.toString(), {
+  const init: RequestInit & { dispatcher?: unknown } = {
     method: options.method,
     headers,
     body: bodyPayload,
-  })
+    signal: options.signal,
+  }
+  if (config.dispatcher !== undefined) {
+    init.dispatcher = config.dispatcher
+  }
+
+  const transport = config.transport ?? fetch
+  const metrics = options.metrics
+  const sentAt = metrics ? performance.now() : 0
+  const response = await transport(url, init)
+  const headersAt = metrics ? performance.now() : 0
 
   const responseContentType = response.headers.get('content-type') ?? ''
   if (!response.ok) {
@@ -81,24 +107,40 @@ export async function request<T>(config: ClientConfig, options: ApiRequestOption
     } catch {
       errorBody = undefined
     }
-    throw new ApiError(url.pathname.toString(), response.status, errorBody)
+    if (metrics) {
+      metrics.status = response.status
+      metrics.timeToFirstByteMs = headersAt - sentAt
+      metrics.requestBytes = byteLength(bodyPayload)
+    }
+    const queryStart = pathAndQuery.indexOf('?')
+    throw new ApiError(queryStart === -1 ? pathAndQuery : pathAndQuery.slice(0, queryStart), response.status, errorBody, response.headers)
   }
 
+  const bytes = new Uint8Array(await response.arrayBuffer())
+  const bodyReadAt = metrics ? performance.now() : 0
+
+  let payload: unknown
+  const isJson = responseContentType.includes('application/json')
   if (
+    !responseContentType ||
     responseContentType.includes('application/msgpack') ||
     responseContentType.includes('application/octet-stream') ||
     responseContentType.includes('application/x-binary')
   ) {
-    return new Uint8Array(await response.arrayBuffer()) as unknown as T
+    payload = bytes
+  } else if (isJson) {
+    payload = parseJson(textDecoder.decode(bytes))
+  } else {
+    payload = textDecoder.decode(bytes)
   }
 
-  if (responseContentType.includes('application/json')) {
-    return parseJson(await response.text()) as unknown as T
+  if (metrics) {
+    metrics.status = response.status
+    metrics.timeToFirstByteMs = headersAt - sentAt
+    metrics.bodyReadMs = bodyReadAt - headersAt
+    metrics.parseMs = isJson ? performance.now() - bodyReadAt : undefined
+    metrics.requestBytes = byteLength(bodyPayload)
+    metrics.responseBytes = bytes.byteLength
   }
-
-  if (!responseContentType) {
-    return new Uint8Array(await response.arrayBuffer()) as unknown as T
-  }
-
-  return (await response.text()) as unknown as T
+  return payload as T
 }
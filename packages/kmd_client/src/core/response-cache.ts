@@ -0,0 +1,154 @@
+import { clonePayload } from './request-coalescer'
+
+/**
+ * How long a cached response stays valid:
+ * - `immutable`: the response never changes once it exists (e.g. a block for a final round)
+ * - `slow-changing`: the response rarely changes (e.g. asset params) and may be served until its TTL expires
+ */
+export type CachePolicy = 'immutable' | 'slow-changing'
+
+/** A pluggable cache for raw (not yet decoded) response payloads, keyed by request identity. */
+export interface ResponseCache {
+  /** Returns the cached payload, or `undefined` on a miss. */
+  get(key: string): unknown | undefined
+  /** Stores the payload for the given request key. */
+  set(key: string, payload: unknown, policy: CachePolicy): void
+}
+
+/** Counters describing the effectiveness of a `LruResponseCache`. */
+export interface ResponseCacheStats {
+  hits: number
+  misses: number
+  /** Entries removed to respect the entry or byte bounds */
+  evictions: number
+  /** Entries removed because their TTL elapsed */
+  expirations: number
+  entries: number
+  /** Approximate size of the cached payloads in bytes */
+  bytes: number
+}
+
+export interface LruResponseCacheOptions {
+  /** Maximum number of cached responses. Defaults to 1000. */
+  maxEntries?: number
+  /** Maximum approximate size of all cached payloads in bytes. Defaults to 32 MiB. */
+  maxBytes?: number
+  /** TTL for `immutable` responses in milliseconds. Defaults to no expiry. */
+  immutableTtlMs?: number
+  /** TTL for `slow-changing` responses in milliseconds. Defaults to 5 seconds. */
+  slowChangingTtlMs?: number
+}
+
+interface CacheEntry {
+  payload: unknown
+  bytes: number
+  expiresAt: number
+}
+
+/**
+ * Approximates the in-memory size of a raw response payload.
+ */
+export const estimatePayloadSize = (payload: unknown): number => {
+  if (payload === null || payload === undefined) return 0
+  if (payload instanceof Uint8Array) return payload.byteLength
+  if (typeof payload === 'string') return payload.length * 2
+  if (typeof payload === 'number' || typeof payload === 'bigint') return 8
+  if (typeof payload === 'boolean') return 4
+  if (Array.isArray(payload)) return payload.reduce<number>((size, item) => size + estimatePayloadSize(item), 0)
+  if (payload instanceof Map) {
+    let size = 0
+    for (const [key, value] of payload) size += estimatePayloadSize(key) + estimatePayloadSize(value)
+    return size
+  }
+  if (typeof payload === 'object') {
+    let size = 0
+    for (const [key, value] of Object.entries(payload)) size += key.length * 2 + estimatePayloadSize(value)
+    return size
+  }
+  return 0
+}
+
+/**
+ * An in-memory least-recently-used response cache, bounded by entry count and approximate byte size, with per-policy TTLs.
+ *
+ * Payloads are copied on the way in and on the way out, so callers that mutate a decoded model can never corrupt the cache.
+ */
+export class LruResponseCache implements ResponseCache {
+  private readonly entries = new Map<string, CacheEntry>()
+  private readonly maxEntries: number
+  private readonly maxBytes: number
+  private readonly ttlMs: Record<CachePolicy, number>
+  private totalBytes = 0
+  private hits = 0
+  private misses = 0
+  private evictions = 0
+  private expirations = 0
+
+  constructor(options: LruResponseCacheOptions = {}) {
+    this.maxEntries = options.maxEntries ?? 1000
+    this.maxBytes = options.maxBytes ?? 32 * 1024 * 1024
+    this.ttlMs = {
+      immutable: options.immutableTtlMs ?? Number.POSITIVE_INFINITY,
+      'slow-changing': options.slowChangingTtlMs ?? 5_000,
+    }
+  }
+
+  /** A snapshot of the cache counters. */
+  get stats(): ResponseCacheStats {
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      expirations: this.expirations,
+      entries: this.entries.size,
+      bytes: this.totalBytes,
+    }
+  }
+
+  get(key: string): unknown | undefined {
+    const entry = this.entries.get(key)
+    if (!entry) {
+      this.misses += 1
+      return undefined
+    }
+    if (entry.expiresAt <= Date.now()) {
+      this.remove(key, entry)
+      this.expirations += 1
+      this.misses += 1
+      return undefined
+    }
+    // Re-insert to mark as most recently used
+    this.entries.delete(key)
+    this.entries.set(key, entry)
+    this.hits += 1
+    return clonePayload(entry.payload)
+  }
+
+  set(key: string, payload: unknown, policy: CachePolicy): void {
+    const bytes = estimatePayloadSize(payload)
+    if (bytes > this.maxBytes) return
+
+    const existing = this.entries.get(key)
+    if (existing) this.remove(key, existing)
+
+    this.entries.set(key, { payload: clonePayload(payload), bytes, expiresAt: Date.now() + this.ttlMs[policy] })
+    this.totalBytes += bytes
+
+    for (const [oldestKey, oldest] of this.entries) {
+      if (this.entries.size <= this.maxEntries && this.totalBytes <= this.maxBytes) break
+      this.remove(oldestKey, oldest)
+      this.evictions += 1
+    }
+  }
+
+  /** Removes all cached responses. */
+  clear(): void {
+    this.entries.clear()
+    this.totalBytes = 0
+  }
+
+  private remove(key: string, entry: CacheEntry): void {
+    this.entries.delete(key)
+    this.totalBytes -= entry.bytes
+  }
+}
@@ -1,6 +1,14 @@
 export * from './core/client-config'
 export * from './core/base-http-request'
 export * from './core/fetch-http-request'
+export * from './core/request-coalescer'
+export * from './core/response-cache'
+export * from './core/http-transport'
+export * from './core/recording-transport'
+export * from './core/request-scheduler'
+export * from './core/request-hedger'
+export * from './core/endpoint-pool'
+export * from './core/instrumentation'
 export * from './core/api-error'
 
 // Generated
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/wallet`
@@ -41,3 +42,14 @@ export const CreateWalletRequestMeta: ObjectModelMetadata<CreateWalletRequest> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `CreateWalletRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeCreateWalletRequest<K extends keyof CreateWalletRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<CreateWalletRequest, K> {
+  return decodeFields(payload, CreateWalletRequestMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Wallet } from './wallet'
 import { WalletMeta } from './wallet'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * CreateWalletResponse is the response to `POST /v1/wallet`
@@ -22,3 +23,14 @@ export const CreateWalletResponseMeta: ObjectModelMetadata<CreateWalletResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `CreateWalletResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeCreateWalletResponse<K extends keyof CreateWalletResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<CreateWalletResponse, K> {
+  return decodeFields(payload, CreateWalletResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `DELETE /v1/key`
@@ -34,3 +35,14 @@ export const DeleteKeyRequestMeta: ObjectModelMetadata<DeleteKeyRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `DeleteKeyRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeDeleteKeyRequest<K extends keyof DeleteKeyRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<DeleteKeyRequest, K> {
+  return decodeFields(payload, DeleteKeyRequestMeta, fields)
+}
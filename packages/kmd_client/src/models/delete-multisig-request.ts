@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `DELETE /v1/multisig`
@@ -34,3 +35,14 @@ export const DeleteMultisigRequestMeta: ObjectModelMetadata<DeleteMultisigReques
     },
   ],
 }
+
+/**
+ * Decodes only the given `DeleteMultisigRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeDeleteMultisigRequest<K extends keyof DeleteMultisigRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<DeleteMultisigRequest, K> {
+  return decodeFields(payload, DeleteMultisigRequestMeta, fields)
+}
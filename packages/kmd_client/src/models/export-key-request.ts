@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/key/export`
@@ -34,3 +35,14 @@ export const ExportKeyRequestMeta: ObjectModelMetadata<ExportKeyRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ExportKeyRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeExportKeyRequest<K extends keyof ExportKeyRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ExportKeyRequest, K> {
+  return decodeFields(payload, ExportKeyRequestMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ExportKeyResponse is the response to `POST /v1/key/export`
@@ -20,3 +21,14 @@ export const ExportKeyResponseMeta: ObjectModelMetadata<ExportKeyResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ExportKeyResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeExportKeyResponse<K extends keyof ExportKeyResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ExportKeyResponse, K> {
+  return decodeFields(payload, ExportKeyResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/master-key/export`
@@ -27,3 +28,14 @@ export const ExportMasterKeyRequestMeta: ObjectModelMetadata<ExportMasterKeyRequ
     },
   ],
 }
+
+/**
+ * Decodes only the given `ExportMasterKeyRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeExportMasterKeyRequest<K extends keyof ExportMasterKeyRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ExportMasterKeyRequest, K> {
+  return decodeFields(payload, ExportMasterKeyRequestMeta, fields)
+}
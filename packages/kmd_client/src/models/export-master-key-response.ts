@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ExportMasterKeyResponse is the response to `POST /v1/master-key/export`
@@ -20,3 +21,14 @@ export const ExportMasterKeyResponseMeta: ObjectModelMetadata<ExportMasterKeyRes
     },
   ],
 }
+
+/**
+ * Decodes only the given `ExportMasterKeyResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeExportMasterKeyResponse<K extends keyof ExportMasterKeyResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ExportMasterKeyResponse, K> {
+  return decodeFields(payload, ExportMasterKeyResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/multisig/export`
@@ -27,3 +28,14 @@ export const ExportMultisigRequestMeta: ObjectModelMetadata<ExportMultisigReques
     },
   ],
 }
+
+/**
+ * Decodes only the given `ExportMultisigRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeExportMultisigRequest<K extends keyof ExportMultisigRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ExportMultisigRequest, K> {
+  return decodeFields(payload, ExportMultisigRequestMeta, fields)
+}
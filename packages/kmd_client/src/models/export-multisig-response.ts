@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, bytesArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ExportMultisigResponse is the response to `POST /v1/multisig/export`
@@ -34,3 +35,14 @@ export const ExportMultisigResponseMeta: ObjectModelMetadata<ExportMultisigRespo
     },
   ],
 }
+
+/**
+ * Decodes only the given `ExportMultisigResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeExportMultisigResponse<K extends keyof ExportMultisigResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ExportMultisigResponse, K> {
+  return decodeFields(payload, ExportMultisigResponseMeta, fields)
+}
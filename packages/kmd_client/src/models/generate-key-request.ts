@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/key`
@@ -20,3 +21,14 @@ export const GenerateKeyRequestMeta: ObjectModelMetadata<GenerateKeyRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `GenerateKeyRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeGenerateKeyRequest<K extends keyof GenerateKeyRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<GenerateKeyRequest, K> {
+  return decodeFields(payload, GenerateKeyRequestMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * GenerateKeyResponse is the response to `POST /v1/key`
@@ -20,3 +21,14 @@ export const GenerateKeyResponseMeta: ObjectModelMetadata<GenerateKeyResponse> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `GenerateKeyResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeGenerateKeyResponse<K extends keyof GenerateKeyResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<GenerateKeyResponse, K> {
+  return decodeFields(payload, GenerateKeyResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/key/import`
@@ -27,3 +28,14 @@ export const ImportKeyRequestMeta: ObjectModelMetadata<ImportKeyRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ImportKeyRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeImportKeyRequest<K extends keyof ImportKeyRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ImportKeyRequest, K> {
+  return decodeFields(payload, ImportKeyRequestMeta, fields)
+}
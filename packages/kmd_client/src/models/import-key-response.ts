@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ImportKeyResponse is the response to `POST /v1/key/import`
@@ -20,3 +21,14 @@ export const ImportKeyResponseMeta: ObjectModelMetadata<ImportKeyResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ImportKeyResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeImportKeyResponse<K extends keyof ImportKeyResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ImportKeyResponse, K> {
+  return decodeFields(payload, ImportKeyResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, bytesArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/multisig/import`
@@ -41,3 +42,14 @@ export const ImportMultisigRequestMeta: ObjectModelMetadata<ImportMultisigReques
     },
   ],
 }
+
+/**
+ * Decodes only the given `ImportMultisigRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeImportMultisigRequest<K extends keyof ImportMultisigRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ImportMultisigRequest, K> {
+  return decodeFields(payload, ImportMultisigRequestMeta, fields)
+}
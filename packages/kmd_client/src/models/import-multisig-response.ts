@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ImportMultisigResponse is the response to `POST /v1/multisig/import`
@@ -20,3 +21,14 @@ export const ImportMultisigResponseMeta: ObjectModelMetadata<ImportMultisigRespo
     },
   ],
 }
+
+/**
+ * Decodes only the given `ImportMultisigResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeImportMultisigResponse<K extends keyof ImportMultisigResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ImportMultisigResponse, K> {
+  return decodeFields(payload, ImportMultisigResponseMeta, fields)
+}
@@ -42,5 +42,48 @@ export type { SignTxnRequest } from './sign-txn-request'
 export type { TxType } from './tx-type'
 export type { VersionsResponse } from './versions-response'
 export type { WalletInfoRequest } from './wallet-info-request'
+export { decodeListWalletsResponse } from './list-wallets-response'
+export { decodeExportKeyResponse } from './export-key-response'
+export { decodeImportKeyResponse } from './import-key-response'
+export { decodeListKeysResponse } from './list-keys-response'
+export { decodeGenerateKeyResponse } from './generate-key-response'
+export { decodeExportMasterKeyResponse } from './export-master-key-response'
+export { decodeExportMultisigResponse } from './export-multisig-response'
+export { decodeImportMultisigResponse } from './import-multisig-response'
+export { decodeListMultisigResponse } from './list-multisig-response'
+export { decodeSignProgramMultisigResponse } from './sign-program-multisig-response'
+export { decodeSignMultisigResponse } from './sign-multisig-response'
+export { decodeSignProgramResponse } from './sign-program-response'
+export { decodeSignTransactionResponse } from './sign-transaction-response'
+export { decodeWalletInfoResponse } from './wallet-info-response'
+export { decodeInitWalletHandleTokenResponse } from './init-wallet-handle-token-response'
+export { decodeRenameWalletResponse } from './rename-wallet-response'
+export { decodeRenewWalletHandleTokenResponse } from './renew-wallet-handle-token-response'
+export { decodeCreateWalletResponse } from './create-wallet-response'
+export { decodeWallet } from './wallet'
+export { decodeWalletHandle } from './wallet-handle'
+export { decodeCreateWalletRequest } from './create-wallet-request'
+export { decodeDeleteKeyRequest } from './delete-key-request'
+export { decodeDeleteMultisigRequest } from './delete-multisig-request'
+export { decodeExportKeyRequest } from './export-key-request'
+export { decodeExportMasterKeyRequest } from './export-master-key-request'
+export { decodeExportMultisigRequest } from './export-multisig-request'
+export { decodeGenerateKeyRequest } from './generate-key-request'
+export { decodeImportKeyRequest } from './import-key-request'
+export { decodeImportMultisigRequest } from './import-multisig-request'
+export { decodeInitWalletHandleTokenRequest } from './init-wallet-handle-token-request'
+export { decodeListKeysRequest } from './list-keys-request'
+export { decodeListMultisigRequest } from './list-multisig-request'
+export { decodeMultisigSig } from './multisig-sig'
+export { decodeMultisigSubsig } from './multisig-subsig'
+export { decodeReleaseWalletHandleTokenRequest } from './release-wallet-handle-token-request'
+export { decodeRenameWalletRequest } from './rename-wallet-request'
+export { decodeRenewWalletHandleTokenRequest } from './renew-wallet-handle-token-request'
+export { decodeSignMultisigTxnRequest } from './sign-multisig-txn-request'
+export { decodeSignProgramMultisigRequest } from './sign-program-multisig-request'
+export { decodeSignProgramRequest } from './sign-program-request'
+export { decodeSignTxnRequest } from './sign-txn-request'
+export { decodeVersionsResponse } from './versions-response'
+export { decodeWalletInfoRequest } from './wallet-info-request'
 export type { SignMultisigRequest } from './sign-multisig-request'
 export type { SignTransactionRequest } from './sign-transaction-request'
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/wallet/init`
@@ -27,3 +28,14 @@ export const InitWalletHandleTokenRequestMeta: ObjectModelMetadata<InitWalletHan
     },
   ],
 }
+
+/**
+ * Decodes only the given `InitWalletHandleTokenRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeInitWalletHandleTokenRequest<K extends keyof InitWalletHandleTokenRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<InitWalletHandleTokenRequest, K> {
+  return decodeFields(payload, InitWalletHandleTokenRequestMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * InitWalletHandleTokenResponse is the response to `POST /v1/wallet/init`
@@ -20,3 +21,14 @@ export const InitWalletHandleTokenResponseMeta: ObjectModelMetadata<InitWalletHa
     },
   ],
 }
+
+/**
+ * Decodes only the given `InitWalletHandleTokenResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeInitWalletHandleTokenResponse<K extends keyof InitWalletHandleTokenResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<InitWalletHandleTokenResponse, K> {
+  return decodeFields(payload, InitWalletHandleTokenResponseMeta, fields)
+}
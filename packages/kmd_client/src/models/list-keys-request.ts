@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/key/list`
@@ -20,3 +21,14 @@ export const ListKeysRequestMeta: ObjectModelMetadata<ListKeysRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ListKeysRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeListKeysRequest<K extends keyof ListKeysRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ListKeysRequest, K> {
+  return decodeFields(payload, ListKeysRequestMeta, fields)
+}
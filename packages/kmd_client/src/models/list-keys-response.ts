@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { addressArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ListKeysResponse is the response to `POST /v1/key/list`
@@ -20,3 +21,14 @@ export const ListKeysResponseMeta: ObjectModelMetadata<ListKeysResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `ListKeysResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeListKeysResponse<K extends keyof ListKeysResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ListKeysResponse, K> {
+  return decodeFields(payload, ListKeysResponseMeta, fields)
+}
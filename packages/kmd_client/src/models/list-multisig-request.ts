@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/multisig/list`
@@ -20,3 +21,14 @@ export const ListMultisigRequestMeta: ObjectModelMetadata<ListMultisigRequest> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `ListMultisigRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeListMultisigRequest<K extends keyof ListMultisigRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ListMultisigRequest, K> {
+  return decodeFields(payload, ListMultisigRequestMeta, fields)
+}
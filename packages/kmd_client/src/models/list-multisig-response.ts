@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { addressArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ListMultisigResponse is the response to `POST /v1/multisig/list`
@@ -20,3 +21,14 @@ export const ListMultisigResponseMeta: ObjectModelMetadata<ListMultisigResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `ListMultisigResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeListMultisigResponse<K extends keyof ListMultisigResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ListMultisigResponse, K> {
+  return decodeFields(payload, ListMultisigResponseMeta, fields)
+}
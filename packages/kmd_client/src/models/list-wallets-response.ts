@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Wallet } from './wallet'
 import { WalletMeta } from './wallet'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * ListWalletsResponse is the response to `GET /v1/wallets`
@@ -22,3 +23,14 @@ export const ListWalletsResponseMeta: ObjectModelMetadata<ListWalletsResponse> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `ListWalletsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeListWalletsResponse<K extends keyof ListWalletsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ListWalletsResponse, K> {
+  return decodeFields(payload, ListWalletsResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, ArrayCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { MultisigSubsig } from './multisig-subsig'
 import { MultisigSubsigMeta } from './multisig-subsig'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * MultisigSig is the structure that holds multiple Subsigs
@@ -36,3 +37,14 @@ export const MultisigSigMeta: ObjectModelMetadata<MultisigSig> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `MultisigSig` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeMultisigSig<K extends keyof MultisigSig & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<MultisigSig, K> {
+  return decodeFields(payload, MultisigSigMeta, fields)
+}
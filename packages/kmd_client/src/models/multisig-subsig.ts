@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * MultisigSubsig is a struct that holds a pair of public key and signatures
@@ -28,3 +29,14 @@ export const MultisigSubsigMeta: ObjectModelMetadata<MultisigSubsig> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `MultisigSubsig` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeMultisigSubsig<K extends keyof MultisigSubsig & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<MultisigSubsig, K> {
+  return decodeFields(payload, MultisigSubsigMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/wallet/release`
@@ -20,3 +21,14 @@ export const ReleaseWalletHandleTokenRequestMeta: ObjectModelMetadata<ReleaseWal
     },
   ],
 }
+
+/**
+ * Decodes only the given `ReleaseWalletHandleTokenRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeReleaseWalletHandleTokenRequest<K extends keyof ReleaseWalletHandleTokenRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<ReleaseWalletHandleTokenRequest, K> {
+  return decodeFields(payload, ReleaseWalletHandleTokenRequestMeta, fields)
+}
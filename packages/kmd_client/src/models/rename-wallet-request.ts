@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/wallet/rename`
@@ -34,3 +35,14 @@ export const RenameWalletRequestMeta: ObjectModelMetadata<RenameWalletRequest> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `RenameWalletRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeRenameWalletRequest<K extends keyof RenameWalletRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<RenameWalletRequest, K> {
+  return decodeFields(payload, RenameWalletRequestMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Wallet } from './wallet'
 import { WalletMeta } from './wallet'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * RenameWalletResponse is the response to `POST /v1/wallet/rename`
@@ -22,3 +23,14 @@ export const RenameWalletResponseMeta: ObjectModelMetadata<RenameWalletResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `RenameWalletResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeRenameWalletResponse<K extends keyof RenameWalletResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<RenameWalletResponse, K> {
+  return decodeFields(payload, RenameWalletResponseMeta, fields)
+}
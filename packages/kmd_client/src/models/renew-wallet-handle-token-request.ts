@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/wallet/renew`
@@ -20,3 +21,14 @@ export const RenewWalletHandleTokenRequestMeta: ObjectModelMetadata<RenewWalletH
     },
   ],
 }
+
+/**
+ * Decodes only the given `RenewWalletHandleTokenRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeRenewWalletHandleTokenRequest<K extends keyof RenewWalletHandleTokenRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<RenewWalletHandleTokenRequest, K> {
+  return decodeFields(payload, RenewWalletHandleTokenRequestMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { WalletHandle } from './wallet-handle'
 import { WalletHandleMeta } from './wallet-handle'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * RenewWalletHandleTokenResponse is the response to `POST /v1/wallet/renew`
@@ -22,3 +23,14 @@ export const RenewWalletHandleTokenResponseMeta: ObjectModelMetadata<RenewWallet
     },
   ],
 }
+
+/**
+ * Decodes only the given `RenewWalletHandleTokenResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeRenewWalletHandleTokenResponse<K extends keyof RenewWalletHandleTokenResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<RenewWalletHandleTokenResponse, K> {
+  return decodeFields(payload, RenewWalletHandleTokenResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * SignMultisigResponse is the response to `POST /v1/multisig/sign`
@@ -20,3 +21,14 @@ export const SignMultisigResponseMeta: ObjectModelMetadata<SignMultisigResponse>
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignMultisigResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignMultisigResponse<K extends keyof SignMultisigResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignMultisigResponse, K> {
+  return decodeFields(payload, SignMultisigResponseMeta, fields)
+}
@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { MultisigSig } from './multisig-sig'
 import { MultisigSigMeta } from './multisig-sig'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/multisig/sign`
@@ -57,3 +58,14 @@ export const SignMultisigTxnRequestMeta: ObjectModelMetadata<SignMultisigTxnRequ
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignMultisigTxnRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignMultisigTxnRequest<K extends keyof SignMultisigTxnRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignMultisigTxnRequest, K> {
+  return decodeFields(payload, SignMultisigTxnRequestMeta, fields)
+}
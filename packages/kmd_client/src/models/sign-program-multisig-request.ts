@@ -2,6 +2,7 @@ import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-c
 import { stringCodec, booleanCodec, bytesCodec, addressCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { MultisigSig } from './multisig-sig'
 import { MultisigSigMeta } from './multisig-sig'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/multisig/signprogram`
@@ -64,3 +65,14 @@ export const SignProgramMultisigRequestMeta: ObjectModelMetadata<SignProgramMult
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignProgramMultisigRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignProgramMultisigRequest<K extends keyof SignProgramMultisigRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignProgramMultisigRequest, K> {
+  return decodeFields(payload, SignProgramMultisigRequestMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * SignProgramMultisigResponse is the response to `POST /v1/multisig/signdata`
@@ -20,3 +21,14 @@ export const SignProgramMultisigResponseMeta: ObjectModelMetadata<SignProgramMul
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignProgramMultisigResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignProgramMultisigResponse<K extends keyof SignProgramMultisigResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignProgramMultisigResponse, K> {
+  return decodeFields(payload, SignProgramMultisigResponseMeta, fields)
+}
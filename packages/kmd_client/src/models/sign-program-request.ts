@@ -1,5 +1,6 @@
 import type { Address, ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesCodec, addressCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/program/sign`
@@ -41,3 +42,14 @@ export const SignProgramRequestMeta: ObjectModelMetadata<SignProgramRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignProgramRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignProgramRequest<K extends keyof SignProgramRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignProgramRequest, K> {
+  return decodeFields(payload, SignProgramRequestMeta, fields)
+}
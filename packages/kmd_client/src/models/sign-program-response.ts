@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * SignProgramResponse is the response to `POST /v1/data/sign`
@@ -20,3 +21,14 @@ export const SignProgramResponseMeta: ObjectModelMetadata<SignProgramResponse> =
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignProgramResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignProgramResponse<K extends keyof SignProgramResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignProgramResponse, K> {
+  return decodeFields(payload, SignProgramResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * SignTransactionResponse is the response to `POST /v1/transaction/sign`
@@ -20,3 +21,14 @@ export const SignTransactionResponseMeta: ObjectModelMetadata<SignTransactionRes
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignTransactionResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignTransactionResponse<K extends keyof SignTransactionResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignTransactionResponse, K> {
+  return decodeFields(payload, SignTransactionResponseMeta, fields)
+}
@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, bytesCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/transaction/sign`
@@ -48,3 +49,14 @@ export const SignTxnRequestMeta: ObjectModelMetadata<SignTxnRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `SignTxnRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeSignTxnRequest<K extends keyof SignTxnRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<SignTxnRequest, K> {
+  return decodeFields(payload, SignTxnRequestMeta, fields)
+}
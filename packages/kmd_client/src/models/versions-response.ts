@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringArrayCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * VersionsResponse is the response to `GET /versions`
@@ -21,3 +22,14 @@ export const VersionsResponseMeta: ObjectModelMetadata<VersionsResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `VersionsResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeVersionsResponse<K extends keyof VersionsResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<VersionsResponse, K> {
+  return decodeFields(payload, VersionsResponseMeta, fields)
+}
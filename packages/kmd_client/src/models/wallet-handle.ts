@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { numberCodec, ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { Wallet } from './wallet'
 import { WalletMeta } from './wallet'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * WalletHandle includes the wallet the handle corresponds to
@@ -30,3 +31,14 @@ export const WalletHandleMeta: ObjectModelMetadata<WalletHandle> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `WalletHandle` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeWalletHandle<K extends keyof WalletHandle & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<WalletHandle, K> {
+  return decodeFields(payload, WalletHandleMeta, fields)
+}
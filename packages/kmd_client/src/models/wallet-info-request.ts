@@ -1,5 +1,6 @@
 import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec } from '@algorandfoundation/algokit-common'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * The request for `POST /v1/wallet/info`
@@ -20,3 +21,14 @@ export const WalletInfoRequestMeta: ObjectModelMetadata<WalletInfoRequest> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `WalletInfoRequest` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeWalletInfoRequest<K extends keyof WalletInfoRequest & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<WalletInfoRequest, K> {
+  return decodeFields(payload, WalletInfoRequestMeta, fields)
+}
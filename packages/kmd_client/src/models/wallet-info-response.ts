@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { ObjectModelCodec } from '@algorandfoundation/algokit-common'
 import type { WalletHandle } from './wallet-handle'
 import { WalletHandleMeta } from './wallet-handle'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * WalletInfoResponse is the response to `POST /v1/wallet/info`
@@ -22,3 +23,14 @@ export const WalletInfoResponseMeta: ObjectModelMetadata<WalletInfoResponse> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `WalletInfoResponse` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeWalletInfoResponse<K extends keyof WalletInfoResponse & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<WalletInfoResponse, K> {
+  return decodeFields(payload, WalletInfoResponseMeta, fields)
+}
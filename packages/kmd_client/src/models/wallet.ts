@@ -2,6 +2,7 @@ import type { ObjectModelMetadata } from '@algorandfoundation/algokit-common'
 import { stringCodec, numberCodec, booleanCodec, ArrayCodec, PrimitiveModelCodec } from '@algorandfoundation/algokit-common'
 import type { TxType } from './tx-type'
 import { TxTypeMeta } from './tx-type'
+import { decodeFields } from '../core/model-runtime'
 
 /**
  * Wallet is the API's representation of a wallet
@@ -57,3 +58,14 @@ export const WalletMeta: ObjectModelMetadata<Wallet> = {
     },
   ],
 }
+
+/**
+ * Decodes only the given `Wallet` fields, skipping the decoding of all other fields.
+ * @param payload A JSON object, or msgpack bytes
+ */
+export function decodeWallet<K extends keyof Wallet & string>(
+  payload: Record<string, unknown> | Uint8Array,
+  fields: readonly K[],
+): Pick<Wallet, K> {
+  return decodeFields(payload, WalletMeta, fields)
+}
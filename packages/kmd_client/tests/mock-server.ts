@@ -0,0 +1,171 @@
+import { ObjectModelCodec, type ObjectModelMetadata } from '@algorandfoundation/algokit-common'
+import { startLocalMockServer, type LocalMockServer, type LocalMockServerOptions, type MockRoute } from '@algorandfoundation/algokit-testing'
+import { encodeJson, encodeMsgpack } from '../src/core/model-runtime'
+import {
+  CreateWalletResponseMeta,
+  ExportKeyResponseMeta,
+  ExportMasterKeyResponseMeta,
+  ExportMultisigResponseMeta,
+  GenerateKeyResponseMeta,
+  ImportKeyResponseMeta,
+  ImportMultisigResponseMeta,
+  InitWalletHandleTokenResponseMeta,
+  ListKeysResponseMeta,
+  ListMultisigResponseMeta,
+  ListWalletsResponseMeta,
+  RenameWalletResponseMeta,
+  RenewWalletHandleTokenResponseMeta,
+  SignMultisigResponseMeta,
+  SignProgramMultisigResponseMeta,
+  SignProgramResponseMeta,
+  SignTransactionResponseMeta,
+  VersionsResponseMeta,
+  WalletInfoResponseMeta,
+} from '../src/models/model-meta'
+
+// A stand-in for the API behind KmdClient, for load testing without a node. It serves every operation of the client, each
+// with a schema-valid (default valued) response in the operation's wire format; recorded responses can be served instead with the
+// `fixturesDir` option. See `startLocalMockServer` for the latency, error and rate limit injection options.
+
+type Meta = ObjectModelMetadata<Record<string, unknown>>
+
+const defaultValue = (meta: Meta) => new ObjectModelCodec(meta).defaultValue()
+
+const json = (meta: Meta): MockRoute['response'] => ({ format: 'json', body: () => encodeJson(defaultValue(meta), meta) })
+const msgpack = (meta: Meta): MockRoute['response'] => ({ format: 'msgpack', body: () => encodeMsgpack(defaultValue(meta), meta) })
+
+/** The route of every KmdClient operation. */
+export const routes: MockRoute[] = [
+  {
+    operationId: 'createWallet',
+    method: 'POST',
+    path: '/v1/wallet',
+    response: json(CreateWalletResponseMeta as Meta),
+  },
+  {
+    operationId: 'deleteKey',
+    method: 'DELETE',
+    path: '/v1/key',
+  },
+  {
+    operationId: 'deleteMultisig',
+    method: 'DELETE',
+    path: '/v1/multisig',
+  },
+  {
+    operationId: 'exportKey',
+    method: 'POST',
+    path: '/v1/key/export',
+    response: json(ExportKeyResponseMeta as Meta),
+  },
+  {
+    operationId: 'exportMasterKey',
+    method: 'POST',
+    path: '/v1/master-key/export',
+    response: json(ExportMasterKeyResponseMeta as Meta),
+  },
+  {
+    operationId: 'exportMultisig',
+    method: 'POST',
+    path: '/v1/multisig/export',
+    response: json(ExportMultisigResponseMeta as Meta),
+  },
+  {
+    operationId: 'generateKey',
+    method: 'POST',
+    path: '/v1/key',
+    response: json(GenerateKeyResponseMeta as Meta),
+  },
+  {
+    operationId: 'importKey',
+    method: 'POST',
+    path: '/v1/key/import',
+    response: json(ImportKeyResponseMeta as Meta),
+  },
+  {
+    operationId: 'importMultisig',
+    method: 'POST',
+    path: '/v1/multisig/import',
+    response: json(ImportMultisigResponseMeta as Meta),
+  },
+  {
+    operationId: 'initWalletHandle',
+    method: 'POST',
+    path: '/v1/wallet/init',
+    response: json(InitWalletHandleTokenResponseMeta as Meta),
+  },
+  {
+    operationId: 'listKeysInWallet',
+    method: 'POST',
+    path: '/v1/key/list',
+    response: json(ListKeysResponseMeta as Meta),
+  },
+  {
+    operationId: 'listMultisig',
+    method: 'POST',
+    path: '/v1/multisig/list',
+    response: json(ListMultisigResponseMeta as Meta),
+  },
+  {
+    operationId: 'listWallets',
+    method: 'GET',
+    path: '/v1/wallets',
+    response: json(ListWalletsResponseMeta as Meta),
+  },
+  {
+    operationId: 'releaseWalletHandleToken',
+    method: 'POST',
+    path: '/v1/wallet/release',
+  },
+  {
+    operationId: 'renameWallet',
+    method: 'POST',
+    path: '/v1/wallet/rename',
+    response: json(RenameWalletResponseMeta as Meta),
+  },
+  {
+    operationId: 'renewWalletHandleToken',
+    method: 'POST',
+    path: '/v1/wallet/renew',
+    response: json(RenewWalletHandleTokenResponseMeta as Meta),
+  },
+  {
+    operationId: 'signMultisigProgram',
+    method: 'POST',
+    path: '/v1/multisig/signprogram',
+    response: json(SignProgramMultisigResponseMeta as Meta),
+  },
+  {
+    operationId: 'signMultisigTransaction',
+    method: 'POST',
+    path: '/v1/multisig/sign',
+    response: json(SignMultisigResponseMeta as Meta),
+  },
+  {
+    operationId: 'signProgram',
+    method: 'POST',
+    path: '/v1/program/sign',
+    response: json(SignProgramResponseMeta as Meta),
+  },
+  {
+    operationId: 'signTransaction',
+    method: 'POST',
+    path: '/v1/transaction/sign',
+    response: json(SignTransactionResponseMeta as Meta),
+  },
+  {
+    operationId: 'version',
+    method: 'GET',
+    path: '/versions',
+    response: json(VersionsResponseMeta as Meta),
+  },
+  {
+    operationId: 'walletInfo',
+    method: 'POST',
+    path: '/v1/wallet/info',
+    response: json(WalletInfoResponseMeta as Meta),
+  },
+]
+
+/** Starts a local mock server for the API behind KmdClient; see `startLocalMockServer` for the options. */
+export const startMockServer = (options?: LocalMockServerOptions): Promise<LocalMockServer> => startLocalMockServer(routes, options)
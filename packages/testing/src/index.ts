@@ -16,3 +16,16 @@ export {
 } from './mockServer'
 
 export { createGlobalSetup, algodGlobalSetup, indexerGlobalSetup, kmdGlobalSetup } from './globalSetup'
+
+export {
+  type MockResponseFormat,
+  type MockRoute,
+  type MockRouteMatch,
+  type LocalMockServerOptions,
+  type LocalMockServerStats,
+  type LocalMockServer,
+  MockRouteTable,
+  startLocalMockServer,
+} from './localMockServer'
+
+export { TEST_GENESIS, jsonResponse, hangingResponse, sleep } from './transportStubs'
@@ -0,0 +1,317 @@
+/**
+ * A local, in-process stand-in for the algod/indexer/kmd APIs, for load testing clients and services without a node.
+ *
+ * Unlike the recorded mock servers used by the client tests (see `mockServer.ts`), it serves every route of a client's
+ * route table (generated alongside the client as `tests/mock-server.ts`) and can inject latency, errors and rate
+ * limiting, so retry, scheduling and caching behaviour can be benchmarked reproducibly.
+ */
+
+import { existsSync, readFileSync } from 'node:fs'
+import { createServer, type IncomingMessage, type ServerResponse } from 'node:http'
+import type { AddressInfo } from 'node:net'
+import { join } from 'node:path'
+
+/** The wire format of a route's response body */
+export type MockResponseFormat = 'json' | 'msgpack'
+
+/** A route of a mocked API */
+export interface MockRoute {
+  /** The name of the client method for the route, e.g. `accountInformation` */
+  operationId: string
+  method: string
+  /** The URL template, e.g. `/v2/accounts/{address}` */
+  path: string
+  /** The response body; routes without one respond with an empty body */
+  response?: {
+    format: MockResponseFormat
+    /** Builds the body; called once, on the first request to the route */
+    body: () => string | Uint8Array
+  }
+}
+
+/** A matched route, with the values of its path parameters */
+export interface MockRouteMatch {
+  route: MockRoute
+  params: Record<string, string>
+}
+
+interface RouteNode {
+  routes: Map<string, MockRoute>
+  children: Map<string, RouteNode>
+  param?: { name: string; node: RouteNode }
+}
+
+const newRouteNode = (): RouteNode => ({ routes: new Map(), children: new Map() })
+
+const pathSegments = (path: string): string[] => path.split('/').filter((segment) => segment !== '')
+
+/** Routes compiled into a tree of path segments, so matching a request is a lookup per segment. */
+export class MockRouteTable {
+  private readonly root = newRouteNode()
+
+  constructor(routes: readonly MockRoute[]) {
+    for (const route of routes) {
+      let node = this.root
+      for (const segment of pathSegments(route.path)) {
+        const param = /^\{(.+)\}$/.exec(segment)
+        if (param) {
+          node.param ??= { name: param[1], node: newRouteNode() }
+          node = node.param.node
+        } else {
+          let child = node.children.get(segment)
+          if (!child) {
+            child = newRouteNode()
+            node.children.set(segment, child)
+          }
+          node = child
+        }
+      }
+      node.routes.set(route.method.toUpperCase(), route)
+    }
+  }
+
+  /**
+   * Finds the route for a request, preferring static segments over path parameters.
+   *
+   * @param method - The HTTP method
+   * @param pathname - The URL path, without the query string
+   * @returns The route and its path parameter values, or `undefined` if no route matches
+   */
+  match(method: string, pathname: string): MockRouteMatch | undefined {
+    const params: Record<string, string> = {}
+    const find = (node: RouteNode, segments: string[], index: number): MockRoute | undefined => {
+      if (index === segments.length) {
+        return node.routes.get(method.toUpperCase())
+      }
+      const child = node.children.get(segments[index])
+      const route = child ? find(child, segments, index + 1) : undefined
+      if (route || !node.param) {
+        return route
+      }
+      params[node.param.name] = decodeURIComponent(segments[index])
+      const paramRoute = find(node.param.node, segments, index + 1)
+      if (!paramRoute) {
+        delete params[node.param.name]
+      }
+      return paramRoute
+    }
+    const route = find(this.root, pathSegments(pathname), 0)
+    return route ? { route, params } : undefined
+  }
+}
+
+export interface LocalMockServerOptions {
+  /** The port to listen on; defaults to a free port */
+  port?: number
+  /** The host to listen on; defaults to `127.0.0.1` */
+  host?: string
+  /** Latency added to every response in milliseconds, either fixed or uniformly distributed between `min` and `max` */
+  latencyMs?: number | { min: number; max: number }
+  /** The share (0-1) of requests answered with a 500 error */
+  errorRate?: number
+  /** The share (0-1) of requests answered with a 429 (too many requests) error */
+  throttleRate?: number
+  /** The `Retry-After` header sent with 429 errors, in seconds; defaults to 1 */
+  retryAfterSeconds?: number
+  /**
+   * A directory of recorded response bodies, named `<operationId>.json` or `<operationId>.msgpack`, that are served
+   * instead of the routes' default responses
+   */
+  fixturesDir?: string
+  /** Seed for the latency and error injection, so runs are reproducible; defaults to 1 */
+  seed?: number
+  /** Logs throughput every `logIntervalMs` milliseconds (skipping idle intervals); defaults to not logging */
+  logIntervalMs?: number
+  /** Receives throughput logs; defaults to `console` */
+  logger?: { info(message: string): void }
+}
+
+/** Counters describing the requests served */
+export interface LocalMockServerStats {
+  requests: number
+  /** Response body bytes sent */
+  bytes: number
+  /** Requests by response status */
+  statuses: Record<number, number>
+  /** Requests by operation */
+  operations: Record<string, number>
+}
+
+export interface LocalMockServer {
+  /** Base URL of the server, e.g. `http://127.0.0.1:49152` */
+  baseUrl: string
+  /** A snapshot of the counters */
+  readonly stats: LocalMockServerStats
+  /** Resets the counters */
+  resetStats(): void
+  /** Stops the server */
+  close(): Promise<void>
+}
+
+const CONTENT_TYPES: Record<MockResponseFormat, string> = {
+  json: 'application/json',
+  msgpack: 'application/msgpack',
+}
+
+// A small seeded PRNG (mulberry32), so injected latency and errors are the same from run to run
+const seededRandom = (seed: number): (() => number) => {
+  let state = seed >>> 0
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0
+    let t = state
+    t = Math.imul(t ^ (t >>> 15), t | 1)
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61)
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+}
+
+const emptyStats = (): LocalMockServerStats => ({ requests: 0, bytes: 0, statuses: {}, operations: {} })
+
+interface ResolvedResponse {
+  contentType?: string
+  body: Uint8Array
+}
+
+/**
+ * Starts a local mock server for the given routes.
+ *
+ * @param routes - The routes to serve, e.g. the `routes` exported by a client's generated `tests/mock-server.ts`
+ * @param options - Latency, error and rate limit injection, fixtures and logging options
+ * @returns Promise resolving to the running server
+ *
+ * @example
+ * ```typescript
+ * const server = await startLocalMockServer(routes, { latencyMs: { min: 5, max: 50 }, throttleRate: 0.05, logIntervalMs: 1000 })
+ * const algod = new AlgodClient({ baseUrl: server.baseUrl })
+ * // ... run the load test ...
+ * await server.close()
+ * ```
+ */
+export async function startLocalMockServer(routes: readonly MockRoute[], options: LocalMockServerOptions = {}): Promise<LocalMockServer> {
+  const table = new MockRouteTable(routes)
+  const random = seededRandom(options.seed ?? 1)
+  const logger = options.logger ?? console
+  const responses = new Map<MockRoute, ResolvedResponse>()
+  let stats = emptyStats()
+
+  const resolveResponse = (route: MockRoute): ResolvedResponse => {
+    let response = responses.get(route)
+    if (!response) {
+      const fixture = (['json', 'msgpack'] as const)
+        .map((format) => ({ format, path: options.fixturesDir ? join(options.fixturesDir, `${route.operationId}.${format}`) : undefined }))
+        .find(({ path }) => path !== undefined && existsSync(path))
+      if (fixture?.path) {
+        response = { contentType: CONTENT_TYPES[fixture.format], body: new Uint8Array(readFileSync(fixture.path)) }
+      } else if (route.response) {
+        const body = route.response.body()
+        response = {
+          contentType: CONTENT_TYPES[route.response.format],
+          body: typeof body === 'string' ? new TextEncoder().encode(body) : body,
+        }
+      } else {
+        response = { body: new Uint8Array() }
+      }
+      responses.set(route, response)
+    }
+    return response
+  }
+
+  const latency = (): number => {
+    const { latencyMs } = options
+    if (latencyMs === undefined) return 0
+    return typeof latencyMs === 'number' ? latencyMs : latencyMs.min + random() * (latencyMs.max - latencyMs.min)
+  }
+
+  const send = (res: ServerResponse, status: number, operationId: string, response: ResolvedResponse, headers: Record<string, string> = {}) => {
+    stats.requests += 1
+    stats.bytes += response.body.byteLength
+    stats.statuses[status] = (stats.statuses[status] ?? 0) + 1
+    stats.operations[operationId] = (stats.operations[operationId] ?? 0) + 1
+    res.writeHead(status, {
+      ...(response.contentType ? { 'content-type': response.contentType } : {}),
+      'content-length': String(response.body.byteLength),
+      ...headers,
+    })
+    res.end(response.body)
+  }
+
+  const errorResponse = (message: string): ResolvedResponse => ({
+    contentType: CONTENT_TYPES.json,
+    body: new TextEncoder().encode(JSON.stringify({ message })),
+  })
+
+  const handle = async (req: IncomingMessage, res: ServerResponse) => {
+    // Discard the request body, so the connection can be reused
+    req.resume()
+    const pathname = new URL(req.url ?? '/', 'http://localhost').pathname
+    const match = table.match(req.method ?? 'GET', pathname)
+
+    const delayMs = latency()
+    if (delayMs > 0) {
+      await new Promise((resolve) => setTimeout(resolve, delayMs))
+    }
+
+    if (!match) {
+      send(res, 404, 'unmatched', errorResponse(`No route for ${req.method} ${pathname}`))
+      return
+    }
+    const { operationId } = match.route
+    const roll = random()
+    if (roll < (options.throttleRate ?? 0)) {
+      send(res, 429, operationId, errorResponse('Too many requests'), { 'retry-after': String(options.retryAfterSeconds ?? 1) })
+    } else if (roll < (options.throttleRate ?? 0) + (options.errorRate ?? 0)) {
+      send(res, 500, operationId, errorResponse('Injected error'))
+    } else {
+      send(res, 200, operationId, resolveResponse(match.route))
+    }
+  }
+
+  const server = createServer((req, res) => {
+    handle(req, res).catch((error) => {
+      if (!res.headersSent) {
+        send(res, 500, 'unmatched', errorResponse(String(error)))
+      }
+    })
+  })
+  await new Promise<void>((resolve, reject) => {
+    server.once('error', reject)
+    server.listen(options.port ?? 0, options.host ?? '127.0.0.1', () => resolve())
+  })
+
+  let logged = { ...emptyStats(), at: performance.now() }
+  const logTimer = options.logIntervalMs
+    ? setInterval(() => {
+        if (stats.requests === logged.requests) return
+        const now = performance.now()
+        const seconds = (now - logged.at) / 1000
+        const statuses = Object.entries(stats.statuses)
+          .map(([status, count]) => `${status}: ${count - (logged.statuses[Number(status)] ?? 0)}`)
+          .join(', ')
+        logger.info(
+          `[LocalMockServer] ${((stats.requests - logged.requests) / seconds).toFixed(0)} req/s, ` +
+            `${((stats.bytes - logged.bytes) / 1024 / 1024 / seconds).toFixed(2)} MiB/s (${statuses})`,
+        )
+        logged = { ...stats, statuses: { ...stats.statuses }, operations: { ...stats.operations }, at: now }
+      }, options.logIntervalMs)
+    : undefined
+  logTimer?.unref()
+
+  const { address, port } = server.address() as AddressInfo
+  return {
+    baseUrl: `http://${address.includes(':') ? `[${address}]` : address}:${port}`,
+    get stats() {
+      return { ...stats, statuses: { ...stats.statuses }, operations: { ...stats.operations } }
+    },
+    resetStats() {
+      stats = emptyStats()
+      logged = { ...emptyStats(), at: performance.now() }
+    },
+    close() {
+      clearInterval(logTimer)
+      return new Promise<void>((resolve, reject) => {
+        server.close((error) => (error ? reject(error) : resolve()))
+        server.closeAllConnections()
+      })
+    },
+  }
+}
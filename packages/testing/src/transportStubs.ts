@@ -0,0 +1,38 @@
+/**
+ * Stubs for the HTTP transport of the algod/indexer/kmd clients, for testing the client's request handling (retries,
+ * timeouts, caching, etc.) without a server.
+ */
+
+/** The genesis of a test network, as algod's `/genesis` responds with it */
+export const TEST_GENESIS = { alloc: [], fees: 'fees', id: 'v1', network: 'testnet', proto: 'future', rwd: 'rwd', timestamp: 1 }
+
+/**
+ * Creates a JSON response.
+ *
+ * @param body - The body, serialised as JSON
+ * @param status - The HTTP status (default: 200)
+ * @param headers - Headers to add to the `content-type` header
+ * @returns The response
+ */
+export function jsonResponse(body: unknown, status = 200, headers: Record<string, string> = {}): Response {
+  return new Response(JSON.stringify(body), { status, headers: { 'content-type': 'application/json', ...headers } })
+}
+
+/**
+ * A response that never arrives, for the request to time out or be aborted.
+ *
+ * @param init - The init of the request
+ * @returns A promise that rejects with the abort reason once the request's signal is aborted
+ */
+export function hangingResponse(init: RequestInit): Promise<Response> {
+  return new Promise<Response>((_, reject) => init.signal?.addEventListener('abort', () => reject(init.signal!.reason), { once: true }))
+}
+
+/**
+ * Waits for the given time; with fake timers, until the timers are advanced by it.
+ *
+ * @param ms - The time to wait in milliseconds
+ */
+export function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms))
+}
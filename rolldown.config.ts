@@ -44,6 +44,9 @@ export default createConfig(
     'src/algod-client/index.ts',
     'src/indexer-client/index.ts',
     'src/kmd-client/index.ts',
+    'src/algod-client/node.ts',
+    'src/indexer-client/node.ts',
+    'src/kmd-client/node.ts',
     'src/crypto/index.ts',
     'src/common/index.ts',
   ],
@@ -0,0 +1,5 @@
+/**
+ * Node.js only exports of the algod client, e.g. the pooled keep-alive transport.
+ * @module algokit-utils/algod-client/node
+ */
+export * from '@algorandfoundation/algokit-algod-client/node'
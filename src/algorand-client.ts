@@ -12,6 +12,7 @@ import { AlgoSdkClients, ClientManager } from './client-manager'
 import { ErrorTransformer, TransactionComposer, TransactionComposerConfig } from './composer'
 import { AlgoConfig } from './network-client'
 import { NetworkManager } from './network-manager'
+import { SimulateBatcher } from './transaction/simulate-batcher'
 
 /**
  * A client that brokers easy access to Algorand functionality.
@@ -32,6 +33,8 @@ export class AlgorandClient {
 
   private _defaultValidityWindow: bigint | undefined = undefined
 
+  private _simulateBatcher?: SimulateBatcher
+
   /**
    * A set of error transformers to use when an error is caught in simulate or execute
    * `registerErrorTransformer` and `unregisterErrorTransformer` can be used to add and remove
@@ -145,6 +148,22 @@ export class AlgorandClient {
     return this
   }
 
+  /**
+   * Sets a batcher that the transaction groups made from `newGroup` send their simulate requests through, so that
+   * concurrent simulate requests are sent to algod together (see `SimulateBatcher` for when requests are merged).
+   * @param simulateBatcher The batcher to use, or `undefined` to send each simulate request on its own (the default)
+   * @returns The `AlgorandClient` so method calls can be chained
+   * @example
+   * ```typescript
+   * const algorand = AlgorandClient.mainNet()
+   * algorand.setSimulateBatcher(new SimulateBatcher(algorand.client.algod, { independentGroups: true }))
+   * ```
+   */
+  public setSimulateBatcher(simulateBatcher: SimulateBatcher | undefined) {
+    this._simulateBatcher = simulateBatcher
+    return this
+  }
+
   /**
    * Get suggested params for a transaction (either cached or from algod if the cache is stale or empty)
    * @returns The suggested transaction parameters.
@@ -263,6 +282,7 @@ export class AlgorandClient {
       appManager: this._appManager,
       errorTransformers: [...this._errorTransformers],
       composerConfig: composerConfig,
+      simulateBatcher: this._simulateBatcher,
     })
   }
 
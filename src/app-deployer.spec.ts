@@ -0,0 +1,142 @@
+import { Address } from '@algorandfoundation/algokit-common'
+import { IndexerClient, Transaction } from '@algorandfoundation/algokit-indexer-client'
+import { describe, expect, test, vi } from 'vitest'
+import { APP_DEPLOY_NOTE_DAPP } from './app'
+import { AppDeployer } from './app-deployer'
+import { AppManager } from './app-manager'
+import { AlgorandClientTransactionSender } from './algorand-client-transaction-sender'
+
+const textEncoder = new TextEncoder()
+
+const creator = Address.zeroAddress()
+
+const deployNote = (name: string, version: string) =>
+  textEncoder.encode(`${APP_DEPLOY_NOTE_DAPP}:j${JSON.stringify({ name, version, deletable: false, updatable: true })}`)
+
+// An indexer with the apps the creator created, and the deployment transactions (creations and updates) of each of them
+const fakeIndexer = () => {
+  let currentRound = 10n
+  const apps: { id: bigint; createdAtRound: bigint }[] = []
+  const transactions: { appId: bigint; transaction: Transaction }[] = []
+  const indexer = {
+    lookupAccountCreatedApplications: vi.fn(async () => ({ applications: [...apps], currentRound })),
+    searchForTransactions: vi.fn(async (criteria: { minRound?: bigint; applicationId?: bigint }) => {
+      await new Promise((resolve) => setTimeout(resolve, 1))
+      return {
+        currentRound,
+        transactions: transactions
+          .filter(({ appId }) => criteria.applicationId === undefined || appId === criteria.applicationId)
+          .filter(({ transaction }) => transaction.confirmedRound! >= (criteria.minRound ?? 0n))
+          .map(({ transaction }) => transaction),
+      }
+    }),
+  }
+  const deploy = (appId: bigint, name: string, version: string, create: boolean) => {
+    currentRound += 1n
+    if (create) apps.push({ id: appId, createdAtRound: currentRound })
+    transactions.push({
+      appId,
+      transaction: {
+        sender: creator.toString(),
+        applicationTransaction: { applicationId: create ? 0n : appId },
+        confirmedRound: currentRound,
+        intraRoundOffset: 0,
+        note: deployNote(name, version),
+      } as unknown as Transaction,
+    })
+  }
+  return {
+    indexer: indexer as unknown as IndexerClient,
+    fake: indexer,
+    create: (appId: bigint, name: string, version = '1.0') => deploy(appId, name, version, true),
+    update: (appId: bigint, name: string, version: string) => deploy(appId, name, version, false),
+  }
+}
+
+const lookedUpAppIds = (fake: ReturnType<typeof fakeIndexer>['fake']) =>
+  fake.searchForTransactions.mock.calls.map(([criteria]) => criteria.applicationId).filter((appId) => appId !== undefined)
+
+const newDeployer = (indexer: IndexerClient) =>
+  new AppDeployer({} as AppManager, {} as AlgorandClientTransactionSender, indexer, { maxLookupConcurrency: 2 })
+
+describe('AppDeployer.getCreatorAppsByName', () => {
+  test('looks up the deployment metadata of every app the creator created', async () => {
+    const { indexer, fake, create, update } = fakeIndexer()
+    create(1n, 'A')
+    create(2n, 'B')
+    update(1n, 'A', '2.0')
+    create(3n, 'B', '3.0')
+
+    const lookup = await newDeployer(indexer).getCreatorAppsByName(creator)
+
+    expect(Object.keys(lookup.apps).sort()).toEqual(['A', 'B'])
+    expect(lookup.apps.A).toMatchObject({ appId: 1n, version: '2.0', createdRound: 11n, updatedRound: 13n })
+    expect(lookup.apps.B).toMatchObject({ appId: 3n, version: '3.0', createdRound: 14n })
+    expect(lookedUpAppIds(fake).sort()).toEqual([1n, 2n, 3n])
+  })
+
+  test('serves the cached lookup until the cache is ignored', async () => {
+    const { indexer, fake, create } = fakeIndexer()
+    create(1n, 'A')
+    const deployer = newDeployer(indexer)
+
+    const first = await deployer.getCreatorAppsByName(creator)
+    create(2n, 'B')
+    const second = await deployer.getCreatorAppsByName(creator)
+
+    expect(second).toBe(first)
+    expect(fake.lookupAccountCreatedApplications).toHaveBeenCalledTimes(1)
+  })
+
+  test('only looks up new apps, and updates to known apps since the last lookup, on a refresh', async () => {
+    const { indexer, fake, create, update } = fakeIndexer()
+    create(1n, 'A')
+    create(2n, 'B')
+    const deployer = newDeployer(indexer)
+    await deployer.getCreatorAppsByName(creator)
+    fake.searchForTransactions.mockClear()
+
+    update(1n, 'A', '2.0')
+    create(3n, 'C')
+    const lookup = await deployer.getCreatorAppsByName(creator, true)
+
+    expect(lookedUpAppIds(fake)).toEqual([3n])
+    expect(fake.searchForTransactions.mock.calls.filter(([criteria]) => criteria.applicationId === undefined)).toMatchObject([
+      [{ minRound: 13n }],
+    ])
+    expect(lookup.apps.A).toMatchObject({ appId: 1n, version: '2.0', createdRound: 11n, updatedRound: 13n })
+    expect(lookup.apps.B).toMatchObject({ appId: 2n, version: '1.0' })
+    expect(lookup.apps.C).toMatchObject({ appId: 3n, createdRound: 14n })
+  })
+
+  test('stores lookups in the given cache', async () => {
+    const { indexer, create } = fakeIndexer()
+    create(1n, 'A')
+    const set = vi.fn()
+    const deployer = newDeployer(indexer).setAppLookupCache({ get: () => undefined, set })
+
+    await deployer.getCreatorAppsByName(creator)
+
+    expect(set).toHaveBeenCalledTimes(1)
+    expect(set.mock.calls[0][0]).toBe(creator.toString())
+    expect(set.mock.calls[0][1]).toMatchObject({ round: 11n, appIds: [1n] })
+  })
+
+  test('rejects when looking up an app fails, without caching a partial lookup', async () => {
+    const { indexer, fake, create } = fakeIndexer()
+    ;[1n, 2n, 3n, 4n].forEach((appId) => create(appId, `APP_${appId}`))
+    const searchForTransactions = fake.searchForTransactions.getMockImplementation()!
+    fake.searchForTransactions.mockImplementation(async (criteria) => {
+      if (criteria.applicationId === 1n) throw new Error('indexer unavailable')
+      return searchForTransactions(criteria)
+    })
+    const deployer = newDeployer(indexer)
+
+    await expect(deployer.getCreatorAppsByName(creator)).rejects.toThrow('indexer unavailable')
+    // The lookups still in flight finish without unhandled rejections
+    await new Promise((resolve) => setTimeout(resolve, 10))
+
+    fake.searchForTransactions.mockImplementation(searchForTransactions)
+    expect(Object.keys((await deployer.getCreatorAppsByName(creator)).apps)).toHaveLength(4)
+  })
+})
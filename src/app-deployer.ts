@@ -1,6 +1,6 @@
 import { ABIReturn } from '@algorandfoundation/algokit-abi'
 import { Address, Expand, getAddress, getApplicationAddress, ReadableAddress } from '@algorandfoundation/algokit-common'
-import { IndexerClient } from '@algorandfoundation/algokit-indexer-client'
+import { Application, IndexerClient, Transaction } from '@algorandfoundation/algokit-indexer-client'
 import { TransactionType } from '@algorandfoundation/algokit-transact'
 import { AlgorandClientTransactionSender } from './algorand-client-transaction-sender'
 import {
@@ -23,9 +23,9 @@ import {
   TransactionComposer,
 } from './composer'
 import { Config } from './config'
-import { lookupAccountCreatedApplicationByAddress, searchTransactions } from './indexer-client'
+import { searchTransactions, streamAccountCreatedApplicationsByAddress } from './indexer-client'
 import { ConfirmedTransactionResult, SendParams } from './transaction/types'
-import { calculateExtraProgramPages } from './util'
+import { calculateExtraProgramPages, streamWithConcurrency } from './util'
 
 /** Params to specify an update transaction for an app deployment */
 export type DeployAppUpdateParams = Expand<Omit<AppUpdateParams, 'appId' | 'approvalProgram' | 'clearStateProgram'>>
@@ -97,6 +97,39 @@ export interface AppLookup {
   }
 }
 
+/** A cached `AppLookup` for a creator, along with how far through the indexer data it's been brought up to date. */
+export interface CachedAppLookup {
+  /** The app lookup */
+  lookup: AppLookup
+  /** The round the lookup is up to date as of; a refresh only looks for app updates after this round */
+  round: bigint
+  /** The IDs of the apps created by the creator that have been looked up (including those without deployment metadata) */
+  appIds: bigint[]
+}
+
+/**
+ * A pluggable (e.g. persistent) cache of app lookups, keyed by creator address.
+ *
+ * The entries contain `bigint` and `Address` values, so an implementation that stores them outside of memory needs to
+ * serialize them accordingly.
+ */
+export interface AppLookupCache {
+  /** Returns the cached lookup for the given creator, or `undefined` on a miss. */
+  get(creator: string): CachedAppLookup | undefined | Promise<CachedAppLookup | undefined>
+  /** Stores the lookup for the given creator. */
+  set(creator: string, entry: CachedAppLookup): void | Promise<void>
+}
+
+/** Options to control how an `AppDeployer` looks up app metadata. */
+export interface AppDeployerOptions {
+  /** The cache to store app lookups in; defaults to an in-memory cache */
+  appLookupCache?: AppLookupCache
+  /** The maximum number of apps to look up the deployment transactions of at a time; defaults to 8 */
+  maxLookupConcurrency?: number
+}
+
+const DEFAULT_MAX_LOOKUP_CONCURRENCY = 8
+
 export type AppDeployResult =
   | Expand<{ operationPerformed: 'create' } & Omit<AppMetadata, 'appId' | 'appAddress'> & SendAppCreateTransactionResult>
   | Expand<{ operationPerformed: 'update' } & AppMetadata & SendAppUpdateTransactionResult>
@@ -114,22 +147,49 @@ export class AppDeployer {
   private _appManager: AppManager
   private _transactionSender: AlgorandClientTransactionSender
   private _indexer?: IndexerClient
-  private _appLookups = new Map<string, AppLookup>()
+  private _appLookupCache: AppLookupCache
+  private _maxLookupConcurrency: number
 
   /**
    * Creates an `AppManager`
    * @param appManager An `AppManager` instance
    * @param transactionSender An `AlgorandClientTransactionSender` instance
    * @param indexer An optional indexer instance; supply if you want to indexer to look up app metadata
+   * @param options Optional options to control how app metadata is looked up
    * @example
    * ```ts
    * const deployer = new AppDeployer(appManager, transactionSender, indexer)
    * ```
    */
-  constructor(appManager: AppManager, transactionSender: AlgorandClientTransactionSender, indexer?: IndexerClient) {
+  constructor(
+    appManager: AppManager,
+    transactionSender: AlgorandClientTransactionSender,
+    indexer?: IndexerClient,
+    options?: AppDeployerOptions,
+  ) {
     this._appManager = appManager
     this._transactionSender = transactionSender
     this._indexer = indexer
+    const appLookups = new Map<string, CachedAppLookup>()
+    this._appLookupCache = options?.appLookupCache ?? {
+      get: (creator) => appLookups.get(creator),
+      set: (creator, entry) => void appLookups.set(creator, entry),
+    }
+    this._maxLookupConcurrency = options?.maxLookupConcurrency ?? DEFAULT_MAX_LOOKUP_CONCURRENCY
+  }
+
+  /**
+   * Sets the cache that app lookups are stored in, e.g. to persist them between runs so that refreshes are incremental.
+   * @param cache The app lookup cache
+   * @returns The `AppDeployer` so method calls can be chained
+   * @example
+   * ```ts
+   * deployer.setAppLookupCache(myPersistentCache)
+   * ```
+   */
+  setAppLookupCache(cache: AppLookupCache): AppDeployer {
+    this._appLookupCache = cache
+    return this
   }
 
   /**
@@ -238,7 +298,7 @@ export class AppDeployer {
         updatedRound: BigInt(result.confirmation.confirmedRound!),
         deleted: false,
       }
-      this.updateAppLookup(createParams.sender, appMetadata)
+      await this.updateAppLookup(createParams.sender, appMetadata)
       return {
         operationPerformed: 'create',
         compiledApproval,
@@ -275,7 +335,7 @@ export class AppDeployer {
         ...metadata,
         deleted: false,
       }
-      this.updateAppLookup(createParams.sender, appMetadata)
+      await this.updateAppLookup(createParams.sender, appMetadata)
       return {
         operationPerformed: 'update',
         compiledApproval,
@@ -325,7 +385,7 @@ export class AppDeployer {
         updatedRound: BigInt(confirmation.confirmedRound!),
         deleted: false,
       }
-      this.updateAppLookup(createParams.sender, appMetadata)
+      await this.updateAppLookup(createParams.sender, appMetadata)
 
       return {
         operationPerformed: 'replace',
@@ -467,13 +527,19 @@ export class AppDeployer {
     return { ...existingApp, operationPerformed: 'nothing' }
   }
 
-  private updateAppLookup(sender: ReadableAddress, appMetadata: AppMetadata) {
+  private async updateAppLookup(sender: ReadableAddress, appMetadata: AppMetadata) {
     const s = getAddress(sender).toString()
-    const lookup = this._appLookups.get(s)
-    if (!lookup) {
-      this._appLookups.set(s, { creator: Address.fromString(s), apps: { [appMetadata.name]: appMetadata } })
+    const cached = await this._appLookupCache.get(s)
+    if (!cached) {
+      // Apps that haven't been looked up yet are looked up in full on the next refresh
+      await this._appLookupCache.set(s, {
+        lookup: { creator: Address.fromString(s), apps: { [appMetadata.name]: appMetadata } },
+        round: 0n,
+        appIds: [],
+      })
     } else {
-      lookup.apps[appMetadata.name] = appMetadata
+      cached.lookup.apps[appMetadata.name] = appMetadata
+      await this._appLookupCache.set(s, cached)
     }
   }
 
@@ -494,113 +560,174 @@ export class AppDeployer {
    * const result = await deployer.getCreatorAppsByName(creator)
    */
   async getCreatorAppsByName(creator: ReadableAddress, ignoreCache?: boolean): Promise<AppLookup> {
-    const appLookup: Record<string, AppMetadata> = {}
-
     const creatorAddress = getAddress(creator)
     const creatorString = creatorAddress.toString()
-    if (!ignoreCache && this._appLookups.has(creatorString)) {
-      return this._appLookups.get(creatorString)!
+    const cached = await this._appLookupCache.get(creatorString)
+    if (!ignoreCache && cached) {
+      return cached.lookup
     }
 
     if (!this._indexer) {
       throw new Error(`Didn't receive an indexer client when this AppManager was created, but received a call to getCreatorApps`)
     }
+    const indexer = this._indexer
+
+    const knownAppIds = new Set(cached?.appIds ?? [])
+    const appLookup: Record<string, AppMetadata> = { ...cached?.lookup.apps }
+    const appIds: bigint[] = []
+    const deleted = new Map<bigint, boolean>()
+    const rounds: bigint[] = []
+    const found: AppMetadata[] = []
+
+    // Stream the apps that account created, looking up the ones that haven't been looked up before as they arrive...
+    const lookupNewApps = async () => {
+      const lookupCreatedApp = async (app: Application) => {
+        appIds.push(app.id)
+        deleted.set(app.id, app.deleted ?? false)
+        if (knownAppIds.has(app.id)) return undefined
+        const { currentRound, metadata } = await this.lookupApp(indexer, creatorAddress, app)
+        rounds.push(currentRound)
+        return metadata
+      }
+      const createdApps = streamAccountCreatedApplicationsByAddress(indexer, creatorString)
+      for await (const { result } of streamWithConcurrency(createdApps, this._maxLookupConcurrency, lookupCreatedApp)) {
+        if (result) found.push(result)
+      }
+    }
 
-    // Extract all apps that account created
-    const createdApps = (await lookupAccountCreatedApplicationByAddress(this._indexer, creatorString))
-      .map((a) => {
-        return { id: a.id, createdAtRound: a.createdAtRound!, deleted: a.deleted }
+    // ...while finding any updates to the apps that were looked up before, since the last refresh
+    const lookupUpdates = async () => {
+      if (!cached || knownAppIds.size === 0) return
+      const appTransactions = await searchTransactions(indexer, {
+        minRound: cached.round + 1n,
+        txType: TransactionType.AppCall,
+        address: creatorAddress,
+        addressRole: 'sender',
+        notePrefix: Buffer.from(APP_DEPLOY_NOTE_DAPP).toString('base64'),
       })
-      .sort((a, b) => Number(a.createdAtRound - b.createdAtRound))
-
-    // For each app that account created (in parallel)...
-    const apps = await Promise.all(
-      createdApps.map(async (createdApp) => {
-        // Find any app transactions for that app in the round it was created (should always just be a single creation transaction)
-        const appTransactions = await searchTransactions(this._indexer!, {
-          minRound: createdApp.createdAtRound,
-          txType: TransactionType.AppCall,
-          applicationId: createdApp.id,
-          address: creatorAddress,
-          addressRole: 'sender',
-          notePrefix: Buffer.from(APP_DEPLOY_NOTE_DAPP).toString('base64'),
-        })
-
-        // Triple check the transaction is intact by filtering for the one we want:
-        //  * application-id is 0 when the app is first created
-        //  * also verify the sender to prevent a potential security risk
-        const appCreationTransaction = appTransactions.transactions.filter(
-          (t) => t.applicationTransaction?.applicationId === 0n && t.sender.toString() === creatorAddress.toString(),
-        )[0]
-
-        const latestAppUpdateTransaction = appTransactions.transactions
-          .filter((t) => t.sender.toString() === creatorAddress.toString())
-          .sort((a, b) =>
-            a.confirmedRound === b.confirmedRound
-              ? (b.intraRoundOffset! - a.intraRoundOffset!) / 10
-              : Number(b.confirmedRound! - a.confirmedRound!),
-          )[0]
-
-        if (!appCreationTransaction?.note)
-          // No note; ignoring
-          return null
-
-        return { createdApp, appCreationTransaction, latestAppUpdateTransaction }
-      }),
-    )
-
-    apps
-      .filter((a) => a !== null)
-      .forEach((a) => {
-        const { createdApp, appCreationTransaction, latestAppUpdateTransaction } = a!
-
-        const parseNote = (note?: string) => {
-          if (!note) {
-            // No note; ignoring...
-            return
-          }
-
-          if (!note.startsWith(`${APP_DEPLOY_NOTE_DAPP}:j{`))
-            // Clearly not APP_DEPLOY JSON; ignoring...
-            return
-
-          return JSON.parse(note.substring(APP_DEPLOY_NOTE_DAPP.length + 2)) as AppDeployMetadata
-        }
-
+      rounds.push(appTransactions.currentRound)
+
+      for (const [name, app] of Object.entries(appLookup)) {
+        if (!knownAppIds.has(app.appId)) continue
+        const latestAppUpdateTransaction = this.latestTransaction(
+          appTransactions.transactions.filter(
+            (t) => t.applicationTransaction?.applicationId === app.appId && t.sender.toString() === creatorString,
+          ),
+        )
+        if (!latestAppUpdateTransaction || (latestAppUpdateTransaction.confirmedRound ?? 0n) < app.updatedRound) continue
         try {
-          const creationNote = parseNote(
-            appCreationTransaction.note ? Buffer.from(appCreationTransaction.note).toString('utf-8') : undefined,
-          )
-          const updateNote = parseNote(
-            latestAppUpdateTransaction.note ? Buffer.from(latestAppUpdateTransaction.note).toString('utf-8') : undefined,
-          )
-          if (creationNote?.name) {
-            appLookup[creationNote.name] = {
-              appId: createdApp.id,
-              appAddress: getApplicationAddress(createdApp.id),
-              createdMetadata: creationNote,
-              createdRound: appCreationTransaction.confirmedRound ?? 0n,
-              ...(updateNote ?? creationNote),
-              updatedRound: latestAppUpdateTransaction?.confirmedRound ?? 0n,
-              deleted: createdApp.deleted ?? false,
-            }
-          }
+          const updateNote = this.parseDeployNote(latestAppUpdateTransaction.note)
+          appLookup[name] = { ...app, ...updateNote, updatedRound: latestAppUpdateTransaction.confirmedRound ?? 0n }
         } catch (e) {
-          Config.logger.warn(
-            `Received error trying to retrieve app with ${createdApp.id} for creator ${creatorAddress}; failing silently`,
-            e,
-          )
-          return
+          Config.logger.warn(`Received error trying to retrieve app with ${app.appId} for creator ${creatorAddress}; failing silently`, e)
+        }
+      }
+    }
+
+    await Promise.all([lookupNewApps(), lookupUpdates()])
+
+    // Later apps with the same name take precedence
+    found
+      .sort((a, b) => Number(a.createdRound - b.createdRound))
+      .forEach((metadata) => {
+        const existing = appLookup[metadata.createdMetadata.name]
+        if (!existing || !knownAppIds.has(existing.appId) || existing.createdRound <= metadata.createdRound) {
+          appLookup[metadata.createdMetadata.name] = metadata
         }
       })
+    Object.values(appLookup).forEach((app) => {
+      app.deleted = deleted.get(app.appId) ?? app.deleted
+    })
 
     const lookup = {
       creator: creatorAddress,
       apps: appLookup,
     }
 
-    this._appLookups.set(creatorString, lookup)
+    await this._appLookupCache.set(creatorString, {
+      lookup,
+      // The lookups are only known to be up to date as of the earliest round that indexer was at
+      round: rounds.length > 0 ? rounds.reduce((min, round) => (round < min ? round : min)) : (cached?.round ?? 0n),
+      appIds,
+    })
 
     return lookup
   }
+
+  private async lookupApp(
+    indexer: IndexerClient,
+    creatorAddress: Address,
+    createdApp: Application,
+  ): Promise<{ currentRound: bigint; metadata?: AppMetadata }> {
+    // Find any app transactions for that app from the round it was created (the creation transaction and any updates)
+    const appTransactions = await searchTransactions(indexer, {
+      minRound: createdApp.createdAtRound,
+      txType: TransactionType.AppCall,
+      applicationId: createdApp.id,
+      address: creatorAddress,
+      addressRole: 'sender',
+      notePrefix: Buffer.from(APP_DEPLOY_NOTE_DAPP).toString('base64'),
+    })
+    const currentRound = appTransactions.currentRound
+
+    // Triple check the transaction is intact by filtering for the one we want:
+    //  * application-id is 0 when the app is first created
+    //  * also verify the sender to prevent a potential security risk
+    const appCreationTransaction = appTransactions.transactions.filter(
+      (t) => t.applicationTransaction?.applicationId === 0n && t.sender.toString() === creatorAddress.toString(),
+    )[0]
+
+    const latestAppUpdateTransaction = this.latestTransaction(
+      appTransactions.transactions.filter((t) => t.sender.toString() === creatorAddress.toString()),
+    )
+
+    if (!appCreationTransaction?.note)
+      // No note; ignoring
+      return { currentRound }
+
+    try {
+      const creationNote = this.parseDeployNote(appCreationTransaction.note)
+      const updateNote = this.parseDeployNote(latestAppUpdateTransaction?.note)
+      if (!creationNote?.name) {
+        return { currentRound }
+      }
+      return {
+        currentRound,
+        metadata: {
+          appId: createdApp.id,
+          appAddress: getApplicationAddress(createdApp.id),
+          createdMetadata: creationNote,
+          createdRound: appCreationTransaction.confirmedRound ?? 0n,
+          ...(updateNote ?? creationNote),
+          updatedRound: latestAppUpdateTransaction?.confirmedRound ?? 0n,
+          deleted: createdApp.deleted ?? false,
+        },
+      }
+    } catch (e) {
+      Config.logger.warn(`Received error trying to retrieve app with ${createdApp.id} for creator ${creatorAddress}; failing silently`, e)
+      return { currentRound }
+    }
+  }
+
+  private latestTransaction(transactions: Transaction[]): Transaction | undefined {
+    return [...transactions].sort((a, b) =>
+      a.confirmedRound === b.confirmedRound
+        ? (b.intraRoundOffset! - a.intraRoundOffset!) / 10
+        : Number(b.confirmedRound! - a.confirmedRound!),
+    )[0]
+  }
+
+  private parseDeployNote(note?: Uint8Array): AppDeployMetadata | undefined {
+    if (!note) {
+      // No note; ignoring...
+      return
+    }
+
+    const noteString = Buffer.from(note).toString('utf-8')
+    if (!noteString.startsWith(`${APP_DEPLOY_NOTE_DAPP}:j{`))
+      // Clearly not APP_DEPLOY JSON; ignoring...
+      return
+
+    return JSON.parse(noteString.substring(APP_DEPLOY_NOTE_DAPP.length + 2)) as AppDeployMetadata
+  }
 }
@@ -0,0 +1,80 @@
+import { AlgodClient } from '@algorandfoundation/algokit-algod-client'
+import { describe, expect, test, vi } from 'vitest'
+import { AppManager } from './app-manager'
+
+const textEncoder = new TextEncoder()
+const textDecoder = new TextDecoder()
+
+// A node at `round` whose boxes hold their name and the round they were last written in; `afterRead` runs after each
+// box read, e.g. to move the node on to the next round
+const fakeAlgod = (round = 10n) => {
+  const node = {
+    round,
+    afterRead: (_name: string) => {},
+    status: vi.fn(async () => ({ lastRound: node.round })),
+    applicationBoxByName: vi.fn(async (_appId: number | bigint, nameRaw: Uint8Array) => {
+      const name = textDecoder.decode(nameRaw)
+      const box = { name: nameRaw, round: node.round, value: textEncoder.encode(`${name}@${node.round}`) }
+      node.afterRead(name)
+      return box
+    }),
+  }
+  return { node, algod: node as unknown as AlgodClient }
+}
+
+const readNames = (node: ReturnType<typeof fakeAlgod>['node']) =>
+  node.applicationBoxByName.mock.calls.map(([, nameRaw]) => textDecoder.decode(nameRaw))
+
+const decode = (values: Uint8Array[]) => values.map((value) => textDecoder.decode(value))
+
+describe('AppManager.getBoxValues', () => {
+  test('reads the values as of the latest round by default, without caching them', async () => {
+    const { node, algod } = fakeAlgod()
+    node.afterRead = () => (node.round += 1n)
+    const appManager = new AppManager(algod)
+
+    expect(decode(await appManager.getBoxValues(1n, ['a', 'b']))).toEqual(['a@10', 'b@11'])
+    expect(decode(await appManager.getBoxValues(1n, ['a', 'b']))).toEqual(['a@12', 'b@13'])
+    expect(node.applicationBoxByName).toHaveBeenCalledTimes(4)
+  })
+
+  test('re-reads the values read in an earlier round for a consistent snapshot', async () => {
+    const { node, algod } = fakeAlgod()
+    node.afterRead = (name) => {
+      if (name === 'a' && node.round === 10n) node.round = 11n
+    }
+    const appManager = new AppManager(algod)
+
+    const values = await appManager.getBoxValues(1n, ['a', 'b', 'c'], { consistentRound: true, maxConcurrency: 1 })
+
+    expect(decode(values)).toEqual(['a@11', 'b@11', 'c@11'])
+    expect(readNames(node)).toEqual(['a', 'b', 'c', 'a'])
+  })
+
+  test('serves the values of a consistent snapshot from the cache in the same round, and re-reads them in a later round', async () => {
+    const { node, algod } = fakeAlgod()
+    const appManager = new AppManager(algod)
+
+    await appManager.getBoxValues(1n, ['a', 'b'], { consistentRound: true })
+    const cached = await appManager.getBoxValues(1n, ['a', 'b'], { consistentRound: true })
+    expect(decode(cached)).toEqual(['a@10', 'b@10'])
+    expect(node.applicationBoxByName).toHaveBeenCalledTimes(2)
+
+    node.round = 11n
+    const reread = await appManager.getBoxValues(1n, ['b', 'c'], { consistentRound: true })
+    expect(decode(reread)).toEqual(['b@11', 'c@11'])
+    expect(readNames(node)).toEqual(['a', 'b', 'b', 'c'])
+  })
+
+  test("doesn't share cached values with callers", async () => {
+    const { algod } = fakeAlgod()
+    const appManager = new AppManager(algod)
+
+    const [read] = await appManager.getBoxValues(1n, ['a'], { consistentRound: true })
+    read.fill(0)
+    const [cached] = await appManager.getBoxValues(1n, ['a'], { consistentRound: true })
+    cached.fill(0)
+
+    expect(decode(await appManager.getBoxValues(1n, ['a'], { consistentRound: true }))).toEqual(['a@10'])
+  })
+})
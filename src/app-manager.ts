@@ -11,6 +11,7 @@ import {
   type CompiledTeal,
   type TealTemplateParams,
 } from './app'
+import { mapWithConcurrency, streamWithConcurrency } from './util'
 
 /** Information about an app. */
 export interface AppInformation {
@@ -84,10 +85,39 @@ export interface BoxValueRequestParams {
   type: ABIType
 }
 
+/**
+ * Options for reading many box values.
+ */
+export interface BoxValuesReadOptions {
+  /** The maximum number of box reads in flight; defaults to 16 */
+  maxConcurrency?: number
+  /**
+   * Whether to return the values as of a single round, for a consistent snapshot of the boxes.
+   *
+   * algod returns box values as of its latest round, so values read in an earlier round than the others are read again
+   * until they all agree; this works for as many boxes as can be read within a round or two. The values read this way are
+   * cached by app, box and round (up to 4 MiB of them), so reading the same boxes again in the same round doesn't make any
+   * requests for them. Reads without `consistentRound` aren't cached.
+   */
+  consistentRound?: boolean
+}
+
+/**
+ * A box value and the round it was read at.
+ */
+export interface BoxValueWithRound {
+  /** The name of the box */
+  name: BoxName
+  /** The box value as a byte array */
+  value: Uint8Array
+  /** The round the value was read at */
+  round: bigint
+}
+
 /**
  * Parameters to get and decode a box value as an ABI type.
  */
-export interface BoxValuesRequestParams {
+export interface BoxValuesRequestParams extends BoxValuesReadOptions {
   /** The ID of the app return box names for */
   appId: bigint
   /** The names of the boxes to return either as a string, binary array or BoxName` */
@@ -96,10 +126,17 @@ export interface BoxValuesRequestParams {
   type: ABIType
 }
 
+const DEFAULT_BOX_READ_CONCURRENCY = 16
+const MAX_BOX_SNAPSHOT_ATTEMPTS = 5
+const MAX_CACHED_BOX_VALUES = 10_000
+const MAX_CACHED_BOX_BYTES = 4 * 1024 * 1024
+
 /** Allows management of application information. */
 export class AppManager {
   private _algod: AlgodClient
   private _compilationResults: Record<string, CompiledTeal> = {}
+  private _boxValues = new Map<string, Uint8Array>()
+  private _boxValueBytes = 0
 
   /**
    * Creates an `AppManager`
@@ -300,14 +337,47 @@ export class AppManager {
    * Returns the value of the given box names for the given app.
    * @param appId The ID of the app return box names for
    * @param boxNames The names of the boxes to return either as a string, binary array or `BoxName`
+   * @param options The concurrency and consistency of the reads; by default at most 16 boxes are read at a time
    * @returns The current box values as a byte array in the same order as the passed in box names
    * @example
    * ```typescript
    * const boxValues = await appManager.getBoxValues(12353n, ['boxName1', 'boxName2']);
    * ```
    */
-  public async getBoxValues(appId: bigint, boxNames: (BoxIdentifier | BoxName)[]): Promise<Uint8Array[]> {
-    return await Promise.all(boxNames.map(async (boxName) => await this.getBoxValue(appId, boxName)))
+  public async getBoxValues(appId: bigint, boxNames: (BoxIdentifier | BoxName)[], options?: BoxValuesReadOptions): Promise<Uint8Array[]> {
+    return (await this.readBoxValues(appId, boxNames.map(AppManager.getBoxName), options)).map((box) => box.value)
+  }
+
+  /**
+   * Reads the values of the given box names for the given app, yielding each value as soon as it's read.
+   *
+   * With `consistentRound`, the values are yielded once they've all been read as of the same round.
+   * @param appId The ID of the app return box values for
+   * @param boxNames The names of the boxes to return either as a string, binary array or `BoxName`
+   * @param options The concurrency and consistency of the reads
+   * @returns An async generator of the box values, along with their names and the round they were read at
+   * @example
+   * ```typescript
+   * const boxNames = await appManager.getBoxNames(12353n)
+   * for await (const { name, value } of appManager.streamBoxValues(12353n, boxNames, { maxConcurrency: 32 })) {
+   *   console.log(name.name, value)
+   * }
+   * ```
+   */
+  public async *streamBoxValues(
+    appId: bigint,
+    boxNames: (BoxIdentifier | BoxName)[],
+    options?: BoxValuesReadOptions,
+  ): AsyncGenerator<BoxValueWithRound, void> {
+    const names = boxNames.map(AppManager.getBoxName)
+    if (options?.consistentRound) {
+      yield* await this.readBoxValues(appId, names, options)
+      return
+    }
+    const concurrency = options?.maxConcurrency ?? DEFAULT_BOX_READ_CONCURRENCY
+    for await (const { result } of streamWithConcurrency(names, concurrency, (name) => this.readBoxValue(appId, name))) {
+      yield result
+    }
   }
 
   /**
@@ -335,8 +405,84 @@ export class AppManager {
    * ```
    */
   public async getBoxValuesFromABIType(request: BoxValuesRequestParams): Promise<ABIValue[]> {
-    const { appId, boxNames, type } = request
-    return await Promise.all(boxNames.map(async (boxName) => await this.getBoxValueFromABIType({ appId, boxName, type })))
+    const { appId, boxNames, type, ...options } = request
+    const values = await this.getBoxValues(appId, boxNames, options)
+    return values.map((value) => type.decode(value))
+  }
+
+  private async readBoxValues(appId: bigint, names: BoxName[], options?: BoxValuesReadOptions): Promise<BoxValueWithRound[]> {
+    const concurrency = options?.maxConcurrency ?? DEFAULT_BOX_READ_CONCURRENCY
+    if (!options?.consistentRound) {
+      return await mapWithConcurrency(names, concurrency, (name) => this.readBoxValue(appId, name))
+    }
+
+    let round = BigInt((await this._algod.status()).lastRound)
+    const values = new Array<BoxValueWithRound | undefined>(names.length)
+    for (let attempt = 0; attempt < MAX_BOX_SNAPSHOT_ATTEMPTS; attempt++) {
+      // Values already known as of the snapshot round are kept (or served from the cache); the rest are (re-)read
+      const toRead: number[] = []
+      names.forEach((name, i) => {
+        if (values[i]?.round === round) return
+        const cached = this._boxValues.get(AppManager.boxValueKey(appId, name, round))
+        if (cached) {
+          values[i] = { name, value: cached.slice(), round }
+        } else {
+          toRead.push(i)
+        }
+      })
+      if (toRead.length === 0) {
+        return values as BoxValueWithRound[]
+      }
+
+      for await (const { index, result } of streamWithConcurrency(toRead, concurrency, (i) => this.readBoxValue(appId, names[i], true))) {
+        values[toRead[index]] = result
+        // The node moved on to a later round, so that becomes the snapshot round
+        if (result.round > round) round = result.round
+      }
+      if (values.every((value) => value?.round === round)) {
+        return values as BoxValueWithRound[]
+      }
+    }
+
+    throw new Error(
+      `Unable to read a consistent snapshot of ${names.length} boxes for app ${appId} after ${MAX_BOX_SNAPSHOT_ATTEMPTS} attempts; the values kept changing round`,
+    )
+  }
+
+  private async readBoxValue(appId: bigint, name: BoxName, cache = false): Promise<BoxValueWithRound> {
+    const box = await this._algod.applicationBoxByName(appId, name.nameRaw)
+    if (cache) {
+      // Cached values are copied in and out, so callers changing the returned values don't change the cache
+      this.cacheBoxValue(AppManager.boxValueKey(appId, name, box.round), box.value.slice())
+    }
+    return { name, value: box.value, round: box.round }
+  }
+
+  // Keeps the most recently read values, evicting the oldest ones beyond the entry and byte bounds
+  private cacheBoxValue(key: string, value: Uint8Array) {
+    if (value.byteLength > MAX_CACHED_BOX_BYTES) return
+    const existing = this._boxValues.get(key)
+    if (existing) {
+      this._boxValues.delete(key)
+      this._boxValueBytes -= existing.byteLength
+    }
+    this._boxValues.set(key, value)
+    this._boxValueBytes += value.byteLength
+    while (this._boxValues.size > MAX_CACHED_BOX_VALUES || this._boxValueBytes > MAX_CACHED_BOX_BYTES) {
+      const [oldestKey, oldest] = this._boxValues.entries().next().value!
+      this._boxValues.delete(oldestKey)
+      this._boxValueBytes -= oldest.byteLength
+    }
+  }
+
+  private static boxValueKey(appId: bigint, name: BoxName, round: bigint) {
+    return `${appId}:${name.nameBase64}:${round}`
+  }
+
+  private static getBoxName(boxName: BoxIdentifier | BoxName): BoxName {
+    if (typeof boxName === 'object' && 'nameRaw' in boxName) return boxName
+    const nameRaw = AppManager.getBoxReference(boxName).name
+    return { nameRaw, nameBase64: Buffer.from(nameRaw).toString('base64'), name: Buffer.from(nameRaw).toString('utf-8') }
   }
 
   /**
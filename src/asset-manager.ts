@@ -3,8 +3,9 @@ import { Address, MAX_TRANSACTION_GROUP_SIZE } from '@algorandfoundation/algokit
 import { AccountAssetInformation } from './account'
 import { CommonTransactionParams, TransactionComposer, TransactionComposerConfig } from './composer'
 import { Config } from './config'
+import { PipelinedGroupResult, PipelinedSendParams, sendTransactionGroups } from './transaction/send-pipeline'
 import { SendParams } from './transaction/types'
-import { chunkArray } from './util'
+import { chunkArray, mapWithConcurrency } from './util'
 
 /** Individual result from performing a bulk opt-in or bulk opt-out for an account against a series of assets. */
 export interface BulkAssetOptInOutResult {
@@ -14,6 +15,14 @@ export interface BulkAssetOptInOutResult {
   transactionId: string
 }
 
+/**
+ * Parameters to control sending the groups of a bulk opt-in or opt-out; see `sendTransactionGroups`.
+ *
+ * The groups only hold asset transfers, so there are no app call resources or inner transaction fees to simulate for:
+ * `populateAppCallResources` and `coverAppCallInnerTransactionFees` are accepted, but have no effect.
+ */
+export type BulkOptInOutSendParams = SendParams & Pick<PipelinedSendParams, 'maxGroupsInFlight'>
+
 /** Information about an asset. */
 export interface AssetInformation {
   /** The ID of the asset. */
@@ -135,6 +144,8 @@ export interface AssetInformation {
   metadataHash?: Uint8Array
 }
 
+const ASSET_LOOKUP_CONCURRENCY = 16
+
 /**
  * Allows management of asset information.
  * @see {@link AlgorandClient} for the main entry point that provides access to this manager
@@ -220,7 +231,8 @@ export class AssetManager {
   /**
    * Opt an account in to a list of Algorand Standard Assets.
    *
-   * Transactions will be sent in batches of 16 as transaction groups.
+   * Transactions will be sent in batches of 16 as transaction groups, with up to `maxGroupsInFlight` (by default 8) groups
+   * being sent and confirmed at a time; if any group fails, an error is thrown once the others have been sent.
    *
    * @param account The account to opt-in
    * @param assetIds The list of asset IDs to opt-in to
@@ -237,40 +249,39 @@ export class AssetManager {
   async bulkOptIn(
     account: string | Address,
     assetIds: bigint[],
-    options?: Omit<CommonTransactionParams, 'sender'> & SendParams,
+    options?: Omit<CommonTransactionParams, 'sender'> & BulkOptInOutSendParams,
   ): Promise<BulkAssetOptInOutResult[]> {
-    const results: BulkAssetOptInOutResult[] = []
-
-    for (const assetGroup of chunkArray(assetIds, MAX_TRANSACTION_GROUP_SIZE)) {
-      const composer = this._newGroup()
-
-      for (const assetId of assetGroup) {
-        composer.addAssetOptIn({
-          ...options,
-          sender: account,
-          assetId: BigInt(assetId),
-        })
-      }
-
-      const result = await composer.send(options)
+    const assetGroups = [...chunkArray(assetIds, MAX_TRANSACTION_GROUP_SIZE)]
+
+    const groupResults = await sendTransactionGroups(
+      this._algod,
+      assetGroups.map((assetGroup) => () => {
+        const composer = this._newGroup()
+        for (const assetId of assetGroup) {
+          composer.addAssetOptIn({
+            ...options,
+            sender: account,
+            assetId: BigInt(assetId),
+          })
+        }
+        return composer
+      }),
+      options,
+    )
 
+    return this.bulkResults(assetGroups, groupResults, (assetGroup, result) =>
       Config.getLogger(options?.suppressLog).info(
         `Successfully opted in ${account} for assets ${assetGroup.join(', ')} with transaction IDs ${result.txIds.join(', ')}` +
           `\n  Grouped under ${result.groupId} in round ${result.confirmations?.[0]?.confirmedRound}.`,
-      )
-
-      assetGroup.forEach((assetId, index) => {
-        results.push({ assetId: BigInt(assetId), transactionId: result.txIds[index] })
-      })
-    }
-
-    return results
+      ),
+    )
   }
 
   /**
    * Opt an account out of a list of Algorand Standard Assets.
    *
-   * Transactions will be sent in batches of 16 as transaction groups.
+   * Transactions will be sent in batches of 16 as transaction groups, with up to `maxGroupsInFlight` (by default 8) groups
+   * being sent and confirmed at a time; if any group fails, an error is thrown once the others have been sent.
    *
    * @param account The account to opt-in
    * @param assetIds The list of asset IDs to opt-out of
@@ -288,7 +299,7 @@ export class AssetManager {
     account: string | Address,
     assetIds: bigint[],
     options?: Omit<CommonTransactionParams, 'sender'> &
-      SendParams & {
+      BulkOptInOutSendParams & {
         /** Whether or not to check if the account has a zero balance for each asset first or not.
          *
          * Defaults to `true`.
@@ -300,25 +311,16 @@ export class AssetManager {
         ensureZeroBalance?: boolean
       },
   ): Promise<BulkAssetOptInOutResult[]> {
-    const results: BulkAssetOptInOutResult[] = []
-
-    for (const assetGroup of chunkArray(assetIds, MAX_TRANSACTION_GROUP_SIZE)) {
-      const composer = this._newGroup()
-
-      const notOptedInAssetIds: bigint[] = []
-      const nonZeroBalanceAssetIds: bigint[] = []
-      for (const assetId of assetGroup) {
-        if (options?.ensureZeroBalance !== false) {
-          try {
-            const accountAssetInfo = await this.getAccountInformation(account, assetId)
-            if (accountAssetInfo.balance !== 0n) {
-              nonZeroBalanceAssetIds.push(BigInt(assetId))
-            }
-          } catch {
-            notOptedInAssetIds.push(BigInt(assetId))
-          }
+    if (options?.ensureZeroBalance !== false) {
+      const balances = await mapWithConcurrency(assetIds, ASSET_LOOKUP_CONCURRENCY, async (assetId) => {
+        try {
+          return (await this.getAccountInformation(account, assetId)).balance
+        } catch {
+          return undefined
         }
-      }
+      })
+      const notOptedInAssetIds = assetIds.filter((_, i) => balances[i] === undefined).map(BigInt)
+      const nonZeroBalanceAssetIds = assetIds.filter((_, i) => balances[i] !== undefined && balances[i] !== 0n).map(BigInt)
 
       if (notOptedInAssetIds.length > 0 || nonZeroBalanceAssetIds.length > 0) {
         throw new Error(
@@ -329,28 +331,49 @@ export class AssetManager {
           }; can't opt-out.`,
         )
       }
+    }
 
-      for (const assetId of assetGroup) {
-        composer.addAssetOptOut({
-          ...options,
-          creator: (await this.getById(BigInt(assetId))).creator,
-          sender: account,
-          assetId: BigInt(assetId),
-        })
-      }
-
-      const result = await composer.send(options)
+    const creators = await mapWithConcurrency(assetIds, ASSET_LOOKUP_CONCURRENCY, async (assetId) => (await this.getById(BigInt(assetId))).creator)
+    const creatorsByAssetId = new Map(assetIds.map((assetId, i) => [BigInt(assetId), creators[i]]))
+    const assetGroups = [...chunkArray(assetIds, MAX_TRANSACTION_GROUP_SIZE)]
+
+    const groupResults = await sendTransactionGroups(
+      this._algod,
+      assetGroups.map((assetGroup) => () => {
+        const composer = this._newGroup()
+        for (const assetId of assetGroup) {
+          composer.addAssetOptOut({
+            ...options,
+            creator: creatorsByAssetId.get(BigInt(assetId))!,
+            sender: account,
+            assetId: BigInt(assetId),
+          })
+        }
+        return composer
+      }),
+      options,
+    )
 
+    return this.bulkResults(assetGroups, groupResults, (assetGroup, result) =>
       Config.getLogger(options?.suppressLog).info(
         `Successfully opted ${account} out of assets ${assetGroup.join(', ')} with transaction IDs ${result.txIds.join(', ')}` +
           `\n  Grouped under ${result.groupId} in round ${result.confirmations?.[0]?.confirmedRound}.`,
-      )
+      ),
+    )
+  }
 
-      assetGroup.forEach((assetId, index) => {
-        results.push({ assetId: BigInt(assetId), transactionId: result.txIds[index] })
-      })
+  private bulkResults(
+    assetGroups: bigint[][],
+    groupResults: PipelinedGroupResult[],
+    logSuccess: (assetGroup: bigint[], result: PipelinedGroupResult) => void,
+  ): BulkAssetOptInOutResult[] {
+    const failed = groupResults.find((result) => result.error)
+    groupResults.filter((result) => !result.error).forEach((result) => logSuccess(assetGroups[result.index], result))
+    if (failed) {
+      throw failed.error
     }
-
-    return results
+    return groupResults.flatMap((result) =>
+      assetGroups[result.index].map((assetId, index) => ({ assetId: BigInt(assetId), transactionId: result.txIds[index] })),
+    )
   }
 }
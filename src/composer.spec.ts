@@ -75,6 +75,18 @@ describe('TransactionComposer', () => {
       await expect(composer.send()).rejects.toThrow('ASSET MISSING!')
     })
 
+    test('transforms errors from sending the group other than with send', async () => {
+      const composer = fixture.context.algorand.newGroup()
+
+      errorTransformers.forEach((errorTransformer) => {
+        composer.registerErrorTransformer(errorTransformer)
+      })
+
+      await expect(composer.transformSendError(new Error('asset 1337 missing from account'))).resolves.toMatchObject({
+        message: 'ASSET MISSING!',
+      })
+    })
+
     test('not throw error from simulate when the flag is set', async () => {
       const algorand = fixture.context.algorand
       const sender = fixture.context.testAccount
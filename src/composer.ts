@@ -25,7 +25,7 @@ import {
 } from '@algorandfoundation/algokit-transact'
 import { Buffer } from 'buffer'
 import { Config } from './config'
-import { TransactionWithSigner, waitForConfirmation } from './transaction'
+import { TransactionWithSigner, waitForConfirmations } from './transaction'
 import {
   buildAppCall,
   buildAppCreate,
@@ -52,6 +52,7 @@ import { AlgoAmount } from './amount'
 import { AppManager } from './app-manager'
 import { EventType } from './lifecycle-events'
 import { genesisIdIsLocalNet } from './network-client'
+import { SimulateBatcher } from './transaction/simulate-batcher'
 import { Arc2TransactionNote, SendParams, SendTransactionComposerResults } from './transaction/types'
 import {
   buildAssetConfig,
@@ -208,6 +209,12 @@ export type TransactionComposerParams = {
    */
   errorTransformers?: ErrorTransformer[]
   composerConfig?: TransactionComposerConfig
+  /**
+   * A batcher to send this composer's simulate requests through, along with those of other composers (see `SimulateBatcher`).
+   *
+   * If not specified then each simulate request is sent on its own.
+   */
+  simulateBatcher?: SimulateBatcher
 }
 
 /** Set of transactions built by `TransactionComposer`. */
@@ -246,6 +253,8 @@ export class TransactionComposer {
 
   private composerConfig: TransactionComposerConfig
 
+  private simulateBatcher?: SimulateBatcher
+
   private transactionsWithSigners?: TransactionWithSigner[]
 
   private signedTransactions?: Uint8Array[]
@@ -307,6 +316,7 @@ export class TransactionComposer {
       coverAppCallInnerTransactionFees: false,
       populateAppCallResources: true,
     }
+    this.simulateBatcher = params.simulateBatcher
   }
 
   private cloneTransaction(txn: Txn): Txn {
@@ -449,6 +459,21 @@ export class TransactionComposer {
     return this
   }
 
+  /**
+   * Runs the registered error transformers on an error from sending the transaction group other than with `send`
+   * (e.g. with `sendTransactionGroups`), as `send` does on its own errors.
+   *
+   * The signed transactions of the group are attached to the error as `sentTransactions`, for the transformers to use.
+   * @param error The error to transform
+   * @returns The transformed error, or the error as is if it isn't an `Error`
+   */
+  async transformSendError(error: unknown): Promise<unknown> {
+    if (error instanceof Error && this.transactionsWithSigners) {
+      Object.assign(error, { sentTransactions: this.transactionsWithSigners.map((t) => t.txn) })
+    }
+    return await this.transformError(error)
+  }
+
   /**
    * Add a pre-built transaction to the transaction group.
    * @param transaction The pre-built transaction
@@ -1639,6 +1664,10 @@ export class TransactionComposer {
     }
   }
 
+  private simulateRequest(request: SimulateRequest): Promise<SimulateResponse> {
+    return this.simulateBatcher ? this.simulateBatcher.simulate(request) : this.algod.simulateTransactions(request)
+  }
+
   private async analyzeGroupRequirements(
     transactions: Transaction[],
     suggestedParams: SuggestedParams,
@@ -1700,7 +1729,7 @@ export class TransactionComposer {
       },
     }
 
-    const response = await this.algod.simulateTransactions(simulateRequest)
+    const response = await this.simulateRequest(simulateRequest)
     const groupResponse = response.txnGroups[0]
 
     // Handle any simulation failures
@@ -1887,7 +1916,7 @@ export class TransactionComposer {
 
       let confirmations = new Array<PendingTransactionResponse>()
       if (params?.maxRoundsToWaitForConfirmation !== 0) {
-        confirmations = await Promise.all(transactionIds.map(async (id) => await waitForConfirmation(id, waitRounds, this.algod)))
+        confirmations = await waitForConfirmations(transactionIds, waitRounds, this.algod)
       }
 
       const abiReturns = this.parseAbiReturnValues(confirmations)
@@ -2060,7 +2089,7 @@ export class TransactionComposer {
         : undefined),
     } satisfies SimulateRequest
 
-    const simulateResponse = await this.algod.simulateTransactions(simulateRequest)
+    const simulateResponse = await this.simulateRequest(simulateRequest)
     const simulateResult = simulateResponse.txnGroups[0]
 
     if (simulateResult?.failureMessage && !resultOnFailure) {
@@ -38,10 +38,13 @@ export { AppClient } from './app-client'
 export type { AppClientParams, ResolveAppClientByCreatorAndName } from './app-client'
 export { AppDeployer } from './app-deployer'
 export type {
+  AppDeployerOptions,
   AppDeployParams,
   AppDeployResult,
   AppLookup,
+  AppLookupCache,
   AppMetadata,
+  CachedAppLookup,
   DeployAppDeleteMethodCall,
   DeployAppDeleteParams,
   DeployAppUpdateMethodCall,
@@ -50,9 +53,17 @@ export type {
 export { AppFactory } from './app-factory'
 export type { AppFactoryParams } from './app-factory'
 export { AppManager } from './app-manager'
-export type { AppInformation, BoxIdentifier, BoxReference, BoxValueRequestParams, BoxValuesRequestParams } from './app-manager'
+export type {
+  AppInformation,
+  BoxIdentifier,
+  BoxReference,
+  BoxValueRequestParams,
+  BoxValuesReadOptions,
+  BoxValuesRequestParams,
+  BoxValueWithRound,
+} from './app-manager'
 export { AssetManager } from './asset-manager'
-export type { AssetInformation, BulkAssetOptInOutResult } from './asset-manager'
+export type { AssetInformation, BulkAssetOptInOutResult, BulkOptInOutSendParams } from './asset-manager'
 export { AsyncEventEmitter } from './async-event-emitter'
 export { ClientManager } from './client-manager'
 export type {
@@ -81,6 +92,8 @@ export type {
 export { TestNetDispenserApiClient } from './dispenser-client'
 export type { LookupAssetHoldingsOptions } from './indexer'
 export { KmdAccountManager } from './kmd-account-manager'
+export { KmdBatchSigner } from './kmd-batch-signer'
+export type { KmdBatchSignerOptions } from './kmd-batch-signer'
 export { genesisIdIsLocalNet } from './network-client'
 export type { AlgoClientConfig, AlgoConfig, NetworkDetails } from './network-client'
 export { LocalNetManager, NetworkManager } from './network-manager'
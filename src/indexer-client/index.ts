@@ -2,4 +2,5 @@
  * @module algokit-utils/indexer-client
  */
 export * from '@algorandfoundation/algokit-indexer-client'
+export * from './indexer-backfill'
 export * from './indexer-lookup'
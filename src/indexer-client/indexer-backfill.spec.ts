@@ -0,0 +1,135 @@
+import { IndexerClient, Transaction } from '@algorandfoundation/algokit-indexer-client'
+import { describe, expect, test, vi } from 'vitest'
+import { BackfillBatch, backfillTransactions } from './indexer-backfill'
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+type SearchCriteria = { minRound: bigint; maxRound: bigint; limit: number; next?: string }
+
+// An indexer with `perRound` transactions in each of the given rounds, that takes longer to search earlier rounds (so
+// later shards finish first); the `next` token of a page is the offset of the page after it
+const fakeIndexer = (rounds: number[], perRound = 1) => {
+  const transactions = rounds.flatMap((round) =>
+    Array.from({ length: perRound }, (_, i) => ({ id: `${round}-${i}`, confirmedRound: BigInt(round) }) as Transaction),
+  )
+  const failing = new Set<bigint>()
+  const searchForTransactions = vi.fn(async ({ minRound, maxRound, limit, next }: SearchCriteria) => {
+    await sleep(Math.max(1, 20 - Number(minRound) / 10))
+    if (failing.has(minRound)) throw new Error(`search from round ${minRound} failed`)
+    const matching = transactions.filter((t) => t.confirmedRound! >= minRound && t.confirmedRound! <= maxRound)
+    const offset = Number(next ?? 0)
+    return {
+      currentRound: 1000n,
+      transactions: matching.slice(offset, offset + limit),
+      nextToken: offset + limit < matching.length ? `${offset + limit}` : undefined,
+    }
+  })
+  return { indexer: { searchForTransactions } as unknown as IndexerClient, searchForTransactions, failing }
+}
+
+const collect = async (batches: AsyncIterable<BackfillBatch>) => {
+  const collected: BackfillBatch[] = []
+  for await (const batch of batches) collected.push(batch)
+  return collected
+}
+
+const ids = (batches: BackfillBatch[]) => batches.flatMap((batch) => batch.transactions.map((t) => t.id))
+
+describe('backfillTransactions', () => {
+  test('emits the transactions in round order, however the shards finish', async () => {
+    const rounds = [1, 5, 12, 18, 25, 33, 47, 50]
+    const { indexer, searchForTransactions } = fakeIndexer(rounds)
+
+    const batches = await collect(backfillTransactions(indexer, {}, { minRound: 1, maxRound: 50, shardRounds: 10, paginationLimit: 2 }))
+
+    expect(ids(batches)).toEqual(rounds.map((round) => `${round}-0`))
+    expect(new Set(searchForTransactions.mock.calls.map(([{ minRound }]) => minRound))).toEqual(new Set([1n, 11n, 21n, 31n, 41n]))
+    const checkpoints = batches.map(({ checkpoint }) => checkpoint.nextRound)
+    expect(checkpoints).toEqual([...checkpoints].sort((a, b) => Number(a - b)))
+    expect(batches[batches.length - 1].checkpoint).toEqual({ nextRound: 51n, maxRound: 50n })
+  })
+
+  test('keeps the transactions of a round together across pages', async () => {
+    const { indexer } = fakeIndexer([1, 2, 3, 4], 3)
+
+    const batches = await collect(backfillTransactions(indexer, {}, { minRound: 1, maxRound: 4, paginationLimit: 2 }))
+
+    expect(ids(batches)).toHaveLength(12)
+    for (const { transactions, checkpoint } of batches) {
+      const batchRounds = new Set(transactions.map((t) => t.confirmedRound))
+      batchRounds.forEach((round) => expect(transactions.filter((t) => t.confirmedRound === round)).toHaveLength(3))
+      if (transactions.length > 0) expect(checkpoint.nextRound).toBe(transactions[transactions.length - 1].confirmedRound! + 1n)
+    }
+  })
+
+  test('checkpoints past ranges without any transactions', async () => {
+    const { indexer } = fakeIndexer([5])
+
+    const batches = await collect(backfillTransactions(indexer, {}, { minRound: 1, maxRound: 30, shardRounds: 10 }))
+
+    expect(batches.map(({ transactions, checkpoint }) => [transactions.length, checkpoint.nextRound])).toEqual([
+      [1, 6n],
+      [0, 11n],
+      [0, 21n],
+      [0, 31n],
+    ])
+  })
+
+  test('carries on from a checkpoint without repeating or missing transactions', async () => {
+    const rounds = Array.from({ length: 40 }, (_, i) => i + 1)
+    const options = { minRound: 1, maxRound: 40, shardRounds: 10, paginationLimit: 3 }
+    const { indexer, searchForTransactions } = fakeIndexer(rounds)
+
+    const before: BackfillBatch[] = []
+    for await (const batch of backfillTransactions(indexer, {}, options)) {
+      before.push(batch)
+      if (batch.checkpoint.nextRound > 15n) break
+    }
+    const checkpoint = before[before.length - 1].checkpoint
+    searchForTransactions.mockClear()
+    const after = await collect(backfillTransactions(indexer, {}, { ...options, resumeFrom: checkpoint }))
+
+    expect([...ids(before), ...ids(after)]).toEqual(rounds.map((round) => `${round}-0`))
+    expect(searchForTransactions.mock.calls.every(([{ minRound }]) => minRound >= checkpoint.nextRound)).toBe(true)
+  })
+
+  test('splits a dense shard between idle workers', async () => {
+    const rounds = Array.from({ length: 400 }, (_, i) => i + 1)
+    const { indexer, searchForTransactions } = fakeIndexer(rounds)
+
+    const options = { minRound: 1, maxRound: 400, shardRounds: 400, minShardRounds: 10, maxConcurrency: 4, paginationLimit: 20 }
+    const batches = await collect(backfillTransactions(indexer, {}, options))
+
+    expect(ids(batches)).toEqual(rounds.map((round) => `${round}-0`))
+    const shardStarts = new Set(searchForTransactions.mock.calls.filter(([{ next }]) => !next).map(([{ minRound }]) => minRound))
+    expect(shardStarts.size).toBeGreaterThan(1)
+  })
+
+  test('throws the error of a failed shard once the shards before it are emitted', async () => {
+    const { indexer, failing } = fakeIndexer([1, 15, 25])
+    failing.add(21n)
+
+    const batches: BackfillBatch[] = []
+    const consume = async () => {
+      for await (const batch of backfillTransactions(indexer, {}, { minRound: 1, maxRound: 30, shardRounds: 10 })) batches.push(batch)
+    }
+
+    await expect(consume()).rejects.toThrow('search from round 21 failed')
+    expect(ids(batches)).toEqual(['1-0', '15-0'])
+  })
+
+  test('stops searching when the caller stops early', async () => {
+    const { indexer, searchForTransactions } = fakeIndexer(Array.from({ length: 100 }, (_, i) => i + 1))
+
+    for await (const batch of backfillTransactions(indexer, {}, { minRound: 1, maxRound: 100, shardRounds: 10, maxConcurrency: 2 })) {
+      expect(batch.transactions.length).toBeGreaterThan(0)
+      break
+    }
+    await sleep(50)
+    const searches = searchForTransactions.mock.calls.length
+    await sleep(50)
+
+    expect(searchForTransactions).toHaveBeenCalledTimes(searches)
+    expect(searches).toBeLessThan(10)
+  })
+})
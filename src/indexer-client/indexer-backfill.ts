@@ -0,0 +1,227 @@
+import { IndexerClient, Transaction } from '@algorandfoundation/algokit-indexer-client'
+import { SearchForTransactionsCriteria } from './indexer-lookup'
+
+const DEFAULT_SHARD_ROUNDS = 10_000
+const DEFAULT_MIN_SHARD_ROUNDS = 100
+const DEFAULT_MAX_CONCURRENCY = 4
+const DEFAULT_MAX_BUFFERED_PAGES = 8
+const DEFAULT_PAGINATION_LIMIT = 1000
+
+/** How far a backfill has got; pass it back in as `resumeFrom` to carry on from there. */
+export interface BackfillCheckpoint {
+  /** The first round that hasn't been backfilled yet; all transactions before it have been emitted */
+  nextRound: bigint
+  /** The last round of the backfill */
+  maxRound: bigint
+}
+
+/** Options to control a transaction backfill. */
+export interface TransactionBackfillOptions {
+  /** The first round to backfill; ignored when resuming from a checkpoint */
+  minRound: number | bigint
+  /** The last round to backfill */
+  maxRound: number | bigint
+  /** A checkpoint from an earlier backfill to carry on from */
+  resumeFrom?: BackfillCheckpoint
+  /** The number of rounds in each shard the range is split into up front, default 10,000 */
+  shardRounds?: number
+  /** Dense shards are split further while there's idle capacity, but never into shards of fewer than this many rounds, default 100 */
+  minShardRounds?: number
+  /** The maximum number of shards being searched at a time, default 4 */
+  maxConcurrency?: number
+  /** The maximum number of pages a shard buffers before waiting for them to be emitted, default 8 */
+  maxBufferedPages?: number
+  /** The number of records to return per paginated request, default 1000 */
+  paginationLimit?: number
+}
+
+/** A batch of backfilled transactions. */
+export interface BackfillBatch {
+  /** The transactions, in round order; these are always whole rounds, and there may be none if a range had no matches */
+  transactions: Transaction[]
+  /** The checkpoint to resume from once the transactions have been processed */
+  checkpoint: BackfillCheckpoint
+}
+
+interface Shard {
+  minRound: bigint
+  maxRound: bigint
+  started: boolean
+  done: boolean
+  /** Whole rounds of transactions that haven't been emitted yet */
+  buffered: Transaction[][]
+  error?: unknown
+}
+
+/**
+ * Backfills the transactions matching the given criteria over a (potentially huge) round range, by searching shards of the
+ * range concurrently rather than following one pagination cursor.
+ *
+ * The range is split into shards of `shardRounds` rounds, which are searched by up to `maxConcurrency` workers. When a
+ * shard turns out to be dense (it has more pages) and there's no other work for the workers, the rest of it is split in
+ * two so an idle worker can take on the second half. The results go through a reorder buffer, so they're emitted in
+ * round order regardless of which shard finishes first, and at most `maxBufferedPages` pages per shard are held before
+ * the shard waits for them to be consumed.
+ *
+ * Each batch comes with a checkpoint; persist it once the batch has been processed and pass it back in as `resumeFrom`
+ * to carry on from there after a restart.
+ *
+ * @param indexer An indexer client
+ * @param searchCriteria The criteria to search for
+ * @param options The round range and options to control the backfill
+ * @returns An async iterator of batches of transactions, in round order
+ * @example
+ * ```typescript
+ * for await (const { transactions, checkpoint } of backfillTransactions(
+ *   algorand.client.indexer,
+ *   { txType: 'appl', applicationId: 1234n },
+ *   { minRound: 1, maxRound: 40_000_000, resumeFrom: await loadCheckpoint() },
+ * )) {
+ *   await store(transactions)
+ *   await saveCheckpoint(checkpoint)
+ * }
+ * ```
+ */
+export async function* backfillTransactions(
+  indexer: IndexerClient,
+  searchCriteria: Omit<SearchForTransactionsCriteria, 'minRound' | 'maxRound'>,
+  options: TransactionBackfillOptions,
+): AsyncGenerator<BackfillBatch> {
+  const maxRound = BigInt(options.maxRound)
+  const shardRounds = BigInt(Math.max(1, options.shardRounds ?? DEFAULT_SHARD_ROUNDS))
+  const minShardRounds = BigInt(Math.max(1, options.minShardRounds ?? DEFAULT_MIN_SHARD_ROUNDS))
+  const maxConcurrency = Math.max(1, options.maxConcurrency ?? DEFAULT_MAX_CONCURRENCY)
+  const maxBufferedPages = Math.max(1, options.maxBufferedPages ?? DEFAULT_MAX_BUFFERED_PAGES)
+  const limit = options.paginationLimit ?? DEFAULT_PAGINATION_LIMIT
+  // Shards are created as they're needed, up to this many ahead of the one being emitted
+  const maxShardsAhead = maxConcurrency * 2
+
+  let nextRound = options.resumeFrom?.nextRound ?? BigInt(options.minRound)
+  let nextShardRound = nextRound
+  const shards: Shard[] = []
+  let stopped = false
+
+  // Workers and the consumer wait for each other through a shared signal
+  let notify = () => {}
+  let changed = new Promise<void>((resolve) => (notify = resolve))
+  const signal = () => {
+    const notifyWaiters = notify
+    changed = new Promise<void>((resolve) => (notify = resolve))
+    notifyWaiters()
+  }
+
+  const canCreateShard = () => nextShardRound <= maxRound && shards.length < maxShardsAhead
+  const nextShard = (): Shard | undefined => {
+    const unstarted = shards.find((shard) => !shard.started)
+    if (unstarted || !canCreateShard()) return unstarted
+    const shardMaxRound = nextShardRound + shardRounds - 1n < maxRound ? nextShardRound + shardRounds - 1n : maxRound
+    const shard: Shard = { minRound: nextShardRound, maxRound: shardMaxRound, started: false, done: false, buffered: [] }
+    nextShardRound = shardMaxRound + 1n
+    shards.push(shard)
+    return shard
+  }
+
+  const searchShard = async (shard: Shard) => {
+    let nextToken: string | undefined = undefined
+    // The transactions of the last round of a page, which may carry on in the next page
+    let lastRoundTransactions: Transaction[] = []
+    while (!stopped) {
+      while (shard.buffered.length >= maxBufferedPages && !stopped) {
+        await changed
+      }
+
+      const response = await indexer.searchForTransactions({
+        ...searchCriteria,
+        minRound: shard.minRound,
+        maxRound: shard.maxRound,
+        limit,
+        next: nextToken,
+      })
+      const transactions = [...lastRoundTransactions, ...response.transactions]
+      if (!response.nextToken || response.transactions.length === 0) {
+        if (transactions.length > 0) shard.buffered.push(transactions)
+        return
+      }
+
+      const lastRound = transactions[transactions.length - 1].confirmedRound ?? 0n
+      const wholeRounds = transactions.filter((t) => (t.confirmedRound ?? 0n) < lastRound)
+      lastRoundTransactions = transactions.slice(wholeRounds.length)
+      if (wholeRounds.length > 0) {
+        shard.buffered.push(wholeRounds)
+        signal()
+      }
+
+      // Split the rest of a dense shard if the other workers have nothing to do; this shard starts again from the last round
+      const remainingRounds = shard.maxRound - lastRound + 1n
+      if (wholeRounds.length > 0 && remainingRounds >= 2n * minShardRounds && !shards.some((s) => !s.started) && !canCreateShard()) {
+        const splitRound = lastRound + remainingRounds / 2n
+        shards.splice(shards.indexOf(shard) + 1, 0, {
+          minRound: splitRound,
+          maxRound: shard.maxRound,
+          started: false,
+          done: false,
+          buffered: [],
+        })
+        shard.minRound = lastRound
+        shard.maxRound = splitRound - 1n
+        nextToken = undefined
+        lastRoundTransactions = []
+        signal()
+        continue
+      }
+      nextToken = response.nextToken
+    }
+  }
+
+  const work = async () => {
+    while (!stopped) {
+      const shard = nextShard()
+      if (!shard) {
+        if (nextShardRound > maxRound && shards.every((s) => s.done)) return
+        await changed
+        continue
+      }
+      shard.started = true
+      try {
+        await searchShard(shard)
+      } catch (e) {
+        shard.error = e
+      }
+      shard.done = true
+      signal()
+    }
+  }
+
+  for (let i = 0; i < maxConcurrency; i++) {
+    void work()
+  }
+
+  try {
+    while (nextRound <= maxRound) {
+      const head = shards[0]
+      if (head && head.buffered.length > 0) {
+        const transactions = head.buffered.flat()
+        head.buffered = []
+        signal()
+        nextRound = (transactions[transactions.length - 1].confirmedRound ?? nextRound) + 1n
+        yield { transactions, checkpoint: { nextRound, maxRound } }
+      } else if (head?.error) {
+        throw head.error
+      } else if (head?.done) {
+        shards.shift()
+        signal()
+        // Let the consumer checkpoint past ranges without any transactions too
+        const emittedAll = nextRound > head.maxRound
+        nextRound = head.maxRound + 1n
+        if (!emittedAll) {
+          yield { transactions: [], checkpoint: { nextRound, maxRound } }
+        }
+      } else {
+        await changed
+      }
+    }
+  } finally {
+    stopped = true
+    signal()
+  }
+}
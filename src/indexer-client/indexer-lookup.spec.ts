@@ -1,5 +1,6 @@
 import { Address } from '@algorandfoundation/algokit-common'
-import { beforeEach, describe, expect, test } from 'vitest'
+import { IndexerClient } from '@algorandfoundation/algokit-indexer-client'
+import { beforeEach, describe, expect, test, vi } from 'vitest'
 import { getTestingAppContract } from '../../tests/example-contracts/testing-app/contract'
 import { AlgoAmount } from '../amount'
 import { algorandFixture, runWhenIndexerCaughtUp } from '../testing'
@@ -87,3 +88,84 @@ describe('indexer-lookup', () => {
     expect(apps.map((a) => BigInt(a.id)).sort()).toEqual([app1.appId, app2.appId].sort())
   })
 })
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+// Paged items, where each page is a list of the items on it; the request for a page fails if it's in `failing`
+const pagedRequest = (pages: number[][], failing: number[] = []) => {
+  const requested: number[] = []
+  const buildRequest = vi.fn(async (nextToken?: string) => {
+    const page = nextToken ? Number(nextToken) : 0
+    requested.push(page)
+    await sleep(1)
+    if (failing.includes(page)) throw new Error(`page ${page} failed`)
+    return { items: pages[page] ?? [], nextToken: page + 1 < pages.length ? `${page + 1}` : undefined }
+  })
+  return { buildRequest, requested, extractItems: (response: { items: number[] }) => response.items }
+}
+
+describe('streamPaginatedRequest', () => {
+  test('yields the items of every page in order, requesting the next page while a page is consumed', async () => {
+    const { buildRequest, requested, extractItems } = pagedRequest([[1, 2], [3, 4], [5]])
+    const pages: number[][] = []
+
+    for await (const page of indexer.streamPaginatedRequest(extractItems, buildRequest)) {
+      pages.push(page)
+      if (pages.length === 1) await vi.waitFor(() => expect(requested).toEqual([0, 1]))
+    }
+
+    expect(pages).toEqual([[1, 2], [3, 4], [5]])
+    expect(requested).toEqual([0, 1, 2])
+  })
+
+  test('throws the error of a page that fails while an earlier page is consumed, once the earlier pages are consumed', async () => {
+    const { buildRequest, extractItems } = pagedRequest([[1], [2], [3]], [2])
+    const pages: number[][] = []
+    const consume = async () => {
+      for await (const page of indexer.streamPaginatedRequest(extractItems, buildRequest, { prefetchPages: 2 })) {
+        pages.push(page)
+        // The failing page is requested (and fails) while this one is being consumed
+        await sleep(10)
+      }
+    }
+
+    await expect(consume()).rejects.toThrow('page 2 failed')
+    expect(pages).toEqual([[1], [2]])
+  })
+
+  test('stops requesting pages when the caller stops early, ignoring the failure of a prefetched page', async () => {
+    const { buildRequest, requested, extractItems } = pagedRequest([[1], [2], [3], [4]], [1])
+
+    for await (const page of indexer.streamPaginatedRequest(extractItems, buildRequest)) {
+      expect(page).toEqual([1])
+      break
+    }
+    // The prefetched page fails without an unhandled rejection
+    await sleep(10)
+
+    expect(requested).toEqual([0, 1])
+  })
+
+  test('stops once maxItems items have been yielded, without prefetching pages that are not needed', async () => {
+    const { buildRequest, requested, extractItems } = pagedRequest([[1, 2], [3, 4], [5, 6], [7, 8]])
+    const items: number[] = []
+
+    for await (const page of indexer.streamPaginatedRequest(extractItems, buildRequest, { maxItems: 3, prefetchPages: 3 })) {
+      items.push(...page)
+    }
+
+    expect(items).toEqual([1, 2, 3])
+    expect(requested).toEqual([0, 1])
+  })
+
+  test('requests pages no bigger than maxItems, and no bigger than paginationLimit', async () => {
+    const searchForTransactions = vi.fn(async (_criteria: { limit?: number }) => ({ currentRound: 1n, transactions: [] }))
+    const indexerClient = { searchForTransactions } as unknown as IndexerClient
+
+    await indexer.streamTransactions(indexerClient, { txType: 'pay' }, { maxItems: 5 }).next()
+    await indexer.streamTransactions(indexerClient, { txType: 'pay' }, { maxItems: 5, paginationLimit: 2 }).next()
+    await indexer.streamTransactions(indexerClient, { txType: 'pay' }).next()
+
+    expect(searchForTransactions.mock.calls.map(([criteria]) => criteria)).toMatchObject([{ limit: 5 }, { limit: 2 }, { limit: 1000 }])
+  })
+})
@@ -5,12 +5,28 @@ import {
   AssetBalancesResponse,
   IndexerClient,
   MiniAssetHolding,
+  Transaction,
   TransactionsResponse,
 } from '@algorandfoundation/algokit-indexer-client'
 import { LookupAssetHoldingsOptions } from '../indexer'
 export type SearchForTransactionsCriteria = Omit<NonNullable<Parameters<IndexerClient['searchForTransactions']>[0]>, 'limit' | 'next'>
 
 const DEFAULT_INDEXER_MAX_API_RESOURCES_PER_ACCOUNT = 1000 //MaxAPIResourcesPerAccount: This is the default maximum, though may be provider specific
+const DEFAULT_PREFETCH_PAGES = 1
+
+/** Options to control streaming the results of a paginated indexer request. */
+export interface PaginatedStreamOptions {
+  /** The number of records to return per paginated request, default 1000 */
+  paginationLimit?: number
+  /** The maximum number of items to yield; default: all of them */
+  maxItems?: number
+  /**
+   * The number of pages to request ahead of the items being consumed, default 1. Each page is requested (and decoded) as
+   * soon as the page before it arrives, while the items of the earlier pages are being consumed; 0 only requests a page
+   * once all the items before it have been consumed.
+   */
+  prefetchPages?: number
+}
 
 /**
  * Looks up applications that were created by the given address; will automatically paginate through all data.
@@ -43,6 +59,41 @@ export async function lookupAccountCreatedApplicationByAddress(
   )
 }
 
+/**
+ * Streams the applications that were created by the given address; will automatically paginate through all data, requesting
+ * the next page while the items of the current page are consumed.
+ * @param indexer An indexer instance
+ * @param address The address of the creator to look up
+ * @param getAll Whether or not to include deleted applications. Default true.
+ * @param options Optional options to control the pagination
+ * @returns An async iterator of the application results
+ */
+export async function* streamAccountCreatedApplicationsByAddress(
+  indexer: IndexerClient,
+  address: string | Address,
+  getAll: boolean = true,
+  options?: PaginatedStreamOptions,
+): AsyncGenerator<Application> {
+  for await (const page of streamPaginatedRequest(
+    (response: ApplicationsResponse | { message: string }) => {
+      if ('message' in response) {
+        throw { status: 404, ...response }
+      }
+      return response.applications
+    },
+    (nextToken) => {
+      return indexer.lookupAccountCreatedApplications(address, {
+        includeAll: getAll,
+        limit: pageLimit(options),
+        ...(nextToken && { next: nextToken }),
+      })
+    },
+    options,
+  )) {
+    yield* page
+  }
+}
+
 /**
  * Looks up asset holdings for the given asset; will automatically paginate through all data.
  * @param indexer An indexer instance
@@ -76,6 +127,43 @@ export async function lookupAssetHoldings(
   )
 }
 
+/**
+ * Streams the asset holdings for the given asset; will automatically paginate through all data, requesting the next page
+ * while the items of the current page are consumed.
+ * @param indexer An indexer instance
+ * @param assetId The ID of the asset to look up holdings for
+ * @param options Optional options to control the lookup
+ * @param streamOptions Optional options to control the pagination
+ * @returns An async iterator of the asset holdings
+ */
+export async function* streamAssetHoldings(
+  indexer: IndexerClient,
+  assetId: number | bigint,
+  options?: LookupAssetHoldingsOptions,
+  streamOptions?: PaginatedStreamOptions,
+): AsyncGenerator<MiniAssetHolding> {
+  for await (const page of streamPaginatedRequest(
+    (response: AssetBalancesResponse | { message: string }) => {
+      if ('message' in response) {
+        throw { status: 404, ...response }
+      }
+      return response.balances
+    },
+    (nextToken) => {
+      return indexer.lookupAssetBalances(assetId, {
+        limit: pageLimit(streamOptions),
+        ...(options?.currencyGreaterThan !== undefined && { currencyGreaterThan: options.currencyGreaterThan }),
+        ...(options?.currencyLessThan !== undefined && { currencyLessThan: options.currencyLessThan }),
+        ...(options?.includeAll !== undefined && { includeAll: options.includeAll }),
+        ...(nextToken && { next: nextToken }),
+      })
+    },
+    streamOptions,
+  )) {
+    yield* page
+  }
+}
+
 /**
  * Allows transactions to be searched for the given criteria.
  * @param indexer An indexer client
@@ -115,6 +203,43 @@ export async function searchTransactions(
   } satisfies TransactionsResponse
 }
 
+/**
+ * Streams the transactions that match the given criteria; will automatically paginate through all data, requesting the next
+ * page while the items of the current page are consumed.
+ * @param indexer An indexer client
+ * @param searchCriteria The criteria to search for
+ * @param options Optional options to control the pagination
+ * @returns An async iterator of the matching transactions
+ */
+export async function* streamTransactions(
+  indexer: IndexerClient,
+  searchCriteria: SearchForTransactionsCriteria,
+  options?: PaginatedStreamOptions,
+): AsyncGenerator<Transaction> {
+  for await (const page of streamPaginatedRequest(
+    (response: TransactionsResponse | { message: string }) => {
+      if ('message' in response) {
+        throw { status: 404, ...response }
+      }
+      return response.transactions
+    },
+    (nextToken) => {
+      return indexer.searchForTransactions({
+        ...searchCriteria,
+        limit: pageLimit(options),
+        next: nextToken,
+      })
+    },
+    options,
+  )) {
+    yield* page
+  }
+}
+
+// Pages don't need to be any bigger than the number of items that are wanted
+const pageLimit = (options?: PaginatedStreamOptions) =>
+  Math.min(options?.paginationLimit ?? DEFAULT_INDEXER_MAX_API_RESOURCES_PER_ACCOUNT, options?.maxItems ?? Number.MAX_SAFE_INTEGER)
+
 // https://dev.algorand.co/reference/rest-apis/indexer
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
 export async function executePaginatedRequest<TResult, TRequest extends Promise<any>>(
@@ -123,21 +248,72 @@ export async function executePaginatedRequest<TResult, TRequest extends Promise<
   buildRequest: (nextToken?: string) => TRequest,
 ): Promise<TResult[]> {
   const results = []
+  for await (const items of streamPaginatedRequest(extractItems, buildRequest)) {
+    results.push(...items)
+  }
+  return results
+}
 
-  let nextToken: string | undefined = undefined
-  while (true) {
-    const request = buildRequest(nextToken)
-    const response = await request
+/**
+ * Yields the items of each page of a paginated indexer request, until there are no more pages or `maxItems` items have been
+ * yielded.
+ *
+ * Up to `prefetchPages` pages are requested ahead of the page being consumed, each as soon as the `nextToken` of the page
+ * before it arrives, so the latency of the requests overlaps with the processing of the items.
+ */
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+export async function* streamPaginatedRequest<TResult, TRequest extends Promise<any>>(
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  extractItems: (response: any) => TResult[],
+  buildRequest: (nextToken?: string) => TRequest,
+  options?: Pick<PaginatedStreamOptions, 'maxItems' | 'prefetchPages'>,
+): AsyncGenerator<TResult[]> {
+  const maxItems = options?.maxItems ?? Number.POSITIVE_INFINITY
+  const prefetchPages = Math.max(0, options?.prefetchPages ?? DEFAULT_PREFETCH_PAGES)
+
+  // A page is undefined once there are no more pages
+  const fetchPage = async (nextToken?: string): Promise<{ items: TResult[]; nextToken?: string } | undefined> => {
+    const response = await buildRequest(nextToken)
     const items = extractItems(response)
     if (items == null || items.length === 0) {
-      break
-    }
-    results.push(...items)
-    nextToken = response['nextToken']
-    if (!nextToken) {
-      break
+      return undefined
     }
+    return { items, nextToken: response['nextToken'] || undefined }
   }
 
-  return results
+  let stopped = false
+  let last = fetchPage()
+  const pages = [last]
+  // A prefetched page may fail before it's awaited (e.g. while the caller is consuming an earlier page), so it gets a
+  // handler as soon as it's requested; the error is still thrown when the page is awaited in order
+  last.catch(() => {})
+  const requestNextPage = () => {
+    last = last.then((page) => (page?.nextToken && !stopped ? fetchPage(page.nextToken) : undefined))
+    last.catch(() => {})
+    pages.push(last)
+  }
+
+  let yielded = 0
+  try {
+    while (pages.length > 0 && yielded < maxItems) {
+      const page = await pages.shift()!
+      if (!page) {
+        return
+      }
+      const items = page.items.slice(0, maxItems - yielded)
+      yielded += items.length
+      // Don't prefetch more pages than (going by the size of this one) are needed to reach `maxItems`
+      const pagesWanted = Math.min(prefetchPages, Math.ceil((maxItems - yielded) / page.items.length))
+      while (pages.length < pagesWanted) {
+        requestNextPage()
+      }
+      yield items
+      if (pages.length === 0 && yielded < maxItems) {
+        requestNextPage()
+      }
+    }
+  } finally {
+    // Pages that were prefetched but aren't going to be consumed are ignored, and no more pages are requested
+    stopped = true
+  }
 }
@@ -0,0 +1,5 @@
+/**
+ * Node.js only exports of the indexer client, e.g. the pooled keep-alive transport.
+ * @module algokit-utils/indexer-client/node
+ */
+export * from '@algorandfoundation/algokit-indexer-client/node'
@@ -7,6 +7,7 @@ import { AlgoAmount } from './amount'
 import { ClientManager } from './client-manager'
 import { TransactionComposer } from './composer'
 import { Config } from './config'
+import { KmdBatchSigner, KmdBatchSignerOptions } from './kmd-batch-signer'
 
 /** Provides abstractions over a [KMD](https://github.com/algorand/go-algorand/blob/master/daemon/kmd/README.md) instance
  * that makes it easier to get and manage accounts using KMD. */
@@ -46,6 +47,23 @@ export class KmdAccountManager {
     return this._kmd
   }
 
+  /**
+   * Returns a signer that signs many transactions with the keys in KMD, reusing a leased handle per wallet and signing
+   * concurrently, rather than getting a wallet handle for each transaction.
+   *
+   * @param options Options to control the signer, e.g. which wallets to sign with
+   * @example
+   * ```typescript
+   * const batchSigner = await kmdAccountManager.getBatchSigner({ walletNames: ['unencrypted-default-wallet'] })
+   * const signedTransactions = await batchSigner.signTransactions(transactions)
+   * await batchSigner.close()
+   * ```
+   * @returns The batch signer; call `close()` on it when done to release its wallet handles
+   */
+  public async getBatchSigner(options?: KmdBatchSignerOptions): Promise<KmdBatchSigner> {
+    return new KmdBatchSigner(await this.kmd(), options)
+  }
+
   /**
    * Returns an Algorand signing account with private key loaded from the given KMD wallet (identified by name).
    *
@@ -0,0 +1,155 @@
+import { KmdClient } from '@algorandfoundation/algokit-kmd-client'
+import { Transaction } from '@algorandfoundation/algokit-transact'
+import { afterEach, describe, expect, test, vi } from 'vitest'
+import { KmdBatchSigner } from './kmd-batch-signer'
+
+const textEncoder = new TextEncoder()
+const textDecoder = new TextDecoder()
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+const transaction = (sender: string) => ({ sender }) as unknown as Transaction
+
+// A KMD with the given wallets (by ID) and the addresses of the keys in them; a signed transaction is `<sender>:<handle>`
+const fakeKmd = (keys: Record<string, string[]>) => {
+  let handles = 0
+  const kmd = {
+    keys,
+    expired: new Set<string>(),
+    listWallets: vi.fn(async () => ({ wallets: Object.keys(kmd.keys).map((id) => ({ id, name: `${id}-name` })) })),
+    listKeysInWallet: vi.fn(async ({ walletHandleToken }: { walletHandleToken: string }) => ({
+      addresses: kmd.keys[walletHandleToken.split(':')[0]],
+    })),
+    initWalletHandle: vi.fn(async ({ walletId }: { walletId: string }) => {
+      await sleep(1)
+      return { walletHandleToken: `${walletId}:${++handles}` }
+    }),
+    renewWalletHandleToken: vi.fn(async (_: { walletHandleToken: string }) => {
+      await sleep(1)
+      return { walletHandle: { expiresSeconds: 60 } }
+    }),
+    releaseWalletHandleToken: vi.fn(async (_: { walletHandleToken: string }) => ({})),
+    signTransaction: vi.fn(async ({ walletHandleToken, transaction }: { walletHandleToken: string; transaction: Transaction }) => {
+      await sleep(1)
+      if (kmd.expired.has(walletHandleToken)) throw Object.assign(new Error('Bad request'), { body: { message: 'handle expired' } })
+      return { signedTransaction: textEncoder.encode(`${transaction.sender}:${walletHandleToken}`) }
+    }),
+  }
+  return { kmd, client: kmd as unknown as KmdClient }
+}
+
+const decode = (signedTransactions: Uint8Array[]) => signedTransactions.map((stxn) => textDecoder.decode(stxn))
+
+describe('KmdBatchSigner', () => {
+  afterEach(() => {
+    vi.restoreAllMocks()
+  })
+
+  test('signs each transaction with the key of its wallet, leasing one handle per wallet', async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A', 'B'], w2: ['C'] })
+    const signer = new KmdBatchSigner(client, { maxConcurrency: 2 })
+
+    const signed = await signer.signTransactions(['A', 'C', 'B', 'A', 'C'].map(transaction))
+
+    expect(decode(signed)).toEqual(['A:w1:1', 'C:w2:2', 'B:w1:1', 'A:w1:1', 'C:w2:2'])
+    expect(kmd.listWallets).toHaveBeenCalledTimes(1)
+    expect(kmd.initWalletHandle).toHaveBeenCalledTimes(2)
+  })
+
+  test('only signs with the wallets with the given names', async () => {
+    const { client } = fakeKmd({ w1: ['A'], w2: ['B'] })
+    const signer = new KmdBatchSigner(client, { walletNames: ['w2-name'] })
+
+    await expect(signer.signTransactions([transaction('B')])).resolves.toHaveLength(1)
+    await expect(signer.signTransactions([transaction('A')])).rejects.toThrow('No KMD wallet holds the key for A')
+  })
+
+  test('looks the wallets up again for a key that may have been added since', async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A'] })
+    const signer = new KmdBatchSigner(client)
+    await signer.signTransactions([transaction('A')])
+
+    kmd.keys.w1 = ['A', 'B']
+    const signed = await signer.signTransactions([transaction('B')])
+
+    expect(decode(signed)).toEqual(['B:w1:1'])
+    expect(kmd.listWallets).toHaveBeenCalledTimes(2)
+    expect(kmd.initWalletHandle).toHaveBeenCalledTimes(1)
+  })
+
+  test('renews a handle shortly before it expires, once for concurrent callers', async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A'] })
+    const signer = new KmdBatchSigner(client)
+    const start = Date.now()
+    const now = vi.spyOn(Date, 'now').mockReturnValue(start)
+    await signer.signTransactions([transaction('A')])
+
+    now.mockReturnValue(start + 40_000)
+    await signer.signTransactions([transaction('A')])
+    expect(kmd.renewWalletHandleToken).not.toHaveBeenCalled()
+
+    now.mockReturnValue(start + 55_000)
+    const signed = await signer.signTransactions(['A', 'A', 'A'].map(transaction))
+    expect(decode(signed)).toEqual(['A:w1:1', 'A:w1:1', 'A:w1:1'])
+    expect(kmd.renewWalletHandleToken).toHaveBeenCalledTimes(1)
+    expect(kmd.renewWalletHandleToken).toHaveBeenCalledWith({ walletHandleToken: 'w1:1' })
+
+    // The renewal gives the handle another 60 seconds
+    now.mockReturnValue(start + 100_000)
+    await signer.signTransactions([transaction('A')])
+    expect(kmd.renewWalletHandleToken).toHaveBeenCalledTimes(1)
+    expect(kmd.initWalletHandle).toHaveBeenCalledTimes(1)
+  })
+
+  test('gets a new handle when the handle has expired, once for concurrent callers', async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A'] })
+    const signer = new KmdBatchSigner(client)
+    await signer.signTransactions([transaction('A')])
+
+    kmd.expired.add('w1:1')
+    const signed = await signer.signTransactions(['A', 'A', 'A'].map(transaction))
+
+    expect(decode(signed)).toEqual(['A:w1:2', 'A:w1:2', 'A:w1:2'])
+    expect(kmd.initWalletHandle).toHaveBeenCalledTimes(2)
+  })
+
+  test("doesn't retry errors that aren't about the handle", async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A'] })
+    const signer = new KmdBatchSigner(client)
+    kmd.signTransaction.mockRejectedValueOnce(new Error('wrong password'))
+
+    await expect(signer.signTransactions([transaction('A')])).rejects.toThrow('wrong password')
+    expect(kmd.signTransaction).toHaveBeenCalledTimes(1)
+  })
+
+  test("doesn't keep a lease whose handle couldn't be got", async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A'] })
+    const signer = new KmdBatchSigner(client)
+    kmd.initWalletHandle.mockRejectedValueOnce(new Error('kmd unavailable'))
+
+    await expect(signer.signTransactions([transaction('A')])).rejects.toThrow('kmd unavailable')
+    await expect(signer.signTransactions([transaction('A')])).resolves.toHaveLength(1)
+  })
+
+  test('releases its handles on close, and leases new ones after', async () => {
+    const { kmd, client } = fakeKmd({ w1: ['A'], w2: ['B'] })
+    const signer = new KmdBatchSigner(client)
+    await signer.signTransactions(['A', 'B'].map(transaction))
+    kmd.releaseWalletHandleToken.mockRejectedValueOnce(new Error('handle expired'))
+
+    await signer.close()
+
+    expect(kmd.releaseWalletHandleToken.mock.calls.map(([{ walletHandleToken }]) => walletHandleToken).sort()).toEqual(['w1:1', 'w2:2'])
+    expect(decode(await signer.signTransactions([transaction('A')]))).toEqual(['A:w1:3'])
+    expect(kmd.listWallets).toHaveBeenCalledTimes(2)
+  })
+
+  test('signs the transactions of a group through signer()', async () => {
+    const { client } = fakeKmd({ w1: ['A', 'B'] })
+    const signer = new KmdBatchSigner(client).signer()
+
+    const signed = await signer(['A', 'B', 'A'].map(transaction), [0, 2])
+
+    expect(decode(signed)).toEqual(['A:w1:1', 'A:w1:1'])
+  })
+})
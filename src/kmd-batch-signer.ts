@@ -0,0 +1,194 @@
+import { Address } from '@algorandfoundation/algokit-common'
+import { KmdClient } from '@algorandfoundation/algokit-kmd-client'
+import { Transaction, TransactionSigner } from '@algorandfoundation/algokit-transact'
+import { mapWithConcurrency } from './util'
+
+const DEFAULT_MAX_CONCURRENCY = 16
+// KMD doesn't say how long a new handle lasts; it's 60 seconds by default, and a renewal says how long it has from then
+const DEFAULT_HANDLE_LIFETIME_SECONDS = 60
+const RENEW_MARGIN_SECONDS = 10
+
+/** Options to control a `KmdBatchSigner`. */
+export interface KmdBatchSignerOptions {
+  /** The names of the wallets to sign with; defaults to all of the wallets in KMD */
+  walletNames?: string[]
+  /** The password of the wallets; defaults to an empty password (as used by LocalNet) */
+  walletPassword?: string
+  /** The maximum number of sign requests in flight at a time, default 16 */
+  maxConcurrency?: number
+}
+
+interface WalletHandleLease {
+  token: Promise<string>
+  /** When the handle needs to be renewed, in milliseconds since the epoch */
+  renewAt: number
+}
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+const isHandleError = (e: any) => /handle/i.test(e?.body?.message ?? e?.message ?? '')
+
+/**
+ * Signs transactions with the keys held in [KMD](https://github.com/algorand/go-algorand/blob/master/daemon/kmd/README.md)
+ * wallets, for signing large numbers of transactions (e.g. in LocalNet load tests).
+ *
+ * Rather than getting a wallet handle for each transaction, it leases one handle per wallet, renews it shortly before it
+ * expires and releases it on `close()`. The wallet that holds the key of each address is looked up once and cached, and
+ * transactions are signed concurrently with at most `maxConcurrency` requests in flight.
+ *
+ * @example
+ * ```typescript
+ * const batchSigner = await algorand.account.kmd.getBatchSigner()
+ * const signedTransactions = await batchSigner.signTransactions(transactions)
+ * algorand.setSigner(sender, batchSigner.signer())
+ * // ...
+ * await batchSigner.close()
+ * ```
+ */
+export class KmdBatchSigner {
+  private readonly _kmd: KmdClient
+  private readonly _walletNames?: string[]
+  private readonly _walletPassword: string
+  private readonly _maxConcurrency: number
+  private readonly _leases = new Map<string, WalletHandleLease>()
+  private _walletIdsByAddress?: Promise<Map<string, string>>
+
+  /**
+   * Creates a batch signer.
+   * @param kmd The KMD client
+   * @param options Options to control the signer
+   */
+  constructor(kmd: KmdClient, options?: KmdBatchSignerOptions) {
+    this._kmd = kmd
+    this._walletNames = options?.walletNames
+    this._walletPassword = options?.walletPassword ?? ''
+    this._maxConcurrency = options?.maxConcurrency ?? DEFAULT_MAX_CONCURRENCY
+  }
+
+  /**
+   * Signs the given transactions, each with the key of its sender (or of `signerAddress`, e.g. for a rekeyed account).
+   * @param transactions The transactions to sign
+   * @param signerAddress The address of the key to sign with, if not the sender of each transaction
+   * @returns The encoded signed transactions, in the order of `transactions`
+   */
+  async signTransactions(transactions: Transaction[], signerAddress?: string | Address): Promise<Uint8Array[]> {
+    return await mapWithConcurrency(transactions, this._maxConcurrency, (transaction) => this.signTransaction(transaction, signerAddress))
+  }
+
+  /**
+   * Returns a transaction signer that signs with this batch signer.
+   * @param signerAddress The address of the key to sign with, if not the sender of each transaction
+   * @returns The transaction signer
+   */
+  signer(signerAddress?: string | Address): TransactionSigner {
+    return (txnGroup: Transaction[], indexesToSign: number[]) => this.signTransactions(indexesToSign.map((i) => txnGroup[i]), signerAddress)
+  }
+
+  /** Releases the leased wallet handles and forgets the cached wallets, so newly added keys are found on the next call. */
+  async close(): Promise<void> {
+    const leases = [...this._leases.values()]
+    this._leases.clear()
+    this._walletIdsByAddress = undefined
+    await Promise.all(
+      leases.map(async (lease) => {
+        try {
+          await this._kmd.releaseWalletHandleToken({ walletHandleToken: await lease.token })
+        } catch {
+          // The handle has already expired
+        }
+      }),
+    )
+  }
+
+  private async signTransaction(transaction: Transaction, signerAddress?: string | Address): Promise<Uint8Array> {
+    const address = (signerAddress ?? transaction.sender).toString()
+    const walletId = await this.walletIdFor(address)
+    const sign = async (walletHandleToken: string) => {
+      const { signedTransaction } = await this._kmd.signTransaction({
+        walletHandleToken,
+        walletPassword: this._walletPassword,
+        transaction,
+        ...(signerAddress !== undefined && { publicKey: Address.fromString(address).publicKey }),
+      })
+      return signedTransaction
+    }
+
+    const walletHandleToken = await this.walletHandle(walletId)
+    try {
+      return await sign(walletHandleToken)
+    } catch (e) {
+      // The handle may have expired (e.g. the process was suspended), so get a new one (once, for all callers) and try again
+      if (!isHandleError(e)) throw e
+      if ((await this._leases.get(walletId)?.token.catch(() => undefined)) === walletHandleToken) {
+        this._leases.delete(walletId)
+      }
+      return await sign(await this.walletHandle(walletId))
+    }
+  }
+
+  private async walletIdFor(address: string): Promise<string> {
+    this._walletIdsByAddress ??= this.lookupWallets()
+    let walletId = (await this._walletIdsByAddress).get(address)
+    if (walletId === undefined) {
+      // The key may have been added since the wallets were looked up
+      this._walletIdsByAddress = this.lookupWallets()
+      walletId = (await this._walletIdsByAddress).get(address)
+    }
+    if (walletId === undefined) {
+      throw new Error(`No KMD wallet holds the key for ${address}`)
+    }
+    return walletId
+  }
+
+  private lookupWallets(): Promise<Map<string, string>> {
+    const lookup = this.listWalletKeys().catch((e) => {
+      if (this._walletIdsByAddress === lookup) this._walletIdsByAddress = undefined
+      throw e
+    })
+    return lookup
+  }
+
+  private async listWalletKeys(): Promise<Map<string, string>> {
+    const wallets = (await this._kmd.listWallets()).wallets.filter((w) => !this._walletNames || this._walletNames.includes(w.name))
+    const walletIdsByAddress = new Map<string, string>()
+    for (const wallet of wallets) {
+      const { addresses } = await this._kmd.listKeysInWallet({ walletHandleToken: await this.walletHandle(wallet.id) })
+      addresses.forEach((address) => walletIdsByAddress.set(address.toString(), wallet.id))
+    }
+    return walletIdsByAddress
+  }
+
+  private walletHandle(walletId: string): Promise<string> {
+    const lease = this._leases.get(walletId)
+    if (!lease) {
+      return this.lease(walletId, async () => {
+        return (await this._kmd.initWalletHandle({ walletId, walletPassword: this._walletPassword })).walletHandleToken
+      })
+    }
+    if (Date.now() >= lease.renewAt) {
+      return this.lease(walletId, async () => {
+        const token = await lease.token
+        const { walletHandle } = await this._kmd.renewWalletHandleToken({ walletHandleToken: token })
+        this.leaseUntil(walletId, walletHandle.expiresSeconds)
+        return token
+      })
+    }
+    return lease.token
+  }
+
+  // Concurrent callers share the initialisation or renewal of a lease
+  private lease(walletId: string, getToken: () => Promise<string>): Promise<string> {
+    const token = getToken().catch((e) => {
+      if (this._leases.get(walletId)?.token === token) this._leases.delete(walletId)
+      throw e
+    })
+    this._leases.set(walletId, { token, renewAt: Date.now() + (DEFAULT_HANDLE_LIFETIME_SECONDS - RENEW_MARGIN_SECONDS) * 1000 })
+    return token
+  }
+
+  private leaseUntil(walletId: string, expiresInSeconds: number) {
+    const lease = this._leases.get(walletId)
+    if (lease) {
+      lease.renewAt = Date.now() + Math.max(0, expiresInSeconds - RENEW_MARGIN_SECONDS) * 1000
+    }
+  }
+}
@@ -0,0 +1,5 @@
+/**
+ * Node.js only exports of the kmd client, e.g. the pooled keep-alive transport.
+ * @module algokit-utils/kmd-client/node
+ */
+export * from '@algorandfoundation/algokit-kmd-client/node'
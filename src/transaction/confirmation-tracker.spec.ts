@@ -0,0 +1,148 @@
+import { AlgodClient, PendingTransactionResponse } from '@algorandfoundation/algokit-algod-client'
+import { afterEach, describe, expect, test, vi } from 'vitest'
+import { ConfirmationTracker } from './confirmation-tracker'
+
+const notFound = () => Object.assign(new Error('Transaction not found'), { status: 404 })
+
+// A node whose rounds advance by one every time a new round is waited for
+const fakeAlgod = (startRound = 100n) => {
+  let lastRound = startRound
+  const received = new Map<string, { confirmRound?: bigint; poolError?: string }>()
+  const algod = {
+    status: vi.fn(async () => ({ lastRound })),
+    statusAfterBlock: vi.fn(async (round: number | bigint) => {
+      await new Promise((resolve) => setTimeout(resolve, 1))
+      if (lastRound <= BigInt(round)) lastRound = BigInt(round) + 1n
+      return { lastRound }
+    }),
+    blockTxIds: vi.fn(async (round: number | bigint) => ({
+      blockTxIds: [...received].filter(([, txn]) => txn.confirmRound === BigInt(round)).map(([id]) => id),
+    })),
+    pendingTransactionInformation: vi.fn(async (transactionId: string): Promise<Partial<PendingTransactionResponse>> => {
+      const txn = received.get(transactionId)
+      if (!txn) throw notFound()
+      if (txn.confirmRound !== undefined && txn.confirmRound <= lastRound) return { confirmedRound: txn.confirmRound }
+      return { poolError: txn.poolError ?? '' }
+    }),
+  }
+  return {
+    algod: algod as unknown as AlgodClient,
+    fake: algod,
+    /** Makes the node receive the transaction, to be confirmed in the given round */
+    receive: (transactionId: string, txn: { confirmRound?: bigint; poolError?: string } = {}) => received.set(transactionId, txn),
+  }
+}
+
+// Makes following the rounds fail while the returned `node.down` is set
+const failWhileDown = (fake: ReturnType<typeof fakeAlgod>['fake']) => {
+  const node = { down: true }
+  const statusAfterBlock = fake.statusAfterBlock.getMockImplementation()!
+  fake.statusAfterBlock.mockImplementation(async (round) => {
+    if (node.down) throw new Error('node unavailable')
+    return statusAfterBlock(round)
+  })
+  return node
+}
+
+describe('ConfirmationTracker', () => {
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  test('waits for transactions to be confirmed, following each round once', async () => {
+    const { algod, fake, receive } = fakeAlgod()
+    receive('A', { confirmRound: 102n })
+    receive('B', { confirmRound: 103n })
+
+    const confirmations = await new ConfirmationTracker(algod).waitForConfirmations(['A', 'B'], 10)
+
+    expect(confirmations).toMatchObject([{ confirmedRound: 102n }, { confirmedRound: 103n }])
+    expect(fake.statusAfterBlock).toHaveBeenCalledTimes(3)
+    expect(fake.blockTxIds.mock.calls.map(([round]) => round)).toEqual([101n, 102n, 103n])
+  })
+
+  test('resolves transactions that are already confirmed without following rounds', async () => {
+    const { algod, fake, receive } = fakeAlgod()
+    receive('A', { confirmRound: 99n })
+
+    await expect(new ConfirmationTracker(algod).waitForConfirmation('A', 5)).resolves.toMatchObject({ confirmedRound: 99n })
+    expect(fake.statusAfterBlock).not.toHaveBeenCalled()
+  })
+
+  test('rejects transactions with a pool error', async () => {
+    const { algod, receive } = fakeAlgod()
+    receive('A', { poolError: 'overspend' })
+
+    await expect(new ConfirmationTracker(algod).waitForConfirmation('A', 5)).rejects.toThrow(
+      'Transaction A was rejected; pool error: overspend',
+    )
+  })
+
+  test("keeps waiting for transactions the node doesn't know about yet", async () => {
+    const { algod, fake, receive } = fakeAlgod()
+
+    const confirmation = new ConfirmationTracker(algod).waitForConfirmation('A', 5)
+    await vi.waitFor(() => expect(fake.pendingTransactionInformation).toHaveBeenCalled())
+    receive('A', { confirmRound: 103n })
+
+    await expect(confirmation).resolves.toMatchObject({ confirmedRound: 103n })
+  })
+
+  test('rejects transactions that are not confirmed within maxRoundsToWait', async () => {
+    const { algod, fake, receive } = fakeAlgod()
+    receive('A')
+
+    await expect(new ConfirmationTracker(algod).waitForConfirmation('A', 3)).rejects.toThrow('Transaction A not confirmed after 3 rounds')
+    await expect(new ConfirmationTracker(algod).waitForConfirmation('B', 2)).rejects.toThrow('Transaction B not confirmed after 2 rounds')
+    expect(fake.statusAfterBlock).toHaveBeenCalledTimes(5)
+  })
+
+  test('rejects an invalid maxRoundsToWait', async () => {
+    const { algod } = fakeAlgod()
+
+    await expect(new ConfirmationTracker(algod).waitForConfirmation('A', -1)).rejects.toThrow('Invalid timeout, received -1, expected > 0')
+  })
+
+  test('shares one tracker per client', () => {
+    const { algod } = fakeAlgod()
+
+    expect(ConfirmationTracker.for(algod)).toBe(ConfirmationTracker.for(algod))
+    expect(ConfirmationTracker.for(algod)).not.toBe(ConfirmationTracker.for(fakeAlgod().algod))
+  })
+
+  test('keeps following the rounds after a failure', async () => {
+    vi.useFakeTimers()
+    const { algod, fake, receive } = fakeAlgod()
+    const node = failWhileDown(fake)
+    receive('A', { confirmRound: 102n })
+
+    const confirmation = new ConfirmationTracker(algod).waitForConfirmation('A', 10)
+    await vi.advanceTimersByTimeAsync(500)
+    expect(fake.statusAfterBlock).toHaveBeenCalledTimes(2)
+    node.down = false
+    await vi.advanceTimersByTimeAsync(1_000)
+
+    await expect(confirmation).resolves.toMatchObject({ confirmedRound: 102n })
+  })
+
+  test("doesn't fail the wait of one caller when following the rounds fails for another", async () => {
+    vi.useFakeTimers()
+    const { algod, fake, receive } = fakeAlgod()
+    const node = failWhileDown(fake)
+    receive('B', { confirmRound: 102n })
+
+    const first = expect(ConfirmationTracker.for(algod).waitForConfirmation('A', 10)).rejects.toThrow('node unavailable')
+    await vi.advanceTimersByTimeAsync(700)
+    expect(fake.statusAfterBlock).toHaveBeenCalledTimes(3)
+    const second = ConfirmationTracker.for(algod).waitForConfirmation('B', 10)
+    await vi.advanceTimersByTimeAsync(2_500)
+
+    // Following the rounds has failed 5 times in a row for the first caller, but only twice for the second
+    await first
+    expect(ConfirmationTracker.for(algod).pendingCount).toBe(1)
+    node.down = false
+    await vi.advanceTimersByTimeAsync(5_000)
+
+    await expect(second).resolves.toMatchObject({ confirmedRound: 102n })
+  })
+})
@@ -0,0 +1,235 @@
+import { AlgodClient, NodeStatusResponse, PendingTransactionResponse } from '@algorandfoundation/algokit-algod-client'
+
+/** How many times in a row following the rounds can fail while a transaction is waited for before its wait fails */
+const MAX_FOLLOW_FAILURES = 5
+/** The wait before following the rounds again after a failure, doubling with each failure in a row */
+const FOLLOW_RETRY_BACKOFF_MS = 200
+const MAX_FOLLOW_RETRY_BACKOFF_MS = 5_000
+
+interface ConfirmationWaiter {
+  /** The first round that is no longer waited for */
+  deadline: bigint
+  maxRoundsToWait: number | bigint
+  /** The number of times in a row following the rounds has failed since the transaction was waited for */
+  followFailures: number
+  resolve: (confirmation: PendingTransactionResponse) => void
+  reject: (error: Error) => void
+}
+
+const notConfirmedError = (transactionId: string, maxRoundsToWait: number | bigint) =>
+  new Error(`Transaction ${transactionId} not confirmed after ${maxRoundsToWait} rounds`)
+
+/**
+ * Waits for transactions to be confirmed by following the rounds of a node.
+ *
+ * Rather than polling each transaction every round, the tracker waits for each new round once (`statusAfterBlock`) and
+ * reads the IDs of the transactions in it once (`blockTxIds`), however many transactions are being waited for. The
+ * pending transaction information of a transaction is only read when it's first waited for (to pick up transactions
+ * that are already confirmed or were rejected) and once it's been confirmed.
+ *
+ * Use `ConfirmationTracker.for(algod)` to share one tracker between everything that confirms transactions with a client.
+ * A failure to follow the rounds is retried with a backoff; only the waits that have seen it fail too many times in a row
+ * give up, so one caller's wait never fails another's.
+ */
+export class ConfirmationTracker {
+  private static trackers = new WeakMap<AlgodClient, ConfirmationTracker>()
+
+  private readonly waiters = new Map<string, ConfirmationWaiter[]>()
+  /** The next round to read the transaction IDs of, while following rounds */
+  private nextRound?: bigint
+  private following?: Promise<void>
+  private idle?: AbortController
+
+  /**
+   * Creates a tracker that follows the rounds of the given node.
+   * @param algod The algod client
+   */
+  constructor(private readonly algod: AlgodClient) {}
+
+  /**
+   * Returns the tracker shared by everything that confirms transactions with the given algod client.
+   * @param algod The algod client
+   * @returns The shared tracker
+   */
+  static for(algod: AlgodClient): ConfirmationTracker {
+    let tracker = ConfirmationTracker.trackers.get(algod)
+    if (!tracker) {
+      tracker = new ConfirmationTracker(algod)
+      ConfirmationTracker.trackers.set(algod, tracker)
+    }
+    return tracker
+  }
+
+  /** The number of transactions being waited for. */
+  get pendingCount(): number {
+    return this.waiters.size
+  }
+
+  /**
+   * Waits for the given transactions to be confirmed.
+   *
+   * @param transactionIds The IDs of the transactions to wait for
+   * @param maxRoundsToWait The maximum number of rounds to wait for each transaction
+   * @returns The pending transaction information of each confirmed transaction, in the order of `transactionIds`
+   * @throws if a transaction isn't confirmed within `maxRoundsToWait` rounds or was rejected
+   */
+  async waitForConfirmations(transactionIds: string[], maxRoundsToWait: number | bigint): Promise<PendingTransactionResponse[]> {
+    if (maxRoundsToWait < 0) {
+      throw new Error(`Invalid timeout, received ${maxRoundsToWait}, expected > 0`)
+    }
+
+    let startRound = this.nextRound
+    if (startRound === undefined) {
+      const status = await this.algod.status()
+      if (status === undefined) {
+        throw new Error('Unable to get node status')
+      }
+      startRound = BigInt(status.lastRound) + 1n
+      this.nextRound ??= startRound
+    }
+
+    const deadline = startRound + BigInt(maxRoundsToWait)
+    const confirmations = transactionIds.map(
+      (transactionId) =>
+        new Promise<PendingTransactionResponse>((resolve, reject) => {
+          const waiters = this.waiters.get(transactionId) ?? []
+          waiters.push({ deadline, maxRoundsToWait, followFailures: 0, resolve, reject })
+          this.waiters.set(transactionId, waiters)
+        }),
+    )
+
+    // Transactions that are already confirmed won't show up in the rounds that are followed, so check them once up front
+    await Promise.all(transactionIds.map((transactionId) => this.checkPending(transactionId)))
+    if (this.waiters.size > 0) {
+      this.follow()
+    }
+    return Promise.all(confirmations)
+  }
+
+  /**
+   * Waits for the given transaction to be confirmed.
+   *
+   * @param transactionId The ID of the transaction to wait for
+   * @param maxRoundsToWait The maximum number of rounds to wait
+   * @returns The pending transaction information of the confirmed transaction
+   * @throws if the transaction isn't confirmed within `maxRoundsToWait` rounds or was rejected
+   */
+  async waitForConfirmation(transactionId: string, maxRoundsToWait: number | bigint): Promise<PendingTransactionResponse> {
+    const [confirmation] = await this.waitForConfirmations([transactionId], maxRoundsToWait)
+    return confirmation
+  }
+
+  private follow() {
+    this.following ??= this.run().finally(() => {
+      this.following = undefined
+      if (this.waiters.size > 0) {
+        this.follow()
+      } else {
+        this.nextRound = undefined
+      }
+    })
+  }
+
+  private async run() {
+    let failures = 0
+    try {
+      while (this.waiters.size > 0 && this.nextRound !== undefined) {
+        await this.expire(this.nextRound)
+        if (this.waiters.size === 0) return
+
+        this.idle = new AbortController()
+        let status: NodeStatusResponse
+        try {
+          status = await this.algod.statusAfterBlock(this.nextRound - 1n, { signal: this.idle.signal })
+        } catch (e) {
+          // Aborted once there was nothing left to wait for; transactions waited for since then start following again
+          if (this.idle.signal.aborted) return
+          this.followFailed(e as Error)
+          const backoffMs = Math.min(FOLLOW_RETRY_BACKOFF_MS * 2 ** failures++, MAX_FOLLOW_RETRY_BACKOFF_MS)
+          await new Promise((resolve) => setTimeout(resolve, backoffMs))
+          continue
+        }
+        failures = 0
+        this.waiters.forEach((waiters) => waiters.forEach((waiter) => (waiter.followFailures = 0)))
+
+        for (let round = this.nextRound; round <= BigInt(status.lastRound) && this.waiters.size > 0; round++) {
+          await this.checkRound(round)
+          this.nextRound = round + 1n
+          await this.expire(this.nextRound)
+        }
+      }
+    } finally {
+      this.idle = undefined
+    }
+  }
+
+  // Rejects the waiters that have now seen following the rounds fail too many times in a row
+  private followFailed(error: Error) {
+    for (const [transactionId, waiters] of [...this.waiters.entries()]) {
+      waiters.forEach((waiter) => (waiter.followFailures += 1))
+      this.settle(transactionId, (waiter) => waiter.reject(error), (waiter) => waiter.followFailures >= MAX_FOLLOW_FAILURES)
+    }
+  }
+
+  private async checkRound(round: bigint) {
+    let confirmedIds: Set<string> | undefined
+    try {
+      confirmedIds = new Set((await this.algod.blockTxIds(round)).blockTxIds)
+    } catch {
+      // Nodes that can't list the transactions of a round fall back to checking each transaction
+      confirmedIds = undefined
+    }
+    const transactionIds = [...this.waiters.keys()].filter((transactionId) => !confirmedIds || confirmedIds.has(transactionId))
+    await Promise.all(transactionIds.map((transactionId) => this.checkPending(transactionId)))
+  }
+
+  // Rejects the waiters whose rounds are up, unless a last check finds their transaction confirmed
+  private async expire(round: bigint) {
+    const expired = [...this.waiters.entries()]
+      .filter(([, waiters]) => waiters.some((waiter) => waiter.deadline <= round))
+      .map(([transactionId]) => transactionId)
+    await Promise.all(expired.map((transactionId) => this.checkPending(transactionId)))
+    for (const transactionId of expired) {
+      this.settle(
+        transactionId,
+        (waiter) => waiter.reject(notConfirmedError(transactionId, waiter.maxRoundsToWait)),
+        (waiter) => waiter.deadline <= round,
+      )
+    }
+  }
+
+  private async checkPending(transactionId: string) {
+    if (!this.waiters.has(transactionId)) return
+    try {
+      const pendingInfo = await this.algod.pendingTransactionInformation(transactionId)
+      const confirmedRound = pendingInfo.confirmedRound
+      if (confirmedRound && confirmedRound > 0) {
+        this.settle(transactionId, (waiter) => waiter.resolve(pendingInfo))
+      } else if (pendingInfo.poolError != null && pendingInfo.poolError.length > 0) {
+        // If there was a pool error, then the transaction has been rejected!
+        const error = new Error(`Transaction ${transactionId} was rejected; pool error: ${pendingInfo.poolError}`)
+        this.settle(transactionId, (waiter) => waiter.reject(error))
+      }
+    } catch {
+      // The node may not know about the transaction yet (a 404), so keep waiting for it until its rounds are up
+    }
+  }
+
+  private settle(
+    transactionId: string,
+    outcome: (waiter: ConfirmationWaiter) => void,
+    filter: (waiter: ConfirmationWaiter) => boolean = () => true,
+  ) {
+    const waiters = this.waiters.get(transactionId) ?? []
+    const remaining = waiters.filter((waiter) => !filter(waiter))
+    waiters.filter(filter).forEach(outcome)
+    if (remaining.length > 0) {
+      this.waiters.set(transactionId, remaining)
+    } else {
+      this.waiters.delete(transactionId)
+    }
+    if (this.waiters.size === 0) {
+      this.idle?.abort()
+    }
+  }
+}
@@ -1,6 +1,9 @@
 /**
  * @module algokit-utils/transaction
  */
+export * from './confirmation-tracker'
 export * from './perform-transaction-composer-simulate'
+export * from './send-pipeline'
+export * from './simulate-batcher'
 export * from './transaction'
 export * from './types'
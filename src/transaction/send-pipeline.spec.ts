@@ -0,0 +1,200 @@
+import { AlgodClient } from '@algorandfoundation/algokit-algod-client'
+import { describe, expect, test, vi } from 'vitest'
+import { TransactionComposer } from '../composer'
+import { sendTransactionGroups } from './send-pipeline'
+
+const textEncoder = new TextEncoder()
+const textDecoder = new TextDecoder()
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+const apiError = (status: number, message: string) => Object.assign(new Error(message), { status, body: { message } })
+
+// A node whose rounds advance by one every time a new round is waited for, and that confirms the transactions it
+// accepts in the next round. The signed transactions it's sent are the transaction IDs, encoded as bytes.
+const fakeNode = () => {
+  let lastRound = 100n
+  const accepted = new Map<string, bigint | undefined>()
+  const node = {
+    /** IDs of transactions the node accepts but never confirms */
+    dropped: new Set<string>(),
+    get lastRound() {
+      return lastRound
+    },
+    sendRawTransaction: vi.fn(async (signedTransactions: Uint8Array[], _requestOptions?: { maxRetries?: number }) => {
+      for (const txId of signedTransactions.map((stxn) => textDecoder.decode(stxn))) {
+        if (accepted.has(txId)) throw apiError(400, `transaction already in ledger: ${txId}`)
+        accepted.set(txId, node.dropped.has(txId) ? undefined : lastRound + 1n)
+      }
+      return { txId: '' }
+    }),
+    status: vi.fn(async () => ({ lastRound })),
+    statusAfterBlock: vi.fn(async (round: number | bigint) => {
+      await sleep(1)
+      if (lastRound <= BigInt(round)) lastRound = BigInt(round) + 1n
+      return { lastRound }
+    }),
+    blockTxIds: vi.fn(async (round: number | bigint) => ({
+      blockTxIds: [...accepted].filter(([, confirmedRound]) => confirmedRound === BigInt(round)).map(([txId]) => txId),
+    })),
+    pendingTransactionInformation: vi.fn(async (txId: string) => {
+      if (!accepted.has(txId)) throw apiError(404, 'transaction not found')
+      const confirmedRound = accepted.get(txId)
+      return confirmedRound !== undefined && confirmedRound <= lastRound ? { confirmedRound } : { poolError: '' }
+    }),
+  }
+  return { node, algod: node as unknown as AlgodClient }
+}
+
+// A factory of single transaction groups; each build gets the next of the given transaction IDs
+const groupFactory = (
+  node: ReturnType<typeof fakeNode>['node'],
+  txIds: string[],
+  validity: { firstValidOffset?: bigint; window?: bigint } = {},
+) => {
+  const builds: { txId: string; lastRound: bigint }[] = []
+  const newGroup = vi.fn(() => {
+    const txId = txIds[builds.length]
+    builds.push({ txId, lastRound: node.lastRound })
+    const firstValid = node.lastRound + (validity.firstValidOffset ?? 1n)
+    const txn = { txId: () => txId, group: undefined, firstValid, lastValid: firstValid + (validity.window ?? 10n) - 1n }
+    return {
+      gatherSignatures: async () => [textEncoder.encode(txId)],
+      build: async () => ({ transactions: [{ txn }] }),
+      transformSendError: async (e: unknown) => e,
+    } as unknown as TransactionComposer
+  })
+  return { newGroup, builds }
+}
+
+describe('sendTransactionGroups', () => {
+  test('sends and confirms every group', async () => {
+    const { node, algod } = fakeNode()
+    const groups = ['A', 'B', 'C'].map((txId) => groupFactory(node, [txId]).newGroup)
+    const onGroupResult = vi.fn()
+
+    const results = await sendTransactionGroups(algod, groups, { maxGroupsInFlight: 2, onGroupResult })
+
+    expect(results).toMatchObject([
+      { index: 0, attempts: 1, txIds: ['A'], confirmations: [{ confirmedRound: 101n }] },
+      { index: 1, attempts: 1, txIds: ['B'], confirmations: [{ confirmedRound: 101n }] },
+      { index: 2, attempts: 1, txIds: ['C'] },
+    ])
+    expect(results.every((result) => result.error === undefined)).toBe(true)
+    expect(onGroupResult).toHaveBeenCalledTimes(3)
+  })
+
+  test('resubmits the same signed transactions after a transient error', async () => {
+    const { node, algod } = fakeNode()
+    const { newGroup } = groupFactory(node, ['A'])
+    node.sendRawTransaction.mockRejectedValueOnce(apiError(503, 'service unavailable'))
+
+    const [result] = await sendTransactionGroups(algod, [newGroup])
+
+    expect(result).toMatchObject({ attempts: 2, txIds: ['A'], confirmations: [{ confirmedRound: 101n }] })
+    expect(newGroup).toHaveBeenCalledTimes(1)
+    expect(node.sendRawTransaction.mock.calls.map(([stxns]) => textDecoder.decode(stxns[0]))).toEqual(['A', 'A'])
+  })
+
+  test("bounds the submissions of a group by maxAttempts alone, without the client's retries", async () => {
+    const { node, algod } = fakeNode()
+    const { newGroup } = groupFactory(node, ['A'])
+    node.sendRawTransaction.mockRejectedValue(apiError(503, 'service unavailable'))
+
+    const [result] = await sendTransactionGroups(algod, [newGroup], { maxAttempts: 2, suppressLog: true })
+
+    expect(result).toMatchObject({ attempts: 2, error: { status: 503 } })
+    expect(node.sendRawTransaction).toHaveBeenCalledTimes(2)
+    expect(node.sendRawTransaction.mock.calls.every(([, requestOptions]) => requestOptions?.maxRetries === 0)).toBe(true)
+  })
+
+  test('treats a resubmission that the node already accepted as sent', async () => {
+    const { node, algod } = fakeNode()
+    const { newGroup } = groupFactory(node, ['A'])
+    // The first submission is accepted, but its response is lost
+    node.sendRawTransaction.mockImplementationOnce(async (stxns) => {
+      await node.sendRawTransaction(stxns)
+      throw apiError(504, 'gateway timeout')
+    })
+
+    const [result] = await sendTransactionGroups(algod, [newGroup])
+
+    expect(result).toMatchObject({ attempts: 2, txIds: ['A'], confirmations: [{ confirmedRound: 101n }] })
+    expect(result.error).toBeUndefined()
+    expect(newGroup).toHaveBeenCalledTimes(1)
+  })
+
+  test('reports groups that fail with an error that is not transient, without stopping the others', async () => {
+    const { node, algod } = fakeNode()
+    const failing = groupFactory(node, ['A'])
+    const succeeding = groupFactory(node, ['B'])
+    node.sendRawTransaction.mockRejectedValueOnce(apiError(400, 'overspend'))
+
+    const results = await sendTransactionGroups(algod, [failing.newGroup, succeeding.newGroup], { maxGroupsInFlight: 1, suppressLog: true })
+
+    expect(results[0]).toMatchObject({ attempts: 1, error: { message: 'overspend', status: 400, body: { message: 'overspend' } } })
+    expect(results[1]).toMatchObject({ attempts: 1, confirmations: [{ confirmedRound: 101n }] })
+  })
+
+  test("reports the error of a failed group as transformed by the group's error transformers", async () => {
+    const { node, algod } = fakeNode()
+    const { newGroup } = groupFactory(node, ['A'])
+    const error = apiError(400, 'logic eval error')
+    const transformed = new Error('app error')
+    const transformSendError = vi.fn(async () => transformed)
+    const build = newGroup.getMockImplementation()!
+    newGroup.mockImplementationOnce(() => Object.assign(build(), { transformSendError }))
+    node.sendRawTransaction.mockRejectedValueOnce(error)
+
+    const [result] = await sendTransactionGroups(algod, [newGroup], { suppressLog: true })
+
+    expect(result.error).toBe(transformed)
+    expect(transformSendError).toHaveBeenCalledWith(error)
+  })
+
+  test('builds an expired group again once the node is past its last valid round', async () => {
+    const { node, algod } = fakeNode()
+    node.dropped.add('A1')
+    // Valid from 5 rounds in the future, for 2 rounds (105-106), so waiting out 2 rounds isn't enough for it to expire
+    const { newGroup, builds } = groupFactory(node, ['A1', 'A2'], { firstValidOffset: 5n, window: 2n })
+
+    const [result] = await sendTransactionGroups(algod, [newGroup], { suppressLog: true })
+
+    expect(result).toMatchObject({ attempts: 2, txIds: ['A2'] })
+    expect(result.confirmations).toHaveLength(1)
+    expect(builds.map(({ txId }) => txId)).toEqual(['A1', 'A2'])
+    expect(builds[1].lastRound).toBeGreaterThan(106n)
+    expect(node.pendingTransactionInformation.mock.calls.filter(([txId]) => txId === 'A1').length).toBeGreaterThan(0)
+  })
+
+  test("doesn't build an expired group again when its transactions were committed after all", async () => {
+    const { node, algod } = fakeNode()
+    node.dropped.add('A1')
+    const { newGroup, builds } = groupFactory(node, ['A1', 'A2'], { firstValidOffset: 5n, window: 2n })
+    // The node reports the transaction as committed only once it's past the validity window
+    const pendingTransactionInformation = node.pendingTransactionInformation.getMockImplementation()!
+    node.pendingTransactionInformation.mockImplementation(async (txId) =>
+      node.lastRound > 106n ? { confirmedRound: 105n } : pendingTransactionInformation(txId),
+    )
+
+    const [result] = await sendTransactionGroups(algod, [newGroup], { suppressLog: true })
+
+    expect(result).toMatchObject({ attempts: 1, txIds: ['A1'], confirmations: [{ confirmedRound: 105n }] })
+    expect(builds).toHaveLength(1)
+  })
+
+  test("reports groups that aren't confirmed within maxRoundsToWaitForConfirmation without building them again", async () => {
+    const { node, algod } = fakeNode()
+    node.dropped.add('A1')
+    const { newGroup } = groupFactory(node, ['A1', 'A2'])
+
+    const [result] = await sendTransactionGroups(algod, [newGroup], { maxRoundsToWaitForConfirmation: 2, suppressLog: true })
+
+    expect(result).toMatchObject({
+      attempts: 1,
+      txIds: ['A1'],
+      error: { message: 'Transaction A1 not confirmed after 2 rounds' },
+    })
+    expect(newGroup).toHaveBeenCalledTimes(1)
+  })
+})
@@ -0,0 +1,192 @@
+import { AlgodClient, PendingTransactionResponse } from '@algorandfoundation/algokit-algod-client'
+import { Buffer } from 'buffer'
+import { TransactionComposer } from '../composer'
+import { Config } from '../config'
+import { mapWithConcurrency } from '../util'
+import { ConfirmationTracker } from './confirmation-tracker'
+import { SendParams } from './types'
+
+const DEFAULT_MAX_GROUPS_IN_FLIGHT = 8
+const DEFAULT_MAX_ATTEMPTS = 3
+const MAX_RESUBMIT_BACKOFF_MS = 10_000
+const TRANSIENT_STATUS_CODES = [408, 429, 500, 502, 503, 504]
+const TRANSIENT_ERROR_CODES = ['ETIMEDOUT', 'ECONNRESET', 'ECONNREFUSED', 'EPIPE', 'ENOTFOUND', 'ENETUNREACH', 'EAI_AGAIN']
+
+/** Parameters to control sending many transaction groups. */
+export interface PipelinedSendParams extends Pick<SendParams, 'maxRoundsToWaitForConfirmation' | 'suppressLog'> {
+  /** The maximum number of groups being built, submitted or confirmed at a time; defaults to 8 */
+  maxGroupsInFlight?: number
+  /**
+   * The maximum number of times a group is submitted; defaults to 3.
+   *
+   * Submissions that fail with a transient error (e.g. a timeout) are retried with the same signed transactions, so a group
+   * is never confirmed twice. These are the only retries of a submission: the algod client's own retries (`maxRetries`)
+   * don't apply to it. Groups that expire without being confirmed (the node is past their last valid round, and
+   * none of their transactions were committed) are built, signed and submitted again; unless `maxRoundsToWaitForConfirmation`
+   * is shorter than the validity window, in which case they're reported as failed.
+   */
+  maxAttempts?: number
+  /** Called with the result of each group once it's known, e.g. to report progress */
+  onGroupResult?: (result: PipelinedGroupResult) => void
+}
+
+/** The outcome of sending one transaction group. */
+export interface PipelinedGroupResult {
+  /** The index of the group in the groups that were sent */
+  index: number
+  /** The number of times the group was submitted */
+  attempts: number
+  /** The IDs of the transactions of the last attempt */
+  txIds: string[]
+  /** The base64 encoded group ID of the last attempt, if the group had more than one transaction */
+  groupId?: string
+  /** The confirmation of each transaction, if the group was confirmed */
+  confirmations?: PendingTransactionResponse[]
+  /** The error, if the group failed */
+  error?: Error
+}
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+const errorMessage = (e: any): string => e?.body?.message ?? e?.message ?? String(e)
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+const isTransientError = (e: any): boolean => {
+  const status = e?.status ?? e?.response?.status
+  const code = e?.code ?? e?.cause?.code
+  return TRANSIENT_STATUS_CODES.includes(status) || TRANSIENT_ERROR_CODES.includes(code)
+}
+
+// A retried submission that the node already accepted is reported as a duplicate
+const isDuplicateError = (e: unknown): boolean => /already in (the )?(ledger|pool)/i.test(errorMessage(e))
+
+class GroupExpiredError extends Error {}
+
+/**
+ * Waits for the node to be past the last valid round of a group that wasn't seen being confirmed, and checks that none of
+ * its transactions were committed after all.
+ * @returns The confirmations of the transactions if the group was committed, otherwise `undefined`
+ */
+async function confirmExpired(algod: AlgodClient, txIds: string[], lastValid: bigint): Promise<PendingTransactionResponse[] | undefined> {
+  let { lastRound } = await algod.status()
+  while (lastRound <= lastValid) {
+    ;({ lastRound } = await algod.statusAfterBlock(lastRound))
+  }
+  const pending = await Promise.all(txIds.map((txId) => algod.pendingTransactionInformation(txId).catch(() => undefined)))
+  if (!pending.some((info) => info?.confirmedRound)) {
+    return undefined
+  }
+  if (pending.every((info) => info?.confirmedRound)) {
+    return pending as PendingTransactionResponse[]
+  }
+  throw new Error(`Transactions of the group were committed, but the confirmation of ${txIds.join(', ')} couldn't be read`)
+}
+
+/**
+ * Sends many transaction groups, with up to `maxGroupsInFlight` of them being built, signed, submitted and confirmed at a
+ * time, so throughput grows with the window rather than being bound by the round time.
+ *
+ * Each group is created by calling its factory, so that it can be built again (with fresh suggested params) if it expires
+ * before being confirmed. Groups created by the same `AlgorandClient` share its cached suggested params, and the groups
+ * are confirmed together by following the rounds of the node once (see `ConfirmationTracker`).
+ *
+ * A failed group doesn't stop the other groups; check the `error` of each result.
+ *
+ * @param algod An algod client
+ * @param groups A factory for each transaction group to send
+ * @param params Parameters to control the pipeline
+ * @returns The result of each group, in the order of `groups`
+ * @example
+ * ```typescript
+ * const results = await sendTransactionGroups(
+ *   algod,
+ *   receivers.map((receiver) => () => algorand.newGroup().addPayment({ sender, receiver, amount: (1).algo() })),
+ *   { maxGroupsInFlight: 32 },
+ * )
+ * const failed = results.filter((r) => r.error)
+ * ```
+ */
+export async function sendTransactionGroups(
+  algod: AlgodClient,
+  groups: (() => TransactionComposer)[],
+  params?: PipelinedSendParams,
+): Promise<PipelinedGroupResult[]> {
+  return await mapWithConcurrency(groups, params?.maxGroupsInFlight ?? DEFAULT_MAX_GROUPS_IN_FLIGHT, async (newGroup, index) => {
+    const result = await sendGroup(algod, newGroup, index, params)
+    params?.onGroupResult?.(result)
+    return result
+  })
+}
+
+async function sendGroup(
+  algod: AlgodClient,
+  newGroup: () => TransactionComposer,
+  index: number,
+  params?: PipelinedSendParams,
+): Promise<PipelinedGroupResult> {
+  const maxAttempts = params?.maxAttempts ?? DEFAULT_MAX_ATTEMPTS
+  const result: PipelinedGroupResult = { index, attempts: 0, txIds: [] }
+  let composer: TransactionComposer | undefined
+
+  while (result.attempts < maxAttempts) {
+    try {
+      composer = newGroup()
+      const signedTransactions = await composer.gatherSignatures()
+      const { transactions } = await composer.build()
+      const group = transactions[0].txn.group
+      result.txIds = transactions.map(({ txn }) => txn.txId())
+      result.groupId = transactions.length > 1 && group ? Buffer.from(group).toString('base64') : undefined
+
+      // Resubmit the same signed transactions on transient errors; they can only be confirmed once. The client doesn't
+      // retry the submissions itself, so `maxAttempts` bounds the submissions of the group.
+      for (let resubmissions = 0; ; resubmissions++) {
+        result.attempts++
+        try {
+          await algod.sendRawTransaction(signedTransactions, { maxRetries: 0 })
+          break
+        } catch (e) {
+          if (isDuplicateError(e)) break
+          if (!isTransientError(e) || result.attempts >= maxAttempts) throw e
+        }
+        // Back off like the client's retries do: resubmit straight away once, then after 2s, 4s, ...
+        if (resubmissions > 0) {
+          await new Promise((resolve) => setTimeout(resolve, Math.min(1000 * 2 ** resubmissions, MAX_RESUBMIT_BACKOFF_MS)))
+        }
+      }
+
+      if (params?.maxRoundsToWaitForConfirmation === 0) {
+        return result
+      }
+      const firstValid = transactions.reduce((min, { txn }) => (txn.firstValid < min ? txn.firstValid : min), transactions[0].txn.firstValid)
+      const lastValid = transactions.reduce((max, { txn }) => (txn.lastValid > max ? txn.lastValid : max), 0n)
+      const validityWindow = Number(lastValid - firstValid) + 1
+      const waitRounds = params?.maxRoundsToWaitForConfirmation ?? validityWindow
+
+      try {
+        result.confirmations = await ConfirmationTracker.for(algod).waitForConfirmations(result.txIds, waitRounds)
+      } catch (e) {
+        if (waitRounds < validityWindow || !/not confirmed after/.test(errorMessage(e))) throw e
+        // Once the node is past the validity window without the transactions being committed, they can no longer be
+        // confirmed, so it's safe to try again
+        const confirmations = await confirmExpired(algod, result.txIds, lastValid)
+        if (!confirmations) throw new GroupExpiredError(errorMessage(e))
+        result.confirmations = confirmations
+      }
+
+      Config.getLogger(params?.suppressLog).verbose(
+        `Group ${index} confirmed in round ${result.confirmations[0]?.confirmedRound} after ${result.attempts} attempt(s)`,
+      )
+      return result
+    } catch (e) {
+      if (e instanceof GroupExpiredError && result.attempts < maxAttempts) {
+        Config.getLogger(params?.suppressLog).warn(`Group ${index} expired before being confirmed; sending it again`)
+        continue
+      }
+      // The error is reported as is (e.g. an ApiError keeps its status and body), after the group's error transformers
+      const error = composer ? await composer.transformSendError(e) : e
+      result.error = error instanceof Error ? error : new Error(errorMessage(error), { cause: error })
+      Config.getLogger(params?.suppressLog).error(`Failed to send group ${index} after ${result.attempts} attempt(s)`, result.error)
+      return result
+    }
+  }
+  return result
+}
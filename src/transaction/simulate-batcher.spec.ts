@@ -0,0 +1,102 @@
+import { AlgodClient, SimulateRequest, SimulateResponse } from '@algorandfoundation/algokit-algod-client'
+import { describe, expect, test, vi } from 'vitest'
+import { SimulateBatcher } from './simulate-batcher'
+
+// A simulate request with a group for each of the given lists of transaction IDs
+const request = (groups: string[][], options: Partial<SimulateRequest> = {}) =>
+  ({
+    txnGroups: groups.map((txIds) => ({ txns: txIds.map((txId) => ({ txn: { txId: () => txId } })) })),
+    allowEmptySignatures: true,
+    ...options,
+  }) as unknown as SimulateRequest
+
+// A node that fails the groups with any of the `failing` transactions, and rejects requests with any of the `rejected` ones
+const fakeAlgod = () => {
+  const failing = new Set<string>()
+  const rejected = new Set<string>()
+  const simulateTransactions = vi.fn(async (req: SimulateRequest) => {
+    await new Promise((resolve) => setTimeout(resolve, 1))
+    const txIds = req.txnGroups.map((group) => group.txns.map(({ txn }) => txn.txId()))
+    if (txIds.flat().some((txId) => rejected.has(txId))) throw new Error('bad request')
+    return {
+      txnGroups: txIds.map((ids) => ({ txnResults: ids, failureMessage: ids.some((id) => failing.has(id)) ? 'failed' : undefined })),
+    } as unknown as SimulateResponse
+  })
+  return { algod: { simulateTransactions } as unknown as AlgodClient, simulateTransactions, failing, rejected }
+}
+
+const sentGroups = (simulateTransactions: ReturnType<typeof fakeAlgod>['simulateTransactions']) =>
+  simulateTransactions.mock.calls.map(([req]) => req.txnGroups.map((group) => group.txns.map(({ txn }) => txn.txId()).join('+')))
+
+describe('SimulateBatcher', () => {
+  test('simulates each request on its own unless the groups are independent', async () => {
+    const { algod, simulateTransactions } = fakeAlgod()
+    const batcher = new SimulateBatcher(algod)
+
+    await Promise.all([batcher.simulate(request([['A']])), batcher.simulate(request([['B']]))])
+
+    expect(sentGroups(simulateTransactions)).toEqual([['A'], ['B']])
+  })
+
+  test('merges concurrent requests with independent groups, and gives each caller the results of its own groups', async () => {
+    const { algod, simulateTransactions } = fakeAlgod()
+    const batcher = new SimulateBatcher(algod, { independentGroups: true })
+
+    const [a, bc] = await Promise.all([batcher.simulate(request([['A']])), batcher.simulate(request([['B'], ['C1', 'C2']]))])
+
+    expect(sentGroups(simulateTransactions)).toEqual([['A', 'B', 'C1+C2']])
+    expect(a.txnGroups).toEqual([{ txnResults: ['A'], failureMessage: undefined }])
+    expect(bc.txnGroups.map((group) => group.txnResults)).toEqual([['B'], ['C1', 'C2']])
+  })
+
+  test("doesn't merge requests with different options or transactions in common", async () => {
+    const { algod, simulateTransactions } = fakeAlgod()
+    const batcher = new SimulateBatcher(algod, { independentGroups: true })
+
+    await Promise.all([
+      batcher.simulate(request([['A']])),
+      batcher.simulate(request([['B']], { allowUnnamedResources: true })),
+      batcher.simulate(request([['A']])),
+    ])
+
+    expect(sentGroups(simulateTransactions).sort()).toEqual([['A'], ['A'], ['B']])
+  })
+
+  test('sends at most maxGroupsPerRequest groups in one request', async () => {
+    const { algod, simulateTransactions } = fakeAlgod()
+    const batcher = new SimulateBatcher(algod, { independentGroups: true, maxGroupsPerRequest: 2 })
+
+    await Promise.all(['A', 'B', 'C'].map((txId) => batcher.simulate(request([[txId]]))))
+
+    expect(sentGroups(simulateTransactions)).toEqual([['A', 'B'], ['C']])
+  })
+
+  test('simulates the groups of a request that fail when merged again on their own', async () => {
+    const { algod, simulateTransactions, failing } = fakeAlgod()
+    failing.add('B')
+    const batcher = new SimulateBatcher(algod, { independentGroups: true })
+
+    const [a, b] = await Promise.all([batcher.simulate(request([['A']])), batcher.simulate(request([['B']]))])
+
+    expect(sentGroups(simulateTransactions)).toEqual([['A', 'B'], ['B']])
+    expect(a.txnGroups[0].failureMessage).toBeUndefined()
+    expect(b.txnGroups[0].failureMessage).toBe('failed')
+  })
+
+  test('simulates each request of a rejected merged request on its own, so only the bad one fails', async () => {
+    const { algod, simulateTransactions, rejected } = fakeAlgod()
+    rejected.add('B')
+    const batcher = new SimulateBatcher(algod, { independentGroups: true })
+
+    const results = await Promise.allSettled([batcher.simulate(request([['A']])), batcher.simulate(request([['B']]))])
+
+    expect(sentGroups(simulateTransactions)).toEqual([['A', 'B'], ['A'], ['B']])
+    expect(results.map(({ status }) => status)).toEqual(['fulfilled', 'rejected'])
+  })
+
+  test('shares one batcher per client', () => {
+    const { algod } = fakeAlgod()
+
+    expect(SimulateBatcher.for(algod)).toBe(SimulateBatcher.for(algod))
+  })
+})
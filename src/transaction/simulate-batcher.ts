@@ -0,0 +1,174 @@
+import { AlgodClient, SimulateRequest, SimulateResponse } from '@algorandfoundation/algokit-algod-client'
+import { asJson } from '../util'
+
+const DEFAULT_MAX_GROUPS_PER_REQUEST = 16
+const DEFAULT_WINDOW_MS = 0
+
+/** Options to control how simulate requests are batched. */
+export interface SimulateBatcherOptions {
+  /** How long to collect simulate requests for before sending them; defaults to 0 (i.e. the requests made in the same tick) */
+  windowMs?: number
+  /** The maximum number of transaction groups sent in one simulate request; defaults to 16 */
+  maxGroupsPerRequest?: number
+  /**
+   * Whether the transaction groups simulated through the batcher are known not to affect each other, e.g. because they
+   * have different senders and don't touch the same app state. Defaults to `false`, in which case requests aren't merged
+   * and each one is simulated on its own.
+   */
+  independentGroups?: boolean
+}
+
+interface PendingSimulate {
+  request: SimulateRequest
+  resolve: (response: SimulateResponse) => void
+  reject: (error: unknown) => void
+}
+
+interface SimulateBatch {
+  pending: PendingSimulate[]
+  groupCount: number
+  timer: ReturnType<typeof setTimeout>
+}
+
+const transactionIds = (request: SimulateRequest) => request.txnGroups.flatMap((group) => group.txns.map(({ txn }) => txn.txId()))
+
+/**
+ * Batches concurrent simulate requests into one simulate request with many transaction groups.
+ *
+ * Simulate requests made within `windowMs` of each other that have the same options (everything but `txnGroups`) are
+ * sent together, and each caller gets back a response that only has the results of its own transaction groups.
+ *
+ * Groups in one simulate request are evaluated one after the other against shared ledger state: each group sees the
+ * effects of the groups before it (balances, app and box state, asset holdings), so its result can differ from simulating
+ * it on its own, e.g. it only succeeds because an earlier group funded its sender, or it needs different resources or
+ * fees. Merged results are therefore only used with `independentGroups`, where the caller vouches that the groups don't
+ * affect each other; otherwise every request is simulated on its own. Even then, requests with transactions in common are
+ * never sent together, and the groups of a request that fail (or a batch that's rejected altogether) are simulated again
+ * on their own.
+ *
+ * The batcher isn't used unless it's passed to a composer (`simulateBatcher`) or set with
+ * `AlgorandClient.setSimulateBatcher`; use `SimulateBatcher.for(algod)` to share one batcher per client.
+ */
+export class SimulateBatcher {
+  private static batchers = new WeakMap<AlgodClient, SimulateBatcher>()
+
+  private readonly batches = new Map<string, SimulateBatch>()
+  private readonly windowMs: number
+  private readonly maxGroupsPerRequest: number
+  private readonly independentGroups: boolean
+
+  /**
+   * Creates a batcher that simulates with the given node.
+   * @param algod The algod client
+   * @param options Options to control how simulate requests are batched
+   */
+  constructor(
+    private readonly algod: AlgodClient,
+    options?: SimulateBatcherOptions,
+  ) {
+    this.windowMs = options?.windowMs ?? DEFAULT_WINDOW_MS
+    this.maxGroupsPerRequest = options?.maxGroupsPerRequest ?? DEFAULT_MAX_GROUPS_PER_REQUEST
+    this.independentGroups = options?.independentGroups ?? false
+  }
+
+  /**
+   * Returns the batcher shared by everything that simulates with the given algod client.
+   * @param algod The algod client
+   * @param options Options to control how simulate requests are batched, used if the shared batcher doesn't exist yet
+   * @returns The shared batcher
+   */
+  static for(algod: AlgodClient, options?: SimulateBatcherOptions): SimulateBatcher {
+    let batcher = SimulateBatcher.batchers.get(algod)
+    if (!batcher) {
+      batcher = new SimulateBatcher(algod, options)
+      SimulateBatcher.batchers.set(algod, batcher)
+    }
+    return batcher
+  }
+
+  /**
+   * Simulates the transaction groups of the given request, along with any other requests made at the same time.
+   *
+   * @param request The simulate request
+   * @returns The simulate response, with the results of the transaction groups of `request`
+   */
+  simulate(request: SimulateRequest): Promise<SimulateResponse> {
+    // The groups of other requests could change the result, so each request is simulated on its own
+    if (!this.independentGroups) {
+      return this.algod.simulateTransactions(request)
+    }
+
+    const key = asJson({ ...request, txnGroups: undefined })
+
+    let batch = this.batches.get(key)
+    if (batch && (batch.groupCount + request.txnGroups.length > this.maxGroupsPerRequest || this.sharesTransactions(batch, request))) {
+      this.flush(key)
+      batch = undefined
+    }
+
+    return new Promise<SimulateResponse>((resolve, reject) => {
+      if (!batch) {
+        batch = { pending: [], groupCount: 0, timer: setTimeout(() => this.flush(key), this.windowMs) }
+        this.batches.set(key, batch)
+      }
+      batch.pending.push({ request, resolve, reject })
+      batch.groupCount += request.txnGroups.length
+      if (batch.groupCount >= this.maxGroupsPerRequest) {
+        this.flush(key)
+      }
+    })
+  }
+
+  private sharesTransactions(batch: SimulateBatch, request: SimulateRequest) {
+    const batched = new Set(batch.pending.flatMap(({ request }) => transactionIds(request)))
+    return transactionIds(request).some((transactionId) => batched.has(transactionId))
+  }
+
+  private flush(key: string) {
+    const batch = this.batches.get(key)
+    if (!batch) return
+    this.batches.delete(key)
+    clearTimeout(batch.timer)
+    void this.send(batch.pending)
+  }
+
+  private async send(pending: PendingSimulate[]) {
+    if (pending.length === 1) {
+      await this.sendAlone(pending[0])
+      return
+    }
+
+    let response: SimulateResponse
+    try {
+      response = await this.algod.simulateTransactions({
+        ...pending[0].request,
+        txnGroups: pending.flatMap(({ request }) => request.txnGroups),
+      })
+    } catch {
+      // One bad request shouldn't fail the others, so fall back to sending each one on its own
+      await Promise.all(pending.map((p) => this.sendAlone(p)))
+      return
+    }
+
+    let offset = 0
+    await Promise.all(
+      pending.map((p) => {
+        const txnGroups = response.txnGroups.slice(offset, offset + p.request.txnGroups.length)
+        offset += p.request.txnGroups.length
+        // A failure could be down to a group that came before it, so make sure it also fails on its own
+        if (txnGroups.length !== p.request.txnGroups.length || txnGroups.some((group) => group.failureMessage)) {
+          return this.sendAlone(p)
+        }
+        p.resolve({ ...response, txnGroups })
+      }),
+    )
+  }
+
+  private async sendAlone({ request, resolve, reject }: PendingSimulate) {
+    try {
+      resolve(await this.algod.simulateTransactions(request))
+    } catch (e) {
+      reject(e)
+    }
+  }
+}
@@ -1,7 +1,7 @@
 import { AlgodClient, PendingTransactionResponse } from '@algorandfoundation/algokit-algod-client'
 import { Transaction, TransactionSigner } from '@algorandfoundation/algokit-transact'
 import { TransactionComposer } from '../composer'
-import { toNumber } from '../util'
+import { ConfirmationTracker } from './confirmation-tracker'
 import { AdditionalTransactionComposerContext, SendParams, SendTransactionComposerResults, TransactionComposerToSend } from './types'
 
 /** Represents an unsigned transactions and a signer that can authorize that transaction. */
@@ -135,46 +135,27 @@ export const waitForConfirmation = async function (
   maxRoundsToWait: number | bigint,
   algod: AlgodClient,
 ): Promise<PendingTransactionResponse> {
-  if (maxRoundsToWait < 0) {
-    throw new Error(`Invalid timeout, received ${maxRoundsToWait}, expected > 0`)
-  }
-
-  // Get current round
-  const status = await algod.status()
-  if (status === undefined) {
-    throw new Error('Unable to get node status')
-  }
-
-  // Loop for up to `timeout` rounds looking for a confirmed transaction
-  const startRound = BigInt(status.lastRound) + 1n
-  let currentRound = startRound
-  while (currentRound < startRound + BigInt(maxRoundsToWait)) {
-    try {
-      const pendingInfo = await algod.pendingTransactionInformation(transactionId)
-
-      if (pendingInfo !== undefined) {
-        const confirmedRound = pendingInfo.confirmedRound
-        if (confirmedRound && confirmedRound > 0) {
-          return pendingInfo
-        } else {
-          const poolError = pendingInfo.poolError
-          if (poolError != null && poolError.length > 0) {
-            // If there was a pool error, then the transaction has been rejected!
-            throw new Error(`Transaction ${transactionId} was rejected; pool error: ${poolError}`)
-          }
-        }
-      }
-      // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    } catch (e: any) {
-      if ('status' in e && e.status === 404) {
-        currentRound++
-        continue
-      }
-    }
-
-    await algod.statusAfterBlock(toNumber(currentRound))
-    currentRound++
-  }
+  return ConfirmationTracker.for(algod).waitForConfirmation(transactionId, maxRoundsToWait)
+}
 
-  throw new Error(`Transaction ${transactionId} not confirmed after ${maxRoundsToWait} rounds`)
+/**
+ * Wait until the given transactions are confirmed or rejected, or until `timeout`
+ * number of rounds have passed.
+ *
+ * The transactions are confirmed together, by following the rounds of the node once rather than polling for each transaction,
+ * so the number of requests per round doesn't grow with the number of transactions.
+ *
+ * @param transactionIds The transaction IDs to wait for
+ * @param maxRoundsToWait Maximum number of rounds to wait for each transaction
+ * @param algod An algod client
+ *
+ * @return Pending transaction information of each transaction, in the order of `transactionIds`
+ * @throws Throws an error if a transaction is not confirmed or rejected in the next `timeout` rounds
+ */
+export const waitForConfirmations = async function (
+  transactionIds: string[],
+  maxRoundsToWait: number | bigint,
+  algod: AlgodClient,
+): Promise<PendingTransactionResponse[]> {
+  return ConfirmationTracker.for(algod).waitForConfirmations(transactionIds, maxRoundsToWait)
 }
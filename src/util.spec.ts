@@ -0,0 +1,107 @@
+import { describe, expect, test } from 'vitest'
+import { mapWithConcurrency, streamWithConcurrency } from './util'
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+describe('streamWithConcurrency', () => {
+  test('yields every result as soon as it is available, with at most `concurrency` calls in flight', async () => {
+    let running = 0
+    let maxRunning = 0
+    const results: number[] = []
+
+    for await (const { index, result } of streamWithConcurrency([30, 10, 40, 5], 2, async (ms, i) => {
+      maxRunning = Math.max(maxRunning, ++running)
+      await sleep(ms)
+      running -= 1
+      return i * 10
+    })) {
+      expect(result).toBe(index * 10)
+      results.push(index)
+    }
+
+    expect(results).toEqual([1, 0, 3, 2])
+    expect(maxRunning).toBe(2)
+  })
+
+  test('throws the first error, ignoring calls that fail after it', async () => {
+    const calls: number[] = []
+    const stream = streamWithConcurrency([1, 2, 3, 4], 4, async (ms) => {
+      calls.push(ms)
+      await sleep(ms)
+      throw new Error(`failed after ${ms}ms`)
+    })
+
+    await expect(
+      (async () => {
+        for await (const _ of stream) {
+          // Nothing is yielded
+        }
+      })(),
+    ).rejects.toThrow('failed after 1ms')
+    // The calls still in flight fail without unhandled rejections
+    await sleep(10)
+
+    expect(calls).toEqual([1, 2, 3, 4])
+  })
+
+  test('throws the error of a call that fails while the caller is handling a result', async () => {
+    const results: number[] = []
+    const consume = async () => {
+      for await (const { result } of streamWithConcurrency([0, 1], 1, async (i) => {
+        await sleep(1)
+        if (i === 1) throw new Error('failed while the caller was busy')
+        return i
+      })) {
+        results.push(result)
+        await sleep(10)
+      }
+    }
+
+    await expect(consume()).rejects.toThrow('failed while the caller was busy')
+    expect(results).toEqual([0])
+  })
+
+  test('stops reading items when the caller stops early', async () => {
+    let returned = false
+    let read = 0
+    async function* items() {
+      try {
+        for (let i = 0; i < 100; i++) {
+          read += 1
+          yield i
+        }
+      } finally {
+        returned = true
+      }
+    }
+
+    for await (const { index } of streamWithConcurrency(items(), 3, async (i) => {
+      await sleep(i === 0 ? 1 : 5)
+      if (i > 0) throw new Error('failed after the caller stopped')
+      return i
+    })) {
+      expect(index).toBe(0)
+      break
+    }
+    await sleep(10)
+
+    expect(returned).toBe(true)
+    expect(read).toBe(4)
+  })
+})
+
+describe('mapWithConcurrency', () => {
+  test('returns the results in the order of the items', async () => {
+    await expect(mapWithConcurrency([3, 1, 2], 2, async (ms) => (await sleep(ms), ms))).resolves.toEqual([3, 1, 2])
+  })
+
+  test('rejects with the first error', async () => {
+    await expect(
+      mapWithConcurrency([5, 1, 3], 3, async (ms) => {
+        await sleep(ms)
+        throw new Error(`failed after ${ms}ms`)
+      }),
+    ).rejects.toThrow('failed after 1ms')
+    await sleep(10)
+  })
+})
@@ -62,6 +62,70 @@ export function* chunkArray<T>(array: T[], batchSize: number): Generator<T[], vo
   for (let i = 0; i < array.length; i += batchSize) yield array.slice(i, i + batchSize)
 }
 
+/**
+ * Calls `fn` for each of the given items with at most `concurrency` calls in flight, yielding each result as soon as it's
+ * available (so not necessarily in the order of the items).
+ * @param items The items to call `fn` for; an async iterable (e.g. a paginated indexer stream) is consumed as calls finish
+ * @param concurrency The maximum number of calls in flight
+ * @param fn The function to call for each item
+ * @returns An async generator that yields the index of each item along with its result; it throws the first error of a call
+ */
+export async function* streamWithConcurrency<T, R>(
+  items: Iterable<T> | AsyncIterable<T>,
+  concurrency: number,
+  fn: (item: T, index: number) => Promise<R>,
+): AsyncGenerator<{ index: number; result: R }, void> {
+  const iterator: Iterator<T> | AsyncIterator<T> = Symbol.asyncIterator in items ? items[Symbol.asyncIterator]() : items[Symbol.iterator]()
+  const inFlight = new Map<number, Promise<{ index: number; result: R }>>()
+  let nextIndex = 0
+  let done = false
+  const startNext = async () => {
+    if (done) return false
+    const next = await iterator.next()
+    if (next.done) {
+      done = true
+      return false
+    }
+    const index = nextIndex++
+    const call = fn(next.value, index).then((result) => ({ index, result }))
+    // Errors surface through the race below; calls that fail after the caller has stopped (or after an earlier error) are ignored
+    call.catch(() => {})
+    inFlight.set(index, call)
+    return true
+  }
+
+  try {
+    for (let started = 0; started < Math.max(1, concurrency); started++) {
+      if (!(await startNext())) break
+    }
+    while (inFlight.size > 0) {
+      const settled = await Promise.race(inFlight.values())
+      inFlight.delete(settled.index)
+      await startNext()
+      yield settled
+    }
+  } finally {
+    // Calls still in flight after an error (or when the caller stops early) are left to finish, but their results are ignored
+    inFlight.clear()
+    if (!done) await iterator.return?.()
+  }
+}
+
+/**
+ * Calls `fn` for each of the given items with at most `concurrency` calls in flight.
+ * @param items The items to call `fn` for
+ * @param concurrency The maximum number of calls in flight
+ * @param fn The function to call for each item
+ * @returns The results, in the order of the items
+ */
+export async function mapWithConcurrency<T, R>(items: T[], concurrency: number, fn: (item: T, index: number) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length)
+  for await (const { index, result } of streamWithConcurrency(items, concurrency, fn)) {
+    results[index] = result
+  }
+  return results
+}
+
 /**
  * Memoize calls to the given function in an in-memory map.
  * @param fn The function to memoize